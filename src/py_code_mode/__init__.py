@@ -51,7 +51,17 @@ from py_code_mode.session import Session
 from py_code_mode.storage import FileStorage, RedisStorage, StorageBackend
 
 # Core types (foundational, used everywhere)
-from py_code_mode.types import ExecutionResult, JsonSchema, ToolDefinition
+from py_code_mode.types import (
+    DisplayEvent,
+    ErrorEvent,
+    ExecutionEvent,
+    ExecutionResult,
+    JsonSchema,
+    ResultEvent,
+    StderrEvent,
+    StdoutEvent,
+    ToolDefinition,
+)
 
 __version__ = "0.1.0"
 
@@ -65,6 +75,13 @@ __all__ = [
     "ExecutionResult",
     "JsonSchema",
     "ToolDefinition",
+    # Streaming events
+    "ExecutionEvent",
+    "StdoutEvent",
+    "StderrEvent",
+    "DisplayEvent",
+    "ResultEvent",
+    "ErrorEvent",
     # Storage
     "StorageBackend",
     "FileStorage",
@@ -1,15 +1,39 @@
 """py_code_mode.artifacts - Artifact storage implementations."""
 
 from py_code_mode.artifacts.base import (
+    ARTIFACT_CHUNK_SIZE,
+    COMPRESSION_THRESHOLD,
     Artifact,
+    ArtifactCodec,
     ArtifactStoreProtocol,
+    ArtifactWriter,
+    DecompressingReader,
+    StreamingArtifactStore,
+    compress,
+    decompress,
+    map_file,
+    npy_view,
+    open_artifact,
+    view_artifact,
 )
 from py_code_mode.artifacts.file import FileArtifactStore
 from py_code_mode.artifacts.redis import RedisArtifactStore
 
 __all__ = [
+    "ARTIFACT_CHUNK_SIZE",
+    "COMPRESSION_THRESHOLD",
     "Artifact",
+    "ArtifactCodec",
     "ArtifactStoreProtocol",
+    "ArtifactWriter",
+    "DecompressingReader",
     "FileArtifactStore",
     "RedisArtifactStore",
+    "StreamingArtifactStore",
+    "compress",
+    "decompress",
+    "map_file",
+    "npy_view",
+    "open_artifact",
+    "view_artifact",
 ]
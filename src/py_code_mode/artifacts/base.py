@@ -2,9 +2,36 @@
 
 from __future__ import annotations
 
+import abc
+import gzip
+import io
+import json
+import logging
+import math
+import mmap
+import os
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any, Protocol, runtime_checkable
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO, Literal, Protocol, runtime_checkable
+
+import numpy as np
+
+try:
+    import zstandard  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# Size of the pieces streamed artifacts are written, stored and sent in
+ARTIFACT_CHUNK_SIZE = 1024 * 1024
+
+# Payloads smaller than this gain too little from compression to pay for it
+COMPRESSION_THRESHOLD = 1024
+
+ArtifactCodec = Literal["zstd", "gzip"]
 
 
 @dataclass
@@ -18,6 +45,277 @@ class Artifact:
     created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
 
+class ArtifactWriter(io.BufferedIOBase):
+    """Write-only stream returned by open(name, "wb").
+
+    Writes are handed to the store in chunk_size pieces, so memory use is
+    bounded by the chunk size however large the artifact grows. close()
+    commits the artifact and sets .artifact; leaving a with-block through
+    an exception, or calling discard(), throws the data away instead.
+    Subclasses implement _write_chunk(), _commit() and _abort().
+    """
+
+    def __init__(self, chunk_size: int = ARTIFACT_CHUNK_SIZE) -> None:
+        super().__init__()
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self.artifact: Artifact | None = None
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        if self.closed:
+            raise ValueError("write to closed artifact stream")
+        view = memoryview(data).cast("B")
+        size = view.nbytes
+        if self._buffer:
+            take = self._chunk_size - len(self._buffer)
+            self._buffer += view[:take]
+            view = view[take:]
+            if len(self._buffer) < self._chunk_size:
+                return size
+            self._write_chunk(self._buffer)
+            self._buffer = bytearray()
+        # Whole chunks go straight from the caller's buffer
+        while view.nbytes >= self._chunk_size:
+            self._write_chunk(view[: self._chunk_size])
+            view = view[self._chunk_size :]
+        self._buffer += view
+        return size
+
+    def close(self) -> None:
+        """Write any buffered data and commit the artifact."""
+        if self.closed:
+            return
+        try:
+            if self._buffer:
+                self._write_chunk(self._buffer)
+                self._buffer = bytearray()
+            self.artifact = self._commit()
+        except BaseException:
+            self.discard()
+            raise
+        super().close()
+
+    def discard(self) -> None:
+        """Close without committing; nothing written becomes visible."""
+        if self.closed:
+            return
+        self._buffer = bytearray()
+        try:
+            self._abort()
+        finally:
+            super().close()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    @abc.abstractmethod
+    def _write_chunk(self, chunk: bytes | bytearray | memoryview) -> None:
+        """Store one chunk; chunk may be reused by the caller after this returns."""
+
+    @abc.abstractmethod
+    def _commit(self) -> Artifact:
+        """Make the written chunks visible as the artifact and return its metadata."""
+
+    @abc.abstractmethod
+    def _abort(self) -> None:
+        """Throw away everything written so far."""
+
+
+def resolve_codec(codec: str | None) -> ArtifactCodec | None:
+    """Validate a store's compression setting.
+
+    "zstd" needs the zstandard package (the zstd extra); without it
+    artifacts are gzipped instead.
+
+    Raises:
+        ValueError: If codec is not "zstd", "gzip" or None.
+    """
+    if codec is None:
+        return None
+    if codec == "gzip":
+        return "gzip"
+    if codec != "zstd":
+        raise ValueError(f"compression must be 'zstd', 'gzip' or None, got {codec!r}")
+    if zstandard is None:
+        logger.warning("zstandard is not installed; compressing artifacts with gzip")
+        return "gzip"
+    return "zstd"
+
+
+def compress(
+    payload: str | bytes, codec: ArtifactCodec | None, threshold: int
+) -> tuple[str | bytes, str | None]:
+    """Compress a serialized artifact if it is worth it.
+
+    Strings are compressed as UTF-8, and threshold applies to their
+    encoded size.
+
+    Returns:
+        The compressed bytes and the codec to record in the "_codec"
+        metadata field, or (payload, None) if the payload is below
+        threshold or didn't shrink.
+    """
+    if codec is None:
+        return payload, None
+    raw = payload.encode() if isinstance(payload, str) else payload
+    if len(raw) < threshold:
+        return payload, None
+    if codec == "zstd":
+        packed = zstandard.ZstdCompressor(level=3).compress(raw)
+    else:
+        packed = gzip.compress(raw, compresslevel=6, mtime=0)
+    if len(packed) >= len(raw):
+        return payload, None
+    return packed, codec
+
+
+def decompress(data: bytes, codec: str | None) -> bytes:
+    """Reverse compress() given the codec recorded with the artifact.
+
+    Raises:
+        ValueError: If codec is unknown, or zstd and zstandard isn't installed.
+    """
+    if codec is None:
+        return data
+    if codec == "gzip":
+        return gzip.decompress(data)
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError("Artifact is zstd-compressed; install zstandard to read it")
+        content: bytes = zstandard.ZstdDecompressor().decompress(data)
+        return content
+    raise ValueError(f"Unknown artifact codec {codec!r}")
+
+
+class DecompressingReader(io.BufferedIOBase):
+    """Read-only stream that decompresses a stored artifact as it is read.
+
+    Memory use is bounded by the read size rather than the artifact size.
+    Seeking forward decompresses and discards up to the target; seeking
+    backward restarts decompression from the start of raw. The reader
+    owns raw and closes it, including when the codec is rejected.
+
+    Raises:
+        ValueError: If codec is unknown, or zstd and zstandard isn't installed.
+    """
+
+    def __init__(self, raw: BinaryIO, codec: str) -> None:
+        super().__init__()
+        if codec not in ("gzip", "zstd") or (codec == "zstd" and zstandard is None):
+            raw.close()
+            if codec == "zstd":
+                raise ValueError("Artifact is zstd-compressed; install zstandard to read it")
+            raise ValueError(f"Unknown artifact codec {codec!r}")
+        self._raw = raw
+        self._codec = codec
+        self._pos = 0
+        self._stream = self._start()
+
+    def _start(self) -> Any:
+        """Decompressing stream over raw from its first byte."""
+        self._raw.seek(0)
+        if self._codec == "gzip":
+            return gzip.GzipFile(fileobj=self._raw, mode="rb")
+        return zstandard.ZstdDecompressor().stream_reader(self._raw, closefd=False)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def read(self, size: int | None = -1) -> bytes:
+        if self.closed:
+            raise ValueError("I/O operation on closed artifact stream")
+        data: bytes = self._stream.read(-1 if size is None else size)
+        self._pos += len(data)
+        return data
+
+    def read1(self, size: int = -1) -> bytes:
+        return self.read(size)
+
+    def readinto(self, buffer: Any) -> int:
+        data = self.read(len(memoryview(buffer).cast("B")))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("Compressed artifacts can't seek from the end")
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        if offset < self._pos:
+            self._stream.close()
+            self._stream = self._start()
+            self._pos = 0
+        while self._pos < offset:
+            if not self.read(min(offset - self._pos, ARTIFACT_CHUNK_SIZE)):
+                break
+        return self._pos
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            self._stream.close()
+        finally:
+            self._raw.close()
+            super().close()
+
+
+def map_file(path: Path) -> memoryview:
+    """Read-only memoryview of a file, memory-mapped rather than read.
+
+    The mapping stays valid until the view and anything built on it are
+    released; pages come straight from the OS page cache.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(b"")
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def npy_view(buffer: Any) -> np.ndarray:
+    """Array over the bytes of a .npy file, sharing memory with buffer.
+
+    Only the header is parsed; the returned array is read-only if buffer is.
+
+    Raises:
+        ValueError: If buffer is not a .npy file or holds Python objects.
+    """
+    view = memoryview(buffer).cast("B")
+    if view.nbytes < 10 or view[:6].tobytes() != b"\x93NUMPY":
+        raise ValueError("Not a .npy file")
+    length_size = 2 if view[6] == 1 else 4
+    offset = 8 + length_size + int.from_bytes(view[8 : 8 + length_size], "little")
+    header = io.BytesIO(view[:offset].tobytes())
+    version = np.lib.format.read_magic(header)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(header)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(header)
+    if dtype.hasobject:
+        raise ValueError("Object arrays can't be viewed without unpickling")
+    array = np.frombuffer(view, dtype=dtype, count=math.prod(shape), offset=offset)
+    return array.reshape(shape, order="F" if fortran_order else "C")
+
+
 @runtime_checkable
 class ArtifactStoreProtocol(Protocol):
     """Protocol for artifact storage backends."""
@@ -56,3 +354,106 @@ class ArtifactStoreProtocol(Protocol):
     def delete(self, name: str) -> None:
         """Delete artifact."""
         ...
+
+
+@runtime_checkable
+class StreamingArtifactStore(ArtifactStoreProtocol, Protocol):
+    """Artifact store with native chunked streams and low-copy views.
+
+    FileArtifactStore and RedisArtifactStore implement this. Code that must
+    also accept plain ArtifactStoreProtocol stores goes through
+    open_artifact() and view_artifact(), which fall back to load()/save().
+    """
+
+    def open(
+        self,
+        name: str,
+        mode: str = "rb",
+        description: str = "",
+        metadata: dict[str, Any] | None = None,
+    ) -> io.BufferedIOBase:
+        """Open an artifact as a binary stream, "rb" to read or "wb" to write.
+
+        Streams move data in bounded chunks instead of whole payloads. A
+        "wb" stream returns an ArtifactWriter, committed on close.
+        """
+        ...
+
+    def view(self, name: str) -> memoryview | np.ndarray:
+        """Read-only view of an artifact's bytes, copied as little as possible.
+
+        .npy artifacts come back as arrays over the same memory.
+        """
+        ...
+
+
+class _SavingArtifactWriter(ArtifactWriter):
+    """ArtifactWriter for stores without open(): collects chunks, then save()s them."""
+
+    def __init__(
+        self,
+        store: ArtifactStoreProtocol,
+        name: str,
+        description: str,
+        metadata: dict[str, Any] | None,
+    ) -> None:
+        super().__init__()
+        self._store = store
+        self._name = name
+        self._description = description
+        self._metadata = metadata
+        self._data = bytearray()
+
+    def _write_chunk(self, chunk: bytes | bytearray | memoryview) -> None:
+        self._data += chunk
+
+    def _commit(self) -> Artifact:
+        return self._store.save(self._name, bytes(self._data), self._description, self._metadata)
+
+    def _abort(self) -> None:
+        self._data = bytearray()
+
+
+def _loaded_bytes(store: ArtifactStoreProtocol, name: str) -> bytes:
+    """An artifact's content as bytes, from load(); JSON values are re-encoded."""
+    content = store.load(name)
+    if isinstance(content, bytes):
+        return content
+    if isinstance(content, str):
+        return content.encode()
+    return json.dumps(content, separators=(",", ":")).encode()
+
+
+def open_artifact(
+    store: ArtifactStoreProtocol,
+    name: str,
+    mode: str = "rb",
+    description: str = "",
+    metadata: dict[str, Any] | None = None,
+) -> io.BufferedIOBase:
+    """store.open(), or an equivalent stream built on load()/save().
+
+    Stores that only implement ArtifactStoreProtocol get a reader over the
+    whole loaded payload and a writer that saves on close, so streaming
+    works everywhere but only StreamingArtifactStore bounds memory.
+
+    Raises:
+        ValueError: If mode is unsupported.
+    """
+    if isinstance(store, StreamingArtifactStore):
+        return store.open(name, mode, description, metadata)
+    if mode == "wb":
+        return _SavingArtifactWriter(store, name, description, metadata)
+    if mode != "rb":
+        raise ValueError(f"Unsupported artifact mode {mode!r}; use 'rb' or 'wb'")
+    return io.BytesIO(_loaded_bytes(store, name))
+
+
+def view_artifact(store: ArtifactStoreProtocol, name: str) -> memoryview | np.ndarray:
+    """store.view(), or a view over the loaded payload for other stores."""
+    if isinstance(store, StreamingArtifactStore):
+        return store.view(name)
+    content = _loaded_bytes(store, name)
+    if name.endswith(".npy"):
+        return npy_view(content)
+    return memoryview(content)
@@ -2,33 +2,103 @@
 
 from __future__ import annotations
 
+import hashlib
+import io
 import json
+import logging
+import os
+import tempfile
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
-
-from py_code_mode.artifacts.base import Artifact, ArtifactStoreProtocol
+from typing import TYPE_CHECKING, Any
+
+import filelock
+import numpy as np
+
+from py_code_mode.artifacts.base import (
+    ARTIFACT_CHUNK_SIZE,
+    COMPRESSION_THRESHOLD,
+    Artifact,
+    ArtifactCodec,
+    ArtifactWriter,
+    DecompressingReader,
+    StreamingArtifactStore,
+    compress,
+    decompress,
+    map_file,
+    npy_view,
+    resolve_codec,
+)
 from py_code_mode.errors import ArtifactNotFoundError
 
+logger = logging.getLogger(__name__)
+
+# Never compact journals shorter than this, however many entries are dead
+_COMPACT_MIN_LINES = 1024
+
 
 class FileArtifactStore:
     """File-based artifact storage with metadata index.
 
     Artifacts are files on disk with an accompanying metadata index.
     Standard file I/O still works via the .path property.
+
+    The index is an append-only journal (.artifacts.jsonl) with one
+    {"op": "put", "name", "entry"} or {"op": "delete", "name"} line per
+    change, so a save costs O(1) however many artifacts exist. Writers
+    append under a file lock, which makes stores in several processes safe
+    to share; every read first tails lines appended since the last one.
+    The journal is compacted to one line per live artifact once it grows to
+    twice that. A legacy .artifacts.json index is migrated on first open.
+
+    With compression set, save() compresses payloads of at least
+    compression_threshold bytes and records the codec in the "_codec"
+    metadata field; load(), open() and view() decompress transparently.
+    Such files are compressed on disk, so Artifact.path no longer gives
+    their plain content.
+
+    With content_addressed set, each distinct payload is stored once as
+    .blobs/<sha256[:2]>/<sha256[2:]> and index entries name their blob in
+    the "_blob" metadata field. Saving a payload whose blob exists writes
+    nothing but the index line. A blob is deleted when the last artifact
+    referencing it is deleted or overwritten; reference counts come from
+    the index itself. Blobs are shared, so never modify Artifact.path of a
+    content-addressed artifact in place.
     """
 
-    INDEX_FILE = ".artifacts.json"
+    INDEX_FILE = ".artifacts.jsonl"
+    LEGACY_INDEX_FILE = ".artifacts.json"
+    LOCK_FILE = ".artifacts.lock"
+    BLOB_DIR = ".blobs"
 
-    def __init__(self, path: Path | str) -> None:
+    def __init__(
+        self,
+        path: Path | str,
+        compression: ArtifactCodec | None = None,
+        compression_threshold: int = COMPRESSION_THRESHOLD,
+        content_addressed: bool = False,
+    ) -> None:
         """Initialize store at given directory.
 
         Args:
             path: Directory for artifact storage. Created if not exists.
+            compression: "zstd" or "gzip" to compress saved artifacts, None
+                to store them as-is. "zstd" falls back to gzip if the
+                zstandard package is missing.
+            compression_threshold: Smallest payload, in bytes, to compress.
+            content_addressed: Store payloads once per SHA-256 under .blobs/
+                instead of once per name.
         """
+        self._compression = resolve_codec(compression)
+        self._compression_threshold = compression_threshold
+        self._content_addressed = content_addressed
         self._path = Path(path) if isinstance(path, str) else path
         self._path.mkdir(parents=True, exist_ok=True)
-        self._index: dict[str, dict[str, Any]] = self._load_index()
+        self._root = self._path.resolve()
+        self._lock = filelock.FileLock(str(self._path / self.LOCK_FILE))
+        self._reset()
+        if (self._path / self.LEGACY_INDEX_FILE).exists():
+            self._migrate_legacy_index()
 
     def _safe_path(self, name: str) -> Path:
         """Resolve path and verify it's contained within storage directory.
@@ -43,10 +113,22 @@ class FileArtifactStore:
             ValueError: If path would escape storage directory.
         """
         resolved = (self._path / name).resolve()
-        if not resolved.is_relative_to(self._path.resolve()):
+        if not resolved.is_relative_to(self._root):
             raise ValueError(f"Path traversal attempt detected: {name!r}")
+        if resolved.is_relative_to(self._root / self.BLOB_DIR):
+            raise ValueError(f"Artifact names can't point into {self.BLOB_DIR}: {name!r}")
         return resolved
 
+    def _blob_path(self, digest: str) -> Path:
+        """Path of the content-addressed blob with this SHA-256 hex digest."""
+        return self._path / self.BLOB_DIR / digest[:2] / digest[2:]
+
+    def _artifact_path(self, name: str) -> Path:
+        """Where an artifact's data lives: its blob if it has one, else its name."""
+        file_path = self._safe_path(name)
+        blob = self._index_metadata(name).get("_blob")
+        return self._blob_path(blob) if isinstance(blob, str) else file_path
+
     @property
     def path(self) -> str:
         """Base path for raw file access."""
@@ -57,17 +139,122 @@ class FileArtifactStore:
         """Base path as Path object for file operations."""
         return self._path
 
-    def _load_index(self) -> dict[str, dict[str, Any]]:
-        """Load index from disk."""
-        index_path = self._path / self.INDEX_FILE
-        if index_path.exists():
-            return json.loads(index_path.read_text())
-        return {}
+    def _reset(self) -> None:
+        """Forget the index read so far; the next _refresh() starts over."""
+        self._index: dict[str, dict[str, Any]] = {}
+        self._refcounts: dict[str, int] = {}
+        self._journal_lines = 0
+        self._offset = 0
+        self._inode: int | None = None
+
+    def _refresh(self) -> None:
+        """Apply journal lines appended, by any process, since the last call.
+
+        Starts over when the journal was replaced (by compaction) or removed.
+        """
+        journal_path = self._path / self.INDEX_FILE
+        try:
+            with open(journal_path, "rb") as f:
+                st = os.fstat(f.fileno())
+                if st.st_ino != self._inode or st.st_size < self._offset:
+                    self._reset()
+                    self._inode = st.st_ino
+                if st.st_size == self._offset:
+                    return
+                f.seek(self._offset)
+                data = f.read(st.st_size - self._offset)
+        except FileNotFoundError:
+            if self._inode is not None:
+                self._reset()
+            return
+
+        # Only consume complete lines; a writer may be mid-append
+        complete = data[: data.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            self._apply(line)
+        self._offset += len(complete)
+
+    def _apply(self, line: bytes) -> None:
+        """Apply one journal line to the in-memory index."""
+        self._journal_lines += 1
+        try:
+            record = json.loads(line)
+            name = record["name"]
+            if record["op"] == "put":
+                old = self._index.get(name)
+                self._index[name] = record["entry"]
+                self._count_ref(record["entry"], 1)
+            else:
+                old = self._index.pop(name, None)
+            self._count_ref(old, -1)
+        except (ValueError, KeyError, TypeError, AttributeError):
+            logger.warning(f"Skipping corrupt line in artifact index {self._path}")
+
+    def _count_ref(self, entry: dict[str, Any] | None, delta: int) -> None:
+        """Adjust the reference count of the blob an index entry points to."""
+        blob = _blob_of(entry)
+        if blob is None:
+            return
+        count = self._refcounts.get(blob, 0) + delta
+        if count > 0:
+            self._refcounts[blob] = count
+        else:
+            self._refcounts.pop(blob, None)
+
+    def _append(self, record: dict[str, Any]) -> None:
+        """Append one record to the journal, compacting it if mostly dead.
 
-    def _save_index(self) -> None:
-        """Persist index to disk."""
-        index_path = self._path / self.INDEX_FILE
-        index_path.write_text(json.dumps(self._index, indent=2, default=str))
+        A blob the record leaves unreferenced is deleted.
+        """
+        payload = json.dumps(record, separators=(",", ":"), default=str).encode() + b"\n"
+        with self._lock:
+            self._refresh()
+            replaced_blob = _blob_of(self._index.get(record["name"]))
+            with open(self._path / self.INDEX_FILE, "ab") as f:
+                # Bytes past the last complete line are a writer that died
+                # mid-append; drop them so our line doesn't merge with theirs
+                if f.tell() > self._offset and os.fstat(f.fileno()).st_ino == self._inode:
+                    f.truncate(self._offset)
+                f.write(payload)
+            self._refresh()
+            if replaced_blob is not None and replaced_blob not in self._refcounts:
+                self._blob_path(replaced_blob).unlink(missing_ok=True)
+            if self._journal_lines > max(_COMPACT_MIN_LINES, 2 * len(self._index)):
+                self._write_journal(self._index)
+
+    def _write_journal(self, index: dict[str, dict[str, Any]]) -> None:
+        """Atomically replace the journal with one put line per entry.
+
+        Caller must hold the lock.
+        """
+        fd, tmp_name = tempfile.mkstemp(dir=self._path, prefix=".artifacts-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for name, entry in index.items():
+                    record = {"op": "put", "name": name, "entry": entry}
+                    f.write(json.dumps(record, separators=(",", ":"), default=str).encode())
+                    f.write(b"\n")
+            os.replace(tmp_name, self._path / self.INDEX_FILE)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._refresh()
+
+    def _migrate_legacy_index(self) -> None:
+        """Convert a .artifacts.json index written by older versions."""
+        legacy_path = self._path / self.LEGACY_INDEX_FILE
+        with self._lock:
+            if not legacy_path.exists():
+                return
+            self._refresh()
+            if self._inode is None:
+                try:
+                    legacy = json.loads(legacy_path.read_text())
+                except ValueError:
+                    logger.warning(f"Ignoring corrupt legacy artifact index {legacy_path}")
+                    legacy = {}
+                self._write_journal(legacy)
+            legacy_path.unlink()
 
     def save(
         self,
@@ -92,29 +279,108 @@ class FileArtifactStore:
         """
         file_path = self._safe_path(name)
 
-        # Create subdirectories if needed
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write data and track type
+        # Serialize data and track type
         data_type = "bytes" if isinstance(data, bytes) else "text"
+        payload: str | bytes
         if isinstance(data, bytes):
-            file_path.write_bytes(data)
+            payload = data
         elif isinstance(data, (dict, list)):
-            file_path.write_text(json.dumps(data, indent=2))
+            payload = json.dumps(data, separators=(",", ":"))
             data_type = "json"
         else:
-            file_path.write_text(str(data))
+            payload = str(data)
+
+        payload, codec = compress(payload, self._compression, self._compression_threshold)
+        if self._content_addressed:
+            content = payload.encode() if isinstance(payload, str) else payload
+            digest = hashlib.sha256(content).hexdigest()
+            blob_path = self._blob_path(digest)
+            # Write outside the lock; _store_blob re-checks under it
+            tmp_path = None if blob_path.exists() else self._write_temp(blob_path.parent, content)
+            return self._store_blob(
+                name, file_path, digest, tmp_path, content, data_type, description, metadata, codec
+            )
+
+        # Create subdirectories if needed
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(payload, bytes):
+            file_path.write_bytes(payload)
+        else:
+            file_path.write_text(payload)
+        return self._record(name, file_path, data_type, description, metadata, codec)
+
+    def _write_temp(self, directory: Path, content: bytes) -> Path:
+        """Write content to a new temporary file in directory."""
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".blob-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return Path(tmp_name)
+
+    def _store_blob(
+        self,
+        name: str,
+        file_path: Path,
+        digest: str,
+        tmp_path: Path | None,
+        content: bytes | None,
+        data_type: str,
+        description: str,
+        metadata: dict[str, Any] | None,
+        codec: str | None = None,
+    ) -> Artifact:
+        """Index name as a reference to blob digest, moving tmp_path into place.
 
-        # Update index
+        Under the lock the blob can't be collected between the existence
+        check and the index line that references it. tmp_path is dropped if
+        the blob already exists; if it's None and the blob has been
+        collected meanwhile, content is written instead.
+        """
+        blob_path = self._blob_path(digest)
+        with self._lock:
+            self._refresh()
+            if blob_path.exists():
+                if tmp_path is not None:
+                    tmp_path.unlink(missing_ok=True)
+            else:
+                if tmp_path is None:
+                    assert content is not None
+                    tmp_path = self._write_temp(blob_path.parent, content)
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp_path, blob_path)
+            # A plain file left by a save without content addressing is stale now
+            if file_path.is_file():
+                file_path.unlink()
+            return self._record(name, blob_path, data_type, description, metadata, codec, digest)
+
+    def _record(
+        self,
+        name: str,
+        file_path: Path,
+        data_type: str,
+        description: str,
+        metadata: dict[str, Any] | None,
+        codec: str | None = None,
+        blob: str | None = None,
+    ) -> Artifact:
+        """Add the index entry for an artifact whose file has been written."""
         now = datetime.now(UTC)
         index_metadata = metadata.copy() if metadata else {}
         index_metadata["_data_type"] = data_type
-        self._index[name] = {
+        if codec is not None:
+            index_metadata["_codec"] = codec
+        if blob is not None:
+            index_metadata["_blob"] = blob
+        entry = {
             "description": description,
             "created_at": now.isoformat(),
             "metadata": index_metadata,
         }
-        self._save_index()
+        self._append({"op": "put", "name": name, "entry": entry})
 
         return Artifact(
             name=name,
@@ -124,6 +390,49 @@ class FileArtifactStore:
             created_at=now,
         )
 
+    def open(
+        self,
+        name: str,
+        mode: str = "rb",
+        description: str = "",
+        metadata: dict[str, Any] | None = None,
+    ) -> io.BufferedIOBase:
+        """Open an artifact as a binary stream.
+
+        A "wb" stream writes to a temporary file that replaces the artifact
+        and is indexed when the stream is closed, so readers never see a
+        partial artifact. An "rb" stream of a compressed artifact
+        decompresses as it is read.
+
+        Args:
+            name: Artifact name (can include subdirectories like "scans/nmap.json").
+            mode: "rb" to read or "wb" to write.
+            description: Description recorded when a "wb" stream is committed.
+            metadata: Optional additional metadata for a "wb" stream.
+
+        Returns:
+            A file object for "rb", an ArtifactWriter for "wb".
+
+        Raises:
+            ArtifactNotFoundError: If reading an artifact that doesn't exist.
+            ValueError: If mode is unsupported or name contains path traversal sequences.
+        """
+        if mode == "rb":
+            try:
+                f = open(self._artifact_path(name), "rb")
+            except FileNotFoundError:
+                raise ArtifactNotFoundError(name) from None
+            codec = self._codec(name)
+            if codec is None:
+                return f
+            return DecompressingReader(f, codec)
+        if mode == "wb":
+            file_path = self._safe_path(name)
+            if not self._content_addressed:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+            return _FileArtifactWriter(self, name, file_path, description, metadata)
+        raise ValueError(f"Unsupported artifact mode {mode!r}; use 'rb' or 'wb'")
+
     def load(self, name: str) -> Any:
         """Load artifact content.
 
@@ -137,21 +446,24 @@ class FileArtifactStore:
             ArtifactNotFoundError: If artifact doesn't exist.
             ValueError: If name contains path traversal sequences.
         """
-        file_path = self._safe_path(name)
+        file_path = self._artifact_path(name)
 
         if not file_path.exists():
             raise ArtifactNotFoundError(name)
 
-        # Check metadata for data type
-        data_type = None
-        if name in self._index:
-            data_type = self._index[name].get("metadata", {}).get("_data_type")
+        # Check metadata for data type and codec
+        index_metadata = self._index_metadata(name)
+        data_type = index_metadata.get("_data_type")
+        raw = decompress(file_path.read_bytes(), index_metadata.get("_codec"))
 
         # Load based on stored type
         if data_type == "bytes":
-            return file_path.read_bytes()
+            return raw
         elif data_type == "json" or name.endswith(".json"):
-            content = file_path.read_text()
+            try:
+                content = raw.decode()
+            except UnicodeDecodeError:
+                return raw
             try:
                 return json.loads(content)
             except json.JSONDecodeError:
@@ -159,9 +471,51 @@ class FileArtifactStore:
         else:
             # For text or unknown, try text first, fall back to bytes
             try:
-                return file_path.read_text()
+                return raw.decode()
             except UnicodeDecodeError:
-                return file_path.read_bytes()
+                return raw
+
+    def _index_metadata(self, name: str) -> dict[str, Any]:
+        """Metadata of an artifact's index entry, or {} if it has none."""
+        self._refresh()
+        metadata = self._index.get(name, {}).get("metadata", {})
+        return metadata if isinstance(metadata, dict) else {}
+
+    def _codec(self, name: str) -> str | None:
+        """Codec an artifact was compressed with, or None."""
+        return self._index_metadata(name).get("_codec")
+
+    def view(self, name: str) -> memoryview | np.ndarray:
+        """Memory-map an artifact instead of reading it.
+
+        Repeated views of a large artifact cost no copies; pages come from
+        the OS page cache and are shared with every other process mapping
+        the same file. Compressed artifacts can't be mapped and are
+        decompressed into memory instead.
+
+        Args:
+            name: Artifact name.
+
+        Returns:
+            A read-only np.memmap for .npy artifacts, otherwise a read-only
+            memoryview of the file.
+
+        Raises:
+            ArtifactNotFoundError: If artifact doesn't exist.
+            ValueError: If name contains path traversal sequences.
+        """
+        file_path = self._artifact_path(name)
+        if not file_path.is_file():
+            raise ArtifactNotFoundError(name)
+        codec = self._codec(name)
+        if codec is not None:
+            # Compressed on disk: the decompressed copy is all there is to view
+            content = decompress(file_path.read_bytes(), codec)
+            return npy_view(content) if name.endswith(".npy") else memoryview(content)
+        if name.endswith(".npy"):
+            array: np.ndarray = np.load(file_path, mmap_mode="r", allow_pickle=False)
+            return array
+        return map_file(file_path)
 
     def get(self, name: str) -> Artifact | None:
         """Get artifact metadata by name.
@@ -178,13 +532,15 @@ class FileArtifactStore:
         # Validate path even for metadata lookups to prevent index poisoning
         file_path = self._safe_path(name)
 
+        self._refresh()
         if name not in self._index:
             return None
 
         entry = self._index[name]
+        blob = _blob_of(entry)
         return Artifact(
             name=name,
-            path=str(file_path),
+            path=str(self._blob_path(blob) if blob else file_path),
             description=entry["description"],
             metadata=entry.get("metadata", {}),
             created_at=datetime.fromisoformat(entry["created_at"]),
@@ -200,6 +556,7 @@ class FileArtifactStore:
             Only returns artifacts with valid paths. Any index entries with
             path traversal attempts are silently skipped.
         """
+        self._refresh()
         artifacts = []
         for name, entry in self._index.items():
             try:
@@ -207,10 +564,11 @@ class FileArtifactStore:
             except ValueError:
                 # Skip any corrupted/malicious index entries
                 continue
+            blob = _blob_of(entry)
             artifacts.append(
                 Artifact(
                     name=name,
-                    path=str(file_path),
+                    path=str(self._blob_path(blob) if blob else file_path),
                     description=entry["description"],
                     metadata=entry.get("metadata", {}),
                     created_at=datetime.fromisoformat(entry["created_at"]),
@@ -231,6 +589,7 @@ class FileArtifactStore:
             ValueError: If name contains path traversal sequences.
         """
         self._safe_path(name)  # Validate before checking index
+        self._refresh()
         return name in self._index
 
     def delete(self, name: str) -> None:
@@ -246,9 +605,9 @@ class FileArtifactStore:
         if file_path.exists():
             file_path.unlink()
 
+        self._refresh()
         if name in self._index:
-            del self._index[name]
-            self._save_index()
+            self._append({"op": "delete", "name": name})
 
     def register(
         self,
@@ -275,12 +634,12 @@ class FileArtifactStore:
             raise ArtifactNotFoundError(name)
 
         now = datetime.now(UTC)
-        self._index[name] = {
+        entry = {
             "description": description,
             "created_at": now.isoformat(),
             "metadata": metadata or {},
         }
-        self._save_index()
+        self._append({"op": "put", "name": name, "entry": entry})
 
         return Artifact(
             name=name,
@@ -291,5 +650,73 @@ class FileArtifactStore:
         )
 
 
-# Protocol compliance marker
-_: ArtifactStoreProtocol = FileArtifactStore(Path("/tmp"))  # type: ignore[arg-type]
+def _blob_of(entry: dict[str, Any] | None) -> str | None:
+    """Digest of the blob an index entry references, if any."""
+    if entry is None:
+        return None
+    blob = entry.get("metadata", {}).get("_blob")
+    return blob if isinstance(blob, str) else None
+
+
+class _FileArtifactWriter(ArtifactWriter):
+    """ArtifactWriter appending chunks to a temporary file next to the artifact.
+
+    For content-addressed stores the file goes next to the blobs instead,
+    and is hashed as it is written.
+    """
+
+    def __init__(
+        self,
+        store: FileArtifactStore,
+        name: str,
+        file_path: Path,
+        description: str,
+        metadata: dict[str, Any] | None,
+    ) -> None:
+        super().__init__(ARTIFACT_CHUNK_SIZE)
+        self._store = store
+        self._name = name
+        self._file_path = file_path
+        self._description = description
+        self._metadata = metadata
+        self._hash = hashlib.sha256() if store._content_addressed else None
+        tmp_dir = file_path.parent
+        if self._hash is not None:
+            tmp_dir = store.path_obj / store.BLOB_DIR
+            tmp_dir.mkdir(exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=tmp_dir, prefix=f".{file_path.name}-", suffix=".tmp")
+        self._tmp_path = Path(tmp_name)
+        self._file = os.fdopen(fd, "wb")
+
+    def _write_chunk(self, chunk: bytes | bytearray | memoryview) -> None:
+        self._file.write(chunk)
+        if self._hash is not None:
+            self._hash.update(chunk)
+
+    def _commit(self) -> Artifact:
+        self._file.close()
+        if self._hash is not None:
+            return self._store._store_blob(
+                self._name,
+                self._file_path,
+                self._hash.hexdigest(),
+                self._tmp_path,
+                None,
+                "bytes",
+                self._description,
+                self._metadata,
+            )
+        os.replace(self._tmp_path, self._file_path)
+        return self._store._record(
+            self._name, self._file_path, "bytes", self._description, self._metadata
+        )
+
+    def _abort(self) -> None:
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
+# Protocol compliance marker, checked statically only: constructing a store
+# opens (and may migrate) the journal under its directory
+if TYPE_CHECKING:
+    _: StreamingArtifactStore = FileArtifactStore(Path("/tmp"))
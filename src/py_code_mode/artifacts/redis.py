@@ -2,16 +2,67 @@
 
 from __future__ import annotations
 
+import hashlib
+import io
 import json
+import uuid
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
-from py_code_mode.artifacts.base import Artifact
+import numpy as np
+
+from py_code_mode.artifacts.base import (
+    ARTIFACT_CHUNK_SIZE,
+    COMPRESSION_THRESHOLD,
+    Artifact,
+    ArtifactCodec,
+    ArtifactWriter,
+    DecompressingReader,
+    compress,
+    decompress,
+    npy_view,
+    resolve_codec,
+)
 from py_code_mode.errors import ArtifactNotFoundError
 
 if TYPE_CHECKING:
     from redis import Redis
 
+# Uploads left behind by a writer that never closed expire after this long
+_UPLOAD_TTL_SECONDS = 24 * 60 * 60
+
+# Sets (or, given an empty entry, removes) an index entry and deletes any plain
+# value under the name, then drops the reference the old entry held on its
+# blob, deleting the blob with its last reference. Reading the old entry in
+# the same script means concurrent saves and deletes of a name each release
+# exactly the reference they replaced, and a concurrent save can't take a
+# reference to a blob being deleted.
+_SWAP_ENTRY_SCRIPT = """
+local old = redis.call("HGET", KEYS[1], ARGV[1])
+if ARGV[2] == "" then
+    redis.call("HDEL", KEYS[1], ARGV[1])
+else
+    redis.call("HSET", KEYS[1], ARGV[1], ARGV[2])
+end
+redis.call("DEL", KEYS[2])
+if not old then
+    return 0
+end
+local ok, entry = pcall(cjson.decode, old)
+if not ok or type(entry) ~= "table" or type(entry.metadata) ~= "table" then
+    return 0
+end
+local blob = entry.metadata._blob
+if type(blob) ~= "string" then
+    return 0
+end
+if redis.call("HINCRBY", KEYS[3], blob, -1) <= 0 then
+    redis.call("HDEL", KEYS[3], blob)
+    redis.call("DEL", ARGV[3] .. blob)
+end
+return 1
+"""
+
 
 class RedisArtifactStore:
     """Redis-based artifact storage.
@@ -19,19 +70,63 @@ class RedisArtifactStore:
     Uses Redis keys for data storage and a hash for metadata index.
     Key format: {prefix}:{name}
     Index key: {prefix}:__index__
+
+    Artifacts written through open(name, "wb") are stored as a list of
+    chunk_size strings under the same key, with the chunk size recorded in
+    the index entry, so neither writing nor reading them needs the whole
+    payload in memory.
+
+    With compression set, save() compresses payloads of at least
+    compression_threshold bytes and records the codec in the "_codec"
+    metadata field, cutting both Redis memory and network transfer;
+    load(), open() and view() decompress transparently.
+
+    With content_addressed set, each distinct payload is stored once under
+    {prefix}:__blob__:{sha256} and index entries name their blob in the
+    "_blob" metadata field. Reference counts live in the {prefix}:__refs__
+    hash; saving a payload whose blob exists sends only the index entry,
+    and deleting or overwriting the last reference deletes the blob.
+    Streamed artifacts are stored as chunk lists, so their blobs are keyed
+    {sha256}-{chunk_size} and only shared with identical streams. Stores
+    sharing a prefix should agree on content_addressed: one without it
+    doesn't look up what it overwrites, so a blob it replaces keeps its
+    reference.
     """
 
     INDEX_SUFFIX = ":__index__"
+    UPLOAD_INFIX = ":__upload__:"
+    BLOB_INFIX = ":__blob__:"
+    REFS_SUFFIX = ":__refs__"
 
-    def __init__(self, redis: Redis, prefix: str = "artifacts") -> None:
+    def __init__(
+        self,
+        redis: Redis,
+        prefix: str = "artifacts",
+        chunk_size: int = ARTIFACT_CHUNK_SIZE,
+        compression: ArtifactCodec | None = None,
+        compression_threshold: int = COMPRESSION_THRESHOLD,
+        content_addressed: bool = False,
+    ) -> None:
         """Initialize store with Redis client.
 
         Args:
             redis: Redis client instance.
             prefix: Key prefix for all artifacts. Defaults to 'artifacts'.
+            chunk_size: Size of each Redis value for streamed artifacts.
+            compression: "zstd" or "gzip" to compress saved artifacts, None
+                to store them as-is. "zstd" falls back to gzip if the
+                zstandard package is missing.
+            compression_threshold: Smallest payload, in bytes, to compress.
+            content_addressed: Store payloads once per SHA-256 instead of
+                once per name.
         """
         self._redis = redis
         self._prefix = prefix
+        self._chunk_size = chunk_size
+        self._compression = resolve_codec(compression)
+        self._compression_threshold = compression_threshold
+        self._content_addressed = content_addressed
+        self._swap_script: Any = None
 
     @property
     def path(self) -> str:
@@ -46,6 +141,41 @@ class RedisArtifactStore:
         """Build index hash key."""
         return f"{self._prefix}{self.INDEX_SUFFIX}"
 
+    def _blob_key(self, blob: str) -> str:
+        """Build the key of a content-addressed blob."""
+        return f"{self._prefix}{self.BLOB_INFIX}{blob}"
+
+    def _value_key(self, name: str, index_metadata: dict[str, Any]) -> str:
+        """Key holding an artifact's data: its blob if it has one."""
+        blob = index_metadata.get("_blob")
+        return self._blob_key(blob) if isinstance(blob, str) else self._data_key(name)
+
+    def _acquire_blob(self, blob: str) -> bool:
+        """Take a reference to a blob; returns whether it already holds data."""
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.hincrby(f"{self._prefix}{self.REFS_SUFFIX}", blob, 1)
+        pipe.exists(self._blob_key(blob))
+        _, found = pipe.execute()
+        return bool(found)
+
+    def _swap_index_entry(
+        self, name: str, index_entry: dict[str, Any] | None, pipe: Any = None
+    ) -> None:
+        """Index name as index_entry, or unindex it if None, in one script.
+
+        Also removes a plain value stored under name, and releases the
+        blob the old entry referenced. Commands already queued on pipe run
+        in the same transaction.
+        """
+        if self._swap_script is None:
+            self._swap_script = self._redis.register_script(_SWAP_ENTRY_SCRIPT)
+        keys = [self._index_key(), self._data_key(name), f"{self._prefix}{self.REFS_SUFFIX}"]
+        entry_json = "" if index_entry is None else json.dumps(index_entry)
+        args = [name, entry_json, f"{self._prefix}{self.BLOB_INFIX}"]
+        self._swap_script(keys=keys, args=args, client=pipe)
+        if pipe is not None:
+            pipe.execute()
+
     def save(
         self,
         name: str,
@@ -68,24 +198,39 @@ class RedisArtifactStore:
 
         # Serialize data and track type
         data_type = "bytes" if isinstance(data, bytes) else "text"
+        payload: str | bytes
         if isinstance(data, bytes):
-            self._redis.set(data_key, data)
+            payload = data
         elif isinstance(data, (dict, list)):
-            self._redis.set(data_key, json.dumps(data))
+            payload = json.dumps(data, separators=(",", ":"))
             data_type = "json"
         else:
-            self._redis.set(data_key, str(data))
+            payload = str(data)
+        payload, codec = compress(payload, self._compression, self._compression_threshold)
 
-        # Update index with data type in metadata
+        # Update index with data type and codec in metadata
         now = datetime.now(UTC)
         index_metadata = metadata.copy() if metadata else {}
         index_metadata["_data_type"] = data_type
+        if codec is not None:
+            index_metadata["_codec"] = codec
         index_entry = {
             "description": description,
             "created_at": now.isoformat(),
             "metadata": index_metadata,
         }
-        self._redis.hset(self._index_key(), name, json.dumps(index_entry))
+
+        if self._content_addressed:
+            content = payload.encode() if isinstance(payload, str) else payload
+            blob = hashlib.sha256(content).hexdigest()
+            index_metadata["_blob"] = blob
+            data_key = self._blob_key(blob)
+            if not self._acquire_blob(blob):
+                self._redis.set(data_key, content)
+            self._swap_index_entry(name, index_entry)
+        else:
+            self._redis.set(data_key, payload)
+            self._redis.hset(self._index_key(), name, json.dumps(index_entry))
 
         return Artifact(
             name=name,
@@ -107,21 +252,10 @@ class RedisArtifactStore:
         Raises:
             ArtifactNotFoundError: If artifact doesn't exist.
         """
-        data_key = self._data_key(name)
-        content = self._redis.get(data_key)
-
-        if content is None:
-            raise ArtifactNotFoundError(name)
-
         # Check metadata for data type
-        data_type = None
-        try:
-            entry_json = self._redis.hget(self._index_key(), name)
-            if entry_json and isinstance(entry_json, (str, bytes)):
-                entry = json.loads(entry_json)
-                data_type = entry.get("metadata", {}).get("_data_type")
-        except (json.JSONDecodeError, TypeError):
-            pass  # Use fallback logic below
+        index_metadata = self._index_metadata(name)
+        data_type = index_metadata.get("_data_type")
+        content = self._fetch(name, index_metadata)
 
         # Load based on stored type
         if data_type == "bytes":
@@ -137,6 +271,113 @@ class RedisArtifactStore:
                 return content.decode("utf-8")
             return content
 
+    def _fetch(self, name: str, index_metadata: dict[str, Any]) -> Any:
+        """Stored value of an artifact, chunks joined and compression undone."""
+        data_key = self._value_key(name, index_metadata)
+        content: Any
+        if "_chunk_size" in index_metadata:
+            chunks = self._redis.lrange(data_key, 0, -1)
+            content = b"".join(chunks) if chunks else None  # type: ignore[arg-type]
+        else:
+            content = self._redis.get(data_key)
+
+        if content is None:
+            raise ArtifactNotFoundError(name)
+        codec = index_metadata.get("_codec")
+        if codec is not None:
+            if isinstance(content, str):
+                content = content.encode()
+            return decompress(content, codec)
+        return content
+
+    def view(self, name: str) -> memoryview | np.ndarray:
+        """Read-only view of an artifact's stored bytes.
+
+        Redis values can't be memory-mapped, so this costs the one copy of
+        fetching (and, if compressed, decompressing) the value; .npy
+        artifacts become arrays over that buffer without a second copy.
+
+        Args:
+            name: Artifact name.
+
+        Returns:
+            An array for .npy artifacts, otherwise a memoryview.
+
+        Raises:
+            ArtifactNotFoundError: If artifact doesn't exist.
+        """
+        content = self._fetch(name, self._index_metadata(name))
+        if isinstance(content, str):
+            content = content.encode()
+        if name.endswith(".npy"):
+            return npy_view(content)
+        return memoryview(content)
+
+    def _index_metadata(self, name: str) -> dict[str, Any]:
+        """Metadata of an artifact's index entry, or {} if missing or unreadable."""
+        try:
+            entry_json = self._redis.hget(self._index_key(), name)
+            if entry_json and isinstance(entry_json, (str, bytes)):
+                metadata = json.loads(entry_json).get("metadata", {})
+                if isinstance(metadata, dict):
+                    return metadata
+        except (json.JSONDecodeError, TypeError, AttributeError):
+            pass  # Use fallback logic in the caller
+        return {}
+
+    def open(
+        self,
+        name: str,
+        mode: str = "rb",
+        description: str = "",
+        metadata: dict[str, Any] | None = None,
+    ) -> io.BufferedIOBase:
+        """Open an artifact as a binary stream.
+
+        A "wb" stream pushes chunks onto a temporary key that replaces the
+        artifact and is indexed atomically when the stream is closed. An
+        "rb" stream fetches one chunk (or byte range, for artifacts saved
+        with save()) per read, decompressing compressed values as it goes.
+
+        Args:
+            name: Artifact name.
+            mode: "rb" to read or "wb" to write.
+            description: Description recorded when a "wb" stream is committed.
+            metadata: Optional additional metadata for a "wb" stream.
+
+        Returns:
+            A buffered reader for "rb", an ArtifactWriter for "wb".
+
+        Raises:
+            ArtifactNotFoundError: If reading an artifact that doesn't exist.
+            ValueError: If mode is unsupported.
+        """
+        if mode == "wb":
+            return _RedisArtifactWriter(self, name, description, metadata)
+        if mode != "rb":
+            raise ValueError(f"Unsupported artifact mode {mode!r}; use 'rb' or 'wb'")
+
+        index_metadata = self._index_metadata(name)
+        data_key = self._value_key(name, index_metadata)
+        codec = index_metadata.get("_codec")
+        chunk_size = index_metadata.get("_chunk_size")
+        if chunk_size is not None:
+            size = index_metadata.get("_size", 0)
+            found = bool(self._redis.exists(data_key))
+        else:
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.exists(data_key)
+            pipe.strlen(data_key)
+            found, size = pipe.execute()
+        if not found:
+            raise ArtifactNotFoundError(name)
+        raw = _RedisArtifactReader(self._redis, data_key, int(size), chunk_size)
+        reader = io.BufferedReader(raw, buffer_size=chunk_size or self._chunk_size)
+        if codec is not None:
+            # Decompressed as the byte ranges of the stored value arrive
+            return DecompressingReader(reader, codec)
+        return reader
+
     def get(self, name: str) -> Artifact | None:
         """Get artifact metadata by name.
 
@@ -153,7 +394,7 @@ class RedisArtifactStore:
         entry = json.loads(entry_json)
         return Artifact(
             name=name,
-            path=self._data_key(name),
+            path=self._value_key(name, entry.get("metadata", {})),
             description=entry["description"],
             metadata=entry.get("metadata", {}),
             created_at=datetime.fromisoformat(entry["created_at"]),
@@ -170,12 +411,13 @@ class RedisArtifactStore:
             return []
 
         artifacts = []
-        for name, entry_json in index_data.items():
+        for raw_name, entry_json in index_data.items():
+            name = raw_name.decode() if isinstance(raw_name, bytes) else raw_name
             entry = json.loads(entry_json)
             artifacts.append(
                 Artifact(
                     name=name,
-                    path=self._data_key(name),
+                    path=self._value_key(name, entry.get("metadata", {})),
                     description=entry["description"],
                     metadata=entry.get("metadata", {}),
                     created_at=datetime.fromisoformat(entry["created_at"]),
@@ -197,10 +439,162 @@ class RedisArtifactStore:
     def delete(self, name: str) -> None:
         """Delete artifact and its index entry.
 
+        A content-addressed artifact drops its reference to its blob
+        instead, deleting the blob if no other artifact references it.
+
         Args:
             name: Artifact name.
         """
-        # Delete data
-        self._redis.delete(self._data_key(name))
-        # Remove from index
-        self._redis.hdel(self._index_key(), name)
+        self._swap_index_entry(name, None)
+
+
+class _RedisArtifactWriter(ArtifactWriter):
+    """ArtifactWriter pushing chunks onto a temporary Redis list."""
+
+    def __init__(
+        self,
+        store: RedisArtifactStore,
+        name: str,
+        description: str,
+        metadata: dict[str, Any] | None,
+    ) -> None:
+        super().__init__(store._chunk_size)
+        self._store = store
+        self._name = name
+        self._description = description
+        self._metadata = metadata
+        self._upload_key = f"{store._prefix}{store.UPLOAD_INFIX}{uuid.uuid4().hex}"
+        self._size = 0
+        self._hash = hashlib.sha256() if store._content_addressed else None
+
+    def _write_chunk(self, chunk: bytes | bytearray | memoryview) -> None:
+        pipe = self._store._redis.pipeline(transaction=False)
+        pipe.rpush(self._upload_key, bytes(chunk))
+        pipe.expire(self._upload_key, _UPLOAD_TTL_SECONDS)
+        pipe.execute()
+        self._size += len(chunk)
+        if self._hash is not None:
+            self._hash.update(chunk)
+
+    def _commit(self) -> Artifact:
+        store = self._store
+        data_key = store._data_key(self._name)
+        now = datetime.now(UTC)
+        index_metadata = self._metadata.copy() if self._metadata else {}
+        index_metadata["_data_type"] = "bytes"
+        if self._size:
+            index_metadata["_chunk_size"] = self._chunk_size
+            index_metadata["_size"] = self._size
+        index_entry = {
+            "description": self._description,
+            "created_at": now.isoformat(),
+            "metadata": index_metadata,
+        }
+
+        if self._hash is not None:
+            return self._commit_blob(index_entry, now)
+
+        # Swap the upload in and index it atomically
+        pipe = store._redis.pipeline(transaction=True)
+        if self._size:
+            pipe.rename(self._upload_key, data_key)
+            pipe.persist(data_key)
+        else:
+            pipe.set(data_key, b"")
+        pipe.hset(store._index_key(), self._name, json.dumps(index_entry))
+        pipe.execute()
+
+        return Artifact(
+            name=self._name,
+            path=data_key,
+            description=self._description,
+            metadata=self._metadata or {},
+            created_at=now,
+        )
+
+    def _commit_blob(self, index_entry: dict[str, Any], now: datetime) -> Artifact:
+        """Move the upload into its blob, or drop it if the blob exists."""
+        assert self._hash is not None
+        store = self._store
+        # Chunk lists are only interchangeable with the same chunk size
+        blob = self._hash.hexdigest()
+        if self._size:
+            blob = f"{blob}-{self._chunk_size}"
+        index_entry["metadata"]["_blob"] = blob
+        blob_key = store._blob_key(blob)
+
+        pipe = store._redis.pipeline(transaction=True)
+        if store._acquire_blob(blob):
+            pipe.delete(self._upload_key)
+        elif self._size:
+            pipe.rename(self._upload_key, blob_key)
+            pipe.persist(blob_key)
+        else:
+            pipe.set(blob_key, b"")
+        store._swap_index_entry(self._name, index_entry, pipe)
+
+        return Artifact(
+            name=self._name,
+            path=blob_key,
+            description=self._description,
+            metadata=self._metadata or {},
+            created_at=now,
+        )
+
+    def _abort(self) -> None:
+        self._store._redis.delete(self._upload_key)
+
+
+class _RedisArtifactReader(io.RawIOBase):
+    """Seekable raw stream over a stored artifact, one Redis call per read.
+
+    Chunked artifacts are read with LINDEX, plain string values with
+    GETRANGE; either way a read returns at most one chunk.
+    """
+
+    def __init__(self, redis: Redis, key: str, size: int, chunk_size: int | None) -> None:
+        super().__init__()
+        self._redis = redis
+        self._key = key
+        self._size = size
+        self._chunk_size = chunk_size
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._size
+        elif whence != io.SEEK_SET:
+            raise ValueError(f"Invalid whence: {whence}")
+        if offset < 0:
+            raise ValueError(f"Negative seek position {offset}")
+        self._pos = offset
+        return offset
+
+    def readinto(self, buffer: Any) -> int:
+        count = min(len(buffer), self._size - self._pos)
+        if count <= 0:
+            return 0
+        data: Any
+        if self._chunk_size is None:
+            count = min(count, ARTIFACT_CHUNK_SIZE)
+            data = self._redis.getrange(self._key, self._pos, self._pos + count - 1)
+        else:
+            index, start = divmod(self._pos, self._chunk_size)
+            chunk = self._redis.lindex(self._key, index) or b""
+            data = chunk[start : start + count]
+        if isinstance(data, str):
+            data = data.encode()
+        buffer[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
@@ -56,6 +56,9 @@ async def bootstrap_namespaces(config: dict[str, Any]) -> NamespaceBundle:
                 - For "redis": {"type": "redis", "url": str, "prefix": str,
                   "tools_path": str|None}
                 - tools_path is optional; if provided, tools load from that directory
+                - vector_index is optional for "file" ("chroma" or "numpy")
+                - artifact_compression is optional ("zstd" or "gzip")
+                - content_addressed_artifacts is optional (bool)
 
     Returns:
         NamespaceBundle with tools, skills, artifacts namespaces.
@@ -78,7 +81,8 @@ async def _bootstrap_file_storage(config: dict[str, Any]) -> NamespaceBundle:
     """Bootstrap namespaces from FileStorage config.
 
     Args:
-        config: Dict with base_path key and optional tools_path.
+        config: Dict with base_path key and optional tools_path, vector_index,
+            artifact_compression and content_addressed_artifacts.
 
     Returns:
         NamespaceBundle with file-based storage.
@@ -93,7 +97,12 @@ async def _bootstrap_file_storage(config: dict[str, Any]) -> NamespaceBundle:
     from py_code_mode.tools import ToolRegistry, ToolsNamespace
 
     base_path = Path(config["base_path"])
-    storage = FileStorage(base_path)
+    storage = FileStorage(
+        base_path,
+        vector_index=config.get("vector_index", "chroma"),
+        artifact_compression=config.get("artifact_compression"),
+        content_addressed_artifacts=config.get("content_addressed_artifacts", False),
+    )
 
     # Tools are owned by executor, loaded from config if provided
     tools_path_str = config.get("tools_path")
@@ -136,7 +145,8 @@ async def _bootstrap_redis_storage(config: dict[str, Any]) -> NamespaceBundle:
     """Bootstrap namespaces from RedisStorage config.
 
     Args:
-        config: Dict with url, prefix, and optional tools_path keys.
+        config: Dict with url, prefix, and optional tools_path,
+            artifact_compression and content_addressed_artifacts keys.
 
     Returns:
         NamespaceBundle with Redis-based storage.
@@ -154,7 +164,12 @@ async def _bootstrap_redis_storage(config: dict[str, Any]) -> NamespaceBundle:
     prefix = config["prefix"]
 
     # Connect to Redis
-    storage = RedisStorage(url=url, prefix=prefix)
+    storage = RedisStorage(
+        url=url,
+        prefix=prefix,
+        artifact_compression=config.get("artifact_compression"),
+        content_addressed_artifacts=config.get("content_addressed_artifacts", False),
+    )
 
     # Tools are owned by executor, loaded from config if provided
     tools_path_str = config.get("tools_path")
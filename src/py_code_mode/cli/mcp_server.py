@@ -28,11 +28,12 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import contextlib
 import json
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
 if TYPE_CHECKING:
     from py_code_mode import Session
@@ -42,9 +43,13 @@ mcp = FastMCP("py-code-mode")
 # Global session - initialized in main() before mcp.run()
 _session: Session | None = None
 
+# Minimum seconds between run_code progress notifications; output written in
+# between is coalesced into the next one
+PROGRESS_INTERVAL = 0.1
+
 
 @mcp.tool
-async def run_code(code: str) -> str:
+async def run_code(code: str, ctx: Context) -> str:
     """Execute Python code with access to tools, skills, and artifacts.
 
     WORKFLOW:
@@ -78,7 +83,54 @@ async def run_code(code: str) -> str:
     if _session is None:
         return "Error: Session not initialized"
 
-    result = await _session.run(code)
+    from py_code_mode.types import ErrorEvent, ResultEvent, StderrEvent, StdoutEvent
+
+    # Forward output as progress notifications while the code runs, so clients
+    # that sent a progress token can show it before the call returns. Each
+    # notification carries only the output written since the previous one.
+    loop = asyncio.get_running_loop()
+    result = None
+    pending: list[str] = []
+    notifications = 0
+    last_sent = float("-inf")
+
+    async def flush() -> None:
+        nonlocal notifications, last_sent
+        text = "".join(pending)
+        pending.clear()
+        last_sent = loop.time()
+        if text.strip():
+            notifications += 1
+            await ctx.report_progress(progress=notifications, message=text)
+
+    stream = _session.run_stream(code)
+    next_event = asyncio.ensure_future(anext(stream, None))
+    try:
+        while True:
+            wait = None if not pending else max(0.0, last_sent + PROGRESS_INTERVAL - loop.time())
+            done, _ = await asyncio.wait({next_event}, timeout=wait)
+            if not done:
+                await flush()
+                continue
+            event = next_event.result()
+            if event is None:
+                break
+            if isinstance(event, (StdoutEvent, StderrEvent)):
+                pending.append(event.text)
+                if loop.time() - last_sent >= PROGRESS_INTERVAL:
+                    await flush()
+            elif isinstance(event, (ResultEvent, ErrorEvent)):
+                result = event.result
+            next_event = asyncio.ensure_future(anext(stream, None))
+    finally:
+        if not next_event.done():
+            next_event.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await next_event
+    await flush()
+
+    if result is None:
+        return "Error: Execution produced no result"
     if result.error:
         return f"Error: {result.error}" + (f"\n\nStdout:\n{result.stdout}" if result.stdout else "")
 
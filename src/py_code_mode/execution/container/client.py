@@ -13,7 +13,9 @@ Usage:
 
 from __future__ import annotations
 
+import json
 import uuid
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Any
 
@@ -25,6 +27,16 @@ except ImportError:
     HTTPX_AVAILABLE = False
     httpx = None  # type: ignore
 
+from py_code_mode.types import (
+    DisplayEvent,
+    ErrorEvent,
+    ExecutionEvent,
+    ExecutionResult,
+    ResultEvent,
+    StderrEvent,
+    StdoutEvent,
+)
+
 
 @dataclass
 class ExecuteResult:
@@ -157,6 +169,68 @@ class SessionClient:
             session_id=data.get("session_id", self.session_id),
         )
 
+    async def execute_stream(
+        self,
+        code: str,
+        timeout: float | None = None,
+    ) -> AsyncIterator[ExecutionEvent]:
+        """Execute code on session server, yielding output as it arrives.
+
+        Reads the server's Server-Sent Events stream from /execute/stream.
+
+        Args:
+            code: Python code to execute.
+            timeout: Optional execution timeout (sent to server).
+
+        Yields:
+            StdoutEvent, StderrEvent and DisplayEvent as output arrives, then a
+            final ResultEvent or ErrorEvent.
+        """
+        client = await self._get_client()
+        payload = {"code": code}
+        if timeout is not None:
+            payload["timeout"] = timeout  # type: ignore
+
+        # Gaps between chunks are expected while code runs; the server enforces
+        # the execution timeout
+        async with client.stream(
+            "POST",
+            f"{self.base_url}/execute/stream",
+            json=payload,
+            headers=self._headers(),
+            timeout=httpx.Timeout(self.timeout, read=None),
+        ) as response:
+            response.raise_for_status()
+            event_type = ""
+            async for line in response.aiter_lines():
+                if line.startswith("event:"):
+                    event_type = line[len("event:") :].strip()
+                elif line.startswith("data:"):
+                    event = self._parse_stream_event(event_type, json.loads(line[len("data:") :]))
+                    if event is not None:
+                        yield event
+
+    def _parse_stream_event(self, event_type: str, data: dict[str, Any]) -> ExecutionEvent | None:
+        """Convert one SSE message from /execute/stream into an event."""
+        if event_type == StdoutEvent.type:
+            return StdoutEvent(data["text"])
+        if event_type == StderrEvent.type:
+            return StderrEvent(data["text"])
+        if event_type == DisplayEvent.type:
+            return DisplayEvent(data["data"])
+        if event_type in (ResultEvent.type, ErrorEvent.type):
+            if "session_id" in data:
+                self.session_id = data["session_id"]
+            result = ExecutionResult(
+                value=data["value"],
+                stdout=data["stdout"],
+                error=data["error"],
+                execution_time_ms=data.get("execution_time_ms"),
+            )
+            return ResultEvent(result) if event_type == ResultEvent.type else ErrorEvent(result)
+        # Unknown event types are ignored so the server can add new ones
+        return None
+
     async def health(self) -> HealthResult:
         """Check server health.
 
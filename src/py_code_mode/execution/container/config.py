@@ -39,6 +39,8 @@ class SessionConfig:
 
     # Skills
     skills_path: Path = field(default_factory=lambda: Path("/app/skills"))
+    # Shared on-disk embedding cache for skill search (None = embed on every start)
+    embeddings_path: Path | None = None
 
     # Artifacts
     artifacts_path: Path = field(default_factory=lambda: Path("/workspace/artifacts"))
@@ -81,6 +83,8 @@ class SessionConfig:
         # Load paths from env
         if skills_path := os.environ.get("SKILLS_PATH"):
             config.skills_path = Path(skills_path)
+        if embeddings_path := os.environ.get("EMBEDDINGS_PATH"):
+            config.embeddings_path = Path(embeddings_path)
         if artifacts_path := os.environ.get("ARTIFACTS_PATH"):
             config.artifacts_path = Path(artifacts_path)
 
@@ -144,6 +148,9 @@ class SessionConfig:
             mcp_servers=cls._parse_mcp_servers(data.get("mcp_servers", [])),
             python_deps=data.get("python_deps", []),
             skills_path=Path(data.get("skills_path", "/app/skills")),
+            embeddings_path=(
+                Path(data["embeddings_path"]) if data.get("embeddings_path") else None
+            ),
             artifacts_path=Path(data.get("artifacts_path", "/workspace/artifacts")),
             artifact_backend=data.get("artifact_backend", "file"),
             redis_url=data.get("redis_url"),
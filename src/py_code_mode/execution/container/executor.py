@@ -19,6 +19,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -54,7 +55,7 @@ from py_code_mode.execution.protocol import (
     validate_storage_not_access,
 )
 from py_code_mode.execution.registry import register_backend
-from py_code_mode.types import ExecutionResult
+from py_code_mode.types import ExecutionEvent, ExecutionResult
 
 
 def _transform_localhost_for_docker(url: str) -> str:
@@ -514,6 +515,26 @@ class ContainerExecutor:
             error=result.error,
         )
 
+    async def run_stream(
+        self,
+        code: str,
+        timeout: float | None = None,
+    ) -> AsyncIterator[ExecutionEvent]:
+        """Execute code in the container, yielding output as it arrives.
+
+        Args:
+            code: Python code to execute.
+            timeout: Optional execution timeout.
+
+        Yields:
+            Output events, then a final ResultEvent or ErrorEvent.
+        """
+        if self._client is None:
+            raise RuntimeError("Container not started. Use 'async with' or call start()")
+
+        async for event in self._client.execute_stream(code, timeout=timeout):
+            yield event
+
     async def reset(self) -> None:
         """Reset the session state inside the container."""
         if self._client is None:
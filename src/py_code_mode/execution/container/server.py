@@ -15,12 +15,14 @@ from __future__ import annotations
 import dataclasses
 import hmac
 import importlib
+import json
 import logging
 import os
 import subprocess
 import sys
 import time
 import uuid
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -31,6 +33,7 @@ logger = logging.getLogger(__name__)
 # Check for FastAPI at import time for cleaner error messages
 try:
     from fastapi import Depends, FastAPI, Header, HTTPException
+    from fastapi.responses import StreamingResponse
     from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
     from pydantic import BaseModel
 
@@ -45,6 +48,7 @@ except ImportError:
     Depends = None  # type: ignore
     HTTPBearer = None  # type: ignore
     HTTPAuthorizationCredentials = None  # type: ignore
+    StreamingResponse = None  # type: ignore
 
 from py_code_mode.artifacts import (  # noqa: E402
     ArtifactStoreProtocol,
@@ -62,9 +66,22 @@ from py_code_mode.execution.container.config import SessionConfig  # noqa: E402
 from py_code_mode.execution.in_process import (  # noqa: E402
     InProcessExecutor as CodeExecutor,
 )
-from py_code_mode.skills import FileSkillStore, SkillLibrary, create_skill_library  # noqa: E402
+from py_code_mode.skills import (  # noqa: E402
+    EmbeddingCache,
+    FileSkillStore,
+    SkillLibrary,
+    create_skill_library,
+)
 from py_code_mode.tools import ToolRegistry  # noqa: E402
 from py_code_mode.tools.adapters.cli import CLIAdapter  # noqa: E402
+from py_code_mode.types import (  # noqa: E402
+    DisplayEvent,
+    ErrorEvent,
+    ExecutionEvent,
+    ResultEvent,
+    StderrEvent,
+    StdoutEvent,
+)
 
 # Session expiration (seconds)
 SESSION_EXPIRY = 3600  # 1 hour
@@ -91,6 +108,27 @@ def serialize_value(value: Any) -> Any:
     return str(value)
 
 
+def format_sse_event(event: ExecutionEvent, session_id: str, elapsed_ms: float) -> str:
+    """Format an execution event as a Server-Sent Events message.
+
+    Output events carry their text or display data. The final result/error
+    event carries the same fields as the /execute response.
+    """
+    if isinstance(event, (StdoutEvent, StderrEvent)):
+        data: dict[str, Any] = {"text": event.text}
+    elif isinstance(event, DisplayEvent):
+        data = {"data": serialize_value(event.data)}
+    else:
+        data = {
+            "value": serialize_value(event.result.value),
+            "stdout": event.result.stdout,
+            "error": event.result.error,
+            "execution_time_ms": elapsed_ms,
+            "session_id": session_id,
+        }
+    return f"event: {event.type}\ndata: {json.dumps(data)}\n\n"
+
+
 # Pydantic models for API (only if FastAPI available)
 if FASTAPI_AVAILABLE:
 
@@ -262,7 +300,8 @@ def build_skill_library(config: SessionConfig) -> SkillLibrary | None:
 
     # Use file-based store wrapped in skill library
     store = FileSkillStore(config.skills_path)
-    return create_skill_library(store=store)
+    embedding_cache = EmbeddingCache(config.embeddings_path) if config.embeddings_path else None
+    return create_skill_library(store=store, embedding_cache=embedding_cache)
 
 
 def create_session(session_id: str) -> Session:
@@ -626,6 +665,37 @@ def create_app(config: SessionConfig | None = None) -> FastAPI:
             session_id=session.session_id,
         )
 
+    @app.post("/execute/stream", dependencies=[Depends(require_auth)])
+    async def execute_stream(
+        body: ExecuteRequestModel,
+        x_session_id: str | None = Header(None, alias="X-Session-ID"),
+    ) -> StreamingResponse:
+        """Execute code, streaming output as Server-Sent Events.
+
+        Emits stdout/stderr/display events as the code produces output, then
+        one final result or error event shaped like the /execute response.
+        """
+        if _state.config is None:
+            raise HTTPException(status_code=503, detail="Server not initialized")
+
+        cleanup_expired_sessions()
+        session = get_or_create_session(x_session_id)
+        timeout = body.timeout or _state.config.default_timeout
+
+        async def events() -> AsyncIterator[str]:
+            start = time.time()
+            async for event in session.executor.run_stream(body.code, timeout=timeout):
+                if isinstance(event, (ResultEvent, ErrorEvent)):
+                    session.execution_count += 1
+                    session.last_used = time.time()
+                yield format_sse_event(event, session.session_id, (time.time() - start) * 1000)
+
+        return StreamingResponse(
+            events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Session-ID": session.session_id},
+        )
+
     @app.get("/health", response_model=HealthResponseModel)
     async def health() -> HealthResponseModel:
         """Health check endpoint.
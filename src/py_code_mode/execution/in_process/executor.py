@@ -14,7 +14,8 @@ import logging
 import subprocess
 import sys
 import traceback
-from contextlib import redirect_stdout
+from collections.abc import AsyncIterator, Callable
+from contextlib import ExitStack, redirect_stderr, redirect_stdout
 from typing import TYPE_CHECKING, Any
 
 from py_code_mode.deps import (
@@ -29,7 +30,14 @@ from py_code_mode.execution.protocol import Capability, validate_storage_not_acc
 from py_code_mode.execution.registry import register_backend
 from py_code_mode.skills import SkillLibrary
 from py_code_mode.tools import ToolRegistry, ToolsNamespace, load_tools_from_path
-from py_code_mode.types import ExecutionResult
+from py_code_mode.types import (
+    ErrorEvent,
+    ExecutionEvent,
+    ExecutionResult,
+    StderrEvent,
+    StdoutEvent,
+    final_event,
+)
 
 if TYPE_CHECKING:
     from py_code_mode.artifacts import ArtifactStoreProtocol
@@ -42,6 +50,19 @@ _run_code = getattr(builtins, "exec")
 _eval_code = getattr(builtins, "eval")
 
 
+class _StreamingStringIO(io.StringIO):
+    """StringIO that also hands every write to a callback."""
+
+    def __init__(self, on_write: Callable[[str], None]) -> None:
+        super().__init__()
+        self._on_write = on_write
+
+    def write(self, s: str) -> int:
+        if s:
+            self._on_write(s)
+        return super().write(s)
+
+
 class InProcessExecutor:
     """Runs Python code with persistent state in the same process.
 
@@ -178,9 +199,94 @@ class InProcessExecutor:
                 error=f"Execution timeout after {timeout} seconds",
             )
 
-    def _run_sync(self, code: str) -> ExecutionResult:
-        """Run code synchronously, capturing output."""
-        stdout_capture = io.StringIO()
+    async def run_stream(
+        self, code: str, timeout: float | None = None
+    ) -> AsyncIterator[ExecutionEvent]:
+        """Run code, yielding stdout and stderr chunks as they are written.
+
+        Args:
+            code: Python code to run.
+            timeout: Timeout in seconds. Uses default if None.
+
+        Yields:
+            StdoutEvent or StderrEvent for each write, then a final ResultEvent
+            or ErrorEvent.
+        """
+        if self._closed:
+            yield ErrorEvent(ExecutionResult(value=None, stdout="", error="Executor is closed"))
+            return
+
+        timeout = timeout if timeout is not None else self._default_timeout
+
+        loop = asyncio.get_running_loop()
+        if "tools" in self._namespace:
+            self._namespace["tools"].set_loop(loop)
+        if "skills" in self._namespace:
+            self._namespace["skills"].set_loop(loop)
+
+        # Writes happen on the worker thread; hop them onto the loop
+        chunks: asyncio.Queue[ExecutionEvent] = asyncio.Queue()
+
+        def on_output(event: ExecutionEvent) -> None:
+            loop.call_soon_threadsafe(chunks.put_nowait, event)
+
+        task = asyncio.ensure_future(asyncio.to_thread(self._run_sync, code, on_output))
+        deadline = None if timeout is None else loop.time() + timeout
+        get: asyncio.Future[ExecutionEvent] | None = None
+        try:
+            while not task.done():
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    yield ErrorEvent(
+                        ExecutionResult(
+                            value=None,
+                            stdout="",
+                            error=f"Execution timeout after {timeout} seconds",
+                        )
+                    )
+                    return
+                get = asyncio.ensure_future(chunks.get())
+                done, _ = await asyncio.wait(
+                    {get, task}, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                if get in done:
+                    yield get.result()
+                else:
+                    get.cancel()
+                get = None
+
+            # Writes made just before the thread finished
+            while not chunks.empty():
+                yield chunks.get_nowait()
+            yield final_event(task.result())
+        finally:
+            if get is not None:
+                get.cancel()
+
+    def _run_sync(
+        self, code: str, on_output: Callable[[ExecutionEvent], None] | None = None
+    ) -> ExecutionResult:
+        """Run code synchronously, capturing output.
+
+        Args:
+            code: Python code to run.
+            on_output: Called with a StdoutEvent or StderrEvent for each write as
+                it happens, if given. Without it, stderr is left untouched.
+        """
+        stdout_capture: io.StringIO
+        stderr_capture: io.StringIO | None = None
+        if on_output is None:
+            stdout_capture = io.StringIO()
+        else:
+            stdout_capture = _StreamingStringIO(lambda text: on_output(StdoutEvent(text)))
+            stderr_capture = _StreamingStringIO(lambda text: on_output(StderrEvent(text)))
+
+        def capture() -> ExitStack:
+            stack = ExitStack()
+            stack.enter_context(redirect_stdout(stdout_capture))
+            if stderr_capture is not None:
+                stack.enter_context(redirect_stderr(stderr_capture))
+            return stack
 
         try:
             # Parse to check for trailing expression
@@ -196,17 +302,17 @@ class InProcessExecutor:
                 if stmts:
                     stmt_tree = ast.Module(body=stmts, type_ignores=[])
                     stmt_code = compile(stmt_tree, "<code>", "exec")
-                    with redirect_stdout(stdout_capture):
+                    with capture():
                         _run_code(stmt_code, self._namespace)
 
                 # Evaluate final expression
                 expr_tree = ast.Expression(body=expr.value)
                 expr_code = compile(expr_tree, "<expr>", "eval")
-                with redirect_stdout(stdout_capture):
+                with capture():
                     value = _eval_code(expr_code, self._namespace)
             else:
                 # No trailing expression - just run everything
-                with redirect_stdout(stdout_capture):
+                with capture():
                     _run_code(code, self._namespace)
                 value = None
 
@@ -111,6 +111,11 @@ class Executor(Protocol):
 
     All backends must implement these methods to be usable
     with the py-code-mode framework.
+
+    Backends may also implement ``run_stream(code, timeout)``, an async
+    iterator of ExecutionEvent (see py_code_mode.types) that yields output as
+    it is produced. It is optional: Session.run_stream() falls back to run()
+    for backends without it.
     """
 
     async def run(
@@ -19,6 +19,7 @@ from py_code_mode.execution.subprocess.kernel_init import (
     KERNEL_INIT_CODE,
     get_kernel_init_code,
 )
+from py_code_mode.execution.subprocess.pool import KernelPool
 from py_code_mode.execution.subprocess.rpc import RPCRequest, RPCResponse
 from py_code_mode.execution.subprocess.venv import KernelVenv, VenvManager
 
@@ -27,6 +28,7 @@ __all__ = [
     "SubprocessConfig",
     "SubprocessExecutor",
     "StorageResourceProvider",
+    "KernelPool",
     # Venv management
     "KernelVenv",
     "VenvManager",
@@ -31,7 +31,9 @@ class SubprocessConfig:
             cache_venv setting (cached path or temp directory).
         base_deps: Dependencies to install in the venv. Defaults to
             ("ipykernel",) for RPC-based namespace access. pyzmq is included
-            automatically as an ipykernel dependency.
+            automatically as an ipykernel dependency. Add "msgpack" to use
+            binary RPC framing and exact (untruncated) result values when the
+            host also has msgpack installed.
         startup_timeout: Timeout for kernel to become ready (seconds).
         default_timeout: Default timeout for code execution (seconds).
             None means no timeout (unlimited).
@@ -50,6 +52,15 @@ class SubprocessConfig:
             None means no deps file.
         ipc_timeout: Timeout for IPC queries (tool/skill/artifact) in seconds.
             None means unlimited (default).
+        preload_modules: Modules to import in every kernel during init, so they
+            are already in sys.modules when user code imports them (e.g.,
+            ("numpy", "pandas")). Modules that are not installed are skipped.
+        standby_kernel: Keep a fully initialized spare kernel running so that
+            reset() swaps to a fresh process in milliseconds instead of
+            restarting the kernel. Costs one extra idle kernel process.
+        storage_io_workers: Size of the thread pool that runs blocking storage
+            calls (skill store, artifact store, embedding search) for kernel
+            RPCs, so they never stall the host event loop.
     """
 
     python_version: str | None = None
@@ -64,6 +75,9 @@ class SubprocessConfig:
     deps: tuple[str, ...] | None = None
     deps_file: Path | None = None
     ipc_timeout: float | None = None
+    preload_modules: tuple[str, ...] = ()
+    standby_kernel: bool = False
+    storage_io_workers: int = 4
 
     def __post_init__(self) -> None:
         """Validate configuration values."""
@@ -87,6 +101,9 @@ class SubprocessConfig:
         if self.default_timeout is not None and self.default_timeout <= 0.0:
             msg = f"default_timeout must be positive or None, got: {self.default_timeout}"
             raise ValueError(msg)
+        if self.storage_io_workers < 1:
+            msg = f"storage_io_workers must be at least 1, got: {self.storage_io_workers}"
+            raise ValueError(msg)
 
     @staticmethod
     def get_canonical_venv_path(python_version: str) -> Path:
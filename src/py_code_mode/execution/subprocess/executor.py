@@ -13,13 +13,28 @@ Key advantages over code injection (old namespace.py approach):
 from __future__ import annotations
 
 import ast
+import asyncio
+import functools
+import io
 import logging
-from typing import TYPE_CHECKING, Any
+import threading
+import uuid
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
 
 if TYPE_CHECKING:
     from py_code_mode.storage.backends import StorageBackend
 
+from py_code_mode.artifacts import (
+    ARTIFACT_CHUNK_SIZE,
+    ArtifactWriter,
+    FileArtifactStore,
+    open_artifact,
+)
 from py_code_mode.deps import DepsStore, FileDepsStore, MemoryDepsStore
+from py_code_mode.errors import ArtifactNotFoundError
 from py_code_mode.execution.protocol import (
     Capability,
     StorageAccess,
@@ -27,13 +42,19 @@ from py_code_mode.execution.protocol import (
 )
 from py_code_mode.execution.registry import register_backend
 from py_code_mode.execution.subprocess.config import SubprocessConfig
+from py_code_mode.execution.subprocess.host import ExecutionResult as KernelExecutionResult
 from py_code_mode.execution.subprocess.host import KernelHost
+from py_code_mode.execution.subprocess.pool import KernelPool
+from py_code_mode.execution.subprocess.rpc import decode_result_value
 from py_code_mode.execution.subprocess.venv import KernelVenv, VenvManager
+from py_code_mode.skills import compute_content_hash
 from py_code_mode.tools import ToolRegistry, load_tools_from_path
-from py_code_mode.types import ExecutionResult
+from py_code_mode.types import ErrorEvent, ExecutionEvent, ExecutionResult, final_event
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 def _deserialize_value(text_repr: str | None) -> Any:
     """Deserialize IPython text/plain representation to Python value.
@@ -59,12 +80,39 @@ def _deserialize_value(text_repr: str | None) -> Any:
         return text_repr
 
 
+def _decode_result(result: KernelExecutionResult) -> Any:
+    """Recover the Python value of a cell result.
+
+    Uses the kernel's structured RESULT_MIMETYPE payload when present, which
+    is exact and fast for large containers, and falls back to parsing the
+    text/plain representation otherwise.
+
+    Args:
+        result: The KernelHost execution result.
+
+    Returns:
+        The Python value, or its string representation if it cannot be recovered.
+    """
+    if result.value_payload is not None:
+        try:
+            return decode_result_value(result.value_payload)
+        except (RuntimeError, ValueError) as e:
+            logger.debug("Falling back to text/plain result: %s", e)
+    return _deserialize_value(result.value)
+
+
 class StorageResourceProvider:
     """ResourceProvider that bridges RPC to storage backend.
 
     This class implements the ResourceProvider protocol by delegating
     to the storage backend for skills and artifacts, and using
     executor-provided tool registry and deps store.
+
+    Storage backends are synchronous (file I/O, Redis round trips, embedding
+    inference), so every storage call runs on a bounded thread pool instead
+    of the host event loop, which also has to pump kernel messages for
+    other executions. Skill library access is serialized because the
+    library's in-memory index is not thread-safe.
     """
 
     def __init__(
@@ -75,6 +123,7 @@ class StorageResourceProvider:
         allow_runtime_deps: bool = True,
         venv_manager: VenvManager | None = None,
         venv: KernelVenv | None = None,
+        io_workers: int = 4,
     ) -> None:
         """Initialize provider.
 
@@ -85,6 +134,7 @@ class StorageResourceProvider:
             allow_runtime_deps: Whether to allow deps.add() and deps.remove().
             venv_manager: VenvManager for package installation.
             venv: KernelVenv for the current subprocess.
+            io_workers: Maximum number of threads running blocking storage calls.
         """
         self._storage = storage
         self._tool_registry = tool_registry
@@ -92,8 +142,44 @@ class StorageResourceProvider:
         self._allow_runtime_deps = allow_runtime_deps
         self._venv_manager = venv_manager
         self._venv = venv
+        self._io_workers = io_workers
+        self._io_pool: ThreadPoolExecutor | None = None
         # Cached skill library (lazy initialized)
         self._skill_library = None
+        self._skill_lock = threading.Lock()
+        # Open artifacts.open(name, "wb") streams by upload id
+        self._artifact_writers: dict[str, ArtifactWriter] = {}
+        self._artifact_readers: dict[str, io.BufferedIOBase] = {}
+
+    async def _run_io(self, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Run a blocking storage call on the I/O thread pool."""
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=self._io_workers, thread_name_prefix="py-code-mode-storage"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, functools.partial(fn, *args, **kwargs))
+
+    def close(self) -> None:
+        """Shut down the I/O thread pool. Calls already running are not interrupted.
+
+        Artifact streams the kernel left open are discarded.
+        """
+        for writer in self._artifact_writers.values():
+            try:
+                writer.discard()
+            except Exception as e:
+                logger.debug(f"Failed to discard artifact upload: {e}")
+        self._artifact_writers.clear()
+        for reader in self._artifact_readers.values():
+            try:
+                reader.close()
+            except Exception as e:
+                logger.debug(f"Failed to close artifact download: {e}")
+        self._artifact_readers.clear()
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+            self._io_pool = None
 
     def _get_tool_registry(self) -> ToolRegistry | None:
         """Get tool registry. Already loaded at construction time."""
@@ -105,6 +191,15 @@ class StorageResourceProvider:
             self._skill_library = self._storage.get_skill_library()
         return self._skill_library
 
+    async def _with_skill_library(self, fn: Callable[[Any], _T]) -> _T:
+        """Run fn(library) on the I/O pool while holding the skill library lock."""
+
+        def locked() -> _T:
+            with self._skill_lock:
+                return fn(self._get_skill_library())
+
+        return await self._run_io(locked)
+
     # -------------------------------------------------------------------------
     # Tool methods
     # -------------------------------------------------------------------------
@@ -147,7 +242,9 @@ class StorageResourceProvider:
         registry = self._get_tool_registry()
         if registry is None:
             return []
-        return [tool.to_dict() for tool in registry.search(query, limit=limit)]
+        # Semantic search embeds the query, so keep it off the event loop
+        tools = await self._run_io(registry.search, query, limit=limit)
+        return [tool.to_dict() for tool in tools]
 
     async def list_tool_recipes(self, name: str) -> list[dict[str, Any]]:
         """List recipes for a specific tool."""
@@ -173,9 +270,12 @@ class StorageResourceProvider:
 
     async def search_skills(self, query: str, limit: int) -> list[dict[str, Any]]:
         """Search for skills matching query."""
-        library = self._get_skill_library()
-        library.refresh()
-        skills = library.search(query, limit=limit)
+
+        def search(library: Any) -> list[Any]:
+            library.refresh()
+            return library.search(query, limit=limit)
+
+        skills = await self._with_skill_library(search)
         return [
             {
                 "name": s.name,
@@ -187,9 +287,12 @@ class StorageResourceProvider:
 
     async def list_skills(self) -> list[dict[str, Any]]:
         """List all available skills."""
-        library = self._get_skill_library()
-        library.refresh()
-        skills = library.list()
+
+        def list_all(library: Any) -> list[Any]:
+            library.refresh()
+            return library.list()
+
+        skills = await self._with_skill_library(list_all)
         return [
             {
                 "name": s.name,
@@ -199,18 +302,31 @@ class StorageResourceProvider:
             for s in skills
         ]
 
-    async def get_skill(self, name: str) -> dict[str, Any] | None:
-        """Get a skill by name."""
-        library = self._get_skill_library()
-        library.refresh()
-        skill = library.get(name)
+    async def get_skill(self, name: str, if_none_match: str | None = None) -> dict[str, Any] | None:
+        """Get a skill by name.
+
+        Args:
+            name: Skill name.
+            if_none_match: content_hash the caller already has. If it still
+                matches, only the hash is returned instead of the full source.
+        """
+
+        def get(library: Any) -> Any:
+            library.refresh()
+            return library.get(name)
+
+        skill = await self._with_skill_library(get)
         if skill is None:
             return None
+        content_hash = compute_content_hash(skill.description, skill.source)
+        if if_none_match is not None and if_none_match == content_hash:
+            return {"name": skill.name, "content_hash": content_hash, "not_modified": True}
         return {
             "name": skill.name,
             "description": skill.description,
             "source": skill.source,
             "params": {p.name: p.description or p.type for p in skill.parameters},
+            "content_hash": content_hash,
         }
 
     async def create_skill(self, name: str, source: str, description: str) -> dict[str, Any]:
@@ -223,8 +339,7 @@ class StorageResourceProvider:
             description=description,
         )
 
-        library = self._get_skill_library()
-        library.add(skill)
+        await self._with_skill_library(lambda library: library.add(skill))
 
         return {
             "name": skill.name,
@@ -234,8 +349,7 @@ class StorageResourceProvider:
 
     async def delete_skill(self, name: str) -> bool:
         """Delete a skill."""
-        library = self._get_skill_library()
-        return library.remove(name)
+        return await self._with_skill_library(lambda library: library.remove(name))
 
     # -------------------------------------------------------------------------
     # Artifact methods
@@ -244,12 +358,102 @@ class StorageResourceProvider:
     async def load_artifact(self, name: str) -> Any:
         """Load an artifact by name."""
         store = self._storage.get_artifact_store()
-        return store.load(name)
+        return await self._run_io(store.load, name)
 
     async def save_artifact(self, name: str, data: Any, description: str) -> dict[str, Any]:
         """Save an artifact."""
         store = self._storage.get_artifact_store()
-        artifact = store.save(name, data, description=description)
+        artifact = await self._run_io(store.save, name, data, description=description)
+        return {
+            "name": artifact.name,
+            "path": artifact.path,
+            "description": artifact.description,
+            "created_at": artifact.created_at.isoformat(),
+        }
+
+    async def open_artifact_reader(self, name: str) -> str:
+        """Start streaming an artifact out; returns the download id for read calls."""
+        store = self._storage.get_artifact_store()
+        reader = await self._run_io(open_artifact, store, name, "rb")
+        download_id = uuid.uuid4().hex
+        self._artifact_readers[download_id] = reader
+        return download_id
+
+    async def read_artifact(self, download_id: str, offset: int, size: int) -> bytes:
+        """Read up to one chunk of a streamed artifact, starting at offset.
+
+        The download keeps one stream open, so sequential reads continue
+        where the last one stopped instead of reopening (and, for
+        compressed artifacts, re-decompressing) the artifact.
+        """
+        reader = self._artifact_readers.get(download_id)
+        if reader is None:
+            raise ValueError(f"Unknown artifact download: {download_id}")
+        size = min(size, ARTIFACT_CHUNK_SIZE)
+
+        def read() -> bytes:
+            if reader.tell() != offset:
+                reader.seek(offset)
+            return reader.read(size)
+
+        return await self._run_io(read)
+
+    async def close_artifact_reader(self, download_id: str) -> None:
+        """Finish a streamed download."""
+        reader = self._artifact_readers.pop(download_id, None)
+        if reader is not None:
+            await self._run_io(reader.close)
+
+    async def view_artifact(self, name: str) -> dict[str, Any]:
+        """Tell the kernel where to memory-map an artifact from.
+
+        Returns {"path": file} for file-backed stores, so the kernel maps
+        the same file (and page cache) as the host. Other stores, and
+        compressed files, return {"path": None} and the kernel streams the
+        bytes instead.
+        """
+        store = self._storage.get_artifact_store()
+        if not isinstance(store, FileArtifactStore):
+            if not await self._run_io(store.exists, name):
+                raise ArtifactNotFoundError(name)
+            return {"path": None}
+        artifact = await self._run_io(store.get, name)
+        if artifact is None or not await self._run_io(Path(artifact.path).is_file):
+            raise ArtifactNotFoundError(name)
+        if "_codec" in artifact.metadata:
+            return {"path": None}
+        return {"path": artifact.path}
+
+    async def open_artifact_writer(self, name: str, description: str) -> str:
+        """Start streaming an artifact; returns the upload id for write calls."""
+        store = self._storage.get_artifact_store()
+        writer = await self._run_io(open_artifact, store, name, "wb", description=description)
+        assert isinstance(writer, ArtifactWriter)
+        upload_id = uuid.uuid4().hex
+        self._artifact_writers[upload_id] = writer
+        return upload_id
+
+    def _artifact_writer(self, upload_id: str) -> ArtifactWriter:
+        writer = self._artifact_writers.get(upload_id)
+        if writer is None:
+            raise ValueError(f"Unknown artifact upload: {upload_id}")
+        return writer
+
+    async def write_artifact(self, upload_id: str, data: bytes) -> int:
+        """Append a chunk to a streamed artifact."""
+        writer = self._artifact_writer(upload_id)
+        return await self._run_io(writer.write, data)
+
+    async def close_artifact_writer(self, upload_id: str, commit: bool) -> dict[str, Any] | None:
+        """Commit (or discard) a streamed artifact; returns its metadata if committed."""
+        writer = self._artifact_writer(upload_id)
+        del self._artifact_writers[upload_id]
+        if not commit:
+            await self._run_io(writer.discard)
+            return None
+        await self._run_io(writer.close)
+        artifact = writer.artifact
+        assert artifact is not None
         return {
             "name": artifact.name,
             "path": artifact.path,
@@ -260,7 +464,7 @@ class StorageResourceProvider:
     async def list_artifacts(self) -> list[dict[str, Any]]:
         """List all artifacts."""
         store = self._storage.get_artifact_store()
-        artifacts = store.list()
+        artifacts = await self._run_io(store.list)
         return [
             {
                 "name": a.name,
@@ -274,17 +478,17 @@ class StorageResourceProvider:
     async def delete_artifact(self, name: str) -> None:
         """Delete an artifact."""
         store = self._storage.get_artifact_store()
-        store.delete(name)
+        await self._run_io(store.delete, name)
 
     async def artifact_exists(self, name: str) -> bool:
         """Check if an artifact exists."""
         store = self._storage.get_artifact_store()
-        return store.exists(name)
+        return await self._run_io(store.exists, name)
 
     async def get_artifact(self, name: str) -> dict[str, Any] | None:
         """Get artifact metadata."""
         store = self._storage.get_artifact_store()
-        artifact = store.get(name)
+        artifact = await self._run_io(store.get, name)
         if artifact is None:
             return None
         return {
@@ -311,7 +515,7 @@ class StorageResourceProvider:
 
         # Add to deps store if configured
         if self._deps_store is not None:
-            self._deps_store.add(package)
+            await self._run_io(self._deps_store.add, package)
 
         # Install via venv manager if available
         if self._venv_manager is not None and self._venv is not None:
@@ -338,13 +542,13 @@ class StorageResourceProvider:
 
         if self._deps_store is None:
             return False
-        return self._deps_store.remove(package)
+        return await self._run_io(self._deps_store.remove, package)
 
     async def list_deps(self) -> list[str]:
         """List configured packages."""
         if self._deps_store is None:
             return []
-        return self._deps_store.list()
+        return await self._run_io(self._deps_store.list)
 
     async def sync_deps(self) -> dict[str, Any]:
         """Install all configured packages.
@@ -355,7 +559,7 @@ class StorageResourceProvider:
         if self._deps_store is None:
             return {"installed": [], "already_present": [], "failed": []}
 
-        packages = self._deps_store.list()
+        packages = await self._run_io(self._deps_store.list)
 
         if not packages:
             return {"installed": [], "already_present": [], "failed": []}
@@ -380,7 +584,7 @@ class StorageResourceProvider:
 class SubprocessExecutor:
     """Execute code in an isolated subprocess with its own venv and IPython kernel.
 
-    This executor uses bidirectional RPC via the stdin channel for namespace
+    This executor uses bidirectional RPC over a dedicated ZMQ socket for namespace
     operations. The kernel contains lightweight proxy objects that forward
     all tools/skills/artifacts/deps calls to the host.
 
@@ -389,7 +593,7 @@ class SubprocessExecutor:
     - PROCESS_ISOLATION: Yes (code runs in subprocess)
     - NETWORK_ISOLATION: No
     - FILESYSTEM_ISOLATION: No
-    - RESET: Yes (kernel restart)
+    - RESET: Yes (kernel restart, or swap to a pre-warmed kernel)
 
     Usage:
         config = SubprocessConfig(python_version="3.11", venv_path=Path("./venv"))
@@ -407,13 +611,43 @@ class SubprocessExecutor:
         }
     )
 
-    def __init__(self, config: SubprocessConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: SubprocessConfig | None = None,
+        kernel_pool: KernelPool | None = None,
+    ) -> None:
         """Initialize SubprocessExecutor.
 
         Args:
-            config: Configuration for venv and kernel. Uses defaults if None.
+            config: Configuration for venv and kernel. Uses defaults if None,
+                or the pool's config when kernel_pool is given.
+            kernel_pool: Optional KernelPool to check out a pre-warmed kernel
+                from, on start and on every reset(), instead of starting one.
+                The pool owns the venv; this executor never cleans it up.
+                Pooled kernels share that venv, so the pool's config must set
+                allow_runtime_deps=False.
+
+        Raises:
+            ValueError: If both config and kernel_pool are given and config
+                differs from the pool's config, or if the pool's config
+                allows runtime deps.
         """
+        if kernel_pool is not None:
+            if config is not None and config != kernel_pool.config:
+                msg = "config must match kernel_pool.config; omit config to use the pool's"
+                raise ValueError(msg)
+            if kernel_pool.config.allow_runtime_deps:
+                # deps.add() in one session would install into every later session's venv
+                msg = "kernel_pool requires allow_runtime_deps=False; pooled kernels share a venv"
+                raise ValueError(msg)
+            config = kernel_pool.config
         self._config = config or SubprocessConfig()
+        # standby_kernel is a private single-kernel pool owned by this executor
+        self._owns_pool = kernel_pool is None and self._config.standby_kernel
+        if self._owns_pool:
+            kernel_pool = KernelPool(self._config, min_size=1, max_size=1, idle_timeout=None)
+        self._kernel_pool = kernel_pool
+        self._retiring: set[asyncio.Task[None]] = set()
         self._venv_manager: VenvManager | None = None
         self._venv: KernelVenv | None = None
         self._host: KernelHost | None = None
@@ -506,15 +740,19 @@ class SubprocessExecutor:
             for dep in initial_deps:
                 self._deps_store.add(dep)
 
-        # 3. Create venv with VenvManager
+        # 3. Create venv with VenvManager (or reuse the pool's venv)
         # Use minimal base_deps since we don't need py-code-mode in venv
         # The RPC approach only needs ipykernel and pyzmq
-        self._venv_manager = VenvManager(self._config)
-        self._venv = await self._venv_manager.create()
-
-        # 4. Create KernelHost and ResourceProvider
-        self._host = KernelHost()
+        if self._kernel_pool is not None:
+            await self._kernel_pool.start()
+            self._venv_manager = self._kernel_pool.venv_manager
+            self._venv = self._kernel_pool.venv
+            assert self._venv_manager is not None and self._venv is not None
+        else:
+            self._venv_manager = VenvManager(self._config)
+            self._venv = await self._venv_manager.create()
 
+        # 4. Create ResourceProvider
         if storage is not None:
             self._provider = StorageResourceProvider(
                 storage=storage,
@@ -523,17 +761,24 @@ class SubprocessExecutor:
                 allow_runtime_deps=self._config.allow_runtime_deps,
                 venv_manager=self._venv_manager,
                 venv=self._venv,
+                io_workers=self._config.storage_io_workers,
             )
         else:
             # Create a minimal provider for basic execution
             self._provider = None
 
-        # 5. Start kernel with RPC
+        # 5. Start kernel with RPC, or check out a pre-warmed one
+        if self._kernel_pool is not None:
+            self._host = await self._kernel_pool.acquire(self._provider)
+            return
+
+        self._host = KernelHost()
         await self._host.start(
             provider=self._provider,  # type: ignore[arg-type]
             kernel_name=self._venv.kernel_spec_name,
             startup_timeout=self._config.startup_timeout,
             ipc_timeout=self._config.ipc_timeout,
+            preload_modules=self._config.preload_modules,
         )
 
     async def run(self, code: str, timeout: float | None = None) -> ExecutionResult:
@@ -559,10 +804,60 @@ class SubprocessExecutor:
             allow_stdin=True,
             timeout=effective_timeout,
         )
+        return self._convert_result(result)
 
-        # Convert KernelHost ExecutionResult to py-code-mode ExecutionResult
-        # Deserialize the value from IPython's text/plain representation
-        value = _deserialize_value(result.value)
+    async def run_stream(
+        self, code: str, timeout: float | None = None
+    ) -> AsyncIterator[ExecutionEvent]:
+        """Execute code in kernel, yielding output as the kernel sends it.
+
+        Args:
+            code: Python code to execute.
+            timeout: Optional timeout in seconds. Uses config default if None.
+
+        Yields:
+            StdoutEvent, StderrEvent and DisplayEvent as output arrives, then a
+            final ResultEvent or ErrorEvent with the same result run() returns.
+        """
+        if self._closed or self._host is None:
+            yield ErrorEvent(ExecutionResult(value=None, stdout="", error="Executor is closed"))
+            return
+
+        effective_timeout = timeout if timeout is not None else self._config.default_timeout
+
+        events: asyncio.Queue[ExecutionEvent] = asyncio.Queue()
+        task = asyncio.ensure_future(
+            self._host.execute(
+                code,
+                allow_stdin=True,
+                timeout=effective_timeout,
+                on_event=events.put_nowait,
+            )
+        )
+        get: asyncio.Future[ExecutionEvent] | None = None
+        try:
+            while not task.done():
+                get = asyncio.ensure_future(events.get())
+                done, _ = await asyncio.wait({get, task}, return_when=asyncio.FIRST_COMPLETED)
+                if get in done:
+                    yield get.result()
+                else:
+                    get.cancel()
+                get = None
+
+            while not events.empty():
+                yield events.get_nowait()
+            yield final_event(self._convert_result(task.result()))
+        finally:
+            if get is not None:
+                get.cancel()
+            if not task.done():
+                # Consumer stopped early; execute() cleans up its receivers on cancel
+                task.cancel()
+
+    def _convert_result(self, result: KernelExecutionResult) -> ExecutionResult:
+        """Convert a KernelHost ExecutionResult to a py-code-mode ExecutionResult."""
+        value = _decode_result(result)
 
         # Combine stdout and stderr
         combined_output = result.stdout
@@ -583,9 +878,21 @@ class SubprocessExecutor:
         """Clear kernel state by restarting.
 
         This clears all user-defined variables but re-injects RPC namespaces.
+        With a kernel pool (or standby_kernel), the kernel is swapped for a
+        pre-warmed one and the old process is shut down in the background.
         """
-        if self._host is not None:
+        if self._host is None:
+            return
+
+        if self._kernel_pool is None:
             await self._host.restart(startup_timeout=self._config.startup_timeout)
+            return
+
+        old_host = self._host
+        self._host = await self._kernel_pool.acquire(self._provider)
+        task = asyncio.create_task(old_host.shutdown())
+        self._retiring.add(task)
+        task.add_done_callback(self._retiring.discard)
 
     async def install_deps(self, packages: list[str]) -> dict[str, Any]:
         """Install packages in the subprocess venv.
@@ -751,8 +1058,20 @@ class SubprocessExecutor:
             await self._host.shutdown()
             self._host = None
 
+        if self._retiring:
+            await asyncio.gather(*self._retiring, return_exceptions=True)
+
+        if self._owns_pool and self._kernel_pool is not None:
+            await self._kernel_pool.close()
+
+        if self._provider is not None:
+            self._provider.close()
+
+        # Pooled kernels are single-use and were shut down above; the venv
+        # belongs to the pool
         if (
-            self._config.get_resolved_cleanup()
+            self._kernel_pool is None
+            and self._config.get_resolved_cleanup()
             and self._venv is not None
             and self._venv_manager is not None
         ):
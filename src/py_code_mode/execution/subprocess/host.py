@@ -5,30 +5,52 @@ bidirectional RPC support. The key insight is that the host must NEVER
 truly block - it runs an async event loop that handles BOTH execution
 completion AND incoming RPC requests concurrently.
 
-The stdin channel (designed for input() calls) carries RPC messages:
-- Kernel sends input_request with JSON in prompt field
-- Host responds with input_reply containing JSON result
+RPC messages travel over a dedicated ZMQ socket pair, separate from the
+Jupyter channels:
+- Host binds a ROUTER socket on localhost when the kernel starts
+- Each kernel thread connects its own DEALER socket and sends framed requests
+  (msgpack or JSON body, large byte buffers as separate frames; see rpc.py)
+- Host handles every request as its own task and replies to the sender,
+  so many calls can be in flight at once
 """
 
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
+import hmac
 import logging
+import secrets
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from queue import Empty
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
+import zmq
+import zmq.asyncio
 from jupyter_client import AsyncKernelManager
 
 from py_code_mode.execution.subprocess.kernel_init import get_kernel_init_code
-from py_code_mode.execution.subprocess.rpc import RPCRequest, RPCResponse
+from py_code_mode.execution.subprocess.rpc import (
+    RESULT_MIMETYPE,
+    RPCRequest,
+    RPCResponse,
+    available_codecs,
+    decode_message,
+    encode_message,
+)
+from py_code_mode.tools.namespace import DEFAULT_BATCH_CONCURRENCY, gather_with_concurrency
+from py_code_mode.types import DisplayEvent, ExecutionEvent, StderrEvent, StdoutEvent
 
 if TYPE_CHECKING:
     pass
 
 logger = logging.getLogger(__name__)
 
+# How long execute() waits without any kernel message before checking
+# whether the kernel process is still alive. This only bounds how quickly a
+# dead kernel is noticed; it never delays a normal completion.
+_LIVENESS_CHECK_INTERVAL = 1.0
+
 
 def _parse_method(method: str) -> tuple[str, str]:
     """Parse RPC method name into namespace and operation.
@@ -45,6 +67,17 @@ def _parse_method(method: str) -> tuple[str, str]:
     return "rpc", method
 
 
+def _rpc_error_dict(method: str, error: Exception) -> dict[str, Any]:
+    """Structured error the kernel turns back into a NamespaceError."""
+    namespace, operation = _parse_method(method)
+    return {
+        "namespace": namespace,
+        "operation": operation,
+        "message": str(error),
+        "type": type(error).__name__,
+    }
+
+
 @runtime_checkable
 class ResourceProvider(Protocol):
     """Protocol for providing resources to the kernel.
@@ -82,8 +115,12 @@ class ResourceProvider(Protocol):
         """List all available skills."""
         ...
 
-    async def get_skill(self, name: str) -> dict[str, Any] | None:
-        """Get a skill by name."""
+    async def get_skill(self, name: str, if_none_match: str | None = None) -> dict[str, Any] | None:
+        """Get a skill by name.
+
+        If if_none_match equals the skill's content_hash, returns only name,
+        content_hash and not_modified=True instead of the full skill.
+        """
         ...
 
     async def create_skill(self, name: str, source: str, description: str) -> dict[str, Any]:
@@ -103,6 +140,34 @@ class ResourceProvider(Protocol):
         """Save an artifact."""
         ...
 
+    async def open_artifact_reader(self, name: str) -> str:
+        """Start streaming an artifact out; returns a download id."""
+        ...
+
+    async def read_artifact(self, download_id: str, offset: int, size: int) -> bytes:
+        """Read up to size bytes of a streamed artifact, starting at offset."""
+        ...
+
+    async def close_artifact_reader(self, download_id: str) -> None:
+        """Finish a streamed download."""
+        ...
+
+    async def view_artifact(self, name: str) -> dict[str, Any]:
+        """Where the kernel can memory-map an artifact from ({"path": None} if nowhere)."""
+        ...
+
+    async def open_artifact_writer(self, name: str, description: str) -> str:
+        """Start streaming an artifact; returns an upload id."""
+        ...
+
+    async def write_artifact(self, upload_id: str, data: bytes) -> int:
+        """Append a chunk to a streamed artifact."""
+        ...
+
+    async def close_artifact_writer(self, upload_id: str, commit: bool) -> dict[str, Any] | None:
+        """Commit or discard a streamed artifact."""
+        ...
+
     async def list_artifacts(self) -> list[dict[str, Any]]:
         """List all artifacts."""
         ...
@@ -146,6 +211,8 @@ class ExecutionResult:
     value: Any = None
     error: str | None = None
     traceback: list[str] = field(default_factory=list)
+    # Structured copy of value (RESULT_MIMETYPE payload) when the kernel sent one
+    value_payload: str | None = None
 
     @property
     def success(self) -> bool:
@@ -153,17 +220,36 @@ class ExecutionResult:
         return self.error is None
 
 
+@dataclass
+class _CellOutput:
+    """Output collected while a cell runs.
+
+    Chunks are joined once at the end instead of growing a string per message.
+    """
+
+    stdout: list[str] = field(default_factory=list)
+    stderr: list[str] = field(default_factory=list)
+    on_event: Callable[[ExecutionEvent], None] | None = None
+
+    def emit(self, event: ExecutionEvent) -> None:
+        if self.on_event is not None:
+            self.on_event(event)
+
+
 class KernelHost:
     """Manages a Jupyter kernel with bidirectional RPC.
 
     This class provides:
     - Kernel lifecycle management (start, shutdown)
     - Code execution with RPC support
-    - Concurrent handling of stdin (RPC), iopub (output), and shell (completion)
+    - Concurrent handling of iopub (output), shell (completion), and stdin (input())
+    - An RPC server task that serves kernel requests concurrently, independent
+      of whether a cell is currently executing
 
     The key design is that execute() never blocks waiting for shell reply.
-    Instead, it spawns concurrent async tasks for each channel and uses
-    an asyncio.Event for coordination.
+    Instead, it keeps one pending receive per channel and waits on all of them
+    together, returning as soon as both the execute_reply and the iopub
+    status: idle for the request have arrived.
 
     Usage:
         host = KernelHost()
@@ -180,14 +266,22 @@ class KernelHost:
         self._km: AsyncKernelManager | None = None
         self._kc: Any = None  # AsyncKernelClient
         self._provider: ResourceProvider | None = None
-        self._ipc_timeout: float = 30.0
+        self._ipc_timeout: float | None = 30.0
+        self._preload_modules: tuple[str, ...] = ()
+        self._rpc_context: zmq.asyncio.Context | None = None
+        self._rpc_socket: zmq.asyncio.Socket | None = None
+        self._rpc_endpoint: str | None = None
+        self._rpc_token: str = ""
+        self._rpc_server: asyncio.Task[None] | None = None
+        self._rpc_tasks: set[asyncio.Task[None]] = set()
 
     async def start(
         self,
         provider: ResourceProvider,
         kernel_name: str = "python3",
         startup_timeout: float = 30.0,
-        ipc_timeout: float = 30.0,
+        ipc_timeout: float | None = 30.0,
+        preload_modules: tuple[str, ...] = (),
     ) -> None:
         """Start the kernel and initialize RPC channel.
 
@@ -195,15 +289,21 @@ class KernelHost:
             provider: ResourceProvider for handling RPC requests.
             kernel_name: Jupyter kernel spec name.
             startup_timeout: Timeout for kernel to become ready.
-            ipc_timeout: Timeout for IPC/RPC calls.
+            ipc_timeout: Timeout for IPC/RPC calls. None means unlimited.
+            preload_modules: Modules to import in the kernel during init.
 
         Raises:
             RuntimeError: If kernel initialization fails.
         """
         self._provider = provider
         self._ipc_timeout = ipc_timeout
+        self._preload_modules = preload_modules
 
         try:
+            # Bind the RPC socket before the kernel starts so the init code
+            # can connect to it right away
+            self._start_rpc_server()
+
             # Start kernel
             self._km = AsyncKernelManager(kernel_name=kernel_name)
             await self._km.start_kernel()
@@ -213,12 +313,12 @@ class KernelHost:
             # Wait for kernel to be ready
             await self._kc.wait_for_ready(timeout=startup_timeout)
 
-            # Initialize RPC in kernel (with allow_stdin=True)
-            init_code = get_kernel_init_code(ipc_timeout=ipc_timeout)
-            init_result = await self.execute(init_code, allow_stdin=True)
+            # Initialize RPC proxies in kernel
+            init_result = await self.execute(self._get_init_code(), allow_stdin=True)
             if not init_result.success:
                 raise RuntimeError(f"Failed to initialize kernel RPC: {init_result.error}")
-        except Exception:
+        except BaseException:
+            # Also clean up when cancelled (e.g. KernelPool closing mid warm-up)
             await self.shutdown()
             raise
 
@@ -227,13 +327,19 @@ class KernelHost:
         code: str,
         allow_stdin: bool = True,
         timeout: float | None = None,
+        on_event: Callable[[ExecutionEvent], None] | None = None,
     ) -> ExecutionResult:
-        """Execute code in the kernel, handling RPC requests via stdin.
+        """Execute code in the kernel.
+
+        RPC requests made by the code are served by the RPC server task,
+        concurrently with this call.
 
         Args:
             code: Python code to execute.
-            allow_stdin: Whether to allow stdin (RPC). Default: True.
+            allow_stdin: Whether to allow stdin (input()). Default: True.
             timeout: Execution timeout. None means no timeout.
+            on_event: Called with a StdoutEvent, StderrEvent or DisplayEvent
+                for each output message as it arrives.
 
         Returns:
             ExecutionResult with stdout, stderr, value, and error fields.
@@ -242,122 +348,113 @@ class KernelHost:
             return ExecutionResult(error="Kernel not started")
 
         result = ExecutionResult()
-        done_event = asyncio.Event()
+        output = _CellOutput(on_event=on_event)
 
         # Send execute request with allow_stdin enabled
         msg_id = self._kc.execute(code, allow_stdin=allow_stdin)
 
-        async def listen_stdin() -> None:
-            """Listen for stdin messages (RPC requests)."""
-            while not done_event.is_set():
-                try:
-                    msg = await self._kc.get_stdin_msg(timeout=0.5)
-                    await self._handle_stdin_message(msg, msg_id)
-                except Empty:
-                    # Timeout on queue.get() - normal during polling, continue waiting
-                    continue
-                except asyncio.CancelledError:
-                    break
-                except Exception as e:
-                    # Log and continue to prevent listener thread crash
-                    logger.warning("Error handling stdin message: %s", e)
-
-        async def listen_iopub() -> None:
-            """Listen for iopub messages (output, results, errors)."""
-            while not done_event.is_set():
-                try:
-                    msg = await self._kc.get_iopub_msg(timeout=0.5)
-                    self._handle_iopub_message(msg, result, msg_id)
-                except Empty:
-                    # Timeout on queue.get() - normal during polling, continue waiting
-                    continue
-                except asyncio.CancelledError:
-                    break
-                except Exception as e:
-                    # Log and continue to prevent listener thread crash
-                    logger.warning("Error handling iopub message: %s", e)
-
-        async def listen_shell() -> None:
-            """Listen for shell messages (execute_reply signals completion)."""
-            while not done_event.is_set():
-                # Check if kernel died
-                if self._km is not None and not await self._km.is_alive():
-                    result.error = "Kernel died during execution"
-                    done_event.set()
-                    return
-                try:
-                    msg = await self._kc.get_shell_msg(timeout=0.5)
-                    if msg["parent_header"].get("msg_id") == msg_id:
-                        if msg["msg_type"] == "execute_reply":
-                            content = msg["content"]
-                            if content["status"] == "error":
-                                result.error = content.get("evalue", "Unknown error")
-                                result.traceback = content.get("traceback", [])
-                            done_event.set()
-                except Empty:
-                    # Timeout on queue.get() - normal during polling, continue waiting
-                    continue
-                except asyncio.CancelledError:
-                    break
-                except Exception as e:
-                    # Log and continue to prevent listener thread crash
-                    logger.warning("Error handling shell message: %s", e)
-
-        async def timeout_watcher() -> None:
-            """Watch for timeout if specified."""
-            if timeout is None:
-                return
-            try:
-                await asyncio.sleep(timeout)
-                if not done_event.is_set():
-                    result.error = f"Execution timed out after {timeout}s"
-                    done_event.set()
-            except asyncio.CancelledError:
-                pass
-
-        # Start concurrent listeners
-        stdin_task = asyncio.create_task(listen_stdin())
-        iopub_task = asyncio.create_task(listen_iopub())
-        shell_task = asyncio.create_task(listen_shell())
-        timeout_task = asyncio.create_task(timeout_watcher()) if timeout else None
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        # One outstanding receive per channel, all awaited together. A channel's
+        # receive is re-armed as soon as its message has been handled, so no
+        # channel is ever polled on a fixed interval.
+        receivers = {
+            "shell": self._kc.get_shell_msg,
+            "iopub": self._kc.get_iopub_msg,
+            "stdin": self._kc.get_stdin_msg,
+        }
+        # Maps each pending receive to its channel name
+        pending: dict[asyncio.Future[Any], str] = {
+            asyncio.ensure_future(receive()): channel for channel, receive in receivers.items()
+        }
+
+        # Execution is complete once the kernel has sent both the execute_reply
+        # (shell) and the status: idle (iopub) for our request. Waiting for idle
+        # guarantees all output for this request has been received, since iopub
+        # messages are delivered in order.
+        reply_received = False
+        idle_received = False
 
         try:
-            # Wait for execution to complete
-            await done_event.wait()
+            while not (reply_received and idle_received):
+                wait_for = _LIVENESS_CHECK_INTERVAL
+                if deadline is not None:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        result.error = f"Execution timed out after {timeout}s"
+                        break
+                    wait_for = min(wait_for, remaining)
+
+                done, _ = await asyncio.wait(
+                    pending, timeout=wait_for, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    # Nothing arrived for a while - check if kernel died
+                    if self._km is not None and not await self._km.is_alive():
+                        result.error = "Kernel died during execution"
+                        break
+                    continue
+
+                for task in done:
+                    channel = pending.pop(task)
+                    try:
+                        msg = task.result()
+                    except Exception as e:
+                        # Log and continue to keep the execution loop alive
+                        logger.warning("Error handling %s message: %s", channel, e)
+                        msg = None
+
+                    if msg is not None:
+                        if channel == "shell":
+                            reply_received |= self._handle_shell_message(msg, result, msg_id)
+                        elif channel == "iopub":
+                            idle_received |= self._handle_iopub_message(msg, result, msg_id, output)
+                        else:
+                            self._handle_stdin_message(msg)
+
+                    pending[asyncio.ensure_future(receivers[channel]())] = channel
         finally:
-            # Cancel all listener tasks
-            stdin_task.cancel()
-            iopub_task.cancel()
-            shell_task.cancel()
-            if timeout_task:
-                timeout_task.cancel()
-
-            # Wait for tasks to finish cancellation
-            tasks = [stdin_task, iopub_task, shell_task]
-            if timeout_task:
-                tasks.append(timeout_task)
-
-            for task in tasks:
-                try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
-
-        # Drain any remaining iopub messages after execution completes
-        try:
-            while True:
-                iopub_msg = await self._kc.get_iopub_msg(timeout=0.1)
-                self._handle_iopub_message(iopub_msg, result, msg_id)
-        except Empty:
-            # Queue exhausted - all remaining messages processed
-            pass
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
+        result.stdout = "".join(output.stdout)
+        result.stderr = "".join(output.stderr)
         return result
 
-    def _handle_iopub_message(
+    def _handle_shell_message(
         self, msg: dict[str, Any], result: ExecutionResult, exec_msg_id: str
-    ) -> None:
-        """Handle a message from the iopub channel."""
+    ) -> bool:
+        """Handle a message from the shell channel.
+
+        Returns:
+            True if this is the execute_reply for the current execution.
+        """
+        if msg.get("parent_header", {}).get("msg_id") != exec_msg_id:
+            return False
+        if msg.get("msg_type") != "execute_reply":
+            return False
+
+        content = msg.get("content", {})
+        if content.get("status") == "error":
+            result.error = content.get("evalue", "Unknown error")
+            result.traceback = content.get("traceback", [])
+        return True
+
+    def _handle_iopub_message(
+        self,
+        msg: dict[str, Any],
+        result: ExecutionResult,
+        exec_msg_id: str,
+        output: _CellOutput,
+    ) -> bool:
+        """Handle a message from the iopub channel.
+
+        Returns:
+            True if this is the status: idle for the current execution.
+        """
         msg_type = msg.get("msg_type") or msg.get("header", {}).get("msg_type")
         content = msg.get("content", {})
         parent_msg_id = msg.get("parent_header", {}).get("msg_id")
@@ -365,68 +462,161 @@ class KernelHost:
         if msg_type == "stream":
             text = content.get("text", "")
             if content.get("name") == "stdout":
-                result.stdout += text
+                output.stdout.append(text)
+                output.emit(StdoutEvent(text))
             elif content.get("name") == "stderr":
-                result.stderr += text
+                output.stderr.append(text)
+                output.emit(StderrEvent(text))
+
+        elif msg_type in ("display_data", "update_display_data"):
+            if parent_msg_id == exec_msg_id:
+                output.emit(DisplayEvent(content.get("data", {})))
 
         elif msg_type == "execute_result":
             if parent_msg_id == exec_msg_id:
-                result.value = content.get("data", {}).get("text/plain")
+                data = content.get("data", {})
+                result.value = data.get("text/plain")
+                result.value_payload = data.get(RESULT_MIMETYPE)
 
         elif msg_type == "error":
             if parent_msg_id == exec_msg_id:
                 result.error = content.get("evalue", "Unknown error")
                 result.traceback = content.get("traceback", [])
 
-    async def _handle_stdin_message(self, msg: dict[str, Any], exec_msg_id: str) -> None:
-        """Handle a stdin message - could be RPC request or regular input."""
+        elif msg_type == "status":
+            if parent_msg_id == exec_msg_id:
+                return bool(content.get("execution_state") == "idle")
+
+        return False
+
+    def _handle_stdin_message(self, msg: dict[str, Any]) -> None:
+        """Handle a stdin message - a regular input() call from user code."""
         if msg["msg_type"] != "input_request":
             return
 
-        content = msg.get("content", {})
-        prompt = content.get("prompt", "")
+        # We don't support interactive input - send an empty response
+        self._send_input_reply("")
 
-        # Check if this is an RPC request (JSON in prompt)
+    def _get_init_code(self) -> str:
+        """Build the kernel init code pointing at this host's RPC socket."""
+        return get_kernel_init_code(
+            ipc_timeout=self._ipc_timeout,
+            rpc_endpoint=self._rpc_endpoint,
+            rpc_token=self._rpc_token,
+            rpc_codecs=available_codecs(),
+            preload_modules=self._preload_modules,
+        )
+
+    def _start_rpc_server(self) -> None:
+        """Bind the RPC ROUTER socket and start serving requests.
+
+        The socket listens on a random localhost port. Every request must carry
+        a per-host random token, so other local processes cannot use it.
+        """
+        self._rpc_context = zmq.asyncio.Context()
+        self._rpc_socket = self._rpc_context.socket(zmq.ROUTER)
+        self._rpc_socket.setsockopt(zmq.LINGER, 0)
+        self._rpc_socket.bind("tcp://127.0.0.1:*")
+        self._rpc_endpoint = self._rpc_socket.getsockopt_string(zmq.LAST_ENDPOINT)
+        self._rpc_token = secrets.token_hex(16)
+        self._rpc_server = asyncio.create_task(self._serve_rpc())
+
+    async def _serve_rpc(self) -> None:
+        """Receive RPC requests and handle each one in its own task."""
+        assert self._rpc_socket is not None
+        while True:
+            identity, *frames = await self._rpc_socket.recv_multipart()
+            task = asyncio.create_task(self._handle_rpc_message(identity, frames))
+            # Keep a reference until done so the task isn't garbage collected
+            self._rpc_tasks.add(task)
+            task.add_done_callback(self._rpc_tasks.discard)
+
+    async def _handle_rpc_message(self, identity: bytes, frames: list[bytes]) -> None:
+        """Handle one RPC request and send the response back to its sender."""
         try:
-            request_data = json.loads(prompt)
-            if request_data.get("type") == "rpc_request":
-                await self._handle_rpc_request(request_data)
-                return
-        except json.JSONDecodeError:
-            pass
-
-        # Not an RPC request - this would be regular input()
-        # Send empty response (we don't support interactive input)
-        self._send_input_reply("")
+            codec, data = decode_message(frames)
+        except Exception as e:
+            logger.warning("Dropping undecodable RPC message: %s", e)
+            return
 
-    async def _handle_rpc_request(self, data: dict[str, Any]) -> None:
-        """Handle an RPC request from the kernel."""
-        if self._provider is None:
-            self._send_input_reply(
-                json.dumps(RPCResponse(id=data["id"], error="No provider").to_dict())
-            )
+        if not hmac.compare_digest(str(data.get("token", "")), self._rpc_token):
+            logger.warning("Dropping RPC message with invalid token")
             return
 
-        request = RPCRequest.from_dict(data)
+        response = await self._handle_rpc_request(data)
+        try:
+            reply = encode_message(response, codec)
+        except (TypeError, ValueError, OverflowError) as e:
+            # The result can't be sent with this codec - report it to the caller
+            # instead of leaving it waiting for a response that never comes
+            reply = encode_message(self._rpc_error_response(data, e), codec)
+
+        if self._rpc_socket is None:
+            return
+        try:
+            await self._rpc_socket.send_multipart([identity, *reply], copy=False)
+        except Exception as e:
+            logger.warning("Failed to send RPC response for %s: %s", data.get("method"), e)
 
+    async def _handle_rpc_request(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Handle an RPC request from the kernel and build the response."""
         try:
-            rpc_result = await self._dispatch_rpc(request)
-            response = RPCResponse(id=request.id, result=rpc_result)
+            rpc_result = await self._dispatch_rpc(RPCRequest.from_dict(data))
         except Exception as e:
-            namespace, operation = _parse_method(request.method)
-            logger.warning("RPC error for %s.%s: %s", namespace, operation, e)
-            response = RPCResponse(
-                id=request.id,
-                error={
-                    "namespace": namespace,
-                    "operation": operation,
-                    "message": str(e),
-                    "type": type(e).__name__,
-                },
-            )
+            logger.warning("RPC error for %s: %s", data.get("method"), e)
+            return self._rpc_error_response(data, e)
+        return RPCResponse(id=data["id"], result=rpc_result).to_dict()
+
+    @staticmethod
+    def _rpc_error_response(data: dict[str, Any], error: Exception) -> dict[str, Any]:
+        """Build a structured error response for a request."""
+        return RPCResponse(
+            id=data["id"], error=_rpc_error_dict(data.get("method", ""), error)
+        ).to_dict()
+
+    async def _call_tools_batch(
+        self, calls: list[dict[str, Any]], concurrency: int | None
+    ) -> list[dict[str, Any]]:
+        """Run a tools.call_many batch on the provider concurrently.
 
-        # Send response back via input_reply
-        self._send_input_reply(json.dumps(response.to_dict()))
+        Returns:
+            One {"result": ...} or {"error": {...}} entry per call, in order.
+            Errors use the same structure as a failed tools.call response.
+        """
+        assert self._provider is not None
+        provider = self._provider
+        outcomes = await gather_with_concurrency(
+            [
+                functools.partial(provider.call_tool, call["name"], call.get("args", {}))
+                for call in calls
+            ],
+            concurrency,
+        )
+        return [
+            {"error": _rpc_error_dict("tools.call", outcome)}
+            if isinstance(outcome, Exception)
+            else {"result": outcome}
+            for outcome in outcomes
+        ]
+
+    async def _stop_rpc_server(self) -> None:
+        """Stop serving RPC requests and close the socket."""
+        tasks = list(self._rpc_tasks)
+        if self._rpc_server is not None:
+            tasks.append(self._rpc_server)
+            self._rpc_server = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._rpc_tasks.clear()
+
+        if self._rpc_socket is not None:
+            self._rpc_socket.close(linger=0)
+            self._rpc_socket = None
+        if self._rpc_context is not None:
+            self._rpc_context.term()
+            self._rpc_context = None
+        self._rpc_endpoint = None
 
     async def _dispatch_rpc(self, request: RPCRequest) -> Any:
         """Dispatch an RPC request to the appropriate provider method."""
@@ -445,6 +635,10 @@ class KernelHost:
             return await self._provider.search_tools(params["query"], params.get("limit", 10))
         elif method == "tools.list_recipes":
             return await self._provider.list_tool_recipes(params["name"])
+        elif method == "tools.call_many":
+            return await self._call_tools_batch(
+                params["calls"], params.get("concurrency", DEFAULT_BATCH_CONCURRENCY)
+            )
 
         # Skills methods
         # Note: skills.invoke is NOT handled here - skills execute locally in kernel
@@ -455,6 +649,10 @@ class KernelHost:
         elif method == "skills.list":
             return await self._provider.list_skills()
         elif method == "skills.get":
+            if params.get("if_none_match") is not None:
+                return await self._provider.get_skill(
+                    params["name"], if_none_match=params["if_none_match"]
+                )
             return await self._provider.get_skill(params["name"])
         elif method == "skills.create":
             return await self._provider.create_skill(
@@ -470,6 +668,26 @@ class KernelHost:
             return await self._provider.save_artifact(
                 params["name"], params["data"], params.get("description", "")
             )
+        elif method == "artifacts.open_read":
+            return await self._provider.open_artifact_reader(params["name"])
+        elif method == "artifacts.read":
+            return await self._provider.read_artifact(
+                params["download"], params["offset"], params["size"]
+            )
+        elif method == "artifacts.close_read":
+            return await self._provider.close_artifact_reader(params["download"])
+        elif method == "artifacts.view":
+            return await self._provider.view_artifact(params["name"])
+        elif method == "artifacts.open_write":
+            return await self._provider.open_artifact_writer(
+                params["name"], params.get("description", "")
+            )
+        elif method == "artifacts.write":
+            return await self._provider.write_artifact(params["upload"], params["data"])
+        elif method == "artifacts.close_write":
+            return await self._provider.close_artifact_writer(
+                params["upload"], params.get("commit", True)
+            )
         elif method == "artifacts.list":
             return await self._provider.list_artifacts()
         elif method == "artifacts.delete":
@@ -514,9 +732,8 @@ class KernelHost:
         if self._kc is not None:
             await self._kc.wait_for_ready(timeout=startup_timeout)
 
-        # Reinitialize RPC
-        init_code = get_kernel_init_code(ipc_timeout=self._ipc_timeout)
-        init_result = await self.execute(init_code, allow_stdin=True)
+        # Reinitialize RPC proxies; the host's RPC socket stays bound across restarts
+        init_result = await self.execute(self._get_init_code(), allow_stdin=True)
         if not init_result.success:
             raise RuntimeError(f"Failed to reinitialize kernel RPC: {init_result.error}")
 
@@ -530,12 +747,34 @@ class KernelHost:
             await self._km.shutdown_kernel(now=True)
             self._km = None
 
+        await self._stop_rpc_server()
         self._provider = None
 
+    def set_provider(self, provider: ResourceProvider | None) -> None:
+        """Attach the ResourceProvider that serves RPC requests.
+
+        Lets a kernel be started before its session exists (see KernelPool)
+        and bound to that session's resources at checkout.
+
+        Args:
+            provider: ResourceProvider for handling RPC requests.
+        """
+        self._provider = provider
+
     @property
     def is_alive(self) -> bool:
-        """Check if the kernel is alive."""
+        """Check, without waiting, whether the kernel process is running.
+
+        AsyncKernelManager.is_alive() is a coroutine, so this polls the
+        provisioner's process directly; check_alive() asks the manager.
+        """
+        if self._km is None or not self._km.has_kernel:
+            return False
+        process = getattr(self._km.provisioner, "process", None)
+        return bool(process is not None and process.poll() is None)
+
+    async def check_alive(self) -> bool:
+        """Check if the kernel process is still running."""
         if self._km is None:
             return False
-        # is_alive() is sync for AsyncKernelManager
-        return self._km.is_alive()
+        return bool(await self._km.is_alive())
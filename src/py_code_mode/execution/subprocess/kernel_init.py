@@ -4,29 +4,50 @@ This module provides the KERNEL_INIT_CODE constant - a Python code string that
 is executed in the kernel subprocess to set up the RPC mechanism and proxy
 namespaces for tools, skills, artifacts, and deps.
 
-The proxies forward all namespace operations to the host via the stdin channel,
-which allows the host to control access to storage and tools while maintaining
-process isolation.
+The proxies forward all namespace operations to the host over a dedicated ZMQ
+RPC socket, which allows the host to control access to storage and tools while
+maintaining process isolation. Each kernel thread uses its own connection, so
+calls from threads run concurrently.
 """
 
 from __future__ import annotations
 
+from py_code_mode.artifacts.base import ARTIFACT_CHUNK_SIZE
+from py_code_mode.tools.namespace import DEFAULT_BATCH_CONCURRENCY
 
-def get_kernel_init_code(ipc_timeout: float | None = None) -> str:
+
+def get_kernel_init_code(
+    ipc_timeout: float | None = None,
+    rpc_endpoint: str | None = None,
+    rpc_token: str = "",
+    rpc_codecs: list[str] | None = None,
+    preload_modules: tuple[str, ...] = (),
+) -> str:
     """Generate kernel initialization code with configurable timeout.
 
     Args:
         ipc_timeout: Timeout for RPC calls in seconds. Default: 30.0.
+        rpc_endpoint: ZMQ endpoint of the host's RPC socket.
+        rpc_token: Token the host requires on every RPC request.
+        rpc_codecs: Body codecs the host accepts, in order of preference.
+            The kernel uses the first one it can import. Default: ["json"].
+        preload_modules: Modules to import during init so user code finds them
+            in sys.modules. Modules that are not installed are skipped.
 
     Returns:
         Python code string to execute in the kernel.
     """
+    if rpc_codecs is None:
+        rpc_codecs = ["json"]
     return f'''# Auto-generated RPC setup for SubprocessExecutor
-# This code sets up proxy namespaces that forward calls to the host via stdin channel.
+# This code sets up proxy namespaces that forward calls to the host via the RPC socket.
 
 from __future__ import annotations
 
+import io
 import json
+import mmap
+import os
 import threading
 import uuid
 from typing import Any, NamedTuple
@@ -48,12 +69,166 @@ if _ip is not None:
 
     # Will be registered after NamespaceError is defined (see below)
 
-# Threading lock to prevent concurrent RPC corruption
-_rpc_lock = threading.Lock()
-
 # Configurable timeout for RPC calls
 _RPC_TIMEOUT = {ipc_timeout}
 
+# Host RPC socket and the token it expects on every request
+_RPC_ENDPOINT = {rpc_endpoint!r}
+_RPC_TOKEN = {rpc_token!r}
+
+# One DEALER socket per thread - ZMQ sockets must not be shared between threads
+_rpc_context = zmq.Context()
+_rpc_local = threading.local()
+
+
+# =============================================================================
+# RPC wire framing (mirrors py_code_mode.execution.subprocess.rpc)
+# =============================================================================
+# Messages are [header, body, *buffers]. Large bytes-like values are lifted out
+# of the body into their own frames and referenced by index.
+
+_RPC_PROTOCOL_VERSION = 1
+_RPC_BUFFER_REF_KEY = "__rpc_buffer__"
+_RPC_BUFFER_EXT_TYPE = 1
+_RPC_MSGPACK_OOB_THRESHOLD = 64 * 1024
+_RPC_MSGPACK_OOB_DEPTH = 3
+_RPC_BUFFER_TYPES = (bytes, bytearray, memoryview)
+
+# Use msgpack when both the host and this kernel's environment have it
+try:
+    import msgpack as _msgpack
+except ImportError:
+    _msgpack = None
+if _msgpack is not None and "msgpack" in {rpc_codecs!r}:
+    _RPC_CODEC = "msgpack"
+else:
+    _RPC_CODEC = "json"
+
+
+def _rpc_lift_buffers(obj, buffers, depth):
+    """Replace large bytes-like values with msgpack buffer references."""
+    if isinstance(obj, _RPC_BUFFER_TYPES):
+        if memoryview(obj).nbytes < _RPC_MSGPACK_OOB_THRESHOLD:
+            return obj
+        buffers.append(obj)
+        return _msgpack.ExtType(_RPC_BUFFER_EXT_TYPE, str(len(buffers) - 1).encode())
+    if depth <= 0:
+        return obj
+    if isinstance(obj, dict):
+        lifted = {{k: _rpc_lift_buffers(v, buffers, depth - 1) for k, v in obj.items()}}
+        if any(lifted[k] is not v for k, v in obj.items()):
+            return lifted
+    elif isinstance(obj, (list, tuple)):
+        lifted_items = [_rpc_lift_buffers(v, buffers, depth - 1) for v in obj]
+        if any(new is not old for new, old in zip(lifted_items, obj)):
+            return lifted_items
+    return obj
+
+
+def _rpc_encode(message):
+    """Encode an RPC message dict into multipart frames."""
+    buffers = []
+    if _RPC_CODEC == "msgpack":
+        body = _msgpack.packb(_rpc_lift_buffers(message, buffers, _RPC_MSGPACK_OOB_DEPTH))
+    else:
+        def lift(obj):
+            if isinstance(obj, _RPC_BUFFER_TYPES):
+                buffers.append(obj)
+                return {{_RPC_BUFFER_REF_KEY: len(buffers) - 1}}
+            raise TypeError(f"Object of type {{type(obj).__name__}} is not JSON serializable")
+
+        body = json.dumps(message, default=lift).encode()
+    header = f"{{_RPC_PROTOCOL_VERSION}}:{{_RPC_CODEC}}".encode()
+    return [header, body, *buffers]
+
+
+def _rpc_decode(frames):
+    """Decode multipart frames into an RPC message dict."""
+    header = frames[0].decode("ascii", errors="replace")
+    version, _, codec = header.partition(":")
+    if version != str(_RPC_PROTOCOL_VERSION):
+        raise ValueError(f"Unsupported RPC protocol version: {{version!r}}")
+    buffers = frames[2:]
+    if codec == "msgpack" and _msgpack is not None:
+        def ext_hook(code, data):
+            if code == _RPC_BUFFER_EXT_TYPE:
+                return buffers[int(data)]
+            return _msgpack.ExtType(code, data)
+
+        return _msgpack.unpackb(frames[1], ext_hook=ext_hook, strict_map_key=False)
+    if codec == "json":
+        def object_hook(obj):
+            if len(obj) == 1 and _RPC_BUFFER_REF_KEY in obj:
+                return buffers[obj[_RPC_BUFFER_REF_KEY]]
+            return obj
+
+        return json.loads(frames[1], object_hook=object_hook)
+    raise ValueError(f"Unsupported RPC codec: {{codec!r}}")
+
+
+# =============================================================================
+# Result values (mirrors encode_result_value in rpc.py)
+# =============================================================================
+# With msgpack, cell results are also published under _RESULT_MIMETYPE so the
+# host gets the value itself instead of parsing the (truncated) text/plain repr.
+
+_RESULT_MIMETYPE = "application/vnd.py-code-mode.value+msgpack"
+_VALUE_EXT_TUPLE = 2
+_VALUE_EXT_SET = 3
+_VALUE_EXT_FROZENSET = 4
+_VALUE_EXT_COMPLEX = 5
+_VALUE_EXT_BIGINT = 6
+_VALUE_EXT_NDARRAY = 7
+
+
+def _value_default(obj):
+    obj_type = type(obj)
+    if obj_type is tuple:
+        return _msgpack.ExtType(_VALUE_EXT_TUPLE, _pack_value(list(obj)))
+    if obj_type is set:
+        return _msgpack.ExtType(_VALUE_EXT_SET, _pack_value(list(obj)))
+    if obj_type is frozenset:
+        return _msgpack.ExtType(_VALUE_EXT_FROZENSET, _pack_value(list(obj)))
+    if obj_type is complex:
+        return _msgpack.ExtType(_VALUE_EXT_COMPLEX, _pack_value([obj.real, obj.imag]))
+    if obj_type is int:
+        return _msgpack.ExtType(_VALUE_EXT_BIGINT, str(obj).encode("ascii"))
+    numpy = __import__("sys").modules.get("numpy")
+    if numpy is not None and isinstance(obj, (numpy.ndarray, numpy.generic)):
+        array = numpy.asarray(obj)
+        if array.dtype.hasobject or array.dtype.fields is not None:
+            raise TypeError(f"Cannot encode array of dtype {{array.dtype}}")
+        header = [array.dtype.str, list(array.shape), isinstance(obj, numpy.generic)]
+        payload = _pack_value([header, numpy.ascontiguousarray(array).data])
+        return _msgpack.ExtType(_VALUE_EXT_NDARRAY, payload)
+    raise TypeError(f"Cannot encode value of type {{obj_type.__name__}}")
+
+
+def _pack_value(obj):
+    return _msgpack.packb(obj, default=_value_default, strict_types=True)
+
+
+def _install_result_value_hook(ip):
+    """Add the structured result to every execute_result's format data."""
+    import base64
+
+    compute_format_data = ip.displayhook.compute_format_data
+
+    def compute_format_data_with_value(result):
+        data, metadata = compute_format_data(result)
+        try:
+            data[_RESULT_MIMETYPE] = base64.b64encode(_pack_value(result)).decode("ascii")
+        except Exception:
+            # Not exactly encodable - the host falls back to text/plain
+            pass
+        return data, metadata
+
+    ip.displayhook.compute_format_data = compute_format_data_with_value
+
+
+if _ip is not None and _RPC_CODEC == "msgpack":
+    _install_result_value_hook(_ip)
+
 
 # =============================================================================
 # RPC Error Hierarchy (mirrors py_code_mode.errors)
@@ -171,12 +346,24 @@ class ArtifactMeta(NamedTuple):
     created_at: str
 
 
+def _get_rpc_socket():
+    """Get this thread's connection to the host RPC socket, creating it on first use."""
+    sock = getattr(_rpc_local, "socket", None)
+    if sock is None:
+        if _RPC_ENDPOINT is None:
+            raise RuntimeError("RPC channel is not configured")
+        sock = _rpc_context.socket(zmq.DEALER)
+        sock.setsockopt(zmq.LINGER, 0)
+        sock.connect(_RPC_ENDPOINT)
+        _rpc_local.socket = sock
+    return sock
+
+
 def _rpc_call(method: str, **params) -> Any:
-    """Make an RPC call using stdin channel - works during execution.
+    """Make an RPC call to the host over the RPC socket.
 
-    This function sends an RPC request to the host via input_request and
-    waits for the response via input_reply. The host processes the request
-    and returns the result.
+    Safe to call from any thread, including while other threads have calls
+    in flight. The host handles concurrent requests concurrently.
 
     Args:
         method: The RPC method name.
@@ -186,116 +373,87 @@ def _rpc_call(method: str, **params) -> Any:
         The result from the host.
 
     Raises:
-        RuntimeError: If stdin is disabled, RPC fails, or response is malformed.
+        RuntimeError: If the RPC channel is unavailable or response is malformed.
         TimeoutError: If the RPC call times out.
     """
-    with _rpc_lock:
-        kernel = get_ipython().kernel
-
-        if not kernel._allow_stdin:
-            raise RuntimeError("RPC requires stdin to be enabled")
-
-        request_id = str(uuid.uuid4())
-        request = {{
-            "type": "rpc_request",
-            "id": request_id,
-            "method": method,
-            "params": params,
-        }}
-
-        # Get parent context for stdin routing
-        parent_ident = kernel._get_shell_context_var(kernel._shell_parent_ident)
-        parent = kernel.get_parent("shell")
-
-        # Flush stdout/stderr to ensure output ordering
-        import sys
-        if sys.stdout is not None:
-            sys.stdout.flush()
-        if sys.stderr is not None:
-            sys.stderr.flush()
-
-        # Flush stale stdin replies that might be lingering
-        while True:
-            try:
-                kernel.stdin_socket.recv_multipart(zmq.NOBLOCK)
-            except zmq.ZMQError as e:
-                if e.errno == zmq.EAGAIN:
-                    break
-                raise
-
-        # Send RPC request as input_request with JSON in prompt field
-        content = {{
-            "prompt": json.dumps(request),
-            "password": False,
-        }}
-        kernel.session.send(
-            kernel.stdin_socket,
-            "input_request",
-            content,
-            parent,
-            ident=parent_ident,
-        )
-
-        # Wait for response (with optional timeout)
-        elapsed = 0.0
-        poll_interval = 0.01
-
-        while _RPC_TIMEOUT is None or elapsed < _RPC_TIMEOUT:
-            try:
-                rlist, _, xlist = zmq.select(
-                    [kernel.stdin_socket], [], [kernel.stdin_socket], poll_interval
-                )
-                if rlist or xlist:
-                    ident, reply = kernel.session.recv(kernel.stdin_socket)
-                    if (ident, reply) != (None, None):
-                        break
-            except KeyboardInterrupt:
-                raise KeyboardInterrupt("RPC call interrupted") from None
-            except zmq.ZMQError:
-                pass  # Timeout or socket error, continue polling
-            elapsed += poll_interval
+    sock = _get_rpc_socket()
+
+    request_id = str(uuid.uuid4())
+    request = {{
+        "type": "rpc_request",
+        "id": request_id,
+        "token": _RPC_TOKEN,
+        "method": method,
+        "params": params,
+    }}
+
+    # Flush stdout/stderr to ensure output ordering
+    import sys
+    if sys.stdout is not None:
+        sys.stdout.flush()
+    if sys.stderr is not None:
+        sys.stderr.flush()
+
+    sock.send_multipart(_rpc_encode(request), copy=False)
+
+    # Wait for the response matching our request id. Replies to earlier calls
+    # on this socket that timed out may still arrive - skip them.
+    import time
+    deadline = None if _RPC_TIMEOUT is None else time.monotonic() + _RPC_TIMEOUT
+    while True:
+        if deadline is None:
+            wait_ms = None
         else:
+            wait_ms = max(0, int((deadline - time.monotonic()) * 1000))
+        try:
+            ready = sock.poll(wait_ms)
+        except KeyboardInterrupt:
+            raise KeyboardInterrupt("RPC call interrupted") from None
+        if not ready:
             raise TimeoutError(f"RPC call {{method}} timed out after {{_RPC_TIMEOUT}}s")
-
-        # Parse response
+        response_frames = sock.recv_multipart()
         try:
-            response_str = reply["content"]["value"]
-            response = json.loads(response_str)
+            response = _rpc_decode(response_frames)
         except Exception as e:
             raise RuntimeError(f"Failed to parse RPC response: {{e}}")
-
-        if response.get("error"):
-            err = response["error"]
-            if isinstance(err, dict):
-                # Validate required keys
-                required_keys = {{"namespace", "operation", "message", "type"}}
-                if not required_keys.issubset(err.keys()):
-                    raise RPCTransportError(f"Malformed RPC error dict (missing keys): {{err!r}}")
-
-                # Structured error from host
-                namespace = err["namespace"]
-                operation = err["operation"]
-                message = err["message"]
-                error_type = err["type"]
-
-                # Map namespace to error class, suppress traceback (from None)
-                # The error originated host-side, kernel traceback is just RPC plumbing
-                if namespace == "skills":
-                    raise SkillError(operation, message, error_type) from None
-                elif namespace == "tools":
-                    raise ToolError(operation, message, error_type) from None
-                elif namespace == "artifacts":
-                    raise ArtifactError(operation, message, error_type) from None
-                elif namespace == "deps":
-                    raise DepsError(operation, message, error_type) from None
-                else:
-                    msg = f"{{namespace}}.{{operation}}: [{{error_type}}] {{message}}"
-                    raise RPCError(msg) from None
-            else:
-                # Non-dict error is a protocol violation
-                raise RPCTransportError(f"Host sent non-dict error (protocol violation): {{err!r}}")
-
-        return response.get("result")
+        if response.get("id") == request_id:
+            break
+
+    if response.get("error"):
+        raise _rpc_error_from_dict(response["error"]) from None
+
+    return response.get("result")
+
+
+def _rpc_error_from_dict(err) -> Exception:
+    """Build the exception for a structured error sent by the host."""
+    if not isinstance(err, dict):
+        # Non-dict error is a protocol violation
+        return RPCTransportError(f"Host sent non-dict error (protocol violation): {{err!r}}")
+
+    # Validate required keys
+    required_keys = {{"namespace", "operation", "message", "type"}}
+    if not required_keys.issubset(err.keys()):
+        return RPCTransportError(f"Malformed RPC error dict (missing keys): {{err!r}}")
+
+    # Structured error from host
+    namespace = err["namespace"]
+    operation = err["operation"]
+    message = err["message"]
+    error_type = err["type"]
+
+    # Map namespace to error class. Callers raise it "from None": the error
+    # originated host-side, kernel traceback is just RPC plumbing
+    if namespace == "skills":
+        return SkillError(operation, message, error_type)
+    elif namespace == "tools":
+        return ToolError(operation, message, error_type)
+    elif namespace == "artifacts":
+        return ArtifactError(operation, message, error_type)
+    elif namespace == "deps":
+        return DepsError(operation, message, error_type)
+    else:
+        return RPCError(f"{{namespace}}.{{operation}}: [{{error_type}}] {{message}}")
 
 
 class _ToolRecipeProxy:
@@ -304,15 +462,12 @@ class _ToolRecipeProxy:
     def __init__(self, tool_name: str, recipe_name: str):
         self._tool_name = tool_name
         self._recipe_name = recipe_name
+        # Recipe invocation: name is "tool.recipe"
+        self._rpc_name = f"{{tool_name}}.{{recipe_name}}"
 
     def __call__(self, **kwargs) -> Any:
         """Invoke the recipe with given arguments."""
-        # Recipe invocation: name is "tool.recipe"
-        return _rpc_call(
-            "tools.call",
-            name=f"{{self._tool_name}}.{{self._recipe_name}}",
-            args=kwargs,
-        )
+        return _rpc_call("tools.call", name=self._rpc_name, args=kwargs)
 
 
 class _ToolProxy:
@@ -320,6 +475,7 @@ class _ToolProxy:
 
     def __init__(self, name: str, validated: bool = False):
         self._name = name
+        self._rpc_name = name
         self._validated = validated
 
     def __call__(self, **kwargs) -> Any:
@@ -364,6 +520,7 @@ class ToolsProxy:
     - tools.curl.get(url="...") - recipe invocation
     - tools.list() - list all tools
     - tools.search("query") - search tools
+    - tools.map(tools.curl.get, [{{"url": u}}, ...]) - batched concurrent calls
     """
 
     def __getattr__(self, name: str) -> _ToolProxy:
@@ -400,6 +557,78 @@ class ToolsProxy:
         # Return raw dicts (not NamedTuples) so they serialize cleanly through IPython
         return _rpc_call("tools.search", query=query, limit=limit)
 
+    def gather(
+        self,
+        *calls: tuple[Any, dict[str, Any]],
+        concurrency: int | None = {DEFAULT_BATCH_CONCURRENCY},
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Run several tool calls concurrently on the host in one RPC.
+
+        Usage:
+            tools.gather((tools.curl.get, {{"url": a}}), (tools.jq.query, {{"filter": f}}))
+
+        Args:
+            *calls: (tool or recipe, kwargs) pairs.
+            concurrency: Maximum calls the host runs at once. None means no limit.
+            return_exceptions: If True, failed calls put their ToolError in the
+                result list. If False, the first failure (in call order) is
+                raised after all calls finish.
+
+        Returns:
+            List of results in call order.
+        """
+        batch = []
+        for fn, kwargs in calls:
+            if not isinstance(fn, (_ToolProxy, _ToolRecipeProxy)):
+                raise TypeError(
+                    f"Expected a tool or recipe (e.g. tools.curl.get), got {{type(fn).__name__}}"
+                )
+            if not isinstance(kwargs, dict):
+                raise TypeError(f"Expected a dict of arguments, got {{type(kwargs).__name__}}")
+            batch.append({{"name": fn._rpc_name, "args": kwargs}})
+        if concurrency is not None and concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1 or None, got {{concurrency}}")
+        if not batch:
+            return []
+
+        results = []
+        for outcome in _rpc_call("tools.call_many", calls=batch, concurrency=concurrency):
+            if "error" in outcome:
+                error = _rpc_error_from_dict(outcome["error"])
+                if not return_exceptions:
+                    raise error from None
+                results.append(error)
+            else:
+                results.append(outcome.get("result"))
+        return results
+
+    def map(
+        self,
+        fn: Any,
+        kwargs_list,
+        *,
+        concurrency: int | None = {DEFAULT_BATCH_CONCURRENCY},
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Call one tool or recipe once per kwargs dict, concurrently, in one RPC.
+
+        Usage:
+            pages = tools.map(tools.curl.get, [{{"url": u}} for u in urls], concurrency=16)
+
+        See gather() for the arguments and return value.
+        """
+        return self.gather(
+            *((fn, kwargs) for kwargs in kwargs_list),
+            concurrency=concurrency,
+            return_exceptions=return_exceptions,
+        )
+
+
+# Compiled skills by name: (content_hash, run function). Validated against the
+# host on every invoke; create/delete drop the entry immediately.
+_skill_cache: dict[str, tuple[str, Any]] = {{}}
+
 
 class SkillsProxy:
     """Proxy for invoking host skills.
@@ -413,25 +642,24 @@ class SkillsProxy:
     - skills.skill_name(arg=value) - direct invocation syntax
     """
 
-    def invoke(self, skill_name: str, **kwargs) -> Any:
-        """Invoke a skill by name.
+    def _load(self, skill_name: str) -> Any:
+        """Return the skill's run() function, compiling it only when it changed.
 
-        Gets skill source from host and executes it locally in the kernel.
-        This ensures skills can import packages installed at runtime.
-        Handles async skills by running them with asyncio.run().
-
-        Args:
-            skill_name: Name of the skill to invoke.
-            **kwargs: Arguments to pass to the skill's run() function.
-
-        Note: Uses skill_name (not name) to avoid collision with skills
-        that have a 'name' parameter.
+        The host is always asked for the skill, but with the cached content
+        hash as if_none_match, so an unchanged skill costs one small round trip
+        instead of transferring, compiling and executing its source again.
         """
-        import asyncio
-
-        skill = _rpc_call("skills.get", name=skill_name)
+        cached = _skill_cache.get(skill_name)
+        skill = _rpc_call(
+            "skills.get",
+            name=skill_name,
+            if_none_match=cached[0] if cached is not None else None,
+        )
         if skill is None:
+            _skill_cache.pop(skill_name, None)
             raise ValueError(f"Skill not found: {{skill_name}}")
+        if cached is not None and skill.get("not_modified"):
+            return cached[1]
 
         source = skill.get("source")
         if not source:
@@ -450,6 +678,28 @@ class SkillsProxy:
         if not callable(run_func):
             raise ValueError(f"Skill {{skill_name}} has no run() function")
 
+        content_hash = skill.get("content_hash")
+        if content_hash is not None:
+            _skill_cache[skill_name] = (content_hash, run_func)
+        return run_func
+
+    def invoke(self, skill_name: str, **kwargs) -> Any:
+        """Invoke a skill by name.
+
+        Gets skill source from host and executes it locally in the kernel.
+        This ensures skills can import packages installed at runtime.
+        Handles async skills by running them with asyncio.run().
+
+        Args:
+            skill_name: Name of the skill to invoke.
+            **kwargs: Arguments to pass to the skill's run() function.
+
+        Note: Uses skill_name (not name) to avoid collision with skills
+        that have a 'name' parameter.
+        """
+        import asyncio
+
+        run_func = self._load(skill_name)
         result = run_func(**kwargs)
         if asyncio.iscoroutine(result):
             try:
@@ -511,6 +761,7 @@ class SkillsProxy:
         Returns:
             Skill object for the created skill.
         """
+        _skill_cache.pop(name, None)
         result = _rpc_call("skills.create", name=name, source=source, description=description)
         return Skill(
             name=result["name"],
@@ -520,6 +771,7 @@ class SkillsProxy:
 
     def delete(self, name: str) -> bool:
         """Delete a skill."""
+        _skill_cache.pop(name, None)
         return _rpc_call("skills.delete", name=name)
 
     def __getattr__(self, name: str) -> Any:
@@ -530,12 +782,170 @@ class SkillsProxy:
         return lambda **kwargs: self.invoke(name, **kwargs)
 
 
+# Streamed artifacts move through the RPC socket in pieces of this size
+_ARTIFACT_CHUNK_SIZE = {ARTIFACT_CHUNK_SIZE}
+
+
+class _ArtifactReader(io.RawIOBase):
+    """Raw stream reading a host artifact one chunk per RPC call.
+
+    The host keeps the artifact open for the life of the stream, so
+    sequential reads never reopen or re-decompress it.
+    """
+
+    def __init__(self, name: str):
+        super().__init__()
+        self._pos = 0
+        self._download = None
+        # Fails here, not on first read, if the artifact doesn't exist
+        self._download = _rpc_call("artifacts.open_read", name=name)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("artifact streams can't seek from the end")
+        if offset < 0:
+            raise ValueError(f"Negative seek position {{offset}}")
+        self._pos = offset
+        return offset
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), _ARTIFACT_CHUNK_SIZE)
+        data = _rpc_call(
+            "artifacts.read", download=self._download, offset=self._pos, size=size
+        )
+        buffer[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+    def readall(self) -> bytes:
+        chunks = []
+        while chunk := self.read(_ARTIFACT_CHUNK_SIZE):
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._download is not None:
+                _rpc_call("artifacts.close_read", download=self._download)
+        except NamespaceError:
+            pass  # The host already dropped the download
+        finally:
+            super().close()
+
+
+class _ArtifactWriter(io.BufferedIOBase):
+    """Write stream sending a new host artifact one chunk per RPC call.
+
+    Mirrors py_code_mode.artifacts.ArtifactWriter: close() commits the
+    artifact, leaving a with-block through an exception discards it.
+    """
+
+    def __init__(self, name: str, description: str):
+        super().__init__()
+        self._buffer = bytearray()
+        self._upload = _rpc_call("artifacts.open_write", name=name, description=description)
+        self.artifact = None
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self.closed:
+            raise ValueError("write to closed artifact stream")
+        view = memoryview(data).cast("B")
+        size = view.nbytes
+        if self._buffer:
+            take = _ARTIFACT_CHUNK_SIZE - len(self._buffer)
+            self._buffer += view[:take]
+            view = view[take:]
+            if len(self._buffer) < _ARTIFACT_CHUNK_SIZE:
+                return size
+            self._send(self._buffer)
+            self._buffer = bytearray()
+        while view.nbytes >= _ARTIFACT_CHUNK_SIZE:
+            self._send(view[:_ARTIFACT_CHUNK_SIZE])
+            view = view[_ARTIFACT_CHUNK_SIZE:]
+        self._buffer += view
+        return size
+
+    def _send(self, chunk) -> None:
+        _rpc_call("artifacts.write", upload=self._upload, data=chunk)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._buffer:
+                self._send(self._buffer)
+                self._buffer = bytearray()
+            result = _rpc_call("artifacts.close_write", upload=self._upload, commit=True)
+        except BaseException:
+            self.discard()
+            raise
+        self.artifact = ArtifactMeta(
+            name=result["name"],
+            path=result.get("path", ""),
+            description=result.get("description", ""),
+            created_at=result.get("created_at", ""),
+        )
+        super().close()
+
+    def discard(self) -> None:
+        """Close without committing; nothing written becomes visible."""
+        if self.closed:
+            return
+        self._buffer = bytearray()
+        try:
+            _rpc_call("artifacts.close_write", upload=self._upload, commit=False)
+        except NamespaceError:
+            pass  # The host already dropped the upload
+        finally:
+            super().close()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+def _map_file(path: str) -> memoryview:
+    """Read-only memoryview of a file, memory-mapped rather than read."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(b"")
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
 class ArtifactsProxy:
     """Proxy for accessing host artifacts.
 
     Supports:
     - artifacts.save("name", data) - save an artifact
     - artifacts.load("name") - load an artifact
+    - artifacts.open("name", "rb"/"wb") - stream an artifact in chunks
+    - artifacts.view("name") - read-only, memory-mapped view of an artifact
     - artifacts.list() - list all artifacts
     - artifacts.delete("name") - delete an artifact
     """
@@ -544,6 +954,38 @@ class ArtifactsProxy:
         """Load an artifact by name."""
         return _rpc_call("artifacts.load", name=name)
 
+    def open(self, name: str, mode: str = "rb", description: str = ""):
+        """Open an artifact as a binary stream, "rb" to read or "wb" to write.
+
+        Data crosses the RPC socket in chunks, so memory use is bounded by
+        the chunk size rather than the artifact size.
+        """
+        if mode == "rb":
+            return io.BufferedReader(_ArtifactReader(name), buffer_size=_ARTIFACT_CHUNK_SIZE)
+        if mode == "wb":
+            return _ArtifactWriter(name, description)
+        raise ValueError(f"Unsupported artifact mode {{mode!r}}; use 'rb' or 'wb'")
+
+    def view(self, name: str):
+        """Read-only view of an artifact without copying it.
+
+        File-backed artifacts are memory-mapped from the host's own file, so
+        repeated views cost no copies. .npy artifacts come back as read-only
+        numpy memmaps when numpy is installed in the kernel.
+        """
+        path = _rpc_call("artifacts.view", name=name)["path"]
+        numpy = _import_numpy() if name.endswith(".npy") else None
+        if path is not None:
+            if numpy is not None:
+                return numpy.load(path, mmap_mode="r", allow_pickle=False)
+            return _map_file(path)
+        # Not on a shared filesystem (e.g. Redis): stream the bytes once
+        with self.open(name, "rb") as f:
+            data = f.read()
+        if numpy is not None:
+            return numpy.load(io.BytesIO(data), allow_pickle=False)
+        return memoryview(data)
+
     def save(self, name: str, data: Any, description: str = "") -> ArtifactMeta:
         """Save an artifact.
 
@@ -658,7 +1100,21 @@ skills = SkillsProxy()
 artifacts = ArtifactsProxy()
 deps = DepsProxy()
 
-print("RPC initialized: tools, skills, artifacts, deps are available (via stdin channel)")
+
+def _preload_modules(names):
+    import importlib
+
+    for name in names:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            # May be a configured dep that is installed after kernel start
+            pass
+
+
+_preload_modules({list(preload_modules)!r})
+
+print("RPC initialized: tools, skills, artifacts, deps are available (via RPC socket)")
 '''
 
 
@@ -52,18 +52,21 @@ def _build_vector_store_setup_code(vectors_path_str: str) -> str:
     """
     if vectors_path_str == "None":
         return """
-_vector_store = None"""
+_vector_store = None
+_embedder = None"""
 
     return f"""
 _vectors_path = Path({vectors_path_str})
 
-# Setup vector store if vectors_path provided
+# Setup vector store if vectors_path provided. The skill library shares its
+# embedder, whose model loads in the background.
 _vector_store = None
+_embedder = None
 try:
     from py_code_mode.skills.vector_stores.chroma import ChromaVectorStore
     from py_code_mode.skills import Embedder
     _vectors_path.mkdir(parents=True, exist_ok=True)
-    _embedder = Embedder()
+    _embedder = Embedder(start_loading=True)
     _vector_store = ChromaVectorStore(path=_vectors_path, embedder=_embedder)
 except ImportError:
     _vector_store = None"""
@@ -79,11 +82,11 @@ def _build_vector_store_cleanup_code(has_vectors_path: bool) -> str:
         Code string to cleanup vector store-related variables.
     """
     if not has_vectors_path:
-        return "del _vector_store"
+        return "del _vector_store, _embedder"
 
-    return """del _vectors_path, _vector_store
+    return """del _vectors_path, _vector_store, _embedder
 try:
-    del ChromaVectorStore, Embedder, _embedder
+    del ChromaVectorStore, Embedder
 except NameError:
     pass"""
 
@@ -210,7 +213,7 @@ _skills_path = Path({skills_path_str}) if {skills_path_str} else None
 if _skills_path is not None:
     _skills_path.mkdir(parents=True, exist_ok=True)
     _store = FileSkillStore(_skills_path)
-    _library = create_skill_library(store=_store, vector_store=_vector_store)
+    _library = create_skill_library(store=_store, embedder=_embedder, vector_store=_vector_store)
 else:
     from py_code_mode.skills import MemorySkillStore, MockEmbedder, SkillLibrary
     _store = MemorySkillStore()
@@ -255,6 +258,14 @@ class _SimpleArtifactStore:
         """Load artifact by name."""
         return self._store.load(name)
 
+    def open(self, name, mode="rb", description=""):
+        """Open artifact as a binary stream ("rb" or "wb")."""
+        return self._store.open(name, mode, description)
+
+    def view(self, name):
+        """Read-only, memory-mapped view of an artifact."""
+        return self._store.view(name)
+
     def list(self):
         """List all artifacts."""
         return self._store.list()
@@ -552,6 +563,14 @@ class _SimpleArtifactStore:
         """Load artifact by name."""
         return self._store.load(name)
 
+    def open(self, name, mode="rb", description=""):
+        """Open artifact as a binary stream ("rb" or "wb")."""
+        return self._store.open(name, mode, description)
+
+    def view(self, name):
+        """Read-only, memory-mapped view of an artifact."""
+        return self._store.view(name)
+
     def list(self):
         """List all artifacts."""
         return self._store.list()
@@ -0,0 +1,275 @@
+"""Pool of pre-warmed kernels for SubprocessExecutor.
+
+Starting a SubprocessExecutor normally means launching a kernel process,
+waiting for it to become ready, and running the RPC init code - seconds of
+work per session. KernelPool does that work ahead of time in the background
+so SubprocessExecutor.start() only has to check out a ready kernel.
+
+Kernels are single-use: a checked-out kernel belongs to its executor and is
+shut down when the executor closes. It never returns to the pool, so no
+interpreter state leaks between sessions. All kernels share the pool's venv,
+so SubprocessExecutor only accepts pools whose config sets
+allow_runtime_deps=False; otherwise deps.add() in one session would change the
+packages of every later one.
+
+Usage:
+    config = SubprocessConfig(tools_path=Path("./tools"), allow_runtime_deps=False)
+    pool = KernelPool(config, min_size=2)
+    await pool.start()
+
+    executor = SubprocessExecutor(config, kernel_pool=pool)
+    async with Session(storage=storage, executor=executor) as session:
+        ...
+
+    await pool.close()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+
+from py_code_mode.execution.subprocess.config import SubprocessConfig
+from py_code_mode.execution.subprocess.host import KernelHost, ResourceProvider
+from py_code_mode.execution.subprocess.venv import KernelVenv, VenvManager
+
+logger = logging.getLogger(__name__)
+
+
+class KernelPool:
+    """Keeps initialized kernels for one venv ready for checkout.
+
+    The pool tries to keep ``min_size`` kernels ready. Each checkout that finds
+    the pool empty raises that target by one, up to ``max_size``, so bursts of
+    session creation are absorbed by a larger pool. Kernels that sit unused for
+    longer than ``idle_timeout`` are shut down and the target shrinks back
+    toward ``min_size``.
+    """
+
+    def __init__(
+        self,
+        config: SubprocessConfig | None = None,
+        *,
+        min_size: int = 1,
+        max_size: int = 4,
+        idle_timeout: float | None = 300.0,
+    ) -> None:
+        """Initialize KernelPool.
+
+        Args:
+            config: Venv and kernel configuration shared by all pooled kernels.
+                Uses defaults if None.
+            min_size: Number of ready kernels to keep at all times.
+            max_size: Upper bound on ready plus starting kernels.
+            idle_timeout: Seconds a ready kernel may sit unused before it is
+                evicted (never below min_size). None disables eviction.
+
+        Raises:
+            ValueError: If sizes or idle_timeout are out of range.
+        """
+        if min_size < 0:
+            raise ValueError(f"min_size must be >= 0, got {min_size}")
+        if max_size < 1:
+            raise ValueError(f"max_size must be >= 1, got {max_size}")
+        if min_size > max_size:
+            raise ValueError(f"min_size ({min_size}) cannot exceed max_size ({max_size})")
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError(f"idle_timeout must be positive or None, got {idle_timeout}")
+
+        self._config = config or SubprocessConfig()
+        self._min_size = min_size
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._target = min_size
+
+        self._venv_manager: VenvManager | None = None
+        self._venv: KernelVenv | None = None
+        self._start_lock = asyncio.Lock()
+
+        # Ready kernels with the loop time at which they became ready, oldest first
+        self._ready: deque[tuple[KernelHost, float]] = deque()
+        self._starting = 0
+        self._warm_tasks: set[asyncio.Task[None]] = set()
+        self._evict_task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    @property
+    def config(self) -> SubprocessConfig:
+        """Configuration shared by all pooled kernels."""
+        return self._config
+
+    @property
+    def venv(self) -> KernelVenv | None:
+        """The venv pooled kernels run in, once the pool has started."""
+        return self._venv
+
+    @property
+    def venv_manager(self) -> VenvManager | None:
+        """VenvManager for the pool's venv, once the pool has started."""
+        return self._venv_manager
+
+    @property
+    def ready_count(self) -> int:
+        """Number of kernels ready for immediate checkout."""
+        return len(self._ready)
+
+    @property
+    def starting_count(self) -> int:
+        """Number of kernels currently warming up."""
+        return self._starting
+
+    async def start(self) -> None:
+        """Create the venv and begin warming kernels in the background.
+
+        Safe to call more than once; later calls return immediately.
+
+        Raises:
+            RuntimeError: If the pool is closed or venv creation fails.
+        """
+        if self._closed:
+            raise RuntimeError("KernelPool is closed")
+
+        async with self._start_lock:
+            if self._venv is not None:
+                return
+            self._venv_manager = VenvManager(self._config)
+            self._venv = await self._venv_manager.create()
+
+        self._replenish()
+        if self._idle_timeout is not None:
+            self._evict_task = asyncio.create_task(self._evict_idle())
+
+    async def acquire(self, provider: ResourceProvider | None) -> KernelHost:
+        """Check out a ready kernel, cold-starting one if none is ready.
+
+        The kernel is removed from the pool for good; the caller owns it and
+        must shut it down. The pool replenishes itself in the background.
+
+        Args:
+            provider: ResourceProvider that will serve the kernel's RPC requests.
+
+        Returns:
+            A started, initialized KernelHost.
+
+        Raises:
+            RuntimeError: If the pool is closed or a cold start fails.
+        """
+        await self.start()
+
+        host: KernelHost | None = None
+        while self._ready:
+            candidate, _ = self._ready.popleft()
+            if await candidate.check_alive():
+                host = candidate
+                break
+            # Kernel died while waiting in the pool
+            await candidate.shutdown()
+
+        if host is None:
+            # Pool was empty - grow it so the next burst finds kernels ready
+            self._target = min(self._target + 1, self._max_size)
+            host = await self._start_kernel()
+
+        host.set_provider(provider)
+        self._replenish()
+        return host
+
+    def _replenish(self) -> None:
+        """Start warming kernels until ready + starting reaches the target."""
+        if self._closed or self._venv is None:
+            return
+        missing = self._target - len(self._ready) - self._starting
+        for _ in range(max(missing, 0)):
+            self._starting += 1
+            task = asyncio.create_task(self._warm_one())
+            self._warm_tasks.add(task)
+            task.add_done_callback(self._warm_tasks.discard)
+
+    async def _warm_one(self) -> None:
+        """Start one kernel and add it to the ready queue."""
+        try:
+            host = await self._start_kernel()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Failed to warm pooled kernel: %s", e)
+            return
+        finally:
+            self._starting -= 1
+
+        if self._closed:
+            await host.shutdown()
+            return
+        self._ready.append((host, asyncio.get_running_loop().time()))
+
+    async def _start_kernel(self) -> KernelHost:
+        """Start and initialize a kernel with no provider attached yet."""
+        assert self._venv is not None
+        host = KernelHost()
+        await host.start(
+            provider=None,  # type: ignore[arg-type]
+            kernel_name=self._venv.kernel_spec_name,
+            startup_timeout=self._config.startup_timeout,
+            ipc_timeout=self._config.ipc_timeout,
+            preload_modules=self._config.preload_modules,
+        )
+        return host
+
+    async def _evict_idle(self) -> None:
+        """Periodically shut down kernels idle longer than idle_timeout."""
+        assert self._idle_timeout is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(min(self._idle_timeout / 2, 30.0))
+            now = loop.time()
+            while (
+                len(self._ready) > self._min_size and now - self._ready[0][1] >= self._idle_timeout
+            ):
+                host, _ = self._ready.popleft()
+                self._target = max(self._target - 1, self._min_size)
+                await host.shutdown()
+
+            # Replace kernels that died while idle
+            for entry in list(self._ready):
+                if not await entry[0].check_alive() and entry in self._ready:
+                    self._ready.remove(entry)
+                    await entry[0].shutdown()
+            self._replenish()
+
+    async def close(self) -> None:
+        """Shut down all pooled kernels and stop replenishing.
+
+        Kernels already checked out are not affected. The venv is removed if
+        the config asks for cleanup.
+        """
+        self._closed = True
+
+        tasks = list(self._warm_tasks)
+        if self._evict_task is not None:
+            tasks.append(self._evict_task)
+            self._evict_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        while self._ready:
+            host, _ = self._ready.popleft()
+            await host.shutdown()
+
+        if (
+            self._config.get_resolved_cleanup()
+            and self._venv is not None
+            and self._venv_manager is not None
+        ):
+            await self._venv_manager.cleanup(self._venv)
+            self._venv = None
+
+    async def __aenter__(self) -> KernelPool:
+        """Support async context manager."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Close on context exit."""
+        await self.close()
@@ -1,22 +1,36 @@
 """RPC protocol definitions for host<->kernel communication.
 
 This module defines the message format for bidirectional RPC between the host
-process and the Jupyter kernel subprocess. Messages are serialized as JSON and
-sent via the stdin channel (input_request/input_reply).
+process and the Jupyter kernel subprocess, and the multipart framing used to
+send them over the host's dedicated RPC socket (kernel DEALER -> host ROUTER).
+Bodies are encoded with msgpack when both sides have it, JSON otherwise.
+It also defines the msgpack value encoding the kernel uses to return cell
+results to the host without going through their text repr.
 """
 
 from __future__ import annotations
 
+import base64
+import json
+import sys
 import uuid
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, cast
+
+try:
+    import msgpack  # type: ignore[import-untyped]
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
 
 
 @dataclass
 class RPCRequest:
     """RPC request from kernel to host.
 
-    The kernel sends this via input_request with JSON in the prompt field.
+    The kernel sends this as a framed message on its RPC socket.
     The host parses it, dispatches to the appropriate provider method,
     and sends back an RPCResponse.
 
@@ -31,7 +45,7 @@ class RPCRequest:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
 
     def to_dict(self) -> dict[str, Any]:
-        """Serialize to dictionary for JSON transmission.
+        """Serialize to dictionary for transmission.
 
         Returns:
             Dict with type, id, method, and params fields.
@@ -67,7 +81,7 @@ class RPCRequest:
 class RPCResponse:
     """RPC response from host to kernel.
 
-    The host sends this via input_reply with JSON in the value field.
+    The host sends this as a framed message back to the requesting socket.
     The kernel parses it and either returns the result or raises an error.
 
     Attributes:
@@ -83,7 +97,7 @@ class RPCResponse:
     error: dict[str, Any] | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        """Serialize to dictionary for JSON transmission.
+        """Serialize to dictionary for transmission.
 
         Returns:
             Dict with type, id, and either result or error field.
@@ -116,3 +130,280 @@ class RPCResponse:
             result=data.get("result"),
             error=data.get("error"),
         )
+
+
+# =============================================================================
+# Wire framing
+# =============================================================================
+#
+# Each RPC message is sent as a multipart ZMQ message:
+#
+#     [header, body, *buffers]
+#
+# header  - b"<version>:<codec>", e.g. b"1:msgpack" or b"1:json"
+# body    - the request/response dict encoded with the codec
+# buffers - large bytes-like values lifted out of the body and sent as their
+#           own frames, so they are never copied into (or escaped inside) the
+#           encoded body. The body holds a reference to the buffer index.
+#
+# The kernel picks the codec at init time from the codecs the host offers
+# (see get_kernel_init_code) and the host always replies with the codec the
+# request used. The kernel-side implementation lives in kernel_init.py and must
+# stay wire-compatible with this one.
+
+RPC_PROTOCOL_VERSION = 1
+
+# Placeholder for an out-of-band buffer in JSON bodies: {"__rpc_buffer__": index}
+BUFFER_REF_KEY = "__rpc_buffer__"
+
+# msgpack ExtType code for an out-of-band buffer reference (data = index as ASCII)
+BUFFER_EXT_TYPE = 1
+
+# msgpack carries bytes natively, so only buffers at least this large are sent
+# out-of-band. JSON cannot carry bytes at all, so it sends every buffer out-of-band.
+MSGPACK_OOB_THRESHOLD = 64 * 1024
+
+# How deep into params/results msgpack looks for large buffers. Deeper buffers
+# are still sent correctly, just inline in the body.
+_MSGPACK_OOB_DEPTH = 3
+
+_BUFFER_TYPES = (bytes, bytearray, memoryview)
+
+
+def available_codecs() -> list[str]:
+    """Codecs this process can speak, in order of preference."""
+    if MSGPACK_AVAILABLE:
+        return ["msgpack", "json"]
+    return ["json"]
+
+
+def _lift_buffers(obj: Any, buffers: list[Any], depth: int) -> Any:
+    """Replace large bytes-like values with msgpack buffer references.
+
+    Returns obj itself when nothing beneath it was replaced, so large
+    containers without buffers are not rebuilt.
+    """
+    if isinstance(obj, _BUFFER_TYPES):
+        if memoryview(obj).nbytes < MSGPACK_OOB_THRESHOLD:
+            return obj
+        buffers.append(obj)
+        return msgpack.ExtType(BUFFER_EXT_TYPE, str(len(buffers) - 1).encode())
+    if depth <= 0:
+        return obj
+    if isinstance(obj, dict):
+        lifted = {k: _lift_buffers(v, buffers, depth - 1) for k, v in obj.items()}
+        if any(lifted[k] is not v for k, v in obj.items()):
+            return lifted
+    elif isinstance(obj, (list, tuple)):
+        lifted_items = [_lift_buffers(v, buffers, depth - 1) for v in obj]
+        if any(new is not old for new, old in zip(lifted_items, obj, strict=True)):
+            return lifted_items
+    return obj
+
+
+def encode_message(message: dict[str, Any], codec: str) -> list[Any]:
+    """Encode an RPC message dict into multipart frames.
+
+    Args:
+        message: The request or response dict.
+        codec: "msgpack" or "json".
+
+    Returns:
+        Frames to send: header, body, then any out-of-band buffers.
+
+    Raises:
+        ValueError: If the codec is unknown or unavailable.
+        TypeError: If the message contains values the codec cannot encode.
+    """
+    buffers: list[Any] = []
+    if codec == "msgpack" and MSGPACK_AVAILABLE:
+        body = msgpack.packb(_lift_buffers(message, buffers, _MSGPACK_OOB_DEPTH))
+    elif codec == "json":
+
+        def lift(obj: Any) -> Any:
+            if isinstance(obj, _BUFFER_TYPES):
+                buffers.append(obj)
+                return {BUFFER_REF_KEY: len(buffers) - 1}
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+        body = json.dumps(message, default=lift).encode()
+    else:
+        raise ValueError(f"Unsupported RPC codec: {codec}")
+
+    header = f"{RPC_PROTOCOL_VERSION}:{codec}".encode()
+    return [header, body, *buffers]
+
+
+def decode_message(frames: list[bytes]) -> tuple[str, dict[str, Any]]:
+    """Decode multipart frames produced by encode_message.
+
+    Out-of-band buffers are restored as bytes.
+
+    Args:
+        frames: Header, body, then any out-of-band buffers.
+
+    Returns:
+        Tuple of (codec, message dict).
+
+    Raises:
+        ValueError: If the frames are malformed, or the version or codec
+            is not supported.
+    """
+    if len(frames) < 2:
+        raise ValueError(f"RPC message needs at least 2 frames, got {len(frames)}")
+
+    version, _, codec = bytes(frames[0]).decode("ascii", errors="replace").partition(":")
+    if version != str(RPC_PROTOCOL_VERSION):
+        raise ValueError(f"Unsupported RPC protocol version: {version!r}")
+
+    body = frames[1]
+    buffers = [bytes(b) for b in frames[2:]]
+
+    if codec == "msgpack" and MSGPACK_AVAILABLE:
+
+        def ext_hook(code: int, data: bytes) -> Any:
+            if code == BUFFER_EXT_TYPE:
+                return buffers[int(data)]
+            return msgpack.ExtType(code, data)
+
+        message = msgpack.unpackb(body, ext_hook=ext_hook, strict_map_key=False)
+    elif codec == "json":
+
+        def object_hook(obj: dict[str, Any]) -> Any:
+            if len(obj) == 1 and BUFFER_REF_KEY in obj:
+                return buffers[obj[BUFFER_REF_KEY]]
+            return obj
+
+        message = json.loads(body, object_hook=object_hook)
+    else:
+        raise ValueError(f"Unsupported RPC codec: {codec!r}")
+
+    if not isinstance(message, dict):
+        raise ValueError("RPC message body must be a dict")
+    return codec, message
+
+
+# =============================================================================
+# Result values
+# =============================================================================
+#
+# When the kernel uses the msgpack codec it also attaches a structured copy of
+# each cell result to the execute_result message under RESULT_MIMETYPE, so the
+# host gets the value itself instead of parsing IPython's text/plain repr
+# (which is slow for large containers and truncated past 1000 items). Jupyter
+# messages are JSON, so the msgpack bytes travel base64-encoded.
+#
+# Only types the text/plain path could recover with ast.literal_eval are
+# encoded, plus numpy arrays. Types msgpack has no exact equivalent for are
+# tagged with an ExtType. Anything else (custom classes, subclasses of builtin
+# types) makes the encoder fail and the host falls back to text/plain. The
+# kernel-side encoder lives in kernel_init.py and must stay compatible.
+
+RESULT_MIMETYPE = "application/vnd.py-code-mode.value+msgpack"
+
+# ExtType codes for result values (1 is BUFFER_EXT_TYPE)
+VALUE_EXT_TUPLE = 2
+VALUE_EXT_SET = 3
+VALUE_EXT_FROZENSET = 4
+VALUE_EXT_COMPLEX = 5
+VALUE_EXT_BIGINT = 6
+VALUE_EXT_NDARRAY = 7
+
+
+def _value_default(obj: Any) -> Any:
+    """Tag values msgpack cannot represent exactly (strict_types=True)."""
+    obj_type = type(obj)
+    if obj_type is tuple:
+        return msgpack.ExtType(VALUE_EXT_TUPLE, _pack_value(list(obj)))
+    if obj_type is set:
+        return msgpack.ExtType(VALUE_EXT_SET, _pack_value(list(obj)))
+    if obj_type is frozenset:
+        return msgpack.ExtType(VALUE_EXT_FROZENSET, _pack_value(list(obj)))
+    if obj_type is complex:
+        return msgpack.ExtType(VALUE_EXT_COMPLEX, _pack_value([obj.real, obj.imag]))
+    if obj_type is int:
+        # Outside the 64-bit range msgpack supports natively
+        return msgpack.ExtType(VALUE_EXT_BIGINT, str(obj).encode("ascii"))
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(obj, (numpy.ndarray, numpy.generic)):
+        array = numpy.asarray(obj)
+        if array.dtype.hasobject or array.dtype.fields is not None:
+            raise TypeError(f"Cannot encode array of dtype {array.dtype}")
+        header = [array.dtype.str, list(array.shape), isinstance(obj, numpy.generic)]
+        payload = _pack_value([header, numpy.ascontiguousarray(array).data])
+        return msgpack.ExtType(VALUE_EXT_NDARRAY, payload)
+    raise TypeError(f"Cannot encode value of type {obj_type.__name__}")
+
+
+def _pack_value(obj: Any) -> bytes:
+    return cast(bytes, msgpack.packb(obj, default=_value_default, strict_types=True))
+
+
+def _value_ext_hook(code: int, data: bytes) -> Any:
+    """Rebuild values tagged by _value_default."""
+    if code == VALUE_EXT_TUPLE:
+        return tuple(_unpack_value(data))
+    if code == VALUE_EXT_SET:
+        return set(_unpack_value(data))
+    if code == VALUE_EXT_FROZENSET:
+        return frozenset(_unpack_value(data))
+    if code == VALUE_EXT_COMPLEX:
+        real, imag = _unpack_value(data)
+        return complex(real, imag)
+    if code == VALUE_EXT_BIGINT:
+        return int(data)
+    if code == VALUE_EXT_NDARRAY:
+        import numpy
+
+        (dtype, shape, is_scalar), raw = _unpack_value(data)
+        dtype = numpy.dtype(dtype)
+        if dtype.hasobject:
+            raise ValueError(f"Refusing to decode array of dtype {dtype}")
+        array = numpy.frombuffer(raw, dtype=dtype).reshape(shape).copy()
+        return array[()] if is_scalar else array
+    raise ValueError(f"Unknown result value ExtType code: {code}")
+
+
+def _unpack_value(data: bytes) -> Any:
+    return msgpack.unpackb(data, ext_hook=_value_ext_hook, strict_map_key=False)
+
+
+def encode_result_value(value: Any) -> str:
+    """Encode a cell result for the RESULT_MIMETYPE payload.
+
+    Args:
+        value: The result value.
+
+    Returns:
+        Base64 text of the msgpack encoding.
+
+    Raises:
+        RuntimeError: If msgpack is not installed.
+        TypeError: If the value contains a type that cannot be encoded exactly.
+    """
+    if not MSGPACK_AVAILABLE:
+        raise RuntimeError("msgpack is required to encode result values")
+    return base64.b64encode(_pack_value(value)).decode("ascii")
+
+
+def decode_result_value(payload: str) -> Any:
+    """Decode a RESULT_MIMETYPE payload produced by the kernel.
+
+    Args:
+        payload: Base64 text of the msgpack encoding.
+
+    Returns:
+        The result value.
+
+    Raises:
+        RuntimeError: If msgpack is not installed.
+        ValueError: If the payload is malformed.
+    """
+    if not MSGPACK_AVAILABLE:
+        raise RuntimeError("msgpack is required to decode result values")
+    try:
+        return _unpack_value(base64.b64decode(payload, validate=True))
+    except ValueError:
+        raise
+    except Exception as e:
+        raise ValueError(f"Malformed result value payload: {e}") from e
@@ -7,12 +7,19 @@ into the executor's runtime environment.
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from py_code_mode.execution import Executor
 from py_code_mode.skills import PythonSkill
-from py_code_mode.types import ExecutionResult
+from py_code_mode.types import (
+    ErrorEvent,
+    ExecutionEvent,
+    ExecutionResult,
+    StdoutEvent,
+    final_event,
+)
 
 if TYPE_CHECKING:
     from py_code_mode.storage import StorageBackend
@@ -345,6 +352,53 @@ class Session:
 
         return await self._executor.run(code, timeout=timeout)
 
+    async def run_stream(
+        self, code: str, timeout: float | None = None
+    ) -> AsyncIterator[ExecutionEvent]:
+        """Run Python code, yielding output as it is produced.
+
+        Use this instead of run() for long-running code, to show progress
+        before the code finishes:
+
+            async for event in session.run_stream(code):
+                if isinstance(event, StdoutEvent):
+                    print(event.text, end="")
+                elif isinstance(event, (ResultEvent, ErrorEvent)):
+                    result = event.result
+
+        Args:
+            code: Python code to execute.
+            timeout: Optional timeout in seconds.
+
+        Yields:
+            StdoutEvent, StderrEvent and DisplayEvent as output arrives, then
+            exactly one ResultEvent or ErrorEvent with the full ExecutionResult.
+        """
+        if self._closed:
+            yield ErrorEvent(ExecutionResult(value=None, stdout="", error="Session is closed"))
+            return
+
+        if not self._started:
+            await self.start()
+
+        if self._executor is None:
+            yield ErrorEvent(
+                ExecutionResult(value=None, stdout="", error="Executor not initialized")
+            )
+            return
+
+        run_stream = getattr(self._executor, "run_stream", None)
+        if run_stream is None:
+            # Executor without streaming support: deliver everything at the end
+            result = await self._executor.run(code, timeout=timeout)
+            if result.stdout:
+                yield StdoutEvent(result.stdout)
+            yield final_event(result)
+            return
+
+        async for event in run_stream(code, timeout=timeout):
+            yield event
+
     async def reset(self) -> None:
         """Reset the execution environment.
 
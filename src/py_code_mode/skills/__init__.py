@@ -1,5 +1,6 @@
 """py_code_mode.skills - Skill store, library, and semantic search."""
 
+from py_code_mode.skills.lexical import BM25Index, reciprocal_rank_fusion
 from py_code_mode.skills.skill import (
     PythonSkill,
     SkillMetadata,
@@ -10,21 +11,28 @@ from py_code_mode.skills.store import (
     MemorySkillStore,
     RedisSkillStore,
     SkillStore,
+    VersionedSkillStore,
 )
 from py_code_mode.skills.vector_store import (
+    BatchVectorStore,
     ModelInfo,
     SearchResult,
+    VectorEntry,
     VectorStore,
     compute_content_hash,
 )
 
 # Semantic features require numpy/scikit-learn - optional import
 try:
+    from py_code_mode.skills.embedding_cache import EmbeddingCache
     from py_code_mode.skills.embeddings import (
         MODEL_ALIASES,
         Embedder,
+        EmbedderStats,
+        EmbeddingMatrix,
         EmbeddingProvider,
         MockEmbedder,
+        VectorPrecision,
         cosine_similarity,
         resolve_model_name,
     )
@@ -39,8 +47,12 @@ except ImportError:
     SEMANTIC_AVAILABLE = False
     MODEL_ALIASES = None  # type: ignore[assignment]
     Embedder = None  # type: ignore[assignment, misc]
+    EmbedderStats = None  # type: ignore[assignment, misc]
+    EmbeddingCache = None  # type: ignore[assignment, misc]
+    EmbeddingMatrix = None  # type: ignore[assignment, misc]
     EmbeddingProvider = None  # type: ignore[assignment, misc]
     MockEmbedder = None  # type: ignore[assignment, misc]
+    VectorPrecision = None  # type: ignore[assignment, misc]
     cosine_similarity = None  # type: ignore[assignment]
     resolve_model_name = None  # type: ignore[assignment]
     RankingConfig = None  # type: ignore[assignment, misc]
@@ -52,13 +64,19 @@ __all__ = [
     "PythonSkill",
     "SkillMetadata",
     "SkillParameter",
+    # Lexical search
+    "BM25Index",
+    "reciprocal_rank_fusion",
     # Stores
     "SkillStore",
+    "VersionedSkillStore",
     "MemorySkillStore",
     "FileSkillStore",
     "RedisSkillStore",
     # VectorStore types
     "VectorStore",
+    "BatchVectorStore",
+    "VectorEntry",
     "ModelInfo",
     "SearchResult",
     "compute_content_hash",
@@ -66,8 +84,12 @@ __all__ = [
     "SEMANTIC_AVAILABLE",
     "MODEL_ALIASES",
     "Embedder",
+    "EmbedderStats",
+    "EmbeddingCache",
+    "EmbeddingMatrix",
     "EmbeddingProvider",
     "MockEmbedder",
+    "VectorPrecision",
     "cosine_similarity",
     "resolve_model_name",
     "RankingConfig",
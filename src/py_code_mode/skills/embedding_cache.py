@@ -0,0 +1,310 @@
+"""File-backed embedding cache for SkillLibrary's in-memory search path."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import tempfile
+import uuid
+from collections.abc import Callable
+from pathlib import Path
+from typing import BinaryIO
+
+import filelock
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_INDEX_FILE = "index.jsonl"
+_LOCK_FILE = ".lock"
+_SEGMENT_PREFIX = "seg-"
+
+# Compact once this many segment files exist, even without dead rows
+MAX_SEGMENTS = 32
+
+# Characters allowed in the per-model directory name
+_UNSAFE_PATH_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+class _ModelCache:
+    """Cached vectors for one (model_name, dimension) pair.
+
+    Layout of the model directory:
+        seg-<id>.npy  float32 array of shape (rows, 2, dimension): the
+                      description and code vector of each entry
+        index.jsonl   a {"model_name", "dimension"} header line, then one
+                      {"segment", "hashes"} line per segment, row order
+
+    Each put_many() writes its new rows as a fresh segment and appends one
+    line to the index, so a write costs O(new rows) however large the cache
+    is. A segment is complete on disk before its index line is appended,
+    and readers ignore a trailing partial line, so they never see an entry
+    without its vectors. Readers tail the index from where they left off.
+
+    compact() rewrites the live rows into a single segment and replaces the
+    index; it runs when dead rows outnumber live ones or segments pile up.
+    """
+
+    def __init__(self, directory: Path, model_name: str, dimension: int) -> None:
+        self._directory = directory
+        self._model_name = model_name
+        self._dimension = dimension
+        self._reset()
+
+    def _reset(self) -> None:
+        """Forget everything read from disk; the next _refresh() starts over."""
+        self._rows: dict[str, tuple[str, int]] = {}
+        self._segment_rows: dict[str, int] = {}
+        self._segments: dict[str, np.ndarray] = {}
+        self._offset = 0
+        self._inode: int | None = None
+        self._valid = True
+
+    def _header(self) -> bytes:
+        header = {"model_name": self._model_name, "dimension": self._dimension}
+        return json.dumps(header).encode() + b"\n"
+
+    def _refresh(self) -> None:
+        """Read index lines appended since the last call.
+
+        Starts over when the index was replaced (by compaction) or removed.
+        """
+        path = self._directory / _INDEX_FILE
+        try:
+            with open(path, "rb") as f:
+                st = os.fstat(f.fileno())
+                if st.st_ino != self._inode or st.st_size < self._offset:
+                    self._reset()
+                    self._inode = st.st_ino
+                if not self._valid or st.st_size == self._offset:
+                    return
+                f.seek(self._offset)
+                data = f.read(st.st_size - self._offset)
+        except FileNotFoundError:
+            if self._inode is not None:
+                self._reset()
+            return
+        except OSError as e:
+            logger.warning(f"Ignoring unreadable embedding cache {self._directory}: {e}")
+            return
+
+        # Only consume complete lines; a writer may be mid-append
+        complete = data[: data.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            self._apply(line)
+        self._offset += len(complete)
+
+    def _apply(self, line: bytes) -> None:
+        """Apply one index line: the header on the first line, a segment after."""
+        try:
+            record = json.loads(line)
+        except ValueError:
+            logger.warning(f"Skipping corrupt line in embedding cache {self._directory}")
+            return
+        if self._offset == 0 and not self._segment_rows and "segment" not in record:
+            if (
+                record.get("model_name") != self._model_name
+                or record.get("dimension") != self._dimension
+            ):
+                logger.warning(f"Ignoring embedding cache {self._directory}: model mismatch")
+                self._valid = False
+            return
+        segment, hashes = record.get("segment"), record.get("hashes")
+        if not isinstance(segment, str) or not isinstance(hashes, list):
+            logger.warning(f"Skipping corrupt line in embedding cache {self._directory}")
+            return
+        self._segment_rows[segment] = len(hashes)
+        for row, content_hash in enumerate(hashes):
+            self._rows[content_hash] = (segment, row)
+
+    def _segment(self, name: str) -> np.ndarray | None:
+        """Memory-map a segment, or None if it is gone or malformed."""
+        if name not in self._segments:
+            try:
+                vectors = np.load(self._directory / name, mmap_mode="r")
+            except (OSError, ValueError) as e:
+                # Removed by a compaction we haven't seen yet: reread next time
+                logger.debug(f"Embedding cache segment {name} unavailable: {e}")
+                self._inode = None
+                return None
+            if vectors.ndim != 3 or vectors.shape[1:] != (2, self._dimension):
+                logger.warning(f"Ignoring malformed embedding cache segment {name}")
+                return None
+            self._segments[name] = vectors
+        return self._segments[name]
+
+    def get_many(self, content_hashes: list[str]) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+        self._refresh()
+        if not self._valid:
+            return {}
+        found: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        for content_hash in content_hashes:
+            location = self._rows.get(content_hash)
+            if location is None:
+                continue
+            segment, row = location
+            vectors = self._segment(segment)
+            if vectors is not None and row < len(vectors):
+                pair = np.array(vectors[row])
+                found[content_hash] = (pair[0], pair[1])
+        return found
+
+    def put_many(self, items: dict[str, tuple[list[float], list[float]]]) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        with filelock.FileLock(self._directory / _LOCK_FILE, timeout=60):
+            # Catch up under the lock so concurrent writers don't duplicate rows
+            self._refresh()
+            new = (
+                items
+                if not self._valid
+                else {h: pair for h, pair in items.items() if h not in self._rows}
+            )
+            if not new:
+                return
+            vectors = np.empty((len(new), 2, self._dimension), dtype=np.float32)
+            for row, pair in enumerate(new.values()):
+                vectors[row] = pair
+            segment = self._write_segment(vectors)
+            line = json.dumps({"segment": segment, "hashes": list(new)}).encode() + b"\n"
+            if self._valid and self._inode is not None:
+                with open(self._directory / _INDEX_FILE, "ab") as f:
+                    f.write(line)
+            else:
+                # First write, or replacing an index for another model
+                self._atomic_write(_INDEX_FILE, lambda f: f.write(self._header() + line))
+
+    def compact(self, live_hashes: set[str]) -> int:
+        """Rewrite the cache keeping only live_hashes, if it is worth it.
+
+        Returns:
+            Number of dead rows dropped (0 when no compaction ran).
+        """
+        if not (self._directory / _INDEX_FILE).exists():
+            return 0
+        with filelock.FileLock(self._directory / _LOCK_FILE, timeout=60):
+            self._refresh()
+            if not self._valid:
+                return 0
+            dead = len(self._rows) - len(self._rows.keys() & live_hashes)
+            total_rows = sum(self._segment_rows.values())
+            # Rows shadowed by a later segment count as dead too
+            dead += total_rows - len(self._rows)
+            if dead <= total_rows - dead and len(self._segment_rows) <= MAX_SEGMENTS:
+                return 0
+
+            keep: dict[str, np.ndarray] = {}
+            for content_hash in self._rows.keys() & live_hashes:
+                segment, row = self._rows[content_hash]
+                vectors = self._segment(segment)
+                if vectors is not None and row < len(vectors):
+                    keep[content_hash] = vectors[row]
+            merged = np.empty((len(keep), 2, self._dimension), dtype=np.float32)
+            for row, pair in enumerate(keep.values()):
+                merged[row] = pair
+
+            index = self._header()
+            if keep:
+                segment = self._write_segment(merged)
+                index += json.dumps({"segment": segment, "hashes": list(keep)}).encode() + b"\n"
+            self._atomic_write(_INDEX_FILE, lambda f: f.write(index))
+
+            # Also removes segments orphaned by writers that died before appending
+            live_segments = {json.loads(line).get("segment") for line in index.splitlines()}
+            self._segments.clear()
+            for path in self._directory.glob(f"{_SEGMENT_PREFIX}*.npy"):
+                if path.name not in live_segments:
+                    try:
+                        path.unlink()
+                    except OSError as e:
+                        logger.debug(f"Could not remove embedding cache segment {path}: {e}")
+            self._reset()
+        return total_rows - len(keep)
+
+    def _write_segment(self, vectors: np.ndarray) -> str:
+        name = f"{_SEGMENT_PREFIX}{uuid.uuid4().hex}.npy"
+        self._atomic_write(name, lambda f: np.save(f, vectors))
+        return name
+
+    def _atomic_write(self, name: str, write: Callable[[BinaryIO], object]) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self._directory, prefix=f".{name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp, self._directory / name)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+class EmbeddingCache:
+    """Persistent cache of skill description and code embeddings.
+
+    Used by SkillLibrary when no VectorStore is configured, so a process
+    start only embeds skills it has never seen. Entries are keyed by
+    (model_name, dimension, content_hash): each model gets its own
+    subdirectory of memory-mapped .npy segments and an append-only index.
+    Rows of edited or deleted skills are dropped by compact().
+
+    Safe to share between processes. Write failures (e.g. read-only
+    storage) are logged and otherwise ignored.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize cache rooted at path. Directories are created on first write."""
+        self._path = path
+        self._models: dict[tuple[str, int], _ModelCache] = {}
+
+    @property
+    def path(self) -> Path:
+        """Root directory of the cache."""
+        return self._path
+
+    def _model(self, model_name: str, dimension: int) -> _ModelCache:
+        key = (model_name, dimension)
+        if key not in self._models:
+            directory = self._path / f"{_UNSAFE_PATH_CHARS.sub('_', model_name)}-{dimension}"
+            self._models[key] = _ModelCache(directory, model_name, dimension)
+        return self._models[key]
+
+    def get_many(
+        self, model_name: str, dimension: int, content_hashes: list[str]
+    ) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+        """Look up cached vectors.
+
+        Returns:
+            Map of content hash to (description vector, code vector) for
+            every hash found in the cache.
+        """
+        return self._model(model_name, dimension).get_many(content_hashes)
+
+    def put_many(
+        self,
+        model_name: str,
+        dimension: int,
+        items: dict[str, tuple[list[float], list[float]]],
+    ) -> None:
+        """Store (description vector, code vector) pairs keyed by content hash."""
+        if not items:
+            return
+        try:
+            self._model(model_name, dimension).put_many(items)
+        except (OSError, filelock.Timeout) as e:
+            logger.warning(f"Failed to write embedding cache {self._path}: {e}")
+
+    def compact(self, model_name: str, dimension: int, live_hashes: set[str]) -> int:
+        """Drop rows whose content hash is not in live_hashes.
+
+        Only rewrites the cache when dead rows outnumber live ones or more
+        than MAX_SEGMENTS segments have accumulated, so calling it after
+        every refresh costs amortized O(1) per write.
+
+        Returns:
+            Number of rows dropped.
+        """
+        try:
+            return self._model(model_name, dimension).compact(live_hashes)
+        except (OSError, filelock.Timeout) as e:
+            logger.warning(f"Failed to compact embedding cache {self._path}: {e}")
+            return 0
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import os
 import threading
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal, Protocol, get_args, runtime_checkable
 
 if TYPE_CHECKING:
     from sentence_transformers import SentenceTransformer
@@ -23,6 +26,234 @@ def cosine_similarity(a: list[float], b: list[float]) -> float:
     return dot / (norm_a * norm_b)
 
 
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first.
+
+    Uses argpartition so only the k winners are sorted. Ties keep row order.
+    """
+    if k <= 0 or len(scores) == 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(scores):
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order]
+
+
+# Storage precision of embedding vectors. float16 halves and int8 quarters
+# the memory of float32; int8 keeps one float32 scale per vector.
+VectorPrecision = Literal["float32", "float16", "int8"]
+
+_DTYPES: dict[str, type[np.generic]] = {
+    "float32": np.float32,
+    "float16": np.float16,
+    "int8": np.int8,
+}
+
+# int8 codes span [-127, 127] so the scale is symmetric around zero
+_INT8_MAX = 127
+
+# Rows decoded to float32 at a time when scoring quantized vectors
+_SCORE_CHUNK_ROWS = 8192
+
+
+def check_precision(precision: str) -> None:
+    """Raise ValueError unless precision is a VectorPrecision."""
+    if precision not in get_args(VectorPrecision):
+        msg = f"precision must be one of {get_args(VectorPrecision)}, got {precision!r}"
+        raise ValueError(msg)
+
+
+def quantize(
+    vectors: np.ndarray, precision: VectorPrecision
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """Encode the rows of vectors at the given precision.
+
+    Returns:
+        (codes, scales). For int8 each row is scaled so its largest
+        component maps to 127, and row i decodes to codes[i] * scales[i].
+        scales is None for the float precisions.
+    """
+    check_precision(precision)
+    array = np.asarray(vectors, dtype=np.float32)
+    if precision != "int8":
+        return array.astype(_DTYPES[precision], copy=False), None
+    peaks = np.max(np.abs(array), axis=-1)
+    scales = np.where(peaks > 0, peaks / _INT8_MAX, 1.0).astype(np.float32)
+    codes = np.rint(array / scales[..., None]).astype(np.int8)
+    return codes, scales
+
+
+def dequantize(codes: np.ndarray, scales: np.ndarray | None) -> np.ndarray:
+    """Decode quantize() output back to float32 rows."""
+    vectors = codes.astype(np.float32, copy=False)
+    if scales is not None:
+        vectors = vectors * scales[..., None]
+    return vectors
+
+
+def quantized_scores(codes: np.ndarray, scales: np.ndarray | None, query: np.ndarray) -> np.ndarray:
+    """Dot product of query with every decoded row of codes.
+
+    Quantized rows are decoded a chunk at a time, so scoring never holds a
+    float32 copy of the whole matrix.
+    """
+    if codes.dtype == np.float32:
+        return np.asarray(codes @ query)
+    scores = np.empty(len(codes), dtype=np.float32)
+    for start in range(0, len(codes), _SCORE_CHUNK_ROWS):
+        chunk = codes[start : start + _SCORE_CHUNK_ROWS]
+        scores[start : start + len(chunk)] = chunk.astype(np.float32) @ query
+    if scales is not None:
+        scores *= scales
+    return scores
+
+
+class EmbeddingMatrix:
+    """Unit-normalized embedding matrix with a name <-> row index.
+
+    Vectors are stored as contiguous rows so a query is scored against every
+    entry with one matrix-vector product. Rows are added, replaced and removed
+    in place; removal moves the last row into the freed slot, so two matrices
+    that see the same sequence of set()/remove() calls keep the same row order.
+
+    Rows are float32 by default. With precision "float16" or "int8" they are
+    stored quantized and scores are approximate: int8 cosine similarities
+    are typically within 0.01 of the exact ones.
+    """
+
+    def __init__(self, precision: VectorPrecision = "float32") -> None:
+        check_precision(precision)
+        self._precision = precision
+        self._dtype = _DTYPES[precision]
+        self._data = np.empty((0, 0), dtype=self._dtype)
+        # Per-row int8 scales; None for the float precisions
+        self._scales: np.ndarray | None = (
+            np.empty(0, dtype=np.float32) if precision == "int8" else None
+        )
+        self._names: list[str] = []
+        self._rows: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._rows
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Return the normalized vector stored for name."""
+        row = self._rows[name]
+        scales = None if self._scales is None else self._scales[row : row + 1]
+        return np.array(dequantize(self._data[row : row + 1], scales)[0])
+
+    @property
+    def names(self) -> list[str]:
+        """Entry names in row order."""
+        return list(self._names)
+
+    @property
+    def precision(self) -> VectorPrecision:
+        return self._precision
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Populated rows as float32, shape (len(self), dimension).
+
+        A view for float32 storage, a decoded copy otherwise.
+        """
+        return dequantize(self._data[: len(self._names)], self._populated_scales())
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for the rows and their scales."""
+        return self._data.nbytes + (0 if self._scales is None else self._scales.nbytes)
+
+    def _populated_scales(self) -> np.ndarray | None:
+        return None if self._scales is None else self._scales[: len(self._names)]
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        normalized: np.ndarray = np.divide(
+            vectors, norms, out=np.zeros_like(vectors), where=norms > 0
+        )
+        return normalized
+
+    def _reserve(self, rows: int, dimension: int) -> None:
+        """Grow storage geometrically to hold at least rows entries."""
+        if self._data.shape[1] != dimension:
+            if self._names:
+                raise ValueError(
+                    f"Vector dimension {dimension} does not match matrix dimension "
+                    f"{self._data.shape[1]}"
+                )
+            self._data = np.empty((0, dimension), dtype=self._dtype)
+        if rows > self._data.shape[0]:
+            capacity = max(rows, 2 * self._data.shape[0], 16)
+            grown = np.empty((capacity, dimension), self._dtype)
+            grown[: len(self._names)] = self._data[: len(self._names)]
+            self._data = grown
+            if self._scales is not None:
+                scales = np.empty(capacity, np.float32)
+                scales[: len(self._names)] = self._scales[: len(self._names)]
+                self._scales = scales
+
+    def set(self, name: str, vector: list[float] | np.ndarray) -> None:
+        """Add or replace the vector for name."""
+        self.set_many([name], [vector])
+
+    def set_many(
+        self, names: list[str], vectors: Sequence[Sequence[float] | np.ndarray] | np.ndarray
+    ) -> None:
+        """Add or replace vectors for several names at once."""
+        if not names:
+            return
+        array = self._normalize(np.asarray(vectors, dtype=np.float32).reshape(len(names), -1))
+        codes, scales = quantize(array, self._precision)
+        self._reserve(len(self._names) + len(names), array.shape[1])
+        for i, name in enumerate(names):
+            index = self._rows.get(name)
+            if index is None:
+                index = len(self._names)
+                self._names.append(name)
+                self._rows[name] = index
+            self._data[index] = codes[i]
+            if self._scales is not None and scales is not None:
+                self._scales[index] = scales[i]
+
+    def remove(self, name: str) -> bool:
+        """Remove the vector for name. Returns False if it was not present."""
+        index = self._rows.pop(name, None)
+        if index is None:
+            return False
+        last = len(self._names) - 1
+        if index != last:
+            moved = self._names[last]
+            self._data[index] = self._data[last]
+            if self._scales is not None:
+                self._scales[index] = self._scales[last]
+            self._names[index] = moved
+            self._rows[moved] = index
+        self._names.pop()
+        return True
+
+    def clear(self) -> None:
+        """Remove all vectors."""
+        self._data = np.empty((0, 0), dtype=self._dtype)
+        if self._scales is not None:
+            self._scales = np.empty(0, dtype=np.float32)
+        self._names.clear()
+        self._rows.clear()
+
+    def scores(self, query: list[float] | np.ndarray) -> np.ndarray:
+        """Cosine similarity of query against every row, in row order."""
+        if not self._names:
+            return np.empty(0, dtype=np.float32)
+        query_vec = self._normalize(np.asarray(query, dtype=np.float32))
+        return quantized_scores(self._data[: len(self._names)], self._populated_scales(), query_vec)
+
+
 @runtime_checkable
 class EmbeddingProvider(Protocol):
     """Protocol for embedding providers."""
@@ -41,6 +272,30 @@ class EmbeddingProvider(Protocol):
         ...
 
 
+@runtime_checkable
+class BackgroundLoadingProvider(Protocol):
+    """Embedding provider whose model may still be loading in the background.
+
+    While loading is True, embed() blocks; callers that can answer without
+    vectors (like lexical search) should do so instead of waiting.
+    """
+
+    @property
+    def loading(self) -> bool: ...
+
+
+def embed_in_batches(
+    embedder: EmbeddingProvider, texts: list[str], batch_size: int
+) -> list[list[float]]:
+    """Embed texts with at most batch_size texts per embed() call."""
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    vectors: list[list[float]] = []
+    for start in range(0, len(texts), batch_size):
+        vectors.extend(embedder.embed(texts[start : start + batch_size]))
+    return vectors
+
+
 @dataclass
 class MockEmbedder:
     """Mock embedder for testing without GPU/model."""
@@ -85,6 +340,38 @@ def resolve_model_name(model: str) -> str:
     return MODEL_ALIASES.get(model, model)
 
 
+@dataclass(frozen=True)
+class EmbedderStats:
+    """Snapshot of an Embedder's query cache and batching counters."""
+
+    query_hits: int = 0
+    query_misses: int = 0
+    batches: int = 0
+    batched_requests: int = 0
+    batched_texts: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of embed_query() calls served from the cache."""
+        total = self.query_hits + self.query_misses
+        return self.query_hits / total if total else 0.0
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Average number of texts passed to each model encode."""
+        return self.batched_texts / self.batches if self.batches else 0.0
+
+
+@dataclass
+class _PendingEncode:
+    """One embed()/embed_query() call waiting to join a batched encode."""
+
+    texts: list[str]
+    done: threading.Event = field(default_factory=threading.Event)
+    result: np.ndarray | None = None
+    error: BaseException | None = None
+
+
 class Embedder:
     """Embedding provider using sentence-transformers.
 
@@ -100,18 +387,36 @@ class Embedder:
 
     The model is loaded lazily on first embed() or embed_query() call to avoid
     30+ second initialization overhead when embeddings aren't actually used.
+
+    Query vectors are kept in a bounded LRU cache, and calls from different
+    threads that arrive while an encode is running share the next model
+    encode. Counters for both are available from stats.
     """
 
     DEFAULT_MODEL = "bge-small"
     QUERY_INSTRUCTION = "Represent this sentence for searching relevant passages: "
-
-    def __init__(self, model_name: str | None = None, start_loading: bool = False) -> None:
+    DEFAULT_QUERY_CACHE_SIZE = 1024
+    DEFAULT_BATCH_WINDOW_MS = 2.0
+
+    def __init__(
+        self,
+        model_name: str | None = None,
+        start_loading: bool = False,
+        query_cache_size: int = DEFAULT_QUERY_CACHE_SIZE,
+        batch_window_ms: float = DEFAULT_BATCH_WINDOW_MS,
+    ) -> None:
         """Initialize embedder.
 
         Args:
             model_name: Model alias or full HuggingFace name. Default: bge-small.
             start_loading: If True, start loading the model in a background thread
                 immediately. The first embed() call will block until loading completes.
+            query_cache_size: Maximum number of query vectors to keep. 0 disables
+                the cache.
+            batch_window_ms: How long a caller that arrives while an encode is
+                running waits for more calls to join the next one. A caller
+                that arrives when the model is idle encodes immediately.
+                0 encodes every call on its own.
 
         Note: By default, the model is not loaded until embed() or embed_query()
         is called. Use start_loading=True for MCP servers to reduce first-search latency.
@@ -130,6 +435,22 @@ class Embedder:
         self._loading_lock = threading.Lock()
         self._loading_thread: threading.Thread | None = None
 
+        # Query vector LRU cache, keyed by prefixed query text
+        self._query_cache_size = max(0, query_cache_size)
+        self._query_cache: OrderedDict[str, list[float]] = OrderedDict()
+        self._query_hits = 0
+        self._query_misses = 0
+        self._cache_lock = threading.Lock()
+
+        # Micro-batching of concurrent encodes
+        self._batch_window = max(0.0, batch_window_ms) / 1000
+        self._pending: list[_PendingEncode] = []
+        self._pending_lock = threading.Lock()
+        self._encode_lock = threading.Lock()
+        self._batches = 0
+        self._batched_requests = 0
+        self._batched_texts = 0
+
         if start_loading:
             self._start_background_loading()
 
@@ -175,6 +496,12 @@ class Embedder:
         if self._model is None:
             self._load_model()
 
+    @property
+    def loading(self) -> bool:
+        """True while the model is still loading in a background thread."""
+        thread = self._loading_thread
+        return thread is not None and thread.is_alive()
+
     @property
     def device(self) -> str:
         """Device the model runs on (cuda, mps, or cpu)."""
@@ -200,6 +527,72 @@ class Embedder:
         assert dim is not None
         return dim
 
+    @property
+    def stats(self) -> EmbedderStats:
+        """Query cache hit/miss and encode batching counters."""
+        with self._cache_lock, self._pending_lock:
+            return EmbedderStats(
+                query_hits=self._query_hits,
+                query_misses=self._query_misses,
+                batches=self._batches,
+                batched_requests=self._batched_requests,
+                batched_texts=self._batched_texts,
+            )
+
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        """Encode texts, sharing one model call with concurrent callers.
+
+        The first caller to arrive becomes the batch leader. If no encode is
+        running it encodes right away, so a lone caller never pays the batch
+        window. Otherwise it waits for the window, then encodes every text
+        queued meanwhile (deduplicated) and hands each caller its rows. Later
+        callers block until that happens. Leaders serialize on the encode lock,
+        so calls arriving while a batch is running queue up for the next one.
+        """
+        request = _PendingEncode(texts)
+        if self._batch_window == 0:
+            with self._encode_lock:
+                self._run_batch([request])
+        else:
+            with self._pending_lock:
+                self._pending.append(request)
+                leader = len(self._pending) == 1
+            if leader:
+                if self._encode_lock.locked():
+                    time.sleep(self._batch_window)
+                with self._encode_lock:
+                    with self._pending_lock:
+                        batch, self._pending = self._pending, []
+                    self._run_batch(batch)
+            else:
+                request.done.wait()
+
+        if request.error is not None:
+            raise request.error
+        assert request.result is not None  # Set by _run_batch when no error
+        return request.result
+
+    def _run_batch(self, batch: list[_PendingEncode]) -> None:
+        """Encode all texts in batch and deliver results (or the error) to each request."""
+        unique = list(dict.fromkeys(text for request in batch for text in request.texts))
+        try:
+            self._ensure_model_loaded()
+            assert self._model is not None  # Guaranteed after _ensure_model_loaded
+            vectors = np.asarray(self._model.encode(unique, normalize_embeddings=True))
+            rows = {text: row for row, text in enumerate(unique)}
+            for request in batch:
+                request.result = vectors[[rows[text] for text in request.texts]]
+        except BaseException as e:
+            for request in batch:
+                request.error = e
+        finally:
+            with self._pending_lock:
+                self._batches += 1
+                self._batched_requests += len(batch)
+                self._batched_texts += len(unique)
+            for request in batch:
+                request.done.set()
+
     def embed(self, texts: list[str]) -> list[list[float]]:
         """Embed document texts into vectors (no prefix).
 
@@ -209,15 +602,16 @@ class Embedder:
         Returns:
             List of embedding vectors.
         """
-        self._ensure_model_loaded()
-        assert self._model is not None  # Guaranteed after _ensure_model_loaded
-        embeddings = self._model.encode(texts, normalize_embeddings=True)
-        return embeddings.tolist()  # type: ignore[return-value]
+        if not texts:
+            return []
+        vectors: list[list[float]] = self._encode(texts).tolist()
+        return vectors
 
     def embed_query(self, query: str) -> list[float]:
         """Embed query text into vector (with instruction prefix).
 
         BGE models use instruction prefix for better retrieval performance.
+        Repeated queries are served from the LRU cache without touching the model.
 
         Args:
             query: Search query text.
@@ -225,8 +619,21 @@ class Embedder:
         Returns:
             Embedding vector.
         """
-        self._ensure_model_loaded()
-        assert self._model is not None  # Guaranteed after _ensure_model_loaded
         text = self.QUERY_INSTRUCTION + query
-        embedding = self._model.encode([text], normalize_embeddings=True)[0]
-        return embedding.tolist()  # type: ignore[return-value]
+        with self._cache_lock:
+            cached = self._query_cache.get(text)
+            if cached is not None:
+                self._query_cache.move_to_end(text)
+                self._query_hits += 1
+                return list(cached)
+            self._query_misses += 1
+
+        embedding: list[float] = self._encode([text])[0].tolist()
+
+        if self._query_cache_size:
+            with self._cache_lock:
+                self._query_cache[text] = embedding
+                self._query_cache.move_to_end(text)
+                while len(self._query_cache) > self._query_cache_size:
+                    self._query_cache.popitem(last=False)
+        return list(embedding)
@@ -0,0 +1,138 @@
+"""BM25 lexical index and reciprocal-rank fusion for hybrid search."""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable, Sequence
+
+# Word-like runs: identifiers and numbers
+_WORD = re.compile(r"[A-Za-z0-9_]+")
+# Boundaries inside an identifier: snake_case and camelCase parts
+_PART = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+# Standard BM25 parameters: term-frequency saturation and length normalization
+DEFAULT_K1 = 1.2
+DEFAULT_B = 0.75
+
+# Standard reciprocal-rank fusion offset (Cormack et al., 2009)
+DEFAULT_RRF_K = 60
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase search terms.
+
+    Identifiers yield both the whole identifier and its parts, so
+    "github_stars" and "githubStars" each match the query "github_stars"
+    exactly and also match "stars".
+    """
+    tokens: list[str] = []
+    for word in _WORD.findall(text):
+        whole = word.lower().strip("_")
+        if not whole:
+            continue
+        tokens.append(whole)
+        parts = _PART.findall(word)
+        if len(parts) > 1:
+            tokens.extend(part.lower() for part in parts)
+    return tokens
+
+
+class BM25Index:
+    """Incrementally maintained inverted index with Okapi BM25 scoring.
+
+    Documents are bags of tokens keyed by id; set() and remove() update the
+    postings and length statistics in place, so keeping the index in sync
+    costs O(document length) per change rather than a rebuild.
+    """
+
+    def __init__(self, k1: float = DEFAULT_K1, b: float = DEFAULT_B) -> None:
+        self._k1 = k1
+        self._b = b
+        # term -> {doc id -> term frequency}
+        self._postings: dict[str, dict[str, int]] = {}
+        # doc id -> its distinct terms, so remove() only touches those postings
+        self._terms: dict[str, list[str]] = {}
+        self._lengths: dict[str, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._lengths
+
+    def set(self, doc_id: str, tokens: Iterable[str]) -> None:
+        """Index a document, replacing any previous version."""
+        self.remove(doc_id)
+        counts = Counter(tokens)
+        for term, count in counts.items():
+            self._postings.setdefault(term, {})[doc_id] = count
+        self._terms[doc_id] = list(counts)
+        length = sum(counts.values())
+        self._lengths[doc_id] = length
+        self._total_length += length
+
+    def remove(self, doc_id: str) -> bool:
+        """Drop a document. Returns False if it was not indexed."""
+        length = self._lengths.pop(doc_id, None)
+        if length is None:
+            return False
+        self._total_length -= length
+        for term in self._terms.pop(doc_id):
+            docs = self._postings[term]
+            del docs[doc_id]
+            if not docs:
+                del self._postings[term]
+        return True
+
+    def clear(self) -> None:
+        self._postings.clear()
+        self._terms.clear()
+        self._lengths.clear()
+        self._total_length = 0
+
+    def search(self, query: str, limit: int) -> list[tuple[str, float]]:
+        """Best matching (doc id, score) pairs, highest score first.
+
+        Only documents sharing at least one term with the query are returned.
+        """
+        if not self._lengths or limit <= 0:
+            return []
+        n = len(self._lengths)
+        avg_length = self._total_length / n or 1.0
+        scores: dict[str, float] = {}
+        for term in set(tokenize(query)):
+            docs = self._postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+            for doc_id, tf in docs.items():
+                norm = self._k1 * (1 - self._b + self._b * self._lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self._k1 + 1) / (tf + norm)
+        return heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[tuple[Sequence[str], float]], k: int = DEFAULT_RRF_K
+) -> list[str]:
+    """Merge ranked id lists by weighted reciprocal rank.
+
+    Each id scores sum(weight / (k + rank)) over the rankings it appears in,
+    with rank starting at 1. Ties keep the order of first appearance, so the
+    earlier rankings break them.
+
+    Args:
+        rankings: (ids best first, weight) per ranking.
+        k: Rank offset; larger values flatten the gap between top ranks.
+
+    Returns:
+        Every id from the rankings, best fused score first.
+    """
+    scores: dict[str, float] = {}
+    for ids, weight in rankings:
+        for rank, doc_id in enumerate(ids, start=1):
+            scores[doc_id] = scores.get(doc_id, 0.0) + weight / (k + rank)
+    return sorted(scores, key=lambda doc_id: -scores[doc_id])
@@ -2,21 +2,45 @@
 
 from __future__ import annotations
 
+import builtins
+import logging
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
+from py_code_mode.errors import StorageReadError
+from py_code_mode.skills.embedding_cache import EmbeddingCache
 from py_code_mode.skills.embeddings import (
+    BackgroundLoadingProvider,
     Embedder,
+    EmbeddingMatrix,
     EmbeddingProvider,
-    cosine_similarity,
+    VectorPrecision,
+    embed_in_batches,
+    top_k_indices,
+)
+from py_code_mode.skills.lexical import (
+    DEFAULT_RRF_K,
+    BM25Index,
+    reciprocal_rank_fusion,
+    tokenize,
 )
 from py_code_mode.skills.skill import PythonSkill
-from py_code_mode.skills.store import SkillStore
-from py_code_mode.skills.vector_store import VectorStore, compute_content_hash
+from py_code_mode.skills.store import SkillStore, VersionedSkillStore
+from py_code_mode.skills.vector_store import (
+    DEFAULT_EMBED_BATCH_SIZE,
+    BatchVectorStore,
+    VectorEntry,
+    VectorStore,
+    compute_content_hash,
+)
 
 if TYPE_CHECKING:
     pass
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class RankingConfig:
@@ -29,6 +53,34 @@ class RankingConfig:
     code_weight: float = 0.3
     min_score_threshold: float = 0.0  # 0 = return all, 0.8 = high confidence only
     code_min_length: int = 0  # Min code chars to include code embedding (0 = always)
+    # Reciprocal-rank fusion of the semantic and BM25 rankings
+    semantic_weight: float = 1.0  # 0 = lexical only
+    lexical_weight: float = 1.0  # 0 = semantic only
+    rrf_k: int = DEFAULT_RRF_K
+
+
+# Candidates per ranking fed into reciprocal-rank fusion, per requested result
+_FUSION_DEPTH_FACTOR = 4
+
+# Candidates per requested result picked with quantized vectors and then
+# rescored with the full-precision vectors from embedding_cache
+_RESCORE_FACTOR = 4
+
+# Token repetitions per skill field in the BM25 index: names and parameters
+# are short and precise, so a match there counts for more than one in source
+_NAME_BOOST = 3
+_DESCRIPTION_BOOST = 2
+_PARAMETER_BOOST = 2
+
+
+def _lexical_tokens(skill: PythonSkill) -> list[str]:
+    """BM25 terms for a skill: name, description, parameter names and source."""
+    tokens = tokenize(skill.name) * _NAME_BOOST
+    tokens += tokenize(skill.description) * _DESCRIPTION_BOOST
+    for parameter in skill.parameters:
+        tokens += tokenize(parameter.name) * _PARAMETER_BOOST
+    tokens += tokenize(skill.source)
+    return tokens
 
 
 @dataclass
@@ -42,11 +94,26 @@ class SkillLibrary:
     - Skill lifecycle management (add, remove, get, list)
 
     If a store is provided, skills are persisted there and loaded at
-    construction time. Use refresh() to reload from store.
+    construction time. Use refresh() to reload from store; with a
+    VersionedSkillStore only changed skills are reloaded.
 
     If a vector_store is provided, embeddings are cached there and
-    search is delegated to the vector_store. Otherwise, in-memory
-    embeddings are used.
+    search is delegated to the vector_store. Otherwise, embeddings are
+    kept in in-memory EmbeddingMatrix instances and each query is scored
+    against all skills with one matrix-vector product. An optional
+    EmbeddingCache persists those vectors, so a warm start embeds nothing.
+    With vector_precision "float16" or "int8" the matrices are stored
+    quantized; if an embedding_cache is configured, the best candidates
+    are then rescored with its float32 vectors so the ranking matches
+    full precision.
+
+    Search fuses the semantic ranking with a BM25 ranking over skill
+    names, descriptions, parameter names and source tokens, so exact
+    identifiers in a query find their skill. Both indexes are updated
+    together. While the embedder's model is still loading in the
+    background, new skills are only indexed lexically and search answers
+    from BM25 alone instead of blocking; the deferred skills are embedded
+    on the first search or refresh after loading finishes.
 
     Ranking formula is configurable via RankingConfig.
     """
@@ -55,12 +122,24 @@ class SkillLibrary:
     store: SkillStore | None = None
     vector_store: VectorStore | None = None
     ranking: RankingConfig = field(default_factory=RankingConfig)
+    embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE
+    embedding_cache: EmbeddingCache | None = None
+    vector_precision: VectorPrecision = "float32"
     _skills: dict[str, PythonSkill] = field(default_factory=dict)
-    _description_vectors: dict[str, list[float]] = field(default_factory=dict)
-    _code_vectors: dict[str, list[float]] = field(default_factory=dict)
+    # Row-aligned: every set()/remove() is applied to both matrices together
+    _description_vectors: EmbeddingMatrix = field(default_factory=EmbeddingMatrix)
+    _code_vectors: EmbeddingMatrix = field(default_factory=EmbeddingMatrix)
+    _store_token: str | None = None
+    _store_versions: dict[str, str] = field(default_factory=dict)
+    _lexical: BM25Index = field(default_factory=BM25Index)
+    # Skills indexed while the embedder was loading, not yet embedded
+    _unembedded: dict[str, PythonSkill] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         """Load and index skills from store if provided."""
+        if self.vector_precision != "float32":
+            self._description_vectors = EmbeddingMatrix(self.vector_precision)
+            self._code_vectors = EmbeddingMatrix(self.vector_precision)
         if self.store is not None:
             self.refresh()
 
@@ -68,63 +147,210 @@ class SkillLibrary:
         return len(self._skills)
 
     def refresh(self) -> None:
-        """Reload all skills from store and rebuild embedding index.
+        """Sync the in-memory index with the store.
 
-        Clears in-memory state and reloads from the store. When a VectorStore
-        is configured, content-hash checking in _index_skill() handles caching:
-        - New skills: indexed (hash not found)
-        - Changed skills: re-indexed (hash mismatch)
-        - Unchanged skills: skipped (hash match, fast path)
-        - Deleted skills: stale vectors remain in VectorStore but search()
-          filters results via _skills dict
+        With a VersionedSkillStore this is incremental: nothing is loaded when
+        the store's change token is unchanged since the last refresh, and
+        otherwise only skills whose version changed are reloaded and
+        re-indexed. Other stores are reloaded in full.
+
+        Skills that need (re-)embedding are embedded in batches of
+        embed_batch_size texts. When a VectorStore is configured,
+        content-hash checking in _index_skills() skips re-embedding skills
+        whose content is unchanged.
+        Vectors of deleted skills remain in the VectorStore but search()
+        filters results via _skills dict. Without a VectorStore, stale rows
+        are compacted out of embedding_cache instead.
 
         No-op if no store is configured.
         """
         if self.store is None:
             return
+        self._embed_deferred()
 
-        # Clear current in-memory index
-        self._skills.clear()
-        self._description_vectors.clear()
-        self._code_vectors.clear()
+        if not isinstance(self.store, VersionedSkillStore):
+            self._reload_all(self.store.list_all())
+            self._compact_embedding_cache()
+            return
 
-        # Load and index all skills from store
-        # Note: VectorStore is NOT cleared - _index_skill() uses content hashes
+        # Read the token before the data, so a write racing with this refresh
+        # leaves a stale token behind and is picked up by the next one
+        token = self.store.change_token()
+        if token == self._store_token:
+            return
+        versions = self.store.versions()
+
+        if self._store_token is None:
+            self._reload_all(self.store.list_all())
+        else:
+            for name in self._store_versions.keys() - versions.keys():
+                self._unindex_skill(name)
+            self._reload_skills(
+                [
+                    name
+                    for name, version in versions.items()
+                    if self._store_versions.get(name) != version
+                ]
+            )
+
+        self._store_token = token
+        self._store_versions = versions
+        self._compact_embedding_cache()
+
+    def _reload_all(self, skills: list[PythonSkill]) -> None:
+        """Replace the in-memory index with the given skills."""
+        loaded = {skill.name for skill in skills}
+        for name in [n for n in self._skills if n not in loaded]:
+            self._unindex_skill(name)
+        # Note: VectorStore is NOT cleared - _index_skills() uses content hashes
         # to skip re-embedding unchanged skills
-        for skill in self.store.list_all():
-            self._index_skill(skill)
+        self._index_skills(skills)
+
+    def _reload_skills(self, names: list[str]) -> None:
+        """Reload skills from the store, dropping any that are gone or unreadable."""
+        assert self.store is not None
+        reloaded: list[PythonSkill] = []
+        for name in names:
+            try:
+                skill = self.store.load(name)
+            except (StorageReadError, ValueError) as e:
+                logger.warning(f"Failed to reload skill '{name}': {type(e).__name__}: {e}")
+                skill = None
+            if skill is None:
+                self._unindex_skill(name)
+            else:
+                reloaded.append(skill)
+        self._index_skills(reloaded)
+
+    def _unindex_skill(self, name: str) -> None:
+        """Drop a skill from the in-memory index without touching any store."""
+        self._skills.pop(name, None)
+        self._lexical.remove(name)
+        self._unembedded.pop(name, None)
+        self._description_vectors.remove(name)
+        self._code_vectors.remove(name)
 
     def _index_skill(self, skill: PythonSkill) -> None:
-        """Add skill to local embedding index without touching store.
+        """Add skill to local embedding index without touching store."""
+        self._index_skills([skill])
+
+    def _index_skills(self, skills: list[PythonSkill]) -> None:
+        """Add skills to local embedding index without touching store.
 
-        If vector_store is configured, embeddings are cached there with
-        content hash checking to skip re-embedding unchanged skills.
+        New or changed skills are embedded together, embed_batch_size texts
+        per embedding call. If vector_store is configured, embeddings are
+        cached there with content hash checking to skip re-embedding
+        unchanged skills.
         """
+        # Later entries win, as with repeated add() calls
+        latest = {skill.name: skill for skill in skills}
+        previous = {name: self._skills.get(name) for name in latest}
         # Always add to _skills dict for get() by name
-        self._skills[skill.name] = skill
+        self._skills.update(latest)
+        for skill in latest.values():
+            self._lexical.set(skill.name, _lexical_tokens(skill))
 
-        if self.vector_store is not None:
-            # Use vector_store with content hash checking
-            content_hash = compute_content_hash(skill.description, skill.source)
-            stored_hash = self.vector_store.get_content_hash(skill.name)
+        if self._embedder_loading():
+            # Embedding now would block until the model is loaded
+            self._unembedded.update(latest)
+            return
+        self._index_vectors(latest, previous)
+
+    def _embedder_loading(self) -> bool:
+        return isinstance(self.embedder, BackgroundLoadingProvider) and self.embedder.loading
 
-            if stored_hash != content_hash:
-                # New or changed skill - add to vector_store
-                self.vector_store.add(
+    def _embed_deferred(self) -> None:
+        """Embed skills indexed while the model was loading, once it has loaded."""
+        if not self._unembedded or self._embedder_loading():
+            return
+        deferred = self._unembedded
+        self._unembedded = {}
+        self._index_vectors(deferred, dict.fromkeys(deferred))
+
+    def _index_vectors(
+        self, latest: dict[str, PythonSkill], previous: dict[str, PythonSkill | None]
+    ) -> None:
+        """Embed new or changed skills into the vector store or in-memory matrices."""
+        if self.vector_store is not None:
+            entries = [
+                VectorEntry(
                     id=skill.name,
                     description=skill.description,
                     source=skill.source,
-                    content_hash=content_hash,
+                    content_hash=compute_content_hash(skill.description, skill.source),
                 )
-        else:
-            # Fallback: in-memory vectors
-            # Embed description
-            desc_vec = self.embedder.embed([skill.description])[0]
-            self._description_vectors[skill.name] = desc_vec
+                for skill in latest.values()
+            ]
+            if isinstance(self.vector_store, BatchVectorStore):
+                self.vector_store.add_many(entries, batch_size=self.embed_batch_size)
+                return
+
+            # Use vector_store with content hash checking
+            for entry in entries:
+                if self.vector_store.get_content_hash(entry.id) != entry.content_hash:
+                    # New or changed skill - add to vector_store
+                    self.vector_store.add(
+                        id=entry.id,
+                        description=entry.description,
+                        source=entry.source,
+                        content_hash=entry.content_hash,
+                    )
+            return
+
+        # Fallback: in-memory vectors, skipping skills with unchanged content
+        changed = [
+            skill
+            for name, skill in latest.items()
+            if (old := previous[name]) is None
+            or old.description != skill.description
+            or old.source != skill.source
+            or name not in self._description_vectors
+        ]
+        if not changed:
+            return
+
+        vectors = self._embed_skills(changed)
+        names = [skill.name for skill in changed]
+        self._description_vectors.set_many(names, [desc for desc, _ in vectors])
+        self._code_vectors.set_many(names, [code for _, code in vectors])
+
+    def _compact_embedding_cache(self) -> None:
+        """Drop embedding_cache rows of skills that were edited or deleted."""
+        if self.embedding_cache is None or self.vector_store is not None:
+            return
+        live = {compute_content_hash(s.description, s.source) for s in self._skills.values()}
+        self.embedding_cache.compact(self._model_name(), self.embedder.dimension, live)
+
+    def _model_name(self) -> str:
+        # Same model identification as the VectorStore implementations
+        return getattr(self.embedder, "_resolved_model_name", type(self.embedder).__name__)
 
-            # Embed source code
-            code_vec = self.embedder.embed([skill.source])[0]
-            self._code_vectors[skill.name] = code_vec
+    def _embed_skills(self, skills: list[PythonSkill]) -> list[tuple[Any, Any]]:
+        """Return (description vector, code vector) for each skill.
+
+        Vectors found in embedding_cache are reused; only the rest are
+        embedded, and those are written back to the cache.
+        """
+        hashes = [compute_content_hash(s.description, s.source) for s in skills]
+        model_name = self._model_name()
+        vectors: dict[str, tuple[Any, Any]] = {}
+        if self.embedding_cache is not None:
+            cached = self.embedding_cache.get_many(model_name, self.embedder.dimension, hashes)
+            vectors.update(cached)
+
+        missing = {h: s for h, s in zip(hashes, skills, strict=True) if h not in vectors}
+        if missing:
+            # Descriptions then sources, so embedded[i] and embedded[n + i] belong to skill i
+            texts = [s.description for s in missing.values()]
+            texts += [s.source for s in missing.values()]
+            embedded = embed_in_batches(self.embedder, texts, self.embed_batch_size)
+            n = len(missing)
+            new = {h: (embedded[i], embedded[n + i]) for i, h in enumerate(missing)}
+            if self.embedding_cache is not None:
+                self.embedding_cache.put_many(model_name, self.embedder.dimension, new)
+            vectors.update(new)
+
+        return [vectors[h] for h in hashes]
 
     def add(self, skill: PythonSkill) -> None:
         """Add a skill to the library.
@@ -162,11 +388,7 @@ class SkillLibrary:
         # Remove from local index
         if name not in self._skills:
             return False
-        del self._skills[name]
-        if name in self._description_vectors:
-            del self._description_vectors[name]
-        if name in self._code_vectors:
-            del self._code_vectors[name]
+        self._unindex_skill(name)
         return True
 
     def search(
@@ -174,18 +396,45 @@ class SkillLibrary:
         query: str,
         limit: int = 10,
     ) -> list[PythonSkill]:
-        """Search for skills by semantic similarity.
+        """Search for skills by semantic similarity and keyword match.
+
+        The semantic and BM25 rankings are merged by reciprocal-rank fusion
+        with the weights in ranking. min_score_threshold applies to the
+        semantic ranking. While the embedder is still loading in the
+        background, only the BM25 ranking is used.
 
         Args:
             query: Natural language search query.
             limit: Maximum results to return.
 
         Returns:
-            Skills ranked by combined semantic similarity.
+            Skills ranked by fused semantic and lexical relevance.
         """
-        if not self._skills:
+        if not self._skills or limit <= 0:
             return []
+        self._embed_deferred()
+
+        use_semantic = self.ranking.semantic_weight > 0 and not self._embedder_loading()
+        use_lexical = self.ranking.lexical_weight > 0 or not use_semantic
+        if not use_lexical:
+            names = self._semantic_ranking(query, limit)
+        elif not use_semantic:
+            names = [name for name, _ in self._lexical.search(query, limit)]
+        else:
+            # Fetch deeper than limit so skills ranked well by both rise to the top
+            depth = limit * _FUSION_DEPTH_FACTOR
+            lexical = [name for name, _ in self._lexical.search(query, depth)]
+            names = reciprocal_rank_fusion(
+                [
+                    (self._semantic_ranking(query, depth), self.ranking.semantic_weight),
+                    (lexical, self.ranking.lexical_weight),
+                ],
+                k=self.ranking.rrf_k,
+            )
+        return [self._skills[name] for name in names[:limit]]
 
+    def _semantic_ranking(self, query: str, limit: int) -> builtins.list[str]:
+        """Names of the skills most similar to query, best first."""
         # Delegate to vector_store if configured
         if self.vector_store is not None:
             results = self.vector_store.search(
@@ -197,37 +446,63 @@ class SkillLibrary:
             # Filter out stale vectors: if a skill was deleted from the store
             # but its vectors remain in VectorStore (refresh doesn't clear VectorStore),
             # exclude it from results by checking _skills membership
-            return [self._skills[r.id] for r in results if r.id in self._skills]
+            return [r.id for r in results if r.id in self._skills]
 
         # Fallback: in-memory cosine similarity
         # Embed query (uses instruction prefix for retrieval models)
         query_vec = self.embedder.embed_query(query)
-
-        # Score each skill
-        scored: list[tuple[float, str]] = []
-        for name, skill in self._skills.items():
-            # Cosine similarity with description
-            desc_sim = cosine_similarity(query_vec, self._description_vectors[name])
-
-            # Cosine similarity with code (if code is substantial enough)
-            if len(skill.source) >= self.ranking.code_min_length and self.ranking.code_weight > 0:
-                code_sim = cosine_similarity(query_vec, self._code_vectors[name])
-                score = (
-                    self.ranking.description_weight * desc_sim + self.ranking.code_weight * code_sim
-                )
-            else:
-                # Description only
-                score = desc_sim
-
-            # Apply threshold
-            if score >= self.ranking.min_score_threshold:
-                scored.append((score, name))
-
-        # Sort by score descending
-        scored.sort(key=lambda x: x[0], reverse=True)
-
-        # Return top skills
-        return [self._skills[name] for _, name in scored[:limit]]
+        names = self._description_vectors.names
+        code_scores = self._code_vectors.scores(query_vec) if self.ranking.code_weight > 0 else None
+        scores = self._blend_scores(names, self._description_vectors.scores(query_vec), code_scores)
+
+        # Quantized scores only shortlist; exact scores decide the order
+        if self.vector_precision != "float32" and self.embedding_cache is not None:
+            shortlist = [names[i] for i in top_k_indices(scores, limit * _RESCORE_FACTOR)]
+            exact = self._exact_scores(shortlist, query_vec)
+            if exact is not None:
+                names, scores = shortlist, exact
+
+        # Apply threshold, then take the top skills by score
+        candidates = np.flatnonzero(scores >= self.ranking.min_score_threshold)
+        top = candidates[top_k_indices(scores[candidates], limit)]
+        return [names[i] for i in top]
+
+    def _blend_scores(
+        self, names: builtins.list[str], desc_scores: np.ndarray, code_scores: np.ndarray | None
+    ) -> np.ndarray:
+        """Blend in code similarity for skills whose code is substantial enough."""
+        if code_scores is None:
+            return desc_scores
+        weights = self.ranking
+        blended = weights.description_weight * desc_scores + weights.code_weight * code_scores
+        if self.ranking.code_min_length <= 0:
+            return blended
+        min_length = self.ranking.code_min_length
+        has_code = np.fromiter(
+            (len(self._skills[name].source) >= min_length for name in names),
+            dtype=bool,
+            count=len(names),
+        )
+        return np.where(has_code, blended, desc_scores)
+
+    def _exact_scores(self, names: builtins.list[str], query_vec: Any) -> np.ndarray | None:
+        """Scores of names from embedding_cache's float32 vectors.
+
+        Returns None if any of them is missing from the cache, e.g. after
+        another process compacted it.
+        """
+        assert self.embedding_cache is not None
+        hashes = [
+            compute_content_hash(self._skills[n].description, self._skills[n].source) for n in names
+        ]
+        cached = self.embedding_cache.get_many(self._model_name(), self.embedder.dimension, hashes)
+        if len(cached) < len(set(hashes)):
+            return None
+        desc, code = EmbeddingMatrix(), EmbeddingMatrix()
+        desc.set_many(names, np.stack([cached[h][0] for h in hashes]))
+        code.set_many(names, np.stack([cached[h][1] for h in hashes]))
+        code_scores = code.scores(query_vec) if self.ranking.code_weight > 0 else None
+        return self._blend_scores(names, desc.scores(query_vec), code_scores)
 
     def get(self, name: str) -> PythonSkill | None:
         """Get skill by exact name."""
@@ -239,6 +514,8 @@ def create_skill_library(
     embedder: EmbeddingProvider | None = None,
     embedding_model: str | None = None,
     vector_store: VectorStore | None = None,
+    embedding_cache: EmbeddingCache | None = None,
+    vector_precision: VectorPrecision = "float32",
 ) -> SkillLibrary:
     """Create a skill library, optionally backed by storage.
 
@@ -248,11 +525,18 @@ def create_skill_library(
         store: Optional storage (MemorySkillStore, FileSkillStore, RedisSkillStore, etc.).
                If provided, skills are loaded and indexed at creation time.
         embedder: Optional embedding provider. If not provided, creates Embedder
-                  with the specified embedding_model.
+                  with the specified embedding_model and starts loading its
+                  model in the background; searches made before it is ready
+                  use BM25 only.
         embedding_model: Model alias ("bge-small", "bge-base", "granite") or full
                         HuggingFace model name. Default: "bge-small".
         vector_store: Optional VectorStore for embedding caching. If provided,
                       embeddings are cached there and search is delegated to it.
+        embedding_cache: Optional on-disk cache for the in-memory vectors used
+                         when no vector_store is provided.
+        vector_precision: Storage precision of the in-memory vectors: "float32",
+                          "float16" or "int8". Quantized searches are rescored
+                          from embedding_cache when one is provided.
 
     Returns:
         SkillLibrary configured with the provided store, embedder, and vector_store.
@@ -273,5 +557,11 @@ def create_skill_library(
         library = create_skill_library(store=store, vector_store=my_vector_store)
     """
     if embedder is None:
-        embedder = Embedder(model_name=embedding_model)
-    return SkillLibrary(embedder=embedder, store=store, vector_store=vector_store)
+        embedder = Embedder(model_name=embedding_model, start_loading=True)
+    return SkillLibrary(
+        embedder=embedder,
+        store=store,
+        vector_store=vector_store,
+        embedding_cache=embedding_cache,
+        vector_precision=vector_precision,
+    )
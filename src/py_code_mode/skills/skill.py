@@ -4,14 +4,12 @@ from __future__ import annotations
 
 import ast
 import builtins
-import importlib.util
-import inspect
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, get_type_hints
+from typing import Any, cast
 
 logger = logging.getLogger(__name__)
 
@@ -62,54 +60,141 @@ _PYTHON_TYPE_MAP: dict[type, str] = {
 _INJECTED_PARAMS = {"tools", "skills", "artifacts"}
 
 
-def _extract_parameters(func: Callable[..., Any], name: str) -> list[SkillParameter]:
-    """Extract SkillParameter list from a function's signature."""
-    sig = inspect.signature(func)
+def _annotation_type(annotation: ast.expr | None) -> str:
+    """Map a parameter annotation node to our type string.
+
+    Only bare builtin names are mapped, matching what the resolved type
+    hints map to; anything else (generics, unions, custom classes) is
+    reported as "string".
+    """
+    if isinstance(annotation, ast.Constant) and isinstance(annotation.value, str):
+        # String annotation, e.g. under `from __future__ import annotations`
+        try:
+            annotation = ast.parse(annotation.value, mode="eval").body
+        except SyntaxError:
+            return "string"
+    if isinstance(annotation, ast.Name):
+        python_type = getattr(builtins, annotation.id, None)
+        if isinstance(python_type, type):
+            return _PYTHON_TYPE_MAP.get(python_type, "string")
+    return "string"
+
+
+def _default_value(node: ast.expr) -> Any:
+    """Evaluate a parameter default without running the skill module.
+
+    Literal defaults are returned as values. Anything else (module-level
+    constants, calls) is returned as its source text.
+    """
     try:
-        type_hints = get_type_hints(func)
-    except (NameError, AttributeError, TypeError) as e:
-        # NameError: unresolved forward references
-        # AttributeError: issues accessing type attributes
-        # TypeError: invalid type annotations
-        logger.debug(f"Type hint extraction failed for {name}: {type(e).__name__}: {e}")
-        type_hints = {}
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return ast.unparse(node)
+
+
+def _extract_parameters(run: ast.AsyncFunctionDef) -> list[SkillParameter]:
+    """Extract SkillParameter list from the AST of the run() function."""
+    args = run.args
+    positional = [*args.posonlyargs, *args.args]
+    defaults: dict[str, ast.expr | None] = dict.fromkeys(a.arg for a in positional)
+    for arg, positional_default in zip(
+        positional[len(positional) - len(args.defaults) :], args.defaults
+    ):
+        defaults[arg.arg] = positional_default
+    for arg, kw_default in zip(args.kwonlyargs, args.kw_defaults):
+        defaults[arg.arg] = kw_default
+
+    # Same order as inspect.signature()
+    ordered = [*positional]
+    if args.vararg is not None:
+        ordered.append(args.vararg)
+    ordered.extend(args.kwonlyargs)
+    if args.kwarg is not None:
+        ordered.append(args.kwarg)
 
     parameters = []
-    for param_name, param in sig.parameters.items():
-        if param_name in _INJECTED_PARAMS:
+    for arg in ordered:
+        if arg.arg in _INJECTED_PARAMS:
             continue
-
-        python_type = type_hints.get(param_name, str)
-        type_str = _PYTHON_TYPE_MAP.get(python_type, "string")
-        has_default = param.default is not inspect.Parameter.empty
-        default = param.default if has_default else None
-
+        default = defaults.get(arg.arg)
         parameters.append(
             SkillParameter(
-                name=param_name,
-                type=type_str,
+                name=arg.arg,
+                type=_annotation_type(arg.annotation),
                 description="",
-                required=not has_default,
-                default=default,
+                required=default is None,
+                default=None if default is None else _default_value(default),
             )
         )
     return parameters
 
 
+def _parse_skill(source: str, path: Path | None = None) -> tuple[ast.Module, ast.AsyncFunctionDef]:
+    """Parse skill source and find its top-level async run() function.
+
+    Args:
+        source: Skill source code.
+        path: File the source was read from, for error messages.
+
+    Raises:
+        SyntaxError: If code has syntax errors.
+        ValueError: If code doesn't define a top-level async def run().
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError as e:
+        raise SyntaxError(f"Syntax error in skill {path or 'code'}: {e}")
+
+    has_async_run = False
+    has_sync_run = False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.AsyncFunctionDef) and node.name == "run":
+            has_async_run = True
+            break
+        if isinstance(node, ast.FunctionDef) and node.name == "run":
+            has_sync_run = True
+
+    subject = f"Skill {path}" if path is not None else "Skill"
+    if has_sync_run and not has_async_run:
+        raise ValueError(f"{subject} must define 'async def run()', not 'def run()'")
+    if not has_async_run:
+        raise ValueError(f"{subject} must define an 'async def run()' function")
+
+    # The last top-level definition is the one bound when the module runs
+    run = None
+    for node in tree.body:
+        if isinstance(node, ast.AsyncFunctionDef) and node.name == "run":
+            run = node
+    if run is None:
+        raise ValueError("run must be a callable function")
+    return tree, run
+
+
+def _docstring_line(tree: ast.Module, run: ast.AsyncFunctionDef) -> str:
+    """First line of the module docstring, falling back to run()'s docstring."""
+    doc = ast.get_docstring(tree, clean=False) or ast.get_docstring(run, clean=False) or ""
+    return doc.strip().split("\n")[0]
+
+
 @dataclass
 class PythonSkill:
     """A skill defined as a Python module with run() entrypoint.
 
     Provides full IDE support (syntax highlighting, intellisense)
     and exposes source code for agent inspection and adaptation.
+
+    Loading a skill only parses its source: name, description and
+    parameters come from the AST. The module is compiled and executed
+    (running its top-level imports) on the first invoke().
     """
 
     name: str
     description: str
     parameters: list[SkillParameter]
     source: str
-    _func: Callable[..., Any] = field(repr=False)
+    _func: Callable[..., Any] | None = field(default=None, repr=False)
     metadata: SkillMetadata | None = None
+    _filename: str | None = field(default=None, repr=False)
 
     @classmethod
     def from_source(
@@ -143,54 +228,17 @@ class PythonSkill:
         if name in reserved:
             raise ValueError(f"Reserved skill name: {name!r}")
 
-        # Parse and validate syntax
-        try:
-            tree = ast.parse(source)
-        except SyntaxError as e:
-            raise SyntaxError(f"Syntax error in skill code: {e}")
-
-        has_async_run = False
-        has_sync_run = False
-        for node in ast.walk(tree):
-            if isinstance(node, ast.AsyncFunctionDef) and node.name == "run":
-                has_async_run = True
-                break
-            if isinstance(node, ast.FunctionDef) and node.name == "run":
-                has_sync_run = True
-
-        if has_sync_run and not has_async_run:
-            raise ValueError("Skill must define 'async def run()', not 'def run()'")
-        if not has_async_run:
-            raise ValueError("Skill must define an 'async def run()' function")
-
-        # Compile and execute to get the function
-        namespace: dict[str, Any] = {}
-        _run_code(compile(tree, f"<skill:{name}>", "exec"), namespace)
-
-        func = namespace.get("run")
-        if not callable(func):
-            raise ValueError("run must be a callable function")
+        tree, run = _parse_skill(source)
 
         # Extract description from source if not provided
         if not description:
-            # Try module docstring first
-            if tree.body and isinstance(tree.body[0], ast.Expr):
-                if isinstance(tree.body[0].value, ast.Constant):
-                    doc = tree.body[0].value.value
-                    if isinstance(doc, str):
-                        description = doc.strip().split("\n")[0]
-            # Try function docstring
-            if not description and func.__doc__:
-                description = func.__doc__.strip().split("\n")[0]
-
-        parameters = _extract_parameters(func, name)
+            description = _docstring_line(tree, run)
 
         return cls(
             name=name,
             description=description,
-            parameters=parameters,
+            parameters=_extract_parameters(run),
             source=source,
-            _func=func,
             metadata=metadata or SkillMetadata.now(),
         )
 
@@ -203,61 +251,43 @@ class PythonSkill:
         Description comes from the module or function docstring.
         """
         source = path.read_text()
-
-        # Validate async def run() requirement
-        try:
-            tree = ast.parse(source)
-        except SyntaxError as e:
-            raise SyntaxError(f"Syntax error in skill {path}: {e}")
-
-        has_async_run = False
-        has_sync_run = False
-        for node in ast.walk(tree):
-            if isinstance(node, ast.AsyncFunctionDef) and node.name == "run":
-                has_async_run = True
-                break
-            if isinstance(node, ast.FunctionDef) and node.name == "run":
-                has_sync_run = True
-
-        if has_sync_run and not has_async_run:
-            raise ValueError(f"Skill {path} must define 'async def run()', not 'def run()'")
-        if not has_async_run:
-            raise ValueError(f"Skill {path} must define an 'async def run()' function")
-
-        # Load module dynamically
-        spec = importlib.util.spec_from_file_location(path.stem, path)
-        if spec is None or spec.loader is None:
-            raise ValueError(f"Could not load module from {path}")
-
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-
-        func = module.run
-
-        # Extract description from module or function docstring
-        description = module.__doc__ or func.__doc__ or ""
-        description = description.strip().split("\n")[0]  # First line
-
-        parameters = _extract_parameters(func, path.stem)
+        tree, run = _parse_skill(source, path)
 
         return cls(
             name=path.stem,
-            description=description,
-            parameters=parameters,
+            description=_docstring_line(tree, run),
+            parameters=_extract_parameters(run),
             source=source,
-            _func=func,
             metadata=SkillMetadata(
                 created_at=datetime.now(UTC),
                 created_by="human",
                 source="file",
             ),
+            _filename=str(path),
         )
 
+    def _load_func(self) -> Callable[..., Any]:
+        """Compile and execute the skill module, returning its run() function."""
+        if self._filename is not None:
+            filename = self._filename
+            namespace: dict[str, Any] = {"__name__": self.name, "__file__": filename}
+        else:
+            filename = f"<skill:{self.name}>"
+            namespace = {}
+        _run_code(compile(self.source, filename, "exec"), namespace)
+
+        func = namespace.get("run")
+        if not callable(func):
+            raise ValueError("run must be a callable function")
+        return cast(Callable[..., Any], func)
+
     async def invoke(self, **kwargs: Any) -> Any:
         """Invoke the skill with given parameters.
 
-        Awaits the async run() function.
+        Awaits the async run() function, loading the skill module on first use.
         """
+        if self._func is None:
+            self._func = self._load_func()
         return await self._func(**kwargs)
 
     @property
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
 import re
 from dataclasses import asdict
 from datetime import UTC, datetime
@@ -47,15 +49,37 @@ class SkillStore(Protocol):
         ...
 
 
+@runtime_checkable
+class VersionedSkillStore(SkillStore, Protocol):
+    """SkillStore that can report what changed without loading any skills.
+
+    SkillLibrary.refresh() uses this to skip the reload entirely when
+    change_token() is unchanged, and otherwise to reload only the skills
+    whose entry in versions() changed.
+    """
+
+    def change_token(self) -> str:
+        """Cheap token that changes whenever any skill is saved or deleted."""
+        ...
+
+    def versions(self) -> dict[str, str]:
+        """Map each skill name to a token that changes when that skill changes."""
+        ...
+
+
 class MemorySkillStore:
     """In-memory skill store for testing and ephemeral use."""
 
     def __init__(self) -> None:
         self._skills: dict[str, PythonSkill] = {}
+        self._generation = 0
+        self._versions: dict[str, str] = {}
 
     def save(self, skill: PythonSkill) -> None:
         """Store skill in memory."""
         self._skills[skill.name] = skill
+        self._generation += 1
+        self._versions[skill.name] = str(self._generation)
 
     def load(self, name: str) -> PythonSkill | None:
         """Load skill from memory."""
@@ -65,6 +89,8 @@ class MemorySkillStore:
         """Remove skill from memory."""
         if name in self._skills:
             del self._skills[name]
+            del self._versions[name]
+            self._generation += 1
             return True
         return False
 
@@ -76,6 +102,14 @@ class MemorySkillStore:
         """Check if skill exists in memory."""
         return name in self._skills
 
+    def change_token(self) -> str:
+        """Return the store generation, bumped on every save and delete."""
+        return str(self._generation)
+
+    def versions(self) -> dict[str, str]:
+        """Return the generation at which each skill was last saved."""
+        return dict(self._versions)
+
 
 class FileSkillStore:
     """File-based skill store. Reads/writes .py files to a directory."""
@@ -87,6 +121,8 @@ class FileSkillStore:
             directory: Directory to store skill files.
         """
         self._directory = directory
+        # Manifest scanned by the last change_token(), handed to the next versions()
+        self._token_manifest: dict[str, str] | None = None
         # Ensure directory exists
         self._directory.mkdir(parents=True, exist_ok=True)
 
@@ -115,6 +151,7 @@ class FileSkillStore:
         self._validate_skill_name(skill.name)
         path = self._directory / f"{skill.name}.py"
         path.write_text(skill.source)
+        self._token_manifest = None
 
     def load(self, name: str) -> PythonSkill | None:
         """Load skill from .py file.
@@ -145,6 +182,7 @@ class FileSkillStore:
         path = self._directory / f"{name}.py"
         if path.exists():
             path.unlink()
+            self._token_manifest = None
             return True
         return False
 
@@ -173,12 +211,59 @@ class FileSkillStore:
         path = self._directory / f"{name}.py"
         return path.exists()
 
+    def _scan_manifest(self) -> dict[str, str]:
+        """Stat every skill file, returning name -> "mtime_ns:size:inode"."""
+        manifest: dict[str, str] = {}
+        with os.scandir(self._directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".py") or entry.name.startswith("_"):
+                    continue
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                manifest[entry.name[:-3]] = f"{st.st_mtime_ns}:{st.st_size}:{st.st_ino}"
+        return manifest
+
+    def versions(self) -> dict[str, str]:
+        """Return an mtime/size/inode manifest of the skill files.
+
+        Only stats files, never reads them. Any write to a skill file,
+        including in-place edits, changes its entry. Right after
+        change_token(), returns the manifest that token was computed from
+        instead of scanning the directory again.
+        """
+        manifest, self._token_manifest = self._token_manifest, None
+        return manifest if manifest is not None else self._scan_manifest()
+
+    def change_token(self) -> str:
+        """Return a digest of the skill file manifest.
+
+        Costs one directory scan; the scanned manifest is kept for the next
+        versions() call so a refresh that finds changes scans only once.
+        """
+        manifest = self._scan_manifest()
+        self._token_manifest = manifest
+        digest = hashlib.sha256()
+        for name, version in sorted(manifest.items()):
+            digest.update(f"{name}={version}\n".encode())
+        return digest.hexdigest()
+
 
 class RedisSkillStore:
-    """Redis-based skill store. Persists skills as JSON in a Redis hash."""
+    """Redis-based skill store. Persists skills as JSON in a Redis hash.
+
+    Every write also records a per-skill version (a digest of the stored
+    JSON) and bumps a generation counter, so readers can tell what changed
+    with one GET instead of fetching and deserializing every skill.
+    """
 
     # Suffix appended to prefix for Redis hash key: {prefix}:__skills__
     HASH_KEY = ":__skills__"
+    # Hash of skill name -> version: {prefix}:__skill_versions__
+    VERSIONS_KEY = ":__skill_versions__"
+    # Counter incremented on every save/delete: {prefix}:__skills_generation__
+    GENERATION_KEY = ":__skills_generation__"
 
     def __init__(self, redis: Redis, prefix: str = "skills") -> None:
         """Initialize Redis store.
@@ -194,15 +279,35 @@ class RedisSkillStore:
         """Build the Redis hash key."""
         return f"{self._prefix}{self.HASH_KEY}"
 
-    def save(self, skill: PythonSkill) -> None:
-        """Serialize and store skill in Redis."""
+    def _versions_key(self) -> str:
+        """Build the Redis key for the per-skill versions hash."""
+        return f"{self._prefix}{self.VERSIONS_KEY}"
+
+    def _generation_key(self) -> str:
+        """Build the Redis key for the generation counter."""
+        return f"{self._prefix}{self.GENERATION_KEY}"
+
+    def _serialize_skill(self, skill: PythonSkill) -> tuple[str, str]:
+        """Serialize a skill, returning (payload, version)."""
         data = {
             "name": skill.name,
             "description": skill.description,
             "source": skill.source,
             "parameters": [asdict(p) for p in skill.parameters],
         }
-        self._redis.hset(self._hash_key(), skill.name, json.dumps(data))
+        payload = json.dumps(data)
+        version = hashlib.sha256(payload.encode()).hexdigest()[:16]
+        return payload, version
+
+    def save(self, skill: PythonSkill) -> None:
+        """Serialize and store skill in Redis."""
+        payload, version = self._serialize_skill(skill)
+        # One MULTI/EXEC round-trip: readers see the data and new generation together
+        pipe = self._redis.pipeline()
+        pipe.hset(self._hash_key(), skill.name, payload)
+        pipe.hset(self._versions_key(), skill.name, version)
+        pipe.incr(self._generation_key())
+        pipe.execute()
 
     def save_batch(self, skills: list[PythonSkill]) -> None:
         """Serialize and store multiple skills in Redis using a pipeline."""
@@ -210,13 +315,10 @@ class RedisSkillStore:
             return
         pipe = self._redis.pipeline()
         for skill in skills:
-            data = {
-                "name": skill.name,
-                "description": skill.description,
-                "source": skill.source,
-                "parameters": [asdict(p) for p in skill.parameters],
-            }
-            pipe.hset(self._hash_key(), skill.name, json.dumps(data))
+            payload, version = self._serialize_skill(skill)
+            pipe.hset(self._hash_key(), skill.name, payload)
+            pipe.hset(self._versions_key(), skill.name, version)
+        pipe.incr(self._generation_key())
         pipe.execute()
 
     def _deserialize_skill(self, data: dict[str, Any]) -> PythonSkill:
@@ -256,6 +358,9 @@ class RedisSkillStore:
     def delete(self, name: str) -> bool:
         """Delete skill from Redis."""
         result = self._redis.hdel(self._hash_key(), name)
+        if result > 0:
+            self._redis.hdel(self._versions_key(), name)
+            self._redis.incr(self._generation_key())
         return result > 0
 
     def list_all(self) -> list[PythonSkill]:
@@ -283,6 +388,31 @@ class RedisSkillStore:
         """Check if skill exists in Redis."""
         return self._redis.hexists(self._hash_key(), name)
 
+    def change_token(self) -> str:
+        """Return the generation counter (one GET)."""
+        value = self._redis.get(self._generation_key())
+        if value is None:
+            return "0"
+        return value.decode() if isinstance(value, bytes) else str(value)
+
+    def versions(self) -> dict[str, str]:
+        """Return per-skill versions without fetching any skill source.
+
+        Skills written before versions were tracked get an empty version,
+        so they are loaded once and then treated as unchanged.
+        """
+        stored = self._redis.hgetall(self._versions_key())
+        versions = {
+            (k.decode() if isinstance(k, bytes) else k): (v.decode() if isinstance(v, bytes) else v)
+            for k, v in stored.items()
+        }
+        if len(versions) != self._redis.hlen(self._hash_key()):
+            for name in self._redis.hkeys(self._hash_key()):
+                if isinstance(name, bytes):
+                    name = name.decode()
+                versions.setdefault(name, "")
+        return versions
+
     def __len__(self) -> int:
         """Return the number of skills in the store."""
         return self._redis.hlen(self._hash_key())
@@ -6,6 +6,9 @@ import hashlib
 from dataclasses import dataclass
 from typing import Any, Protocol, runtime_checkable
 
+# Texts per embedding call when indexing in bulk
+DEFAULT_EMBED_BATCH_SIZE = 128
+
 
 @dataclass(frozen=True)
 class ModelInfo:
@@ -19,6 +22,23 @@ class ModelInfo:
     version: str = "1"
 
 
+@dataclass(frozen=True)
+class VectorEntry:
+    """A skill to index in a VectorStore via add_many().
+
+    Attributes:
+        id: The skill identifier.
+        description: Skill description text to embed.
+        source: Skill source code to embed.
+        content_hash: Hash of description + source for change detection.
+    """
+
+    id: str
+    description: str
+    source: str
+    content_hash: str
+
+
 @dataclass(frozen=True)
 class SearchResult:
     """Result from a VectorStore similarity search.
@@ -116,6 +136,34 @@ class VectorStore(Protocol):
         ...
 
 
+@runtime_checkable
+class BatchVectorStore(VectorStore, Protocol):
+    """VectorStore that can index many skills in one bulk operation.
+
+    SkillLibrary uses add_many() when indexing several skills at once, so a
+    refresh of N skills costs a few batched embedding calls and one write
+    instead of N of each.
+    """
+
+    def add_many(
+        self, entries: list[VectorEntry], batch_size: int = DEFAULT_EMBED_BATCH_SIZE
+    ) -> int:
+        """Add or update embeddings for several skills.
+
+        Entries whose stored content hash already matches are skipped. The
+        rest are embedded in batches of at most batch_size texts and written
+        in one bulk operation.
+
+        Args:
+            entries: Skills to index.
+            batch_size: Maximum number of texts per embedding call.
+
+        Returns:
+            Number of entries that were (re-)embedded.
+        """
+        ...
+
+
 def compute_content_hash(description: str, source: str) -> str:
     """Compute a content hash for change detection.
 
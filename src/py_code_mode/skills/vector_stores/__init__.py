@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from py_code_mode.skills.vector_stores.numpy_store import NumpyVectorStore
+
 # ChromaDB is an optional dependency
 try:
     from py_code_mode.skills.vector_stores.chroma import ChromaVectorStore
@@ -21,6 +23,7 @@ except ImportError:
     REDIS_AVAILABLE = False
 
 __all__ = [
+    "NumpyVectorStore",
     "ChromaVectorStore",
     "CHROMA_AVAILABLE",
     "RedisVectorStore",
@@ -8,7 +8,13 @@ from typing import TYPE_CHECKING
 
 logger = logging.getLogger(__name__)
 
-from py_code_mode.skills.vector_store import ModelInfo, SearchResult  # noqa: E402
+from py_code_mode.skills.embeddings import embed_in_batches  # noqa: E402
+from py_code_mode.skills.vector_store import (  # noqa: E402
+    DEFAULT_EMBED_BATCH_SIZE,
+    ModelInfo,
+    SearchResult,
+    VectorEntry,
+)
 
 try:
     import chromadb
@@ -19,6 +25,8 @@ except ImportError:
     CHROMADB_AVAILABLE = False
 
 if TYPE_CHECKING:
+    from chromadb.api.types import Metadata, PyEmbedding
+
     from py_code_mode.skills.embeddings import EmbeddingProvider
 
 
@@ -163,6 +171,65 @@ class ChromaVectorStore:
             ],
         )
 
+    def add_many(
+        self, entries: list[VectorEntry], batch_size: int = DEFAULT_EMBED_BATCH_SIZE
+    ) -> int:
+        """Add or update embeddings for several skills.
+
+        Looks up stored hashes with one get(), embeds new or changed skills
+        in batches, and upserts them in as few calls as ChromaDB allows.
+        Returns the number of skills that were (re-)embedded.
+        """
+        # Last entry wins for duplicate ids, matching repeated add() calls
+        by_id = {entry.id: entry for entry in entries}
+        if not by_id:
+            return 0
+
+        existing = self.get_content_hashes(list(by_id))
+        changed = [e for e in by_id.values() if existing.get(e.id) != e.content_hash]
+        if not changed:
+            return 0
+
+        # Descriptions then sources, so vectors[i] and vectors[n + i] belong to changed[i]
+        texts = [e.description for e in changed] + [e.source for e in changed]
+        vectors = embed_in_batches(self._embedder, texts, batch_size)
+        n = len(changed)
+
+        ids: list[str] = []
+        embeddings: list[PyEmbedding] = []
+        metadatas: list[Metadata] = []
+        for i, entry in enumerate(changed):
+            ids += [self._desc_id(entry.id), self._code_id(entry.id)]
+            embeddings += [vectors[i], vectors[n + i]]
+            metadatas += [
+                {_KEY_CONTENT_HASH: entry.content_hash, _KEY_TYPE: kind, _KEY_SKILL_ID: entry.id}
+                for kind in (_TYPE_DESC, _TYPE_CODE)
+            ]
+
+        max_batch = self._client.get_max_batch_size()
+        for start in range(0, len(ids), max_batch):
+            end = start + max_batch
+            self._collection.upsert(
+                ids=ids[start:end],
+                embeddings=embeddings[start:end],
+                metadatas=metadatas[start:end],
+            )
+        return n
+
+    def get_content_hashes(self, skill_ids: list[str]) -> dict[str, str]:
+        """Get stored content hashes for several skills with one get()."""
+        result = self._collection.get(
+            ids=[self._desc_id(skill_id) for skill_id in skill_ids],
+            include=["metadatas"],
+        )
+        hashes: dict[str, str] = {}
+        for metadata in result.get("metadatas") or []:
+            skill_id = metadata.get(_KEY_SKILL_ID)
+            content_hash = metadata.get(_KEY_CONTENT_HASH)
+            if isinstance(skill_id, str) and isinstance(content_hash, str):
+                hashes[skill_id] = content_hash
+        return hashes
+
     def remove(self, id: str) -> bool:
         """Remove a skill's embeddings.
 
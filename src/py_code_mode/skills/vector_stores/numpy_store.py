@@ -0,0 +1,696 @@
+"""NumPy-backed approximate nearest neighbour VectorStore."""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import shutil
+import tempfile
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+import filelock
+import numpy as np
+
+from py_code_mode.skills.embeddings import (
+    VectorPrecision,
+    check_precision,
+    embed_in_batches,
+    quantize,
+    quantized_scores,
+)
+from py_code_mode.skills.vector_store import (
+    DEFAULT_EMBED_BATCH_SIZE,
+    ModelInfo,
+    SearchResult,
+    VectorEntry,
+)
+
+if TYPE_CHECKING:
+    from py_code_mode.skills.embeddings import EmbeddingProvider
+
+logger = logging.getLogger(__name__)
+
+# Inverted lists probed per vector kind and query
+DEFAULT_NPROBE = 8
+
+# Best matches per vector kind that are rescored with both vectors
+_RESCORE_FACTOR = 4
+
+# Rows appended since the last compaction that may be brute-forced before
+# they are merged into the inverted lists; grows with sqrt(rows)
+_MIN_TAIL_ROWS = 1024
+_TAIL_ROWS_PER_SQRT_ROW = 4
+
+# Inverted lists per sqrt(rows); more lists mean fewer vectors per probe
+_LISTS_PER_SQRT_ROW = 2
+
+# k-means training: sample size per list and number of Lloyd iterations
+_KMEANS_SAMPLE_PER_LIST = 64
+_KMEANS_ITERATIONS = 10
+
+# Rows per matrix product when assigning vectors to lists
+_ASSIGN_CHUNK_ROWS = 16_384
+
+_CURRENT_FILE = "current.json"
+_LOCK_FILE = ".lock"
+_ROWS_FILE = "rows.json"
+_LOG_FILE = "log.jsonl"
+_TAIL_FILE = "tail.f32"
+_GENERATION_PREFIX = "gen-"
+
+# Vector kinds: index 0 and 1 of each (2, dimension) row pair
+_KINDS = ("desc", "code")
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows (or a single vector) to unit length, leaving zero rows alone."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.asarray(vectors / np.where(norms == 0, 1.0, norms), dtype=np.float32)
+
+
+def _list_count(rows: int) -> int:
+    """Number of inverted lists for a store of this many rows."""
+    return max(1, min(rows, _LISTS_PER_SQRT_ROW * math.isqrt(rows)))
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Index of the most similar centroid for each row."""
+    assignments = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), _ASSIGN_CHUNK_ROWS):
+        chunk = vectors[start : start + _ASSIGN_CHUNK_ROWS]
+        assignments[start : start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+    return assignments
+
+
+def _train_centroids(vectors: np.ndarray, nlist: int) -> np.ndarray:
+    """Spherical k-means over a sample of the (unit length) vectors."""
+    rng = np.random.default_rng(0)
+    sample_size = min(len(vectors), nlist * _KMEANS_SAMPLE_PER_LIST)
+    sample = vectors[np.sort(rng.choice(len(vectors), sample_size, replace=False))]
+    centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+    for _ in range(_KMEANS_ITERATIONS):
+        assignments = _assign(sample, centroids)
+        order = np.argsort(assignments, kind="stable")
+        counts = np.bincount(assignments, minlength=nlist)
+        filled = np.flatnonzero(counts)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))[filled]
+        # Empty lists keep their previous centroid
+        centroids[filled] = _normalize(np.add.reduceat(sample[order], starts, axis=0))
+    return centroids
+
+
+@dataclass
+class _InvertedLists:
+    """One vector kind of a generation, grouped by nearest centroid.
+
+    vectors[offsets[i]:offsets[i + 1]] are the rows of list i, and
+    rows[p] is the generation row stored at position p. codes and scales
+    are the quantized copy of vectors that probes scan; for float32 stores
+    codes is vectors itself.
+    """
+
+    centroids: np.ndarray
+    offsets: np.ndarray
+    vectors: np.ndarray
+    rows: np.ndarray
+    positions: np.ndarray
+    codes: np.ndarray
+    scales: np.ndarray | None = None
+
+    def search(self, query: np.ndarray, nprobe: int, alive: np.ndarray, limit: int) -> np.ndarray:
+        """Rows of the best live matches within the nprobe closest lists."""
+        nprobe = min(nprobe, len(self.centroids))
+        probes = np.argpartition(self.centroids @ query, -nprobe)[-nprobe:]
+        rows: list[np.ndarray] = []
+        scores: list[np.ndarray] = []
+        for probe in probes:
+            start, end = self.offsets[probe], self.offsets[probe + 1]
+            if start != end:
+                rows.append(self.rows[start:end])
+                scales = None if self.scales is None else self.scales[start:end]
+                scores.append(quantized_scores(self.codes[start:end], scales, query))
+        if not rows:
+            return np.empty(0, dtype=np.int64)
+        row_array = np.concatenate(rows)
+        score_array = np.concatenate(scores)
+        live = alive[row_array]
+        row_array, score_array = row_array[live], score_array[live]
+        if len(row_array) > limit:
+            row_array = row_array[np.argpartition(score_array, -limit)[-limit:]]
+        return np.asarray(row_array)
+
+
+class _Generation:
+    """Rows of one compaction plus everything appended to it since.
+
+    Layout of a generation directory:
+        rows.json          [[id, content_hash], ...] of the compacted rows
+        <kind>.npy         unit-length vectors grouped by inverted list
+        <kind>_rows.npy    row of each position in <kind>.npy
+        <kind>_offsets.npy start of each inverted list, plus the end
+        <kind>_centroids.npy
+        <kind>_codes.npy   quantized copy of <kind>.npy (float16/int8 stores)
+        <kind>_scales.npy  per-row scales of int8 codes
+        tail.f32           (description, code) pairs appended since, raw float32
+        log.jsonl          one {"op": "add"|"remove", ...} line per change
+
+    Compacted rows never change. Updates and removals append to the log:
+    the previous row of the skill becomes a tombstone and, for updates, the
+    new vectors go to the tail until the next compaction.
+    """
+
+    def __init__(
+        self, directory: Path | None, dimension: int, precision: VectorPrecision = "float32"
+    ) -> None:
+        self.directory = directory
+        self._dimension = dimension
+        self.precision = precision
+        self._row_bytes = 2 * dimension * 4
+        self.ids: list[str] = []
+        self.hashes: list[str] = []
+        self.lists: dict[str, _InvertedLists] = {}
+        self.tail = np.empty((0, 2, dimension), dtype=np.float32)
+        self.tail_ids: list[str] = []
+        self.tail_hashes: list[str] = []
+        self._tail_alive = bytearray()
+        # id -> (in tail, row)
+        self.live: dict[str, tuple[bool, int]] = {}
+        self._log_offset = 0
+        if directory is not None:
+            self._load(directory)
+        self.alive = np.ones(len(self.ids), dtype=bool)
+
+    def _load(self, directory: Path) -> None:
+        rows = json.loads((directory / _ROWS_FILE).read_text())
+        self.ids = [row[0] for row in rows]
+        self.hashes = [row[1] for row in rows]
+        self.live = {skill_id: (False, row) for row, skill_id in enumerate(self.ids)}
+        if not rows:
+            return
+        for kind in _KINDS:
+            positions_rows = np.load(directory / f"{kind}_rows.npy")
+            positions = np.empty_like(positions_rows)
+            positions[positions_rows] = np.arange(len(positions_rows))
+            # Plain ndarray views: slicing a np.memmap is several times slower
+            vectors = np.asarray(np.load(directory / f"{kind}.npy", mmap_mode="r"))
+            codes, scales = vectors, None
+            if self.precision != "float32":
+                codes = np.asarray(np.load(directory / f"{kind}_codes.npy", mmap_mode="r"))
+            if self.precision == "int8":
+                scales = np.load(directory / f"{kind}_scales.npy")
+            self.lists[kind] = _InvertedLists(
+                centroids=np.load(directory / f"{kind}_centroids.npy"),
+                offsets=np.load(directory / f"{kind}_offsets.npy"),
+                vectors=vectors,
+                rows=positions_rows,
+                positions=positions,
+                codes=codes,
+                scales=scales,
+            )
+
+    @property
+    def tail_alive(self) -> np.ndarray:
+        return np.frombuffer(self._tail_alive, dtype=bool)
+
+    @property
+    def dead_rows(self) -> int:
+        return len(self.ids) + len(self.tail_ids) - len(self.live)
+
+    def refresh(self) -> None:
+        """Apply log lines appended since the last call."""
+        if self.directory is None:
+            return
+        try:
+            with open(self.directory / _LOG_FILE, "rb") as f:
+                f.seek(self._log_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        # Only consume complete lines; a writer may be mid-append
+        complete = data[: data.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            try:
+                self._apply(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                logger.warning(f"Skipping corrupt line in vector store log {self.directory}")
+        self._log_offset += len(complete)
+
+    def _apply(self, record: dict[str, Any]) -> None:
+        skill_id = record["id"]
+        if skill_id in self.live:
+            in_tail, row = self.live.pop(skill_id)
+            if in_tail:
+                self._tail_alive[row] = False
+            else:
+                self.alive[row] = False
+        if record["op"] != "add":
+            return
+        row = record["row"]
+        if row >= len(self.tail):
+            self._map_tail()
+        if row != len(self.tail_ids) or row >= len(self.tail):
+            msg = f"tail row {row} out of order"
+            raise ValueError(msg)
+        self.tail_ids.append(skill_id)
+        self.tail_hashes.append(record["hash"])
+        self._tail_alive.append(True)
+        self.live[skill_id] = (True, row)
+
+    def _map_tail(self) -> None:
+        assert self.directory is not None
+        path = self.directory / _TAIL_FILE
+        rows = path.stat().st_size // self._row_bytes
+        if rows:
+            self.tail = np.memmap(
+                path, dtype=np.float32, mode="r", shape=(rows, 2, self._dimension)
+            )
+
+    def append(self, entries: list[VectorEntry], vectors: np.ndarray) -> None:
+        """Append vector pairs to the tail and log them (caller holds the lock)."""
+        assert self.directory is not None
+        path = self.directory / _TAIL_FILE
+        with open(path, "ab") as f:
+            # Drop a partial row left behind by a writer that died mid-append
+            size = f.seek(0, os.SEEK_END)
+            start = size // self._row_bytes
+            f.truncate(start * self._row_bytes)
+            f.seek(start * self._row_bytes)
+            f.write(vectors.astype(np.float32).tobytes())
+        lines = [
+            json.dumps({"op": "add", "id": entry.id, "hash": entry.content_hash, "row": start + i})
+            for i, entry in enumerate(entries)
+        ]
+        self._append_log(lines)
+
+    def remove(self, skill_id: str) -> None:
+        """Log the removal of a skill (caller holds the lock)."""
+        self._append_log([json.dumps({"op": "remove", "id": skill_id})])
+
+    def _append_log(self, lines: list[str]) -> None:
+        assert self.directory is not None
+        with open(self.directory / _LOG_FILE, "a") as f:
+            f.write("".join(line + "\n" for line in lines))
+
+    def live_rows(self) -> tuple[list[str], list[str], np.ndarray]:
+        """Ids, content hashes and (n, 2, dimension) vectors of every live skill."""
+        rows = np.flatnonzero(self.alive)
+        tail_rows = np.flatnonzero(self.tail_alive)
+        vectors = np.empty((len(rows) + len(tail_rows), 2, self._dimension), dtype=np.float32)
+        for k, kind in enumerate(_KINDS):
+            if len(rows):
+                lists = self.lists[kind]
+                vectors[: len(rows), k] = lists.vectors[lists.positions[rows]]
+        vectors[len(rows) :] = self.tail[tail_rows]
+        ids = [self.ids[r] for r in rows] + [self.tail_ids[r] for r in tail_rows]
+        hashes = [self.hashes[r] for r in rows] + [self.tail_hashes[r] for r in tail_rows]
+        return ids, hashes, vectors
+
+    def list_assignments(self, kind: str) -> np.ndarray | None:
+        """Inverted list of every compacted row, or None if there are none."""
+        lists = self.lists.get(kind)
+        if lists is None:
+            return None
+        by_position = np.repeat(np.arange(len(lists.centroids)), np.diff(lists.offsets))
+        return np.asarray(by_position[lists.positions])
+
+
+class NumpyVectorStore:
+    """VectorStore backed by an IVF index over memory-mapped NumPy files.
+
+    Needs no external service. Description and code vectors are each
+    clustered into about sqrt(n) inverted lists with spherical k-means and
+    stored grouped by list, so a search scores only the nprobe lists
+    closest to the query, then rescores the best candidates of both kinds
+    exactly. Search cost grows with sqrt(n) rather than n.
+
+    Writes are append-only: new vectors go to a tail that is searched by
+    brute force, and removed or replaced skills leave tombstones. Once the
+    tail or the tombstones grow past a threshold, compact() rewrites the
+    live rows into a new generation, retraining the centroids when the
+    store has grown or shrunk a lot since they were trained.
+
+    With precision "float16" or "int8" the probes scan a quantized copy of
+    each kind, halving or quartering the bytes read per search; candidates
+    are still rescored with the float32 vectors, so only candidates whose
+    quantized score falls just below the cut-off can be lost.
+
+    Several processes may share a directory: writes are serialized by a
+    file lock, and readers pick up appended log lines and new generations
+    on their next call. Model changes (name or dimension) clear the store;
+    opening it with a different precision rewrites the index.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        embedder: EmbeddingProvider,
+        nprobe: int = DEFAULT_NPROBE,
+        precision: VectorPrecision = "float32",
+    ) -> None:
+        """Initialize NumpyVectorStore.
+
+        Args:
+            path: Directory for the index files.
+            embedder: Embedding provider for generating vectors.
+            nprobe: Inverted lists searched per vector kind; higher values
+                trade speed for recall.
+            precision: Precision of the vectors scanned by probes: "float32",
+                "float16" or "int8".
+        """
+        if nprobe < 1:
+            msg = f"nprobe must be at least 1, got {nprobe}"
+            raise ValueError(msg)
+        check_precision(precision)
+        self._path = path
+        self._embedder = embedder
+        self._nprobe = nprobe
+        self._precision = precision
+        self._dimension = embedder.dimension
+        path.mkdir(parents=True, exist_ok=True)
+        self._lock = filelock.FileLock(path / _LOCK_FILE, timeout=60)
+        self._current: dict[str, Any] = {}
+        self._current_stamp: tuple[int, int] | None = None
+        self._generation = _Generation(None, self._dimension)
+        self._validate_or_clear_model()
+
+    def _get_model_info_from_embedder(self) -> ModelInfo:
+        """Build ModelInfo from the current embedder."""
+        # Use embedder class name as model name for mock embedders
+        model_name = getattr(self._embedder, "_resolved_model_name", type(self._embedder).__name__)
+        return ModelInfo(model_name=model_name, dimension=self._dimension, version="1")
+
+    def _validate_or_clear_model(self) -> None:
+        """Clear the store if it was built with a different model."""
+        self._refresh()
+        if not self._current:
+            return
+        info = self._get_model_info_from_embedder()
+        stored = (self._current.get("model_name"), self._current.get("dimension"))
+        if stored != (info.model_name, info.dimension):
+            logger.warning(
+                f"Embedding model changed ({stored[0]}/{stored[1]} -> "
+                f"{info.model_name}/{info.dimension}). Clearing {self.count()} cached embeddings."
+            )
+            self.clear()
+        elif self._current.get("precision", "float32") != self._precision:
+            with self._lock:
+                self._refresh()
+                self._compact(retrain=False)
+
+    def _refresh(self) -> None:
+        """Pick up a new generation or log lines written by other instances."""
+        path = self._path / _CURRENT_FILE
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            if self._current:
+                self._current = {}
+                self._current_stamp = None
+                self._generation = _Generation(None, self._dimension)
+            return
+        stamp = (st.st_mtime_ns, st.st_ino)
+        if stamp != self._current_stamp:
+            try:
+                current = json.loads(path.read_text())
+                if current["generation"] != self._current.get("generation"):
+                    generation = _Generation(
+                        self._path / current["generation"],
+                        self._dimension,
+                        current.get("precision", "float32"),
+                    )
+                    self._generation = generation
+            except (OSError, ValueError, KeyError) as e:
+                # Possibly replaced by a concurrent compaction: retry next call
+                logger.warning(f"Failed to load vector store {self._path}: {e}")
+                return
+            self._current = current
+            self._current_stamp = stamp
+        self._generation.refresh()
+
+    def add(self, id: str, description: str, source: str, content_hash: str) -> None:
+        """Add or update a skill's embeddings.
+
+        If the skill already exists with the same content_hash, this is a no-op.
+        """
+        self.add_many([VectorEntry(id, description, source, content_hash)])
+
+    def add_many(
+        self, entries: list[VectorEntry], batch_size: int = DEFAULT_EMBED_BATCH_SIZE
+    ) -> int:
+        """Add or update embeddings for several skills.
+
+        Embeds new or changed skills in batches and appends them with one
+        write, compacting afterwards if the tail has grown too large.
+        Returns the number of skills that were (re-)embedded.
+        """
+        # Last entry wins for duplicate ids, matching repeated add() calls
+        by_id = {entry.id: entry for entry in entries}
+        self._refresh()
+        changed = [e for e in by_id.values() if self.get_content_hash(e.id) != e.content_hash]
+        if not changed:
+            return 0
+
+        # Descriptions then sources, so vectors[i] and vectors[n + i] belong to changed[i]
+        texts = [e.description for e in changed] + [e.source for e in changed]
+        embedded = np.asarray(embed_in_batches(self._embedder, texts, batch_size))
+        n = len(changed)
+        vectors = _normalize(np.stack([embedded[:n], embedded[n:]], axis=1))
+
+        with self._lock:
+            self._refresh()
+            if self._generation.directory is None:
+                self._write_generation([], [], np.empty((0, 2, self._dimension)), None)
+            self._generation.append(changed, vectors)
+            self._refresh()
+            self._compact_if_needed()
+        return n
+
+    def remove(self, id: str) -> bool:
+        """Remove a skill's embeddings.
+
+        Returns True if the skill was removed, False if it wasn't found.
+        """
+        with self._lock:
+            self._refresh()
+            if id not in self._generation.live:
+                return False
+            self._generation.remove(id)
+            self._refresh()
+            self._compact_if_needed()
+        return True
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        desc_weight: float = 0.7,
+        code_weight: float = 0.3,
+    ) -> list[SearchResult]:
+        """Search for skills by semantic similarity.
+
+        Collects the best limit * 4 description and code matches from the
+        probed lists plus every live tail row, then ranks them by the
+        weighted sum of both similarities.
+        """
+        self._refresh()
+        generation = self._generation
+        if not generation.live or limit <= 0:
+            return []
+        query_vector = _normalize(np.asarray(self._embedder.embed_query(query), dtype=np.float32))
+        weights = np.array([desc_weight, code_weight], dtype=np.float32)
+
+        ids: list[str] = []
+        scores: list[np.ndarray] = []
+        if generation.lists:
+            kinds = [k for k, w in zip(_KINDS, weights, strict=True) if w > 0] or list(_KINDS)
+            candidates = np.unique(
+                np.concatenate(
+                    [
+                        generation.lists[kind].search(
+                            query_vector,
+                            self._nprobe,
+                            generation.alive,
+                            limit * _RESCORE_FACTOR,
+                        )
+                        for kind in kinds
+                    ]
+                )
+            )
+            similarities = np.stack(
+                [
+                    generation.lists[kind].vectors[generation.lists[kind].positions[candidates]]
+                    @ query_vector
+                    for kind in _KINDS
+                ],
+                axis=1,
+            )
+            ids += [generation.ids[row] for row in candidates]
+            scores.append(np.clip(similarities, 0.0, 1.0) @ weights)
+
+        tail_rows = np.flatnonzero(generation.tail_alive)
+        if len(tail_rows):
+            similarities = generation.tail[tail_rows] @ query_vector
+            ids += [generation.tail_ids[row] for row in tail_rows]
+            scores.append(np.clip(similarities, 0.0, 1.0) @ weights)
+
+        if not ids:
+            return []
+        combined = np.concatenate(scores)
+        top = np.argsort(-combined, kind="stable")[:limit]
+        return [SearchResult(id=ids[i], score=float(combined[i]), metadata={}) for i in top]
+
+    def get_content_hash(self, id: str) -> str | None:
+        """Get the stored content hash for a skill."""
+        self._refresh()
+        generation = self._generation
+        location = generation.live.get(id)
+        if location is None:
+            return None
+        in_tail, row = location
+        return generation.tail_hashes[row] if in_tail else generation.hashes[row]
+
+    def get_model_info(self) -> ModelInfo:
+        """Get information about the embedding model."""
+        return self._get_model_info_from_embedder()
+
+    def clear(self) -> None:
+        """Remove all embeddings from the store."""
+        with self._lock:
+            self._write_generation([], [], np.empty((0, 2, self._dimension)), None)
+
+    def count(self) -> int:
+        """Get the number of skills indexed."""
+        self._refresh()
+        return len(self._generation.live)
+
+    def compact(self, retrain: bool = False) -> None:
+        """Merge the tail into the inverted lists and drop tombstones.
+
+        Centroids are reused unless retrain is True or the number of live
+        rows moved far enough from the one they were trained for that the
+        lists would be badly sized.
+        """
+        with self._lock:
+            self._refresh()
+            self._compact(retrain)
+
+    def _compact_if_needed(self) -> None:
+        """Compact when the tail or the tombstones have grown too large."""
+        generation = self._generation
+        live = len(generation.live)
+        max_tail = max(_MIN_TAIL_ROWS, _TAIL_ROWS_PER_SQRT_ROW * math.isqrt(live))
+        if len(generation.tail_ids) > max_tail or generation.dead_rows > live:
+            self._compact(retrain=False)
+
+    def _compact(self, retrain: bool) -> None:
+        generation = self._generation
+        ids, hashes, vectors = generation.live_rows()
+        trained = self._current.get("trained_rows", 0)
+        # Keep centroids while the live row count stays within 2x of training
+        if (
+            retrain
+            or not generation.lists
+            or not trained
+            or not trained / 2 <= len(ids) <= trained * 2
+        ):
+            self._write_generation(ids, hashes, vectors, None)
+            return
+
+        # Compacted rows keep their lists; live_rows() puts tail rows last
+        compacted = int(generation.alive.sum())
+        clustering: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        for k, kind in enumerate(_KINDS):
+            previous = generation.list_assignments(kind)
+            assert previous is not None
+            centroids = generation.lists[kind].centroids
+            tail = _assign(vectors[compacted:, k], centroids)
+            clustering[kind] = (centroids, np.concatenate([previous[generation.alive], tail]))
+        self._write_generation(ids, hashes, vectors, clustering, trained_rows=trained)
+
+    def _write_generation(
+        self,
+        ids: list[str],
+        hashes: list[str],
+        vectors: np.ndarray,
+        clustering: dict[str, tuple[np.ndarray, np.ndarray]] | None,
+        trained_rows: int | None = None,
+    ) -> None:
+        """Write a new generation holding exactly these rows and switch to it.
+
+        Args:
+            ids: Skill ids, one per row.
+            hashes: Content hashes, one per row.
+            vectors: (n, 2, dimension) unit-length vector pairs.
+            clustering: Centroids and list assignments per kind to reuse;
+                None trains new centroids.
+            trained_rows: Row count the reused centroids were trained for.
+        """
+        name = f"{_GENERATION_PREFIX}{uuid.uuid4().hex}"
+        directory = self._path / name
+        directory.mkdir()
+        rows = json.dumps([[i, h] for i, h in zip(ids, hashes, strict=True)]).encode()
+        _atomic_write(directory / _ROWS_FILE, lambda f: f.write(rows))
+        if ids:
+            nlist = _list_count(len(ids))
+            for k, kind in enumerate(_KINDS):
+                kind_vectors = np.ascontiguousarray(vectors[:, k])
+                if clustering is None:
+                    centroids = _train_centroids(kind_vectors, nlist)
+                    assignments = _assign(kind_vectors, centroids)
+                else:
+                    centroids, assignments = clustering[kind]
+                order = np.argsort(assignments, kind="stable")
+                counts = np.bincount(assignments, minlength=len(centroids))
+                offsets = np.concatenate(([0], np.cumsum(counts)))
+                grouped = kind_vectors[order]
+                arrays = [
+                    ("", grouped),
+                    ("_rows", order),
+                    ("_offsets", offsets),
+                    ("_centroids", centroids),
+                ]
+                if self._precision != "float32":
+                    codes, scales = quantize(grouped, self._precision)
+                    arrays.append(("_codes", codes))
+                    if scales is not None:
+                        arrays.append(("_scales", scales))
+                for suffix, array in arrays:
+                    _save_array(directory / f"{kind}{suffix}.npy", array)
+
+        info = self._get_model_info_from_embedder()
+        current = {
+            "generation": name,
+            "model_name": info.model_name,
+            "dimension": info.dimension,
+            "version": info.version,
+            "precision": self._precision,
+            "trained_rows": len(ids) if clustering is None else trained_rows,
+        }
+        _atomic_write(self._path / _CURRENT_FILE, lambda f: f.write(json.dumps(current).encode()))
+        self._refresh()
+
+        # Open memory maps of old generations stay valid after unlinking on POSIX
+        for old in self._path.glob(f"{_GENERATION_PREFIX}*"):
+            if old.name != name:
+                shutil.rmtree(old, ignore_errors=True)
+
+
+def _save_array(path: Path, array: np.ndarray) -> None:
+    _atomic_write(path, lambda f: np.save(f, array))
+
+
+def _atomic_write(path: Path, write: Callable[[BinaryIO], object]) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
@@ -14,14 +14,19 @@ logger = logging.getLogger(__name__)
 _VALID_SKILL_ID = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 _MAX_ID_LENGTH = 128
 
-from py_code_mode.skills.vector_store import ModelInfo, SearchResult  # noqa: E402
+from py_code_mode.skills.embeddings import embed_in_batches  # noqa: E402
+from py_code_mode.skills.vector_store import (  # noqa: E402
+    DEFAULT_EMBED_BATCH_SIZE,
+    ModelInfo,
+    SearchResult,
+    VectorEntry,
+)
 
 try:
     import redis.exceptions
     from redis import Redis
     from redis.commands.search.field import TagField, TextField, VectorField
     from redis.commands.search.index_definition import IndexDefinition, IndexType
-    from redis.commands.search.query import Query
 
     REDIS_AVAILABLE = True
 except ImportError:
@@ -30,13 +35,21 @@ except ImportError:
     REDIS_AVAILABLE = False
 
 if TYPE_CHECKING:
-    from py_code_mode.skills.embeddings import EmbeddingProvider
+    from py_code_mode.skills.embeddings import EmbeddingProvider, VectorPrecision
 
 
 # Metadata keys
 _KEY_MODEL_NAME = "model_name"
 _KEY_DIMENSION = "dimension"
 _KEY_VERSION = "version"
+_KEY_VECTOR_TYPE = "vector_type"
+
+# RediSearch vector field TYPE and matching NumPy dtype per precision.
+# FLOAT16 needs RediSearch 2.10 (Redis Stack 7.4) or later.
+_VECTOR_TYPES: dict[str, tuple[str, type[np.generic]]] = {
+    "float32": ("FLOAT32", np.float32),
+    "float16": ("FLOAT16", np.float16),
+}
 
 # Document field names
 _FIELD_DESC_VECTOR = "desc_vector"
@@ -44,6 +57,45 @@ _FIELD_CODE_VECTOR = "code_vector"
 _FIELD_CONTENT_HASH = "content_hash"
 _FIELD_SKILL_ID = "skill_id"
 
+# Nearest neighbours fetched per vector field and requested result
+_KNN_DEPTH_FACTOR = 2
+
+# (vector field, score kind, distance alias) of the two KNN queries per search
+_KNN_QUERIES = (
+    (_FIELD_DESC_VECTOR, "desc", "desc_score"),
+    (_FIELD_CODE_VECTOR, "code", "code_score"),
+)
+
+
+def _text(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _knn_distances(reply: Any, score_alias: str) -> dict[str, float]:
+    """Map skill_id -> distance from a raw FT.SEARCH reply.
+
+    Handles both the RESP2 reply, [total, key, [field, value, ...], ...],
+    and the RESP3 map with a "results" list of {"extra_attributes": ...}.
+    """
+    if isinstance(reply, dict):
+        reply = {_text(k): v for k, v in reply.items()}
+        rows = []
+        for result in reply.get("results") or []:
+            result = {_text(k): v for k, v in result.items()}
+            rows.append(result.get("extra_attributes") or {})
+    else:
+        rows = [dict(zip(fields[::2], fields[1::2], strict=True)) for fields in reply[2::2]]
+
+    distances: dict[str, float] = {}
+    for row in rows:
+        fields = {_text(k): v for k, v in row.items()}
+        skill_id = fields.get(_FIELD_SKILL_ID)
+        distance = fields.get(score_alias)
+        if skill_id is None or distance is None:
+            continue
+        distances[_text(skill_id)] = float(_text(distance))
+    return distances
+
 
 class RedisVectorStore:
     """VectorStore implementation backed by Redis with RediSearch.
@@ -55,6 +107,16 @@ class RedisVectorStore:
     Model changes are detected via stored ModelInfo in a metadata key. When the
     model changes (different dimension), the index is cleared and recreated.
 
+    With precision "float16" vectors are stored as FLOAT16, halving their
+    Redis memory. KNN runs server-side on the stored vectors, so there is
+    no full-precision rescoring; float16 similarities are within about
+    0.001 of float32 ones. Changing the precision recreates the index.
+
+    Bulk operations are pipelined: add_many() and get_content_hashes() cost
+    a constant number of round-trips, and search() sends both KNN queries
+    in one. count() is cached until this instance next writes, so it does
+    not see writes by other clients until then.
+
     Requires Redis with RediSearch module (e.g., redis-stack image).
     """
 
@@ -64,6 +126,7 @@ class RedisVectorStore:
         embedder: EmbeddingProvider,
         prefix: str = "vectors",
         index_name: str = "skills_idx",
+        precision: VectorPrecision = "float32",
     ) -> None:
         """Initialize RedisVectorStore.
 
@@ -72,23 +135,32 @@ class RedisVectorStore:
             embedder: Embedding provider for generating vectors.
             prefix: Key prefix for stored documents (default: "vectors").
             index_name: RediSearch index name (default: "skills_idx").
+            precision: Stored vector precision, "float32" or "float16"
+                (default: "float32"). RediSearch has no int8 vectors.
 
         Raises:
             ImportError: If redis is not installed.
+            ValueError: If precision is not supported.
         """
         if not REDIS_AVAILABLE:
             raise ImportError(
                 "redis is required for RedisVectorStore. Install with: pip install redis"
             )
+        if precision not in _VECTOR_TYPES:
+            msg = f"precision must be one of {tuple(_VECTOR_TYPES)}, got {precision!r}"
+            raise ValueError(msg)
 
         self._redis = redis
         self._embedder = embedder
         self._prefix = prefix
         self._index_name = index_name
+        self._vector_type, self._dtype = _VECTOR_TYPES[precision]
         # Use index-specific document prefix to isolate documents by index
         self._doc_prefix = f"{prefix}:{index_name}"
         # Store metadata outside the indexed prefix to avoid counting it
         self._metadata_key = f"__vectorstore_meta__:{index_name}"
+        # FT.INFO result, cleared by every write
+        self._count: int | None = None
 
         # Validate model and create/update index
         self._validate_or_clear_model()
@@ -131,13 +203,14 @@ class RedisVectorStore:
         )
 
     def _store_model_info(self, info: ModelInfo) -> None:
-        """Store ModelInfo in Redis metadata key."""
+        """Store ModelInfo and the vector type in Redis metadata key."""
         self._redis.hset(
             self._metadata_key,
             mapping={
                 _KEY_MODEL_NAME: info.model_name,
                 _KEY_DIMENSION: str(info.dimension),
                 _KEY_VERSION: info.version,
+                _KEY_VECTOR_TYPE: self._vector_type,
             },
         )
 
@@ -147,8 +220,13 @@ class RedisVectorStore:
         stored_info = self._get_stored_model_info()
 
         if stored_info is not None:
-            # Model mismatch check - dimension is the critical factor
-            if stored_info.dimension != current_info.dimension:
+            # Stores from before vector_type was recorded are FLOAT32
+            stored_type = self._redis.hget(self._metadata_key, _KEY_VECTOR_TYPE) or b"FLOAT32"
+            if isinstance(stored_type, bytes):
+                stored_type = stored_type.decode()
+            # Model mismatch check - dimension is the critical factor; the
+            # index schema must also match the vector type
+            if stored_info.dimension != current_info.dimension or stored_type != self._vector_type:
                 # Model changed, clear all vectors and index
                 self.clear()
 
@@ -174,7 +252,7 @@ class RedisVectorStore:
                 _FIELD_DESC_VECTOR,
                 "HNSW",
                 {
-                    "TYPE": "FLOAT32",
+                    "TYPE": self._vector_type,
                     "DIM": dim,
                     "DISTANCE_METRIC": "COSINE",
                 },
@@ -183,7 +261,7 @@ class RedisVectorStore:
                 _FIELD_CODE_VECTOR,
                 "HNSW",
                 {
-                    "TYPE": "FLOAT32",
+                    "TYPE": self._vector_type,
                     "DIM": dim,
                     "DISTANCE_METRIC": "COSINE",
                 },
@@ -232,7 +310,7 @@ class RedisVectorStore:
             vector: The vector to convert.
 
         Returns:
-            The vector as bytes in float32 format.
+            The vector as bytes in the index's vector type.
 
         Raises:
             ValueError: If vector dimension doesn't match embedder dimension.
@@ -241,7 +319,7 @@ class RedisVectorStore:
             raise ValueError(
                 f"Vector dimension mismatch: expected {self._embedder.dimension}, got {len(vector)}"
             )
-        return np.array(vector, dtype=np.float32).tobytes()
+        return np.array(vector, dtype=self._dtype).tobytes()
 
     def add(self, id: str, description: str, source: str, content_hash: str) -> None:
         """Add or update a skill's embeddings.
@@ -279,6 +357,82 @@ class RedisVectorStore:
                 _FIELD_SKILL_ID: id,
             },
         )
+        self._count = None
+
+    def add_many(
+        self, entries: list[VectorEntry], batch_size: int = DEFAULT_EMBED_BATCH_SIZE
+    ) -> int:
+        """Add or update embeddings for several skills.
+
+        Stored hashes are fetched in one pipeline, new or changed skills are
+        embedded in batches, and all documents are written in one pipeline.
+
+        Args:
+            entries: Skills to index.
+            batch_size: Maximum number of texts per embedding call.
+
+        Returns:
+            Number of skills that were (re-)embedded.
+
+        Raises:
+            ValueError: If any skill ID format is invalid.
+        """
+        # Last entry wins for duplicate ids, matching repeated add() calls
+        by_id = {entry.id: entry for entry in entries}
+        for skill_id in by_id:
+            self._validate_skill_id(skill_id)
+        if not by_id:
+            return 0
+
+        existing = self.get_content_hashes(list(by_id))
+        changed = [e for e in by_id.values() if existing.get(e.id) != e.content_hash]
+        if not changed:
+            return 0
+
+        # Descriptions then sources, so vectors[i] and vectors[n + i] belong to changed[i]
+        texts = [e.description for e in changed] + [e.source for e in changed]
+        vectors = embed_in_batches(self._embedder, texts, batch_size)
+        n = len(changed)
+
+        pipe = self._redis.pipeline()
+        for i, entry in enumerate(changed):
+            pipe.hset(
+                self._doc_key(entry.id),
+                mapping={
+                    _FIELD_DESC_VECTOR: self._vector_to_bytes(vectors[i]),
+                    _FIELD_CODE_VECTOR: self._vector_to_bytes(vectors[n + i]),
+                    _FIELD_CONTENT_HASH: entry.content_hash,
+                    _FIELD_SKILL_ID: entry.id,
+                },
+            )
+        pipe.execute()
+        self._count = None
+        return n
+
+    def get_content_hashes(self, ids: list[str]) -> dict[str, str]:
+        """Get the stored content hashes of several skills in one round-trip.
+
+        Args:
+            ids: Skill identifiers.
+
+        Returns:
+            Dict mapping skill id to content hash, for skills that exist.
+
+        Raises:
+            ValueError: If any skill ID format is invalid.
+        """
+        for skill_id in ids:
+            self._validate_skill_id(skill_id)
+        if not ids:
+            return {}
+        pipe = self._redis.pipeline()
+        for skill_id in ids:
+            pipe.hget(self._doc_key(skill_id), _FIELD_CONTENT_HASH)
+        return {
+            skill_id: _text(value)
+            for skill_id, value in zip(ids, pipe.execute(), strict=True)
+            if value is not None
+        }
 
     def remove(self, id: str) -> bool:
         """Remove a skill's embeddings.
@@ -294,12 +448,10 @@ class RedisVectorStore:
         """
         self._validate_skill_id(id)
 
-        # Check if skill exists
-        if self.get_content_hash(id) is None:
+        # DEL reports whether the document existed
+        if not self._redis.delete(self._doc_key(id)):
             return False
-
-        # Delete the document
-        self._redis.delete(self._doc_key(id))
+        self._count = None
         return True
 
     def search(
@@ -323,39 +475,57 @@ class RedisVectorStore:
         Returns:
             List of SearchResult objects, sorted by score descending.
         """
-        # Empty store returns empty results
-        if self.count() == 0:
+        if limit <= 0:
             return []
 
         # Embed query
         query_vector = self._embedder.embed_query(query)
         query_bytes = self._vector_to_bytes(query_vector)
 
-        # Fetch enough results to combine scores
-        fetch_limit = min(limit * 2, self.count())
-
-        # Query for description similarity
-        desc_scores = self._knn_search(_FIELD_DESC_VECTOR, query_bytes, fetch_limit, "desc_score")
-
-        # Query for code similarity
-        code_scores = self._knn_search(_FIELD_CODE_VECTOR, query_bytes, fetch_limit, "code_score")
+        # Both KNN queries in one round-trip; an empty index just returns no rows
+        k = limit * _KNN_DEPTH_FACTOR
+        pipe = self._redis.pipeline(transaction=False)
+        for field, _, alias in _KNN_QUERIES:
+            # Raw FT.SEARCH: pipe.ft() would parse replies into Result objects
+            pipe.execute_command(  # type: ignore[no-untyped-call]
+                "FT.SEARCH",
+                self._index_name,
+                f"*=>[KNN {k} @{field} $vec AS {alias}]",
+                "PARAMS",
+                2,
+                "vec",
+                query_bytes,
+                "SORTBY",
+                alias,
+                "RETURN",
+                2,
+                _FIELD_SKILL_ID,
+                alias,
+                "LIMIT",
+                0,
+                k,
+                "DIALECT",
+                2,
+            )
+        try:
+            replies = pipe.execute()
+        except redis.exceptions.ResponseError as e:
+            logger.error(f"RediSearch query failed: {e}")
+            return []
+        except redis.exceptions.ConnectionError as e:
+            logger.error(f"Redis connection failed during search: {e}")
+            return []
 
         # Combine scores per skill
         skill_scores: dict[str, dict[str, float]] = {}
-
-        for skill_id, distance in desc_scores.items():
-            # RediSearch cosine distance: 0 = identical, 2 = opposite
-            # Convert to similarity: 1 - (distance / 2)
-            similarity = max(0.0, min(1.0, 1.0 - (distance / 2.0)))
-            if skill_id not in skill_scores:
-                skill_scores[skill_id] = {"desc": 0.0, "code": 0.0}
-            skill_scores[skill_id]["desc"] = similarity
-
-        for skill_id, distance in code_scores.items():
-            similarity = max(0.0, min(1.0, 1.0 - (distance / 2.0)))
-            if skill_id not in skill_scores:
-                skill_scores[skill_id] = {"desc": 0.0, "code": 0.0}
-            skill_scores[skill_id]["code"] = similarity
+        for (_, kind, alias), reply in zip(_KNN_QUERIES, replies, strict=True):
+            for skill_id, distance in _knn_distances(reply, alias).items():
+                # RediSearch cosine distance: 0 = identical, 2 = opposite
+                # Convert to similarity: 1 - (distance / 2)
+                similarity = max(0.0, min(1.0, 1.0 - (distance / 2.0)))
+                if skill_id not in skill_scores:
+                    skill_scores[skill_id] = {"desc": 0.0, "code": 0.0}
+                skill_scores[skill_id][kind] = similarity
 
         # Build results with combined scores
         results: list[SearchResult] = []
@@ -373,57 +543,6 @@ class RedisVectorStore:
         results.sort(key=lambda r: r.score, reverse=True)
         return results[:limit]
 
-    def _knn_search(
-        self, field: str, query_bytes: bytes, limit: int, score_alias: str
-    ) -> dict[str, float]:
-        """Run KNN search on a vector field.
-
-        Args:
-            field: Vector field name to search.
-            query_bytes: Query vector as bytes.
-            limit: Maximum results to return.
-            score_alias: Alias for the distance score in results.
-
-        Returns:
-            Dict mapping skill_id to distance score.
-        """
-        query_str = f"*=>[KNN {limit} @{field} $vec AS {score_alias}]"
-        q = (
-            Query(query_str)
-            .return_fields(_FIELD_SKILL_ID, score_alias)
-            .sort_by(score_alias)
-            .dialect(2)
-        )
-
-        try:
-            results = self._redis.ft(self._index_name).search(q, query_params={"vec": query_bytes})
-        except redis.exceptions.ResponseError as e:
-            logger.error(f"RediSearch query failed: {e}")
-            return {}
-        except redis.exceptions.ConnectionError as e:
-            logger.error(f"Redis connection failed during search: {e}")
-            return {}
-
-        scores: dict[str, float] = {}
-        for doc in results.docs:
-            skill_id = getattr(doc, _FIELD_SKILL_ID, None)
-            score = getattr(doc, score_alias, None)
-
-            if skill_id is None or score is None:
-                continue
-
-            # Handle bytes vs string
-            if isinstance(skill_id, bytes):
-                skill_id = skill_id.decode()
-            if isinstance(score, bytes):
-                score = float(score.decode())
-            else:
-                score = float(score)
-
-            scores[skill_id] = score
-
-        return scores
-
     def get_content_hash(self, id: str) -> str | None:
         """Get the stored content hash for a skill.
 
@@ -475,20 +594,25 @@ class RedisVectorStore:
 
         # Recreate the index
         self._ensure_index_exists()
+        self._count = 0
 
     def count(self) -> int:
         """Get the number of skills indexed in the store.
 
+        Cached until the next write through this instance.
+
         Returns:
             Number of unique skills with embeddings.
         """
+        if self._count is not None:
+            return self._count
         # Count documents in the index (each skill is one document)
         try:
             info = self._redis.ft(self._index_name).info()
             # info is a dict-like object, num_docs gives total documents
-            num_docs = info.get("num_docs", 0)
-            return int(num_docs)
+            self._count = int(info.get("num_docs", 0))
         except redis.exceptions.ResponseError as e:
             if "Unknown Index name" not in str(e) and "Unknown index name" not in str(e):
                 raise
             return 0  # Index doesn't exist yet
+        return self._count
@@ -10,12 +10,19 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Protocol, runtime_checkable
 from urllib.parse import quote
 
-from py_code_mode.artifacts import ArtifactStoreProtocol, FileArtifactStore, RedisArtifactStore
+from py_code_mode.artifacts import (
+    ArtifactCodec,
+    ArtifactStoreProtocol,
+    FileArtifactStore,
+    RedisArtifactStore,
+)
 from py_code_mode.execution.protocol import FileStorageAccess, RedisStorageAccess
 from py_code_mode.skills import (
+    Embedder,
+    EmbeddingCache,
     FileSkillStore,
     RedisSkillStore,
     SkillLibrary,
@@ -88,19 +95,39 @@ class FileStorage:
 
     _UNINITIALIZED: ClassVar[object] = object()
 
-    def __init__(self, base_path: Path | str) -> None:
+    def __init__(
+        self,
+        base_path: Path | str,
+        vector_index: Literal["chroma", "numpy"] = "chroma",
+        artifact_compression: ArtifactCodec | None = None,
+        content_addressed_artifacts: bool = False,
+    ) -> None:
         """Initialize file storage.
 
         Args:
             base_path: Base directory for storage. Will create skills/, artifacts/ subdirs.
+            vector_index: "chroma" caches embeddings in ChromaDB when it is installed.
+                "numpy" uses NumpyVectorStore under vectors/ann, an approximate
+                index for large skill libraries that needs no extra dependency.
+            artifact_compression: "zstd" or "gzip" to compress saved artifacts
+                on disk. See FileArtifactStore.
+            content_addressed_artifacts: Store each distinct artifact payload
+                once, under artifacts/.blobs/. See FileArtifactStore.
         """
+        if vector_index not in ("chroma", "numpy"):
+            msg = f"vector_index must be 'chroma' or 'numpy', got {vector_index!r}"
+            raise ValueError(msg)
         self._base_path = Path(base_path) if isinstance(base_path, str) else base_path
         self._base_path.mkdir(parents=True, exist_ok=True)
+        self._vector_index = vector_index
+        self._artifact_compression = artifact_compression
+        self._content_addressed_artifacts = content_addressed_artifacts
 
         # Lazy-initialized stores (skills and artifacts only)
         self._skill_library: SkillLibrary | None = None
         self._artifact_store: FileArtifactStore | None = None
         self._vector_store: VectorStore | None | object = FileStorage._UNINITIALIZED
+        self._embedder: Embedder | None = None
 
     @property
     def root(self) -> Path:
@@ -119,15 +146,30 @@ class FileStorage:
         artifacts_path.mkdir(parents=True, exist_ok=True)
         return artifacts_path
 
+    def _get_embeddings_path(self) -> Path:
+        """Get the embedding cache directory path (created on first write)."""
+        return self._base_path / "embeddings"
+
     def _get_vectors_path(self) -> Path:
         """Get the vectors directory path."""
         vectors_path = self._base_path / "vectors"
         vectors_path.mkdir(parents=True, exist_ok=True)
         return vectors_path
 
+    def _get_embedder(self) -> Embedder:
+        """Embedder shared by the vector store and skill library.
+
+        Its model starts loading in a background thread on creation, so
+        searches made before it is ready are answered lexically.
+        """
+        if self._embedder is None:
+            self._embedder = Embedder(start_loading=True)
+        return self._embedder
+
     def get_vector_store(self) -> VectorStore | None:
         """Return ChromaVectorStore if chromadb available, else None.
 
+        With vector_index="numpy", returns a NumpyVectorStore instead.
         The vector store is cached after first creation.
 
         Returns:
@@ -136,16 +178,21 @@ class FileStorage:
         if self._vector_store is not FileStorage._UNINITIALIZED:
             return self._vector_store  # type: ignore[return-value]
 
+        if self._vector_index == "numpy":
+            from py_code_mode.skills.vector_stores.numpy_store import NumpyVectorStore
+
+            self._vector_store = NumpyVectorStore(
+                path=self._get_vectors_path() / "ann", embedder=self._get_embedder()
+            )
         # ChromaVectorStore is imported at module level (None if chromadb unavailable)
-        if ChromaVectorStore is None:
+        elif ChromaVectorStore is None:
             self._vector_store = None
         else:
             try:
-                from py_code_mode.skills import Embedder
-
                 vectors_path = self._get_vectors_path()
-                embedder = Embedder()
-                self._vector_store = ChromaVectorStore(path=vectors_path, embedder=embedder)
+                self._vector_store = ChromaVectorStore(
+                    path=vectors_path, embedder=self._get_embedder()
+                )
             except ImportError:
                 self._vector_store = None
 
@@ -163,15 +210,24 @@ class FileStorage:
         )
 
     def get_skill_library(self) -> SkillLibrary:
-        """Return SkillLibrary for in-process execution."""
+        """Return SkillLibrary for in-process execution.
+
+        Without a vector store, in-memory embeddings are persisted in an
+        EmbeddingCache under embeddings/ so restarts skip re-embedding.
+        """
         if self._skill_library is None:
             skills_path = self._get_skills_path()
             raw_store = FileSkillStore(skills_path)
             vector_store = self.get_vector_store()
+            embedding_cache = (
+                EmbeddingCache(self._get_embeddings_path()) if vector_store is None else None
+            )
             try:
                 self._skill_library = create_skill_library(
                     store=raw_store,
+                    embedder=self._get_embedder(),
                     vector_store=vector_store,
+                    embedding_cache=embedding_cache,
                 )
             except ImportError:
                 logger.warning(
@@ -190,7 +246,11 @@ class FileStorage:
     def get_artifact_store(self) -> ArtifactStoreProtocol:
         """Return artifact store for in-process execution."""
         if self._artifact_store is None:
-            self._artifact_store = FileArtifactStore(self._get_artifacts_path())
+            self._artifact_store = FileArtifactStore(
+                self._get_artifacts_path(),
+                compression=self._artifact_compression,
+                content_addressed=self._content_addressed_artifacts,
+            )
         return self._artifact_store
 
     def get_skill_store(self) -> SkillStore:
@@ -198,18 +258,26 @@ class FileStorage:
         skills_path = self._get_skills_path()
         return FileSkillStore(skills_path)
 
-    def to_bootstrap_config(self) -> dict[str, str]:
+    def to_bootstrap_config(self) -> dict[str, Any]:
         """Serialize storage configuration for subprocess bootstrap.
 
         Returns:
-            Dict with type="file" and base_path as string.
-            This config can be passed to bootstrap_namespaces() to reconstruct
-            the storage in a subprocess.
+            Dict with type="file" and base_path as string, plus vector_index,
+            artifact_compression and content_addressed_artifacts if not the
+            defaults. This config can be passed to bootstrap_namespaces() to
+            reconstruct the storage in a subprocess.
         """
-        return {
+        config: dict[str, Any] = {
             "type": "file",
             "base_path": str(self._base_path),
         }
+        if self._vector_index != "chroma":
+            config["vector_index"] = self._vector_index
+        if self._artifact_compression is not None:
+            config["artifact_compression"] = self._artifact_compression
+        if self._content_addressed_artifacts:
+            config["content_addressed_artifacts"] = True
+        return config
 
 
 class RedisStorage:
@@ -225,6 +293,8 @@ class RedisStorage:
         url: str | None = None,
         redis: Redis | None = None,
         prefix: str = "py_code_mode",
+        artifact_compression: ArtifactCodec | None = None,
+        content_addressed_artifacts: bool = False,
     ) -> None:
         """Initialize Redis storage.
 
@@ -234,6 +304,10 @@ class RedisStorage:
             redis: Redis client instance. Use for advanced configurations
                 (custom connection pools, etc.). Mutually exclusive with url.
             prefix: Key prefix for all storage. Default: "py_code_mode"
+            artifact_compression: "zstd" or "gzip" to compress saved artifacts
+                in Redis. See RedisArtifactStore.
+            content_addressed_artifacts: Store each distinct artifact payload
+                once, with reference counts. See RedisArtifactStore.
 
         Raises:
             ValueError: If neither url nor redis is provided, or if both are.
@@ -253,11 +327,14 @@ class RedisStorage:
             self._url = None  # Will be reconstructed if needed
 
         self._prefix = prefix
+        self._artifact_compression = artifact_compression
+        self._content_addressed_artifacts = content_addressed_artifacts
 
         # Lazy-initialized stores (skills and artifacts only)
         self._skill_library: SkillLibrary | None = None
         self._artifact_store: RedisArtifactStore | None = None
         self._vector_store: VectorStore | None | object = RedisStorage._UNINITIALIZED
+        self._embedder: Embedder | None = None
 
     @property
     def prefix(self) -> str:
@@ -292,6 +369,16 @@ class RedisStorage:
         else:
             return f"redis://{host}:{port}/{db}"
 
+    def _get_embedder(self) -> Embedder:
+        """Embedder shared by the vector store and skill library.
+
+        Its model starts loading in a background thread on creation, so
+        searches made before it is ready are answered lexically.
+        """
+        if self._embedder is None:
+            self._embedder = Embedder(start_loading=True)
+        return self._embedder
+
     def get_vector_store(self) -> VectorStore | None:
         """Return RedisVectorStore if available, else None.
 
@@ -309,12 +396,9 @@ class RedisStorage:
             self._vector_store = None
         else:
             try:
-                from py_code_mode.skills import Embedder
-
-                embedder = Embedder()
                 self._vector_store = RedisVectorStore(
                     redis=self._redis,
-                    embedder=embedder,
+                    embedder=self._get_embedder(),
                     prefix=f"{self._prefix}:vectors",
                 )
             except ImportError:
@@ -358,6 +442,7 @@ class RedisStorage:
             try:
                 self._skill_library = create_skill_library(
                     store=raw_store,
+                    embedder=self._get_embedder(),
                     vector_store=vector_store,
                 )
             except ImportError:
@@ -378,7 +463,10 @@ class RedisStorage:
         """Return artifact store for in-process execution."""
         if self._artifact_store is None:
             self._artifact_store = RedisArtifactStore(
-                self._redis, prefix=f"{self._prefix}:artifacts"
+                self._redis,
+                prefix=f"{self._prefix}:artifacts",
+                compression=self._artifact_compression,
+                content_addressed=self._content_addressed_artifacts,
             )
         return self._artifact_store
 
@@ -386,16 +474,22 @@ class RedisStorage:
         """Return the underlying SkillStore for direct access."""
         return RedisSkillStore(self._redis, prefix=f"{self._prefix}:skills")
 
-    def to_bootstrap_config(self) -> dict[str, str]:
+    def to_bootstrap_config(self) -> dict[str, Any]:
         """Serialize storage configuration for subprocess bootstrap.
 
         Returns:
-            Dict with type="redis", url, and prefix.
+            Dict with type="redis", url, and prefix, plus
+            artifact_compression and content_addressed_artifacts if set.
             This config can be passed to bootstrap_namespaces() to reconstruct
             the storage in a subprocess.
         """
-        return {
+        config: dict[str, Any] = {
             "type": "redis",
             "url": self._reconstruct_redis_url(),
             "prefix": self._prefix,
         }
+        if self._artifact_compression is not None:
+            config["artifact_compression"] = self._artifact_compression
+        if self._content_addressed_artifacts:
+            config["content_addressed_artifacts"] = True
+        return config
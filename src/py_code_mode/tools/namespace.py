@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import builtins
+from collections.abc import Awaitable, Callable, Coroutine, Iterable, Sequence
 from typing import TYPE_CHECKING, Any
 
 from py_code_mode.tools.types import Tool, ToolCallable
@@ -10,6 +12,41 @@ from py_code_mode.tools.types import Tool, ToolCallable
 if TYPE_CHECKING:
     from py_code_mode.tools.registry import ToolRegistry
 
+# Default number of tool calls tools.gather()/tools.map() run at once
+DEFAULT_BATCH_CONCURRENCY = 16
+
+
+async def gather_with_concurrency(
+    calls: Sequence[Callable[[], Awaitable[Any]]],
+    concurrency: int | None = DEFAULT_BATCH_CONCURRENCY,
+) -> list[Any]:
+    """Run calls concurrently, at most `concurrency` at a time.
+
+    Args:
+        calls: Zero-argument callables returning awaitables.
+        concurrency: Maximum calls in flight. None means no limit.
+
+    Returns:
+        One entry per call, in order: its result, or the Exception it raised.
+
+    Raises:
+        ValueError: If concurrency is less than 1.
+    """
+    if concurrency is not None and concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1 or None, got {concurrency}")
+    semaphore = asyncio.Semaphore(concurrency) if concurrency is not None else None
+
+    async def run_one(call: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            if semaphore is None:
+                return await call()
+            async with semaphore:
+                return await call()
+        except Exception as e:
+            return e
+
+    return list(await asyncio.gather(*(run_one(call) for call in calls)))
+
 
 class ToolsNamespace:
     """Agent-facing namespace: tools.X.Y(...)
@@ -27,6 +64,9 @@ class ToolsNamespace:
         # Discovery
         tools.list()  # List all tools
         tools.search("network")  # Search tools
+
+        # Concurrent batch
+        tools.map(tools.curl.get, [{"url": u} for u in urls], concurrency=16)
     """
 
     def __init__(self, registry: ToolRegistry) -> None:
@@ -60,7 +100,76 @@ class ToolsNamespace:
         """List all available tools."""
         return self._registry.get_all_tools()
 
-    def search(self, query: str, limit: int = 5) -> list[Tool]:
+    def gather(
+        self,
+        *calls: tuple[ToolProxy | CallableProxy, dict[str, Any]],
+        concurrency: int | None = DEFAULT_BATCH_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> Any:
+        """Run several tool calls concurrently and return their results in order.
+
+        Usage:
+            tools.gather((tools.curl.get, {"url": a}), (tools.jq.query, {"filter": f}))
+
+        Args:
+            *calls: (tool or recipe, kwargs) pairs.
+            concurrency: Maximum calls in flight. None means no limit.
+            return_exceptions: If True, failed calls put their exception in
+                the result list. If False, the first failure (in call order)
+                is raised after all calls finish.
+
+        Returns:
+            List of results, or a coroutine for it in async context (same rules
+            as calling a tool directly).
+        """
+        batch = [_batch_call(fn, kwargs) for fn, kwargs in calls]
+        return self._run(self._gather(batch, concurrency, return_exceptions))
+
+    def map(
+        self,
+        fn: ToolProxy | CallableProxy,
+        kwargs_list: Iterable[dict[str, Any]],
+        *,
+        concurrency: int | None = DEFAULT_BATCH_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> Any:
+        """Call one tool or recipe once per kwargs dict, concurrently.
+
+        Usage:
+            pages = tools.map(tools.curl.get, [{"url": u} for u in urls], concurrency=16)
+
+        See gather() for the arguments and return value.
+        """
+        return self.gather(
+            *((fn, kwargs) for kwargs in kwargs_list),
+            concurrency=concurrency,
+            return_exceptions=return_exceptions,
+        )
+
+    @staticmethod
+    async def _gather(
+        batch: builtins.list[Callable[[], Awaitable[Any]]],
+        concurrency: int | None,
+        return_exceptions: bool,
+    ) -> builtins.list[Any]:
+        results = await gather_with_concurrency(batch, concurrency)
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+
+    def _run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Run a coroutine the way tool proxies do: sync unless awaited in async code."""
+        if self._loop is not None:
+            return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        return coro
+
+    def search(self, query: str, limit: int = 5) -> builtins.list[Tool]:
         """Search tools by query string."""
         from py_code_mode.tools.registry import substring_search
 
@@ -238,3 +347,12 @@ class CallableProxy:
     def signature(self) -> str:
         """Get the signature string for this callable."""
         return self._callable.signature()
+
+
+def _batch_call(fn: Any, kwargs: dict[str, Any]) -> Callable[[], Awaitable[Any]]:
+    """Turn a (proxy, kwargs) pair into a deferred tool call."""
+    if not isinstance(fn, (ToolProxy, CallableProxy)):
+        raise TypeError(f"Expected a tool or recipe (e.g. tools.curl.get), got {type(fn).__name__}")
+    if not isinstance(kwargs, dict):
+        raise TypeError(f"Expected a dict of arguments, got {type(kwargs).__name__}")
+    return lambda: fn._execute(**kwargs)
@@ -7,7 +7,14 @@ from collections.abc import Callable
 from typing import Any, TypeVar
 
 from py_code_mode.errors import CodeModeError, ToolCallError, ToolNotFoundError
-from py_code_mode.skills import EmbeddingProvider, cosine_similarity
+from py_code_mode.skills.embeddings import (
+    BackgroundLoadingProvider,
+    EmbeddingMatrix,
+    EmbeddingProvider,
+    top_k_indices,
+)
+from py_code_mode.skills.lexical import BM25Index, reciprocal_rank_fusion, tokenize
+from py_code_mode.skills.library import RankingConfig
 from py_code_mode.tools.adapters.base import ToolAdapter
 from py_code_mode.tools.types import Tool
 
@@ -76,6 +83,26 @@ DESCRIPTION_MATCH_SCORE = 25
 
 T = TypeVar("T")
 
+# Candidates per ranking fed into reciprocal-rank fusion, per requested result
+_FUSION_DEPTH_FACTOR = 4
+
+# Token repetitions per field in the BM25 index (see skills.library)
+_NAME_BOOST = 3
+_DESCRIPTION_BOOST = 2
+_PARAMETER_BOOST = 2
+
+
+def _lexical_tokens(tool: Tool) -> list[str]:
+    """BM25 terms for a tool: name, description, callables and parameter names."""
+    tokens = tokenize(tool.name) * _NAME_BOOST
+    tokens += tokenize(tool.description or "") * _DESCRIPTION_BOOST
+    for tool_callable in tool.callables:
+        tokens += tokenize(tool_callable.name) * _PARAMETER_BOOST
+        tokens += tokenize(tool_callable.description or "")
+        for parameter in tool_callable.parameters:
+            tokens += tokenize(parameter.name) * _PARAMETER_BOOST
+    return tokens
+
 
 def substring_search(
     query: str,
@@ -143,12 +170,18 @@ class ToolRegistry:
     def __init__(
         self,
         embedder: EmbeddingProvider | None = None,
+        ranking: RankingConfig | None = None,
     ) -> None:
         self._embedder = embedder
+        # Only the fusion weights (semantic_weight, lexical_weight, rrf_k) apply
+        self._ranking = ranking or RankingConfig()
         self._adapters: list[ToolAdapter] = []
         self._tools: dict[str, Tool] = {}  # name -> Tool
         self._tool_to_adapter: dict[str, ToolAdapter] = {}  # name -> adapter
-        self._vectors: dict[str, list[float]] = {}  # name -> embedding vector
+        self._vectors = EmbeddingMatrix()  # name -> normalized embedding row
+        self._lexical = BM25Index()
+        # Tools registered while the embedder was loading, not yet embedded
+        self._unembedded: list[Tool] = []
 
     @classmethod
     async def from_dir(
@@ -329,14 +362,29 @@ class ToolRegistry:
 
             self._tools[tool.name] = tool
             self._tool_to_adapter[tool.name] = adapter
+            self._lexical.set(tool.name, _lexical_tokens(tool))
             registered.append(tool)
 
-        # Embed tools if embedder is available
+        # Embed tools if embedder is available, unless that would block on loading
         if self._embedder and registered:
-            self._embed_tools(registered)
+            if self._embedder_loading():
+                self._unembedded.extend(registered)
+            else:
+                self._embed_tools(registered)
 
         return registered
 
+    def _embedder_loading(self) -> bool:
+        return isinstance(self._embedder, BackgroundLoadingProvider) and self._embedder.loading
+
+    def _embed_deferred(self) -> None:
+        """Embed tools registered while the model was loading, once it has loaded."""
+        if not self._unembedded or self._embedder_loading():
+            return
+        deferred = [t for t in self._unembedded if self._tools.get(t.name) is t]
+        self._unembedded = []
+        self._embed_tools(deferred)
+
     def _embed_tools(self, tools: list[Tool]) -> None:
         """Embed tools and store their vectors."""
         if not self._embedder:
@@ -345,8 +393,7 @@ class ToolRegistry:
         texts = [f"{t.name}: {t.description or ''}" for t in tools]
         vectors = self._embedder.embed(texts)
 
-        for tool, vector in zip(tools, vectors, strict=True):
-            self._vectors[tool.name] = vector
+        self._vectors.set_many([t.name for t in tools], vectors)
 
     def list_tools(self, scope: set[str] | None = None) -> list[Tool]:
         """List all tools, optionally filtered by scope.
@@ -424,8 +471,11 @@ class ToolRegistry:
     def search(self, query: str, limit: int = 10) -> list[Tool]:
         """Search tools by name, description, or semantic similarity.
 
-        Uses semantic search when embedder is available, otherwise falls back
-        to substring search.
+        With an embedder, the semantic ranking is merged with a BM25 ranking
+        over tool names, descriptions, callable and parameter names by
+        reciprocal-rank fusion, weighted as in the RankingConfig. While the
+        embedder's model is still loading in the background, only the BM25
+        ranking is used. Without an embedder, falls back to substring search.
 
         Args:
             query: Search query.
@@ -434,12 +484,36 @@ class ToolRegistry:
         Returns:
             Matching tools, sorted by relevance.
         """
-        # Use semantic search if embedder and vectors available
-        if self._embedder and self._vectors:
-            return self._semantic_search(query, limit)
+        if not self._embedder:
+            return self._substring_search(query, limit)
+        self._embed_deferred()
 
-        # Fallback to substring search
-        return self._substring_search(query, limit)
+        use_semantic = (
+            bool(self._vectors)
+            and self._ranking.semantic_weight > 0
+            and not self._embedder_loading()
+        )
+        use_lexical = self._ranking.lexical_weight > 0 or not use_semantic
+        if not use_lexical:
+            return self._semantic_search(query, limit)
+        if not use_semantic:
+            names = [name for name, _ in self._lexical.search(query, limit)]
+        else:
+            depth = limit * _FUSION_DEPTH_FACTOR
+            names = reciprocal_rank_fusion(
+                [
+                    (
+                        [t.name for t in self._semantic_search(query, depth)],
+                        self._ranking.semantic_weight,
+                    ),
+                    (
+                        [name for name, _ in self._lexical.search(query, depth)],
+                        self._ranking.lexical_weight,
+                    ),
+                ],
+                k=self._ranking.rrf_k,
+            )
+        return [self._tools[name] for name in names if name in self._tools][:limit]
 
     def _semantic_search(self, query: str, limit: int) -> list[Tool]:
         """Search using cosine similarity with embeddings."""
@@ -449,17 +523,15 @@ class ToolRegistry:
         # Embed the query (uses instruction prefix for retrieval models)
         query_vec = self._embedder.embed_query(query)
 
-        # Compute cosine similarity with each tool
-        scores: list[tuple[float, Tool]] = []
-        for name, tool_vec in self._vectors.items():
-            similarity = cosine_similarity(query_vec, tool_vec)
-            tool = self._tools.get(name)
-            if tool:
-                scores.append((similarity, tool))
+        # Cosine similarity with every tool in one matrix-vector product
+        scores = self._vectors.scores(query_vec)
+        names = self._vectors.names
 
-        # Sort by similarity descending
-        scores.sort(key=lambda x: x[0], reverse=True)
-        return [tool for _, tool in scores[:limit]]
+        # Skip vectors left behind for tools that are no longer registered,
+        # widening the candidate set so they don't shorten the result
+        stale = len(set(names) - self._tools.keys())
+        ranked = (names[i] for i in top_k_indices(scores, limit + stale))
+        return [self._tools[name] for name in ranked if name in self._tools][:limit]
 
     def _substring_search(self, query: str, limit: int) -> list[Tool]:
         """Search using substring matching (fallback)."""
@@ -483,6 +555,8 @@ class ToolRegistry:
         self._tools.clear()
         self._tool_to_adapter.clear()
         self._vectors.clear()
+        self._lexical.clear()
+        self._unembedded.clear()
 
     async def close(self) -> None:
         """Close all adapters in reverse order (LIFO).
@@ -497,6 +571,8 @@ class ToolRegistry:
         self._tools.clear()
         self._tool_to_adapter.clear()
         self._vectors.clear()
+        self._lexical.clear()
+        self._unembedded.clear()
 
 
 class ScopedToolRegistry:
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, ClassVar
 
 
 @dataclass(frozen=True)
@@ -126,6 +126,70 @@ class ExecutionResult:
         return self.error is None
 
 
+# =============================================================================
+# Streaming execution events
+# =============================================================================
+#
+# run_stream() yields these as a cell runs. Output events arrive as the code
+# produces them; the stream always ends with exactly one ResultEvent (success)
+# or ErrorEvent (failure) carrying the same ExecutionResult run() would return.
+
+
+@dataclass(frozen=True)
+class StdoutEvent:
+    """A chunk of stdout written by the running code."""
+
+    text: str
+    type: ClassVar[str] = "stdout"
+
+
+@dataclass(frozen=True)
+class StderrEvent:
+    """A chunk of stderr written by the running code."""
+
+    text: str
+    type: ClassVar[str] = "stderr"
+
+
+@dataclass(frozen=True)
+class DisplayEvent:
+    """Rich display output (e.g. IPython display()), keyed by mimetype."""
+
+    data: dict[str, Any]
+    type: ClassVar[str] = "display"
+
+
+@dataclass(frozen=True)
+class ResultEvent:
+    """Final event of a successful run."""
+
+    result: ExecutionResult
+    type: ClassVar[str] = "result"
+
+
+@dataclass(frozen=True)
+class ErrorEvent:
+    """Final event of a failed run."""
+
+    result: ExecutionResult
+    type: ClassVar[str] = "error"
+
+    @property
+    def error(self) -> str:
+        """The error message."""
+        return self.result.error or ""
+
+
+ExecutionEvent = StdoutEvent | StderrEvent | DisplayEvent | ResultEvent | ErrorEvent
+
+
+def final_event(result: ExecutionResult) -> ResultEvent | ErrorEvent:
+    """Wrap a finished ExecutionResult as the closing event of a stream."""
+    if result.error is None:
+        return ResultEvent(result)
+    return ErrorEvent(result)
+
+
 @dataclass
 class ExecutorConfig:
     """Base configuration for all execution backends.
@@ -24,18 +24,30 @@ from py_code_mode.skills.embeddings import Embedder
 
 _SHARED_EMBEDDER = None
 _original_embedder_init = Embedder.__init__
+_original_load_model = Embedder._load_model
 
 
-def _patched_embedder_init(self, model_name=None, start_loading=False):
+def _patched_embedder_init(self, model_name=None, start_loading=False, **kwargs):
     global _SHARED_EMBEDDER
+    # Never load in the background: a search made right after setup would
+    # otherwise race the model load and fall back to BM25 only
+    _original_embedder_init(self, model_name, False, **kwargs)
     if _SHARED_EMBEDDER is None:
-        _original_embedder_init(self, model_name, start_loading)
         _SHARED_EMBEDDER = self
-    else:
-        self.__dict__.update(_SHARED_EMBEDDER.__dict__)
+    # Other instances keep their own caches and batching state; the model is shared
+
+
+def _patched_load_model(self):
+    if _SHARED_EMBEDDER is None or self is _SHARED_EMBEDDER:
+        _original_load_model(self)
+        return
+    _SHARED_EMBEDDER._ensure_model_loaded()
+    self._model = _SHARED_EMBEDDER._model
+    self._device = _SHARED_EMBEDDER._device
 
 
 Embedder.__init__ = _patched_embedder_init
+Embedder._load_model = _patched_load_model
 
 # Configure DOCKER_HOST for Docker Desktop on macOS/Windows
 # This fixes socket path issues for both testcontainers and our ContainerExecutor
@@ -505,6 +517,9 @@ def pytest_configure(config):
     """Register custom markers."""
     config.addinivalue_line("markers", "requires_redis: mark test as requiring Redis")
     config.addinivalue_line("markers", "requires_docker: mark test as requiring Docker")
+    config.addinivalue_line(
+        "markers", "benchmark: timing benchmark, deselected by default (run with -m benchmark)"
+    )
 
 
 def pytest_sessionfinish(session, exitstatus):  # noqa: ARG001
@@ -621,6 +636,11 @@ class MockRedisClient:
     def get(self, key: str) -> bytes | None:
         return self._strings.get(key)
 
+    def incr(self, key: str, amount: int = 1) -> int:
+        value = int(self._strings.get(key, b"0")) + amount
+        self._strings[key] = str(value).encode()
+        return value
+
     def delete(self, *keys: str) -> int:
         count = 0
         for key in keys:
@@ -674,6 +694,32 @@ class MockRedisClient:
         """Get all members of a set."""
         return self._sets.get(key, set()).copy()
 
+    def pipeline(self, transaction: bool = True) -> MockPipeline:
+        """Queue commands and run them together on execute()."""
+        return MockPipeline(self)
+
+
+class MockPipeline:
+    """Mock redis pipeline: records client calls and replays them on execute()."""
+
+    def __init__(self, client: Any) -> None:
+        self._client = client
+        self._calls: list[tuple[Any, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self._client, name)
+
+        def queue(*args: Any, **kwargs: Any) -> MockPipeline:
+            self._calls.append((method, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self) -> list[Any]:
+        """Run the queued commands in order."""
+        calls, self._calls = self._calls, []
+        return [method(*args, **kwargs) for method, args, kwargs in calls]
+
 
 @pytest.fixture
 def mock_redis() -> MockRedisClient:
@@ -115,6 +115,44 @@ class TestSessionClientExecute:
         assert "ZeroDivisionError" in result.error
 
 
+class TestSessionClientExecuteStream:
+    """Tests for execute_stream method."""
+
+    @pytest.mark.asyncio
+    async def test_execute_stream_parses_sse(self) -> None:
+        """execute_stream turns the server's SSE messages into events."""
+        import httpx
+
+        from py_code_mode import ErrorEvent, ResultEvent, StderrEvent, StdoutEvent
+
+        body = (
+            'event: stdout\ndata: {"text": "hello\\n"}\n\n'
+            'event: stderr\ndata: {"text": "warn"}\n\n'
+            "event: something-new\ndata: {}\n\n"
+            'event: result\ndata: {"value": 42, "stdout": "hello\\n", "error": null, '
+            '"execution_time_ms": 3.0, "session_id": "server-session"}\n\n'
+        )
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+
+        client = SessionClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        events = [e async for e in client.execute_stream("print('hello')", timeout=5.0)]
+        await client.close()
+
+        assert requests[0].url.path == "/execute/stream"
+        assert events[:2] == [StdoutEvent("hello\n"), StderrEvent("warn")]
+        assert isinstance(events[2], ResultEvent)
+        assert not isinstance(events[2], ErrorEvent)
+        assert events[2].result.value == 42
+        assert len(events) == 3
+        assert client.session_id == "server-session"
+
+
 class TestSessionClientHealth:
     """Tests for health check method."""
 
@@ -158,6 +158,48 @@ class TestSessionServer:
         assert "execution_time_ms" in data
         assert data["execution_time_ms"] >= 0
 
+    def test_execute_stream_sends_sse_events(self, client) -> None:
+        """/execute/stream sends output events then a final result event."""
+        import json
+
+        headers = {"X-Session-ID": "stream-session"}
+        with client.stream(
+            "POST",
+            "/execute/stream",
+            json={"code": "print('hi')\n6 * 7"},
+            headers=headers,
+        ) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/event-stream")
+            body = response.read().decode()
+
+        messages = [m for m in body.split("\n\n") if m]
+        parsed = []
+        for message in messages:
+            event_line, data_line = message.split("\n")
+            parsed.append((event_line.removeprefix("event: "), json.loads(data_line[6:])))
+
+        assert [e for e, _ in parsed if e == "stdout"]
+        assert "".join(d["text"] for e, d in parsed if e == "stdout") == "hi\n"
+        final_type, final = parsed[-1]
+        assert final_type == "result"
+        assert final["value"] == 42
+        assert final["stdout"] == "hi\n"
+        assert final["session_id"] == "stream-session"
+
+        # Same session as /execute
+        response = client.post("/execute", json={"code": "1"}, headers=headers)
+        assert response.json()["session_id"] == "stream-session"
+
+    def test_execute_stream_error_event(self, client) -> None:
+        """/execute/stream ends with an error event when code fails."""
+        with client.stream("POST", "/execute/stream", json={"code": "1/0"}) as response:
+            body = response.read().decode()
+
+        last = [m for m in body.split("\n\n") if m][-1]
+        assert last.startswith("event: error\n")
+        assert "ZeroDivisionError" in last
+
 
 class TestSessionServerWithTools:
     """Tests for session server with tools loaded from TOOLS_PATH."""
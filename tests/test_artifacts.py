@@ -89,13 +89,14 @@ class TestArtifactStore:
         """save() updates metadata index."""
         store.save("test.json", {"x": 1}, description="Test data")
 
-        # Index file should exist
-        index_path = store.path_obj / ".artifacts.json"
+        # Index journal should exist and record the entry
+        index_path = store.path_obj / ".artifacts.jsonl"
         assert index_path.exists()
 
-        index = json.loads(index_path.read_text())
-        assert "test.json" in index
-        assert index["test.json"]["description"] == "Test data"
+        records = [json.loads(line) for line in index_path.read_text().splitlines()]
+        assert records[-1]["op"] == "put"
+        assert records[-1]["name"] == "test.json"
+        assert records[-1]["entry"]["description"] == "Test data"
 
     def test_load_reads_file(self, store) -> None:
         """load() reads file content."""
@@ -186,6 +187,658 @@ class TestArtifactStore:
         assert artifact.metadata["tool"] == "nmap"
 
 
+def _save_artifacts(path: Path, prefix: str, count: int) -> None:
+    """Save count artifacts from a separate process."""
+    store = FileArtifactStore(path)
+    for i in range(count):
+        store.save(f"{prefix}-{i}.txt", str(i), description=f"{prefix} {i}")
+
+
+class TestFileArtifactStoreIndex:
+    """The append-only index journal shared between stores and processes."""
+
+    def test_changes_are_visible_to_other_instances(self, tmp_path: Path) -> None:
+        writer = FileArtifactStore(tmp_path)
+        reader = FileArtifactStore(tmp_path)
+
+        writer.save("a.txt", "a", description="First")
+        assert reader.get("a.txt").description == "First"
+
+        writer.delete("a.txt")
+        assert not reader.exists("a.txt")
+
+    def test_concurrent_writers_in_other_processes_lose_nothing(self, tmp_path: Path) -> None:
+        """Each process appends under the lock, so no entry is overwritten."""
+        import multiprocessing
+
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=_save_artifacts, args=(tmp_path, f"p{n}", 100)) for n in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+
+        names = {a.name for a in FileArtifactStore(tmp_path).list()}
+        assert names == {f"p{n}-{i}.txt" for n in range(4) for i in range(100)}
+
+    def test_journal_is_compacted_when_mostly_dead(self, tmp_path: Path) -> None:
+        store = FileArtifactStore(tmp_path)
+        for i in range(1_100):
+            store.save("same.txt", str(i), description=f"version {i}")
+
+        lines = (tmp_path / ".artifacts.jsonl").read_text().splitlines()
+        assert len(lines) < 1_024
+        assert FileArtifactStore(tmp_path).get("same.txt").description == "version 1099"
+
+    def test_legacy_json_index_is_migrated(self, tmp_path: Path) -> None:
+        (tmp_path / "old.txt").write_text("old")
+        legacy = {
+            "old.txt": {
+                "description": "From before",
+                "created_at": "2024-01-01T00:00:00+00:00",
+                "metadata": {"_data_type": "text"},
+            }
+        }
+        (tmp_path / ".artifacts.json").write_text(json.dumps(legacy, indent=2))
+
+        store = FileArtifactStore(tmp_path)
+
+        assert store.get("old.txt").description == "From before"
+        assert store.load("old.txt") == "old"
+        assert not (tmp_path / ".artifacts.json").exists()
+
+    def test_partial_line_from_crashed_writer_is_dropped(self, tmp_path: Path) -> None:
+        store = FileArtifactStore(tmp_path)
+        store.save("a.txt", "a", description="First")
+        with open(tmp_path / ".artifacts.jsonl", "ab") as f:
+            f.write(b'{"op": "put", "na')
+
+        store.save("b.txt", "b", description="Second")
+
+        reopened = FileArtifactStore(tmp_path)
+        assert {a.name for a in reopened.list()} == {"a.txt", "b.txt"}
+
+    @pytest.mark.benchmark
+    def test_benchmark_100k_saves_take_linear_time(self, tmp_path: Path) -> None:
+        """Per-save cost stays flat at 100k artifacts, unlike a rewritten JSON index."""
+        import time
+
+        store = FileArtifactStore(tmp_path / "journal")
+        batch_seconds = []
+        for batch in range(10):
+            start = time.perf_counter()
+            for i in range(batch * 10_000, (batch + 1) * 10_000):
+                store.save(f"a{i}.txt", "x", description=f"artifact {i}")
+            batch_seconds.append(time.perf_counter() - start)
+
+        assert len(FileArtifactStore(tmp_path / "journal").list()) == 100_000
+        # The last 10k saves cost about the same as the first 10k
+        assert batch_seconds[-1] < 3 * batch_seconds[0]
+
+        # The previous implementation rewrote the whole index with indent=2 on
+        # every save; time its last 200 saves at the 100k-artifact mark
+        index = {a.name: {"description": a.description} for a in store.list()}
+        legacy_path = tmp_path / "legacy.json"
+        start = time.perf_counter()
+        for i in range(200):
+            index[f"b{i}.txt"] = {"description": f"artifact {i}"}
+            legacy_path.write_text(json.dumps(index, indent=2, default=str))
+        legacy_per_save = (time.perf_counter() - start) / 200
+
+        assert batch_seconds[-1] / 10_000 * 20 < legacy_per_save
+
+
+class TestArtifactStreams:
+    """open(name, "rb"/"wb") streams artifacts in bounded chunks."""
+
+    def test_writer_hands_store_fixed_size_chunks(self) -> None:
+        """Small writes are coalesced and large ones split at the chunk size."""
+        from py_code_mode.artifacts import Artifact, ArtifactWriter
+
+        class RecordingWriter(ArtifactWriter):
+            def __init__(self) -> None:
+                super().__init__(chunk_size=4)
+                self.chunks: list[bytes] = []
+
+            def _write_chunk(self, chunk) -> None:
+                self.chunks.append(bytes(chunk))
+
+            def _commit(self) -> Artifact:
+                return Artifact(name="x", path="x", description="")
+
+            def _abort(self) -> None:
+                self.chunks.clear()
+
+        writer = RecordingWriter()
+        writer.write(b"ab")
+        writer.write(b"cdefghij")
+        writer.write(bytearray(b"k"))
+        writer.close()
+
+        assert writer.chunks == [b"abcd", b"efgh", b"ijk"]
+        assert writer.artifact is not None
+
+    def test_write_then_read_stream(self, tmp_path: Path) -> None:
+        store = FileArtifactStore(tmp_path)
+        with store.open("scans/big.bin", "wb", description="Big scan") as f:
+            for i in range(10):
+                f.write(bytes([i]) * 300_000)
+
+        assert f.artifact.name == "scans/big.bin"
+        assert store.get("scans/big.bin").description == "Big scan"
+        with store.open("scans/big.bin", "rb") as r:
+            r.seek(600_000)
+            assert r.read(3) == b"\x02\x02\x02"
+        assert store.load("scans/big.bin") == b"".join(bytes([i]) * 300_000 for i in range(10))
+
+    def test_artifact_is_not_visible_until_closed(self, tmp_path: Path) -> None:
+        store = FileArtifactStore(tmp_path)
+        store.save("data.bin", b"old")
+
+        f = store.open("data.bin", "wb")
+        f.write(b"new")
+        assert store.load("data.bin") == b"old"
+
+        f.close()
+        assert store.load("data.bin") == b"new"
+
+    def test_exception_discards_stream(self, tmp_path: Path) -> None:
+        store = FileArtifactStore(tmp_path)
+
+        with pytest.raises(RuntimeError), store.open("data.bin", "wb") as f:
+            f.write(b"partial")
+            raise RuntimeError("boom")
+
+        assert not store.exists("data.bin")
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_open_rejects_missing_artifact_and_bad_mode(self, tmp_path: Path) -> None:
+        from py_code_mode.errors import ArtifactNotFoundError
+
+        store = FileArtifactStore(tmp_path)
+
+        with pytest.raises(ArtifactNotFoundError):
+            store.open("missing.bin", "rb")
+        with pytest.raises(ValueError, match="mode"):
+            store.open("data.txt", "w")
+        with pytest.raises(ValueError, match="traversal"):
+            store.open("../escape.bin", "wb")
+
+    def test_writer_without_commit_cannot_be_created(self) -> None:
+        """ArtifactWriter subclasses must implement all three hooks."""
+        from py_code_mode.artifacts import ArtifactWriter
+
+        class HalfWriter(ArtifactWriter):
+            def _write_chunk(self, chunk) -> None:
+                pass
+
+            def _abort(self) -> None:
+                pass
+
+        with pytest.raises(TypeError, match="_commit"):
+            HalfWriter()
+
+
+class TestArtifactStreamFallbacks:
+    """open_artifact()/view_artifact() work with stores that lack open()/view()."""
+
+    @pytest.fixture
+    def store(self):
+        from datetime import UTC, datetime
+
+        from py_code_mode.artifacts import Artifact
+
+        class LoadSaveStore:
+            """A store written against the load()/save()-only protocol."""
+
+            path = "memory"
+
+            def __init__(self) -> None:
+                self.data: dict[str, object] = {}
+
+            def save(self, name, data, description="", metadata=None) -> Artifact:
+                self.data[name] = data
+                return Artifact(name, self.path, description, metadata or {}, datetime.now(UTC))
+
+            def load(self, name):
+                return self.data[name]
+
+            def get(self, name):
+                return None
+
+            def list(self):
+                return []
+
+            def exists(self, name) -> bool:
+                return name in self.data
+
+            def delete(self, name) -> None:
+                self.data.pop(name, None)
+
+        return LoadSaveStore()
+
+    def test_plain_store_still_satisfies_protocol(self, store, tmp_path: Path) -> None:
+        from py_code_mode.artifacts import ArtifactStoreProtocol, StreamingArtifactStore
+
+        assert isinstance(store, ArtifactStoreProtocol)
+        assert not isinstance(store, StreamingArtifactStore)
+        assert isinstance(FileArtifactStore(tmp_path), StreamingArtifactStore)
+
+    def test_write_stream_saves_on_close(self, store) -> None:
+        from py_code_mode.artifacts import open_artifact
+
+        with open_artifact(store, "big.bin", "wb", description="Big") as f:
+            f.write(b"a" * 3_000_000)
+            assert "big.bin" not in store.data
+
+        assert store.data["big.bin"] == b"a" * 3_000_000
+        assert f.artifact.description == "Big"
+
+    def test_read_stream_and_view_use_load(self, store) -> None:
+        from py_code_mode.artifacts import open_artifact, view_artifact
+
+        store.save("notes.txt", "hello")
+        store.save("data.json", {"a": 1})
+
+        with open_artifact(store, "notes.txt") as f:
+            f.seek(1)
+            assert f.read() == b"ello"
+        assert bytes(view_artifact(store, "data.json")) == b'{"a":1}'
+        with pytest.raises(ValueError, match="mode"):
+            open_artifact(store, "notes.txt", "w")
+
+    def test_npy_view_from_plain_store(self, store) -> None:
+        import io
+
+        import numpy as np
+
+        from py_code_mode.artifacts import view_artifact
+
+        buffer = io.BytesIO()
+        np.save(buffer, np.arange(6, dtype=np.int32).reshape(2, 3))
+        store.save("m.npy", buffer.getvalue())
+
+        assert view_artifact(store, "m.npy").tolist() == [[0, 1, 2], [3, 4, 5]]
+
+
+class TestArtifactViews:
+    """view() returns memory-mapped, read-only data instead of a copy."""
+
+    def test_view_maps_file_read_only(self, tmp_path: Path) -> None:
+        import mmap
+
+        store = FileArtifactStore(tmp_path)
+        store.save("blob.bin", b"\x00\x01" * 1000)
+
+        view = store.view("blob.bin")
+
+        assert isinstance(view.obj, mmap.mmap)
+        assert view.readonly
+        assert view[:4].tobytes() == b"\x00\x01\x00\x01"
+        assert len(view) == 2000
+
+    def test_view_npy_returns_memmap(self, tmp_path: Path) -> None:
+        import numpy as np
+
+        store = FileArtifactStore(tmp_path)
+        array = np.arange(1_000, dtype=np.float32).reshape(10, 100)
+        with store.open("inputs.npy", "wb") as f:
+            np.save(f, array)
+
+        viewed = store.view("inputs.npy")
+
+        assert isinstance(viewed, np.memmap)
+        assert not viewed.flags.writeable
+        np.testing.assert_array_equal(viewed, array)
+
+    def test_view_empty_and_missing(self, tmp_path: Path) -> None:
+        from py_code_mode.errors import ArtifactNotFoundError
+
+        store = FileArtifactStore(tmp_path)
+        store.save("empty.bin", b"")
+
+        assert store.view("empty.bin").tobytes() == b""
+        with pytest.raises(ArtifactNotFoundError):
+            store.view("missing.bin")
+
+    @pytest.mark.parametrize("fortran", [False, True])
+    def test_npy_view_shares_the_buffer(self, fortran: bool) -> None:
+        """npy_view parses only the header and wraps the rest without copying."""
+        import io
+
+        import numpy as np
+
+        from py_code_mode.artifacts import npy_view
+
+        array = np.arange(24, dtype=np.int16).reshape(2, 3, 4)
+        if fortran:
+            array = np.asfortranarray(array)
+        stream = io.BytesIO()
+        np.save(stream, array)
+        buffer = stream.getvalue()
+
+        viewed = npy_view(buffer)
+
+        np.testing.assert_array_equal(viewed, array)
+        assert not viewed.flags.owndata
+        assert not viewed.flags.writeable
+        with pytest.raises(ValueError, match="npy"):
+            npy_view(b"not an array")
+
+    @pytest.mark.benchmark
+    def test_benchmark_repeated_views_of_large_artifact(self, tmp_path: Path) -> None:
+        """Ten views of a 512MB artifact allocate nothing and beat a single load()."""
+        import time
+        import tracemalloc
+
+        import numpy as np
+
+        store = FileArtifactStore(tmp_path)
+        size = 512 * 1024 * 1024
+        with store.open("big.npy", "wb") as f:
+            np.save(f, np.ones(size // 8, dtype=np.float64))
+        with store.open("big.bin", "wb") as f:
+            for _ in range(size // (1 << 20)):
+                f.write(b"\x01" * (1 << 20))
+
+        start = time.perf_counter()
+        loaded = store.load("big.bin")
+        load_seconds = time.perf_counter() - start
+        del loaded
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        for _ in range(10):
+            assert store.view("big.bin")[size - 1] == 1
+            assert store.view("big.npy")[-1] == 1.0
+        view_seconds = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert peak < 1024 * 1024
+        assert view_seconds < load_seconds
+
+
+class TestArtifactCompression:
+    """compression= stores payloads compressed and decompresses transparently."""
+
+    ROWS = {"rows": [{"id": i, "status": "open", "owner": "scanner"} for i in range(500)]}
+
+    def test_json_is_stored_compact(self, tmp_path: Path) -> None:
+        store = FileArtifactStore(tmp_path)
+
+        store.save("data.json", {"a": [1, 2], "b": None})
+
+        assert (tmp_path / "data.json").read_text() == '{"a":[1,2],"b":null}'
+
+    @pytest.mark.parametrize(
+        "data", [ROWS, "log line\n" * 1000, b"\x00\x01" * 2000], ids=["json", "text", "bytes"]
+    )
+    def test_roundtrip_records_codec(self, tmp_path: Path, data: object) -> None:
+        import gzip
+
+        store = FileArtifactStore(tmp_path, compression="gzip")
+
+        store.save("artifact", data)  # type: ignore[arg-type]
+
+        raw = (tmp_path / "artifact").read_bytes()
+        assert gzip.decompress(raw)
+        assert store.get("artifact").metadata["_codec"] == "gzip"
+        assert store.load("artifact") == data
+        assert FileArtifactStore(tmp_path).load("artifact") == data
+
+    def test_small_and_incompressible_payloads_stay_raw(self, tmp_path: Path) -> None:
+        import os
+
+        store = FileArtifactStore(tmp_path, compression="gzip")
+        noise = os.urandom(4096)
+
+        store.save("small.txt", "hello")
+        store.save("noise.bin", noise)
+
+        assert (tmp_path / "small.txt").read_text() == "hello"
+        assert (tmp_path / "noise.bin").read_bytes() == noise
+        assert "_codec" not in store.get("small.txt").metadata
+        assert "_codec" not in store.get("noise.bin").metadata
+
+    def test_threshold_counts_encoded_bytes(self, tmp_path: Path) -> None:
+        """A string of multi-byte characters is measured in UTF-8 bytes."""
+        store = FileArtifactStore(tmp_path, compression="gzip", compression_threshold=1000)
+        text = "é" * 600  # 600 characters, 1200 bytes
+
+        store.save("accents.txt", text)
+
+        assert store.get("accents.txt").metadata["_codec"] == "gzip"
+        assert store.load("accents.txt") == text
+
+    def test_open_and_view_decompress(self, tmp_path: Path) -> None:
+        import io
+
+        import numpy as np
+
+        store = FileArtifactStore(tmp_path, compression="gzip")
+        stream = io.BytesIO()
+        np.save(stream, np.zeros(1000))
+        store.save("zeros.npy", stream.getvalue())
+        store.save("log.txt", "line\n" * 1000)
+
+        with store.open("log.txt", "rb") as f:
+            assert f.read() == b"line\n" * 1000
+        assert store.view("log.txt").tobytes() == b"line\n" * 1000
+        np.testing.assert_array_equal(store.view("zeros.npy"), np.zeros(1000))
+
+    def test_open_streams_without_decompressing_everything(self, tmp_path: Path) -> None:
+        """Reading a compressed artifact holds about one read's worth of data."""
+        import tracemalloc
+
+        from py_code_mode.artifacts import ARTIFACT_CHUNK_SIZE, DecompressingReader
+
+        store = FileArtifactStore(tmp_path, compression="gzip")
+        payload = bytes(range(256)) * 40_000  # ~10MB, compresses to a few KB
+        store.save("big.bin", payload)
+
+        tracemalloc.start()
+        try:
+            with store.open("big.bin", "rb") as f:
+                assert isinstance(f, DecompressingReader)
+                read = 0
+                while chunk := f.read(256 * 1024):
+                    assert chunk == payload[read : read + len(chunk)]
+                    read += len(chunk)
+                f.seek(3_000_000)
+                assert f.read(5) == payload[3_000_000:3_000_005]
+                assert f.tell() == 3_000_005
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert read == len(payload)
+        assert peak < 4 * ARTIFACT_CHUNK_SIZE
+
+    def test_zstd_falls_back_to_gzip_without_zstandard(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from py_code_mode.artifacts import base
+
+        monkeypatch.setattr(base, "zstandard", None)
+        store = FileArtifactStore(tmp_path, compression="zstd")
+
+        store.save("data.json", self.ROWS)
+
+        assert store.get("data.json").metadata["_codec"] == "gzip"
+
+    def test_zstd_roundtrip(self, tmp_path: Path) -> None:
+        pytest.importorskip("zstandard")
+        store = FileArtifactStore(tmp_path, compression="zstd")
+
+        store.save("data.json", self.ROWS)
+
+        assert store.get("data.json").metadata["_codec"] == "zstd"
+        assert store.load("data.json") == self.ROWS
+
+    def test_rejects_unknown_codec(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="compression"):
+            FileArtifactStore(tmp_path, compression="lz4")  # type: ignore[arg-type]
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("codec", ["gzip", "zstd"])
+    def test_benchmark_ratio_and_throughput(self, tmp_path: Path, codec: str) -> None:
+        """~15MB of JSON scan results: compression ratio and save/load MB/s."""
+        import time
+
+        if codec == "zstd":
+            pytest.importorskip("zstandard")
+        data = [
+            {"host": f"10.0.{i % 256}.{i // 256 % 256}", "port": 1000 + i % 2000, "state": "open"}
+            for i in range(300_000)
+        ]
+        size = len(json.dumps(data, separators=(",", ":")))
+        store = FileArtifactStore(tmp_path, compression=codec)  # type: ignore[arg-type]
+
+        start = time.perf_counter()
+        store.save("scan.json", data)
+        save_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        assert store.load("scan.json") == data
+        load_seconds = time.perf_counter() - start
+
+        ratio = size / (tmp_path / "scan.json").stat().st_size
+        save_mb_per_second = size / save_seconds / 1e6
+        load_mb_per_second = size / load_seconds / 1e6
+        assert ratio >= 5
+        assert save_mb_per_second >= 10
+        assert load_mb_per_second >= 10
+
+
+class TestContentAddressedArtifacts:
+    """content_addressed=True stores each distinct payload once, by SHA-256."""
+
+    @staticmethod
+    def _blobs(tmp_path: Path) -> list[Path]:
+        return [p for p in (tmp_path / ".blobs").rglob("*") if p.is_file()]
+
+    def test_identical_payloads_share_one_blob(self, tmp_path: Path) -> None:
+        import hashlib
+
+        store = FileArtifactStore(tmp_path, content_addressed=True)
+        data = {"hosts": ["10.0.0.1", "10.0.0.2"]}
+
+        first = store.save("session-a/hosts.json", data)
+        second = store.save("session-b/hosts.json", data)
+
+        digest = hashlib.sha256(b'{"hosts":["10.0.0.1","10.0.0.2"]}').hexdigest()
+        assert self._blobs(tmp_path) == [tmp_path / ".blobs" / digest[:2] / digest[2:]]
+        assert first.path == second.path == str(self._blobs(tmp_path)[0])
+        assert store.get("session-b/hosts.json").metadata["_blob"] == digest
+        assert store.load("session-a/hosts.json") == data
+        assert store.load("session-b/hosts.json") == data
+        assert not (tmp_path / "session-a").exists()
+
+    def test_existing_blob_is_not_rewritten(self, tmp_path: Path) -> None:
+        store = FileArtifactStore(tmp_path, content_addressed=True)
+        blob = Path(store.save("a.bin", b"payload" * 1000).path)
+        written = blob.stat()
+
+        store.save("b.bin", b"payload" * 1000)
+
+        assert blob.stat().st_ino == written.st_ino
+        assert blob.stat().st_mtime_ns == written.st_mtime_ns
+
+    def test_last_delete_collects_blob(self, tmp_path: Path) -> None:
+        store = FileArtifactStore(tmp_path, content_addressed=True)
+        store.save("a.txt", "shared")
+        store.save("b.txt", "shared")
+
+        store.delete("a.txt")
+        assert len(self._blobs(tmp_path)) == 1
+        assert store.load("b.txt") == "shared"
+
+        store.delete("b.txt")
+        assert self._blobs(tmp_path) == []
+
+    def test_overwrite_collects_unreferenced_blob(self, tmp_path: Path) -> None:
+        store = FileArtifactStore(tmp_path, content_addressed=True)
+        old = Path(store.save("a.txt", "old").path)
+
+        store.save("a.txt", "new")
+
+        assert not old.exists()
+        assert store.load("a.txt") == "new"
+        assert len(self._blobs(tmp_path)) == 1
+
+    def test_refcounts_are_shared_between_instances(self, tmp_path: Path) -> None:
+        """Reference counts come from the index, so any instance collects correctly."""
+        writer = FileArtifactStore(tmp_path, content_addressed=True)
+        other = FileArtifactStore(tmp_path, content_addressed=True)
+        writer.save("a.txt", "shared")
+        other.save("b.txt", "shared")
+
+        other.delete("a.txt")
+        assert writer.load("b.txt") == "shared"
+
+        FileArtifactStore(tmp_path).delete("b.txt")
+        assert self._blobs(tmp_path) == []
+
+    def test_streams_and_views_use_blobs(self, tmp_path: Path) -> None:
+        store = FileArtifactStore(tmp_path, content_addressed=True)
+        payload = bytes(range(256)) * 100
+        saved = store.save("saved.bin", payload)
+
+        with store.open("streamed.bin", "wb") as f:
+            f.write(payload)
+
+        assert f.artifact is not None
+        assert f.artifact.path == saved.path
+        assert len(self._blobs(tmp_path)) == 1
+        assert store.open("streamed.bin", "rb").read() == payload
+        assert store.view("streamed.bin").tobytes() == payload
+        assert not list((tmp_path / ".blobs").glob("*.tmp"))
+
+    def test_replaces_plain_file_of_earlier_save(self, tmp_path: Path) -> None:
+        FileArtifactStore(tmp_path).save("a.txt", "plain")
+
+        FileArtifactStore(tmp_path, content_addressed=True).save("a.txt", "plain")
+
+        assert not (tmp_path / "a.txt").exists()
+        assert FileArtifactStore(tmp_path).load("a.txt") == "plain"
+
+    def test_names_cannot_point_into_blobs(self, tmp_path: Path) -> None:
+        store = FileArtifactStore(tmp_path, content_addressed=True)
+
+        with pytest.raises(ValueError, match="blobs"):
+            store.save(".blobs/ab/cdef", b"clobber")
+
+    @pytest.mark.benchmark
+    def test_benchmark_repeated_payload_saves(self, tmp_path: Path) -> None:
+        """500 saves of one 1MB response: bytes stored and bytes written vs named files."""
+        io_stats = Path("/proc/self/io")
+        if not io_stats.exists():
+            pytest.skip("needs /proc/self/io")
+
+        def written() -> int:
+            fields = dict(line.split(": ") for line in io_stats.read_text().splitlines())
+            return int(fields["wchar"])
+
+        payload = bytes(range(256)) * 4096
+
+        def run(store: FileArtifactStore) -> int:
+            before = written()
+            for i in range(500):
+                store.save(f"session-{i}/response.bin", payload)
+            return written() - before
+
+        plain_written = run(FileArtifactStore(tmp_path / "plain"))
+        deduped_written = run(FileArtifactStore(tmp_path / "cas", content_addressed=True))
+
+        stored = sum(p.stat().st_size for p in self._blobs(tmp_path / "cas"))
+        assert stored == len(payload)
+        assert plain_written >= 500 * len(payload)
+        assert deduped_written < 2 * len(payload)
+
+
 class TestArtifactStoreFileAccess:
     """Tests for raw file access patterns."""
 
@@ -711,6 +711,67 @@ class TestFileStorageBootstrapConfig:
         assert skill is not None
         assert skill.name == "greet"
 
+    @pytest.mark.asyncio
+    async def test_config_roundtrip_keeps_artifact_compression(self, tmp_path: Path) -> None:
+        """Artifacts saved in a bootstrapped subprocess are compressed too.
+
+        Breaks when: artifact_compression is dropped from the config.
+        """
+        from py_code_mode.bootstrap import bootstrap_namespaces
+        from py_code_mode.storage import FileStorage
+
+        storage = FileStorage(tmp_path, artifact_compression="gzip")
+
+        config = storage.to_bootstrap_config()
+        bundle = await bootstrap_namespaces(config)
+        artifact = bundle.artifacts.save("report.txt", "x" * 10_000)
+
+        assert config["artifact_compression"] == "gzip"
+        assert artifact.metadata == {}
+        assert bundle.artifacts.get("report.txt").metadata["_codec"] == "gzip"
+        assert storage.get_artifact_store().load("report.txt") == "x" * 10_000
+
+    @pytest.mark.asyncio
+    async def test_config_roundtrip_keeps_content_addressing(self, tmp_path: Path) -> None:
+        """Artifacts saved in a bootstrapped subprocess share blobs too.
+
+        Breaks when: content_addressed_artifacts is dropped from the config.
+        """
+        from py_code_mode.bootstrap import bootstrap_namespaces
+        from py_code_mode.storage import FileStorage
+
+        storage = FileStorage(tmp_path, content_addressed_artifacts=True)
+        storage.get_artifact_store().save("a.txt", "shared")
+
+        bundle = await bootstrap_namespaces(storage.to_bootstrap_config())
+        bundle.artifacts.save("b.txt", "shared")
+
+        assert bundle.artifacts.get("b.txt").path == storage.get_artifact_store().get("a.txt").path
+
+    def test_to_bootstrap_config_includes_vector_index(self, tmp_path: Path) -> None:
+        """A non-default vector_index is serialized; the default is left out."""
+        from py_code_mode.storage import FileStorage
+
+        assert "vector_index" not in FileStorage(tmp_path).to_bootstrap_config()
+        config = FileStorage(tmp_path, vector_index="numpy").to_bootstrap_config()
+        assert config["vector_index"] == "numpy"
+
+    @pytest.mark.asyncio
+    async def test_config_roundtrip_keeps_vector_index(self, tmp_path: Path) -> None:
+        """A bootstrapped subprocess indexes skills with the same vector store.
+
+        Breaks when: vector_index is dropped from the config or from bootstrap.
+        """
+        from py_code_mode.bootstrap import bootstrap_namespaces
+        from py_code_mode.skills.vector_stores.numpy_store import NumpyVectorStore
+        from py_code_mode.storage import FileStorage
+
+        storage = FileStorage(tmp_path, vector_index="numpy")
+
+        bundle = await bootstrap_namespaces(storage.to_bootstrap_config())
+
+        assert isinstance(bundle.skills.library.vector_store, NumpyVectorStore)
+
 
 # =============================================================================
 # RedisStorage.to_bootstrap_config() Tests
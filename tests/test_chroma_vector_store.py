@@ -328,6 +328,46 @@ class TestChromaVectorStoreCRUD:
 
         assert store.count() == 0
 
+    def test_add_many_indexes_in_batches(self, store, mock_embedder) -> None:
+        """add_many() embeds new skills in batches and stores their hashes."""
+        from unittest.mock import patch
+
+        from py_code_mode.skills.vector_store import BatchVectorStore, VectorEntry
+
+        assert isinstance(store, BatchVectorStore)
+        entries = [VectorEntry(f"skill{i}", f"desc{i}", f"code{i}", f"hash{i}") for i in range(5)]
+
+        with patch.object(mock_embedder, "embed", wraps=mock_embedder.embed) as embed:
+            assert store.add_many(entries, batch_size=4) == 5
+
+        # 10 texts (description + code per skill) in batches of 4
+        assert [len(c.args[0]) for c in embed.call_args_list] == [4, 4, 2]
+        assert store.count() == 5
+        assert store.get_content_hash("skill3") == "hash3"
+
+    def test_add_many_skips_unchanged_skills(self, store, mock_embedder) -> None:
+        """add_many() only re-embeds skills whose content hash changed."""
+        from unittest.mock import patch
+
+        from py_code_mode.skills.vector_store import VectorEntry
+
+        store.add_many(
+            [VectorEntry(f"skill{i}", f"desc{i}", f"code{i}", f"hash{i}") for i in range(3)]
+        )
+        entries = [
+            VectorEntry("skill0", "desc0", "code0", "hash0"),
+            VectorEntry("skill1", "new desc", "code1", "hash1b"),
+            VectorEntry("skill3", "desc3", "code3", "hash3"),
+        ]
+
+        with patch.object(mock_embedder, "embed", wraps=mock_embedder.embed) as embed:
+            assert store.add_many(entries) == 2
+
+        assert embed.call_count == 1
+        assert sorted(embed.call_args.args[0]) == sorted(["new desc", "code1", "desc3", "code3"])
+        assert store.count() == 4
+        assert store.get_content_hash("skill1") == "hash1b"
+
 
 class TestChromaVectorStoreSimilaritySearch:
     """Tests for semantic similarity search."""
@@ -0,0 +1,222 @@
+"""Tests for the on-disk EmbeddingCache and its SkillLibrary integration."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from py_code_mode.skills import (
+    EmbeddingCache,
+    FileSkillStore,
+    MockEmbedder,
+    PythonSkill,
+    SkillLibrary,
+    compute_content_hash,
+)
+
+
+def _make_skill(name: str, description: str) -> PythonSkill:
+    source = f'"""{description}"""\n\nasync def run():\n    return {name!r}'
+    return PythonSkill.from_source(name=name, source=source, description=description)
+
+
+class TestEmbeddingCache:
+    """Storage and lookup of cached vector pairs."""
+
+    def test_get_returns_stored_pairs(self, tmp_path: Path) -> None:
+        """Stored vectors come back as float32 arrays keyed by content hash."""
+        cache = EmbeddingCache(tmp_path / "cache")
+        cache.put_many("model", 3, {"h1": ([1.0, 0.0, 0.0], [0.0, 1.0, 0.0])})
+
+        found = cache.get_many("model", 3, ["h1", "missing"])
+
+        assert list(found) == ["h1"]
+        desc, code = found["h1"]
+        assert desc.dtype == np.float32
+        assert desc.tolist() == [1.0, 0.0, 0.0]
+        assert code.tolist() == [0.0, 1.0, 0.0]
+
+    def test_empty_cache_returns_nothing(self, tmp_path: Path) -> None:
+        """A cache with no files is simply empty."""
+        cache = EmbeddingCache(tmp_path / "cache")
+
+        assert cache.get_many("model", 3, ["h1"]) == {}
+        assert not (tmp_path / "cache").exists()
+
+    def test_entries_are_keyed_by_model_and_dimension(self, tmp_path: Path) -> None:
+        """Vectors from one model are never returned for another."""
+        cache = EmbeddingCache(tmp_path / "cache")
+        cache.put_many("org/model-a", 2, {"h1": ([1.0, 0.0], [0.0, 1.0])})
+
+        assert cache.get_many("org/model-b", 2, ["h1"]) == {}
+        assert cache.get_many("org/model-a", 4, ["h1"]) == {}
+        assert "h1" in cache.get_many("org/model-a", 2, ["h1"])
+
+    def test_appends_and_persists_across_instances(self, tmp_path: Path) -> None:
+        """Writes from one instance are visible to another, and rows are appended."""
+        writer = EmbeddingCache(tmp_path / "cache")
+        reader = EmbeddingCache(tmp_path / "cache")
+        writer.put_many("model", 2, {"h1": ([1.0, 0.0], [0.0, 1.0])})
+        assert "h1" in reader.get_many("model", 2, ["h1"])
+
+        writer.put_many("model", 2, {"h2": ([0.5, 0.5], [0.2, 0.8])})
+        found = reader.get_many("model", 2, ["h1", "h2"])
+
+        assert found["h1"][0].tolist() == [1.0, 0.0]
+        assert found["h2"][1].tolist() == pytest.approx([0.2, 0.8])
+
+    def test_append_leaves_existing_segments_untouched(self, tmp_path: Path) -> None:
+        """A write adds one new segment instead of rewriting what is cached."""
+        cache = EmbeddingCache(tmp_path / "cache")
+        cache.put_many("model", 2, {"h1": ([1.0, 0.0], [0.0, 1.0])})
+        [first] = list((tmp_path / "cache").rglob("seg-*.npy"))
+        before = first.stat().st_mtime_ns
+
+        cache.put_many("model", 2, {"h1": ([1.0, 0.0], [0.0, 1.0]), "h2": ([0.0, 1.0], [1.0, 0.0])})
+
+        segments = list((tmp_path / "cache").rglob("seg-*.npy"))
+        assert len(segments) == 2
+        assert first.stat().st_mtime_ns == before
+        assert np.load(next(p for p in segments if p != first)).shape == (1, 2, 2)
+
+    def test_compact_keeps_only_live_rows(self, tmp_path: Path) -> None:
+        """Compaction merges segments and drops hashes that are no longer live."""
+        cache = EmbeddingCache(tmp_path / "cache")
+        reader = EmbeddingCache(tmp_path / "cache")
+        for i in range(4):
+            cache.put_many("model", 2, {f"h{i}": ([float(i), 0.0], [0.0, float(i)])})
+        assert len(reader.get_many("model", 2, ["h0", "h1", "h2", "h3"])) == 4
+
+        dropped = cache.compact("model", 2, {"h3"})
+
+        assert dropped == 3
+        assert len(list((tmp_path / "cache").rglob("seg-*.npy"))) == 1
+        found = reader.get_many("model", 2, ["h0", "h1", "h2", "h3"])
+        assert list(found) == ["h3"]
+        assert found["h3"][1].tolist() == [0.0, 3.0]
+
+    def test_compact_skips_mostly_live_cache(self, tmp_path: Path) -> None:
+        """A few dead rows are not worth a rewrite."""
+        cache = EmbeddingCache(tmp_path / "cache")
+        cache.put_many("model", 2, {f"h{i}": ([1.0, 0.0], [0.0, 1.0]) for i in range(4)})
+
+        assert cache.compact("model", 2, {"h0", "h1", "h2"}) == 0
+        assert "h3" in cache.get_many("model", 2, ["h3"])
+
+    def test_write_failure_is_logged_not_raised(self, tmp_path: Path) -> None:
+        """An unwritable cache location degrades to no caching."""
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_text("")
+        cache = EmbeddingCache(blocker / "cache")
+
+        cache.put_many("model", 2, {"h1": ([1.0, 0.0], [0.0, 1.0])})
+
+        assert cache.get_many("model", 2, ["h1"]) == {}
+
+
+class TestSkillLibraryEmbeddingCache:
+    """SkillLibrary reuses cached vectors instead of re-embedding."""
+
+    def test_warm_start_embeds_nothing(self, tmp_path: Path) -> None:
+        """A second library over the same skills loads every vector from the cache."""
+        store = FileSkillStore(tmp_path / "skills")
+        for i in range(5):
+            store.save(_make_skill(f"skill_{i}", f"Skill number {i}"))
+        cache_path = tmp_path / "embeddings"
+        cold = SkillLibrary(
+            embedder=MockEmbedder(dimension=16),
+            store=store,
+            embedding_cache=EmbeddingCache(cache_path),
+        )
+
+        embedder = MockEmbedder(dimension=16)
+        with patch.object(embedder, "embed", wraps=embedder.embed) as embed:
+            warm = SkillLibrary(
+                embedder=embedder, store=store, embedding_cache=EmbeddingCache(cache_path)
+            )
+
+        embed.assert_not_called()
+        assert len(warm) == 5
+        assert warm._description_vectors["skill_3"].tolist() == pytest.approx(
+            cold._description_vectors["skill_3"].tolist()
+        )
+
+    def test_only_new_skills_are_embedded(self, tmp_path: Path) -> None:
+        """Skills missing from the cache are embedded and written back."""
+        store = FileSkillStore(tmp_path / "skills")
+        store.save(_make_skill("old", "Old skill"))
+        cache = EmbeddingCache(tmp_path / "embeddings")
+        SkillLibrary(embedder=MockEmbedder(dimension=16), store=store, embedding_cache=cache)
+        store.save(_make_skill("new", "New skill"))
+
+        embedder = MockEmbedder(dimension=16)
+        with patch.object(embedder, "embed", wraps=embedder.embed) as embed:
+            SkillLibrary(embedder=embedder, store=store, embedding_cache=cache)
+
+        assert embed.call_count == 1
+        assert sorted(embed.call_args.args[0]) == sorted(["New skill", store.load("new").source])
+        new = store.load("new")
+        content_hash = compute_content_hash(new.description, new.source)
+        assert content_hash in cache.get_many("MockEmbedder", 16, [content_hash])
+
+    def test_refresh_compacts_deleted_skills(self, tmp_path: Path) -> None:
+        """Vectors of deleted skills are evicted from the cache on refresh."""
+        store = FileSkillStore(tmp_path / "skills")
+        skills = [_make_skill(f"skill_{i}", f"Skill number {i}") for i in range(4)]
+        for skill in skills:
+            store.save(skill)
+        cache = EmbeddingCache(tmp_path / "embeddings")
+        library = SkillLibrary(
+            embedder=MockEmbedder(dimension=16), store=store, embedding_cache=cache
+        )
+        for skill in skills[1:]:
+            store.delete(skill.name)
+
+        library.refresh()
+
+        hashes = [compute_content_hash(s.description, s.source) for s in skills]
+        assert list(cache.get_many("MockEmbedder", 16, hashes)) == hashes[:1]
+
+    def test_warm_start_does_not_load_model(self, tmp_path: Path) -> None:
+        """With every skill cached, the sentence-transformers model stays unloaded."""
+        from py_code_mode.skills import Embedder
+
+        store = FileSkillStore(tmp_path / "skills")
+        skill = _make_skill("greet", "Greet someone")
+        store.save(skill)
+        cache = EmbeddingCache(tmp_path / "embeddings")
+        content_hash = compute_content_hash(skill.description, skill.source)
+        vector = [1.0] + [0.0] * 383
+        cache.put_many("BAAI/bge-small-en-v1.5", 384, {content_hash: (vector, vector)})
+
+        embedder = Embedder("bge-small")
+        library = SkillLibrary(embedder=embedder, store=store, embedding_cache=cache)
+
+        assert len(library) == 1
+        assert embedder._model is None
+
+
+class TestFileStorageEmbeddingCache:
+    """FileStorage enables the cache when no vector store is available."""
+
+    def test_skill_library_uses_cache_without_vector_store(self, tmp_path: Path) -> None:
+        from py_code_mode.storage import FileStorage
+
+        storage = FileStorage(tmp_path)
+        with patch.object(storage, "get_vector_store", return_value=None):
+            library = storage.get_skill_library()
+
+        assert library.embedding_cache is not None
+        assert library.embedding_cache.path == tmp_path / "embeddings"
+
+    def test_skill_library_skips_cache_with_vector_store(self, tmp_path: Path) -> None:
+        from py_code_mode.storage import FileStorage
+
+        storage = FileStorage(tmp_path)
+        with patch.object(storage, "get_vector_store", return_value=object()):
+            library = storage.get_skill_library()
+
+        assert library.embedding_cache is None
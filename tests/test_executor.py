@@ -300,3 +300,77 @@ with open(p / "raw.txt", "w") as f:
 
         assert result.value == "raw content"
         assert (tmp_path / "raw.txt").exists()
+
+
+class TestExecutorStreaming:
+    """Tests for run_stream() - output delivered while code runs."""
+
+    @pytest.fixture
+    def executor(self) -> InProcessExecutor:
+        return InProcessExecutor(default_timeout=5.0)
+
+    @pytest.mark.asyncio
+    async def test_stdout_arrives_before_code_finishes(self, executor: InProcessExecutor) -> None:
+        """The first print is delivered while the code is still running."""
+        import time
+
+        from py_code_mode import ResultEvent, StdoutEvent
+
+        start = time.perf_counter()
+        first_output_at = None
+        events = []
+        async for event in executor.run_stream(
+            "import time\nprint('first')\ntime.sleep(0.5)\nprint('second')\n42"
+        ):
+            if isinstance(event, StdoutEvent) and first_output_at is None:
+                first_output_at = time.perf_counter() - start
+            events.append(event)
+        total = time.perf_counter() - start
+
+        assert first_output_at is not None
+        assert first_output_at < total - 0.3
+        stdout = "".join(e.text for e in events if isinstance(e, StdoutEvent))
+        assert stdout == "first\nsecond\n"
+        assert isinstance(events[-1], ResultEvent)
+        assert events[-1].result.value == 42
+        assert events[-1].result.stdout == stdout
+
+    @pytest.mark.asyncio
+    async def test_stderr_arrives_as_stderr_events(self, executor: InProcessExecutor) -> None:
+        """Writes to sys.stderr stream as StderrEvent, separately from stdout."""
+        from py_code_mode import StderrEvent, StdoutEvent
+
+        events = [
+            e
+            async for e in executor.run_stream(
+                "import sys\nprint('out')\nprint('warn', file=sys.stderr)\n1"
+            )
+        ]
+
+        stderr = "".join(e.text for e in events if isinstance(e, StderrEvent))
+        stdout = "".join(e.text for e in events if isinstance(e, StdoutEvent))
+        assert stderr == "warn\n"
+        assert stdout == "out\n"
+        assert events[-1].result.stdout == "out\n"
+
+    @pytest.mark.asyncio
+    async def test_error_ends_with_error_event(self, executor: InProcessExecutor) -> None:
+        """A failing run ends with an ErrorEvent after any output."""
+        from py_code_mode import ErrorEvent, StdoutEvent
+
+        events = [e async for e in executor.run_stream("print('before')\n1 / 0")]
+
+        assert events[0] == StdoutEvent("before")
+        assert isinstance(events[-1], ErrorEvent)
+        assert "ZeroDivisionError" in events[-1].error
+
+    @pytest.mark.asyncio
+    async def test_timeout_ends_with_error_event(self, executor: InProcessExecutor) -> None:
+        """A run that exceeds the timeout ends with an ErrorEvent."""
+        from py_code_mode import ErrorEvent
+
+        events = [e async for e in executor.run_stream("import time; time.sleep(5)", timeout=0.1)]
+
+        assert len(events) == 1
+        assert isinstance(events[0], ErrorEvent)
+        assert "timeout" in events[0].error.lower()
@@ -0,0 +1,297 @@
+"""Tests for KernelPool - pre-warmed kernels for SubprocessExecutor."""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from py_code_mode.execution.subprocess import pool as pool_module
+from py_code_mode.execution.subprocess.config import SubprocessConfig
+from py_code_mode.execution.subprocess.pool import KernelPool
+from py_code_mode.execution.subprocess.venv import KernelVenv
+
+
+class FakeKernelHost:
+    """Stands in for KernelHost without launching a kernel."""
+
+    startup_delay = 0.01
+    fail_start = False
+    instances: list["FakeKernelHost"] = []
+
+    def __init__(self) -> None:
+        self.provider: Any = "unset"
+        self.alive = False
+        self.shutdown_called = False
+        FakeKernelHost.instances.append(self)
+
+    async def start(self, provider: Any, kernel_name: str, **kwargs: Any) -> None:
+        await asyncio.sleep(self.startup_delay)
+        if self.fail_start:
+            raise RuntimeError("kernel failed to start")
+        self.provider = provider
+        self.alive = True
+
+    def set_provider(self, provider: Any) -> None:
+        self.provider = provider
+
+    async def shutdown(self) -> None:
+        self.alive = False
+        self.shutdown_called = True
+
+    async def check_alive(self) -> bool:
+        return self.alive
+
+
+class FakeVenvManager:
+    """Stands in for VenvManager without creating a venv."""
+
+    cleaned: list[KernelVenv] = []
+
+    def __init__(self, config: SubprocessConfig) -> None:
+        self.config = config
+
+    async def create(self) -> KernelVenv:
+        return KernelVenv(
+            path=Path("/fake/venv"),
+            python_path=Path("/fake/venv/bin/python"),
+            kernel_spec_name="fake-kernel",
+        )
+
+    async def cleanup(self, venv: KernelVenv) -> None:
+        FakeVenvManager.cleaned.append(venv)
+
+
+@pytest.fixture
+def fake_kernels(monkeypatch: pytest.MonkeyPatch) -> type[FakeKernelHost]:
+    """Patch KernelPool to use fake kernels and venvs."""
+    FakeKernelHost.instances = []
+    FakeKernelHost.startup_delay = 0.01
+    FakeKernelHost.fail_start = False
+    FakeVenvManager.cleaned = []
+    monkeypatch.setattr(pool_module, "KernelHost", FakeKernelHost)
+    monkeypatch.setattr(pool_module, "VenvManager", FakeVenvManager)
+    return FakeKernelHost
+
+
+async def wait_for(predicate: Any, timeout: float = 2.0) -> None:
+    """Poll until predicate() is true."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met before timeout")
+        await asyncio.sleep(0.005)
+
+
+class TestKernelPoolValidation:
+    """Tests for KernelPool argument validation."""
+
+    def test_rejects_negative_min_size(self) -> None:
+        with pytest.raises(ValueError, match="min_size"):
+            KernelPool(min_size=-1)
+
+    def test_rejects_zero_max_size(self) -> None:
+        with pytest.raises(ValueError, match="max_size"):
+            KernelPool(min_size=0, max_size=0)
+
+    def test_rejects_min_above_max(self) -> None:
+        with pytest.raises(ValueError, match="cannot exceed"):
+            KernelPool(min_size=3, max_size=2)
+
+    def test_rejects_non_positive_idle_timeout(self) -> None:
+        with pytest.raises(ValueError, match="idle_timeout"):
+            KernelPool(idle_timeout=0)
+
+    def test_executor_rejects_config_that_differs_from_pool(self) -> None:
+        from py_code_mode.execution.subprocess import SubprocessExecutor
+
+        pool = KernelPool(SubprocessConfig(startup_timeout=10.0, allow_runtime_deps=False))
+        with pytest.raises(ValueError, match="kernel_pool.config"):
+            SubprocessExecutor(
+                config=SubprocessConfig(startup_timeout=20.0, allow_runtime_deps=False),
+                kernel_pool=pool,
+            )
+
+    def test_executor_accepts_matching_config_or_uses_pools(self) -> None:
+        from py_code_mode.execution.subprocess import SubprocessExecutor
+
+        config = SubprocessConfig(startup_timeout=10.0, allow_runtime_deps=False)
+        pool = KernelPool(config)
+
+        assert SubprocessExecutor(
+            config=SubprocessConfig(startup_timeout=10.0, allow_runtime_deps=False),
+            kernel_pool=pool,
+        )
+        assert SubprocessExecutor(kernel_pool=pool)._config is config
+
+    def test_executor_rejects_pool_allowing_runtime_deps(self) -> None:
+        """Pooled kernels share a venv, so runtime installs would leak between sessions."""
+        from py_code_mode.execution.subprocess import SubprocessExecutor
+
+        pool = KernelPool(SubprocessConfig(allow_runtime_deps=True))
+
+        with pytest.raises(ValueError, match="allow_runtime_deps=False"):
+            SubprocessExecutor(kernel_pool=pool)
+
+
+class TestKernelPoolSizing:
+    """Tests for warm-up, checkout, growth and eviction using fake kernels."""
+
+    @pytest.mark.asyncio
+    async def test_start_warms_min_size_kernels(self, fake_kernels) -> None:
+        pool = KernelPool(SubprocessConfig(), min_size=2, max_size=4)
+        await pool.start()
+        try:
+            await wait_for(lambda: pool.ready_count == 2)
+            assert pool.starting_count == 0
+            assert all(host.provider is None for host in fake_kernels.instances)
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_returns_ready_kernel_and_binds_provider(self, fake_kernels) -> None:
+        pool = KernelPool(SubprocessConfig(), min_size=1, max_size=2)
+        await pool.start()
+        try:
+            await wait_for(lambda: pool.ready_count == 1)
+            warmed = fake_kernels.instances[0]
+
+            host = await pool.acquire("provider")
+
+            assert host is warmed
+            assert host.provider == "provider"
+            # Pool replenishes in the background
+            await wait_for(lambda: pool.ready_count == 1)
+            assert len(fake_kernels.instances) == 2
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_cold_starts_when_empty_and_grows_target(self, fake_kernels) -> None:
+        pool = KernelPool(SubprocessConfig(), min_size=0, max_size=2, idle_timeout=None)
+        await pool.start()
+        try:
+            assert pool.ready_count == 0
+
+            host = await pool.acquire("provider")
+
+            assert host.alive
+            await wait_for(lambda: pool.ready_count == 1)
+
+            # Target never exceeds max_size
+            await pool.acquire("provider")
+            await pool.acquire("provider")
+            await wait_for(lambda: pool.ready_count == 2)
+            assert pool.ready_count + pool.starting_count <= 2
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_acquire_skips_dead_kernels(self, fake_kernels) -> None:
+        pool = KernelPool(SubprocessConfig(), min_size=1, max_size=1, idle_timeout=None)
+        await pool.start()
+        try:
+            await wait_for(lambda: pool.ready_count == 1)
+            dead = fake_kernels.instances[0]
+            dead.alive = False
+
+            host = await pool.acquire("provider")
+
+            assert host is not dead
+            assert host.alive
+            assert dead.shutdown_called
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_warm_up_does_not_fill_pool(self, fake_kernels) -> None:
+        fake_kernels.fail_start = True
+        pool = KernelPool(SubprocessConfig(), min_size=1, max_size=1, idle_timeout=None)
+        await pool.start()
+        try:
+            await wait_for(lambda: pool.starting_count == 0)
+            assert pool.ready_count == 0
+
+            with pytest.raises(RuntimeError, match="failed to start"):
+                await pool.acquire("provider")
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_kernels_evicted_down_to_min_size(self, fake_kernels) -> None:
+        pool = KernelPool(SubprocessConfig(), min_size=1, max_size=3, idle_timeout=0.05)
+        await pool.start()
+        try:
+            # Simulate a burst that grew the pool to max_size
+            pool._target = 3
+            pool._replenish()
+            await wait_for(lambda: pool.ready_count == 3)
+
+            await wait_for(lambda: pool.ready_count == 1, timeout=1.0)
+            assert pool.starting_count == 0
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_close_shuts_down_ready_kernels_but_not_checked_out(self, fake_kernels) -> None:
+        pool = KernelPool(SubprocessConfig(cache_venv=False), min_size=2, max_size=2)
+        await pool.start()
+        await wait_for(lambda: pool.ready_count == 2)
+        checked_out = await pool.acquire("provider")
+
+        await pool.close()
+
+        assert not checked_out.shutdown_called
+        assert pool.ready_count == 0
+        assert all(h.shutdown_called for h in fake_kernels.instances if h is not checked_out)
+        assert len(FakeVenvManager.cleaned) == 1
+
+        with pytest.raises(RuntimeError, match="closed"):
+            await pool.acquire("provider")
+
+
+@pytest.mark.slow
+@pytest.mark.xdist_group("subprocess")
+class TestKernelPoolIntegration:
+    """KernelPool with real kernels backing SubprocessExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_pooled_executor_starts_without_kernel_launch(self, tmp_path: Path) -> None:
+        """start() checks out the pre-warmed kernel instead of launching one."""
+        from py_code_mode.execution.subprocess import SubprocessExecutor
+
+        config = SubprocessConfig(
+            python_version="3.12",
+            venv_path=tmp_path / "venv",
+            base_deps=("ipykernel",),
+            allow_runtime_deps=False,
+        )
+        async with KernelPool(config, min_size=1, max_size=2) as pool:
+            await wait_for(lambda: pool.ready_count == 1, timeout=60.0)
+
+            executor = SubprocessExecutor(kernel_pool=pool)
+            await executor.start()
+            # The warm kernel was handed over rather than a new one launched
+            assert pool.ready_count == 0
+            try:
+                result = await executor.run("x = 40 + 2\nx")
+                assert result.error is None
+                assert result.value == 42
+                assert "tools" in (await executor.run("dir()")).value
+            finally:
+                await executor.close()
+
+            # Kernels are single-use: the next session gets a fresh namespace
+            await wait_for(lambda: pool.ready_count == 1, timeout=60.0)
+            executor = SubprocessExecutor(kernel_pool=pool)
+            await executor.start()
+            try:
+                result = await executor.run("'x' in dir()")
+                assert result.value is False
+            finally:
+                await executor.close()
+
+            # The pool's venv survives executor close
+            assert pool.venv is not None
+            assert pool.venv.path.exists()
@@ -0,0 +1,74 @@
+"""Tests for the BM25 index and reciprocal-rank fusion."""
+
+from __future__ import annotations
+
+from py_code_mode.skills.lexical import BM25Index, reciprocal_rank_fusion, tokenize
+
+
+class TestTokenize:
+    def test_splits_identifiers_and_keeps_whole(self) -> None:
+        """snake_case and camelCase identifiers match whole and by part."""
+        assert tokenize("github_stars") == ["github_stars", "github", "stars"]
+        assert tokenize("fetchURL") == ["fetchurl", "fetch", "url"]
+
+    def test_lowercases_and_drops_punctuation(self) -> None:
+        assert tokenize("Scan ports, (fast)!") == ["scan", "ports", "fast"]
+
+
+class TestBM25Index:
+    def test_rare_exact_term_ranks_first(self) -> None:
+        """A term found in one document outweighs common terms."""
+        index = BM25Index()
+        index.set("nmap", tokenize("nmap network scanner"))
+        index.set("curl", tokenize("http client for network requests"))
+        index.set("ping", tokenize("network reachability check"))
+
+        ranked = index.search("nmap network", limit=3)
+
+        assert [doc for doc, _ in ranked][0] == "nmap"
+        assert len(ranked) == 3
+
+    def test_only_matching_documents_are_returned(self) -> None:
+        index = BM25Index()
+        index.set("a", ["alpha"])
+        index.set("b", ["beta"])
+
+        assert [doc for doc, _ in index.search("alpha gamma", limit=10)] == ["a"]
+        assert index.search("gamma", limit=10) == []
+
+    def test_set_replaces_and_remove_drops(self) -> None:
+        """Updates are incremental: old terms stop matching after set()."""
+        index = BM25Index()
+        index.set("a", ["alpha"])
+        index.set("a", ["beta"])
+
+        assert index.search("alpha", limit=10) == []
+        assert [doc for doc, _ in index.search("beta", limit=10)] == ["a"]
+        assert index.remove("a") is True
+        assert index.remove("a") is False
+        assert len(index) == 0
+        assert index._postings == {}
+
+    def test_shorter_document_wins_on_equal_frequency(self) -> None:
+        index = BM25Index()
+        index.set("short", ["deploy", "app"])
+        index.set("long", ["deploy", "app", "with", "many", "extra", "words", "here"])
+
+        assert [doc for doc, _ in index.search("deploy", limit=2)] == ["short", "long"]
+
+
+class TestReciprocalRankFusion:
+    def test_items_ranked_well_by_both_lists_win(self) -> None:
+        fused = reciprocal_rank_fusion([(["a", "b", "c"], 1.0), (["c", "b", "d"], 1.0)])
+
+        assert fused == ["c", "b", "a", "d"]
+
+    def test_weights_favor_one_ranking(self) -> None:
+        fused = reciprocal_rank_fusion([(["a", "b"], 1.0), (["b", "a"], 3.0)])
+
+        assert fused == ["b", "a"]
+
+    def test_ties_keep_first_ranking_order(self) -> None:
+        fused = reciprocal_rank_fusion([(["a"], 1.0), (["b"], 1.0)])
+
+        assert fused == ["a", "b"]
@@ -11,6 +11,7 @@ Tests cover:
 - Negative tests (error handling)
 """
 
+import asyncio
 import json
 from pathlib import Path
 
@@ -1189,6 +1190,40 @@ class TestMCPServerNegative:
                 result2 = await session.call_tool("run_code", {"code": "2 + 2"})
                 assert "4" in result2.content[0].text
 
+    @pytest.mark.asyncio
+    async def test_mcp_server_run_code_reports_output_progress(
+        self,
+        mcp_storage_dir: tuple[Path, Path],
+    ) -> None:
+        """E2E: run_code sends output as progress notifications while running."""
+        from mcp import ClientSession
+        from mcp.client.stdio import stdio_client
+
+        storage_path, tools_path = mcp_storage_dir
+        server_params = StdioServerParameters(
+            command="py-code-mode-mcp",
+            args=["--storage", str(storage_path), "--tools", str(tools_path)],
+        )
+        messages: list[str] = []
+
+        async def on_progress(progress: float, total: float | None, message: str | None) -> None:
+            if message:
+                messages.append(message)
+
+        async with stdio_client(server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+
+                result = await session.call_tool(
+                    "run_code",
+                    {"code": "for i in range(3): print(f'step {i}', flush=True)"},
+                    progress_callback=on_progress,
+                )
+
+                assert "step 2" in result.content[0].text
+                assert "step 0" in "".join(messages)
+                assert "step 2" in "".join(messages)
+
     @pytest.mark.asyncio
     async def test_mcp_server_invoke_nonexistent_skill(
         self,
@@ -1690,3 +1725,86 @@ class TestMCPServerDepsToolsSessionNotInitialized:
             assert "error" in result
         finally:
             mcp_server._session = original_session
+
+
+class TestMCPServerRunCodeProgress:
+    """Tests for run_code progress notifications, via the in-memory client."""
+
+    @pytest.mark.asyncio
+    async def test_run_code_reports_output_as_progress(self, tmp_path: Path) -> None:
+        """run_code forwards output chunks as progress messages while it runs.
+
+        Breaks when: Output is only delivered in the final tool result.
+        """
+        from fastmcp import Client
+
+        from py_code_mode import FileStorage, Session
+        from py_code_mode.cli import mcp_server
+        from py_code_mode.execution.in_process import InProcessExecutor
+
+        messages: list[str] = []
+
+        async def on_progress(progress: float, total: float | None, message: str | None) -> None:
+            if message:
+                messages.append(message)
+
+        original_session = mcp_server._session
+        try:
+            async with Session(
+                storage=FileStorage(tmp_path), executor=InProcessExecutor()
+            ) as session:
+                mcp_server._session = session
+                async with Client(mcp_server.mcp) as client:
+                    result = await client.call_tool(
+                        "run_code",
+                        {"code": "for i in range(3): print(f'step {i}')\n'done'"},
+                        progress_handler=on_progress,
+                    )
+        finally:
+            mcp_server._session = original_session
+
+        lines = [line for message in messages for line in message.splitlines() if line]
+        assert lines == ["step 0", "step 1", "step 2"]
+        assert "done" in result.content[0].text
+        assert "step 2" in result.content[0].text
+
+    @pytest.mark.asyncio
+    async def test_run_code_coalesces_rapid_output(self) -> None:
+        """Many small writes become a few progress messages, each carrying only new text.
+
+        Breaks when: Every write sends its own notification.
+        """
+        from fastmcp import Client
+
+        from py_code_mode.cli import mcp_server
+        from py_code_mode.types import ExecutionResult, ResultEvent, StdoutEvent
+
+        class StreamingSession:
+            async def run_stream(self, code: str):
+                for i in range(500):
+                    yield StdoutEvent(f"line {i}\n")
+                # Output followed by a pause is still delivered before the result
+                yield StdoutEvent("tail\n")
+                await asyncio.sleep(0.5)
+                yield ResultEvent(ExecutionResult(value=None, stdout="", error=None))
+
+        messages: list[tuple[float, str]] = []
+        loop = asyncio.get_running_loop()
+
+        async def on_progress(progress: float, total: float | None, message: str | None) -> None:
+            if message:
+                messages.append((loop.time(), message))
+
+        original_session = mcp_server._session
+        try:
+            mcp_server._session = StreamingSession()
+            async with Client(mcp_server.mcp) as client:
+                await client.call_tool("run_code", {"code": "..."}, progress_handler=on_progress)
+                finished = loop.time()
+        finally:
+            mcp_server._session = original_session
+
+        expected = "".join(f"line {i}\n" for i in range(500)) + "tail\n"
+        assert "".join(text for _, text in messages) == expected
+        assert len(messages) < 10
+        assert finished - messages[-1][0] > 0.2
@@ -181,3 +181,102 @@ def test_namespace_search(namespace: ToolsNamespace) -> None:
 
 
 # Test removed - use CLIAdapter(tools_path=...) for loading tools
+
+
+@pytest.fixture
+def tracked_subprocess(monkeypatch):
+    """Mock subprocess execution that records peak concurrency.
+
+    Each call echoes its last argument after a short sleep; a target of
+    "fail" exits non-zero.
+    """
+    state = {"in_flight": 0, "peak": 0}
+
+    async def mock_create_subprocess_exec(*args, **kwargs):
+        class MockProcess:
+            returncode = 0
+
+            async def communicate(self):
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+                await asyncio.sleep(0.01)
+                state["in_flight"] -= 1
+                if args[-1] == "fail":
+                    self.returncode = 1
+                    return (b"", b"boom")
+                return (args[-1].encode(), b"")
+
+        return MockProcess()
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", mock_create_subprocess_exec)
+    return state
+
+
+@pytest.mark.asyncio
+async def test_map_returns_results_in_order(namespace: ToolsNamespace, tracked_subprocess) -> None:
+    """tools.map() calls a recipe once per kwargs dict, preserving order."""
+    targets = [f"10.0.0.{i}" for i in range(20)]
+
+    results = await namespace.map(namespace.nmap.syn_scan, [{"target": t} for t in targets])
+
+    assert results == targets
+
+
+@pytest.mark.asyncio
+async def test_map_respects_concurrency_limit(
+    namespace: ToolsNamespace, tracked_subprocess
+) -> None:
+    """No more than `concurrency` calls run at once."""
+    await namespace.map(
+        namespace.nmap.syn_scan, [{"target": str(i)} for i in range(12)], concurrency=3
+    )
+
+    assert tracked_subprocess["peak"] == 3
+
+
+@pytest.mark.asyncio
+async def test_gather_mixes_tools_and_recipes(
+    namespace: ToolsNamespace, tracked_subprocess
+) -> None:
+    """tools.gather() accepts (tool or recipe, kwargs) pairs."""
+    results = await namespace.gather(
+        (namespace.nmap.syn_scan, {"target": "a"}),
+        (namespace.docker.run, {"image": "b"}),
+    )
+
+    assert results == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_gather_return_exceptions(namespace: ToolsNamespace, tracked_subprocess) -> None:
+    """Failed calls are returned in place when return_exceptions=True, raised otherwise."""
+    calls = [(namespace.nmap.syn_scan, {"target": t}) for t in ("ok", "fail", "ok2")]
+
+    results = await namespace.gather(*calls, return_exceptions=True)
+
+    assert results[0] == "ok"
+    assert isinstance(results[1], Exception)
+    assert results[2] == "ok2"
+
+    with pytest.raises(Exception, match="boom"):
+        await namespace.gather(*calls)
+
+
+def test_map_runs_sync_on_loop_reference(namespace: ToolsNamespace, tracked_subprocess) -> None:
+    """With set_loop(), tools.map() blocks and returns results (agent code thread)."""
+    loop = asyncio.new_event_loop()
+    try:
+        namespace.set_loop(loop)
+        future = loop.run_in_executor(
+            None,
+            lambda: namespace.map(namespace.nmap.syn_scan, [{"target": "x"}, {"target": "y"}]),
+        )
+        assert loop.run_until_complete(future) == ["x", "y"]
+    finally:
+        loop.close()
+
+
+def test_gather_rejects_non_tool_callables(namespace: ToolsNamespace) -> None:
+    """Only tool and recipe proxies can be batched."""
+    with pytest.raises(TypeError, match="tool or recipe"):
+        namespace.gather((print, {}))
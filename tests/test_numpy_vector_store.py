@@ -0,0 +1,280 @@
+"""Tests for NumpyVectorStore, the dependency-free IVF vector store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from py_code_mode.skills import MockEmbedder, VectorEntry
+from py_code_mode.skills.vector_stores import NumpyVectorStore
+
+
+class _TableEmbedder:
+    """Embedder returning fixed vectors for known texts."""
+
+    def __init__(self, table: dict[str, np.ndarray], dimension: int) -> None:
+        self.table = table
+        self.dimension = dimension
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        return [self.table[text].tolist() for text in texts]
+
+    def embed_query(self, query: str) -> list[float]:
+        return self.table[query].tolist()
+
+
+def _clustered(rng: np.random.Generator, count: int, dimension: int, centres: int) -> np.ndarray:
+    """Vectors scattered around shared topic centres, like real embeddings."""
+    centres_array = np.random.default_rng(1).normal(size=(centres, dimension))
+    noise = rng.normal(scale=0.6, size=(count, dimension))
+    return (centres_array[rng.integers(0, centres, count)] + noise).astype(np.float32)
+
+
+def _table_store(
+    tmp_path: Path, count: int, queries: int, dimension: int = 64, precision: str = "float32"
+) -> tuple[NumpyVectorStore, np.ndarray, np.ndarray, np.ndarray]:
+    """Store holding count skills plus the vectors needed to check its results."""
+    rng = np.random.default_rng(0)
+    # About 50 skills per topic
+    centres = max(1, count // 50)
+    desc = _clustered(rng, count, dimension, centres)
+    code = _clustered(rng, count, dimension, centres)
+    query = _clustered(rng, queries, dimension, centres)
+    table = {f"d{i}": desc[i] for i in range(count)}
+    table |= {f"c{i}": code[i] for i in range(count)}
+    table |= {f"q{i}": query[i] for i in range(queries)}
+    store = NumpyVectorStore(
+        tmp_path / "ann",
+        _TableEmbedder(table, dimension),
+        precision=precision,  # type: ignore[arg-type]
+    )
+    store.add_many(
+        [VectorEntry(f"s{i}", f"d{i}", f"c{i}", f"h{i}") for i in range(count)],
+        batch_size=count,
+    )
+    return store, desc, code, query
+
+
+def _exact_top(
+    desc: np.ndarray,
+    code: np.ndarray,
+    query: np.ndarray,
+    limit: int,
+    weights: tuple[float, float] = (0.7, 0.3),
+) -> list[str]:
+    """Brute-force ranking with the store's scoring."""
+
+    def unit(v: np.ndarray) -> np.ndarray:
+        return v / np.linalg.norm(v, axis=-1, keepdims=True)
+
+    q = unit(query)
+    scores = weights[0] * np.clip(unit(desc) @ q, 0, 1) + weights[1] * np.clip(unit(code) @ q, 0, 1)
+    return [f"s{i}" for i in np.argsort(-scores)[:limit]]
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> NumpyVectorStore:
+    return NumpyVectorStore(tmp_path / "ann", MockEmbedder(dimension=32))
+
+
+class TestNumpyVectorStoreContract:
+    """The VectorStore contract shared with Chroma and Redis."""
+
+    def test_satisfies_batch_protocol(self, store: NumpyVectorStore) -> None:
+        from py_code_mode.skills import BatchVectorStore
+
+        assert isinstance(store, BatchVectorStore)
+
+    def test_add_stores_content_hash_and_count(self, store: NumpyVectorStore) -> None:
+        store.add("greet", "Greet someone", "def run(): ...", "hash1")
+
+        assert store.get_content_hash("greet") == "hash1"
+        assert store.get_content_hash("missing") is None
+        assert store.count() == 1
+
+    def test_add_replaces_changed_skill(self, store: NumpyVectorStore) -> None:
+        store.add("greet", "Greet someone", "def run(): ...", "hash1")
+        store.add("greet", "Say goodbye", "def run(): ...", "hash2")
+
+        assert store.get_content_hash("greet") == "hash2"
+        assert store.count() == 1
+        assert [r.id for r in store.search("Say goodbye", limit=5)] == ["greet"]
+
+    def test_add_many_skips_unchanged(self, store: NumpyVectorStore) -> None:
+        entries = [VectorEntry(f"s{i}", f"skill {i}", f"code {i}", f"h{i}") for i in range(3)]
+
+        assert store.add_many(entries) == 3
+        assert store.add_many(entries) == 0
+
+    def test_remove(self, store: NumpyVectorStore) -> None:
+        store.add("greet", "Greet someone", "def run(): ...", "hash1")
+
+        assert store.remove("greet") is True
+        assert store.remove("greet") is False
+        assert store.count() == 0
+        assert store.search("Greet someone", limit=5) == []
+
+    def test_clear(self, store: NumpyVectorStore) -> None:
+        store.add("greet", "Greet someone", "def run(): ...", "hash1")
+
+        store.clear()
+
+        assert store.count() == 0
+        assert store.get_content_hash("greet") is None
+
+    def test_model_info(self, store: NumpyVectorStore) -> None:
+        info = store.get_model_info()
+
+        assert info.model_name == "MockEmbedder"
+        assert info.dimension == 32
+
+    def test_model_change_clears_store(self, tmp_path: Path) -> None:
+        NumpyVectorStore(tmp_path / "ann", MockEmbedder(dimension=32)).add(
+            "greet", "Greet someone", "def run(): ...", "hash1"
+        )
+
+        store = NumpyVectorStore(tmp_path / "ann", MockEmbedder(dimension=16))
+
+        assert store.count() == 0
+
+    def test_rejects_invalid_nprobe(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="nprobe"):
+            NumpyVectorStore(tmp_path / "ann", MockEmbedder(dimension=32), nprobe=0)
+
+
+class TestNumpyVectorStoreIndex:
+    """Inverted lists, tombstones, compaction and persistence."""
+
+    def test_search_matches_brute_force_when_probing_every_list(self, tmp_path: Path) -> None:
+        """With nprobe covering all lists, single-kind search is exact."""
+        store, desc, code, query = _table_store(tmp_path, 400, 5)
+        store.compact(retrain=True)
+        store._nprobe = 1_000
+
+        for i in range(5):
+            results = store.search(f"q{i}", limit=10, desc_weight=1.0, code_weight=0.0)
+            assert [r.id for r in results] == _exact_top(desc, code, query[i], 10, (1.0, 0.0))
+
+    def test_recall_against_brute_force(self, tmp_path: Path) -> None:
+        """The default nprobe finds nearly all of the true top 10."""
+        store, desc, code, query = _table_store(tmp_path, 5_000, 20)
+        store.compact(retrain=True)
+
+        hits = 0
+        for i in range(20):
+            found = {r.id for r in store.search(f"q{i}", limit=10)}
+            hits += len(found & set(_exact_top(desc, code, query[i], 10)))
+
+        assert hits / 200 >= 0.9
+
+    def test_removed_skills_are_tombstoned_then_compacted(self, tmp_path: Path) -> None:
+        """Removals hide rows immediately; compaction drops them from disk."""
+        store, _, _, _ = _table_store(tmp_path, 300, 1)
+        store.compact()
+        for i in range(100):
+            store.remove(f"s{i}")
+
+        assert store.count() == 200
+        assert store._generation.dead_rows == 100
+        assert all(int(r.id[1:]) >= 100 for r in store.search("q0", limit=50))
+
+        store.compact()
+
+        assert store._generation.dead_rows == 0
+        assert store.count() == 200
+        assert len(list((tmp_path / "ann").glob("gen-*"))) == 1
+
+    def test_compaction_runs_when_tombstones_outnumber_live_rows(self, tmp_path: Path) -> None:
+        store, _, _, _ = _table_store(tmp_path, 300, 1)
+        generation = store._generation
+
+        for i in range(160):
+            store.remove(f"s{i}")
+
+        assert store._generation is not generation
+        assert store._generation.dead_rows < 160
+        assert store.count() == 140
+
+    def test_changes_are_visible_to_other_instances(self, tmp_path: Path) -> None:
+        """Appends and compactions by one instance are picked up by another."""
+        writer = NumpyVectorStore(tmp_path / "ann", MockEmbedder(dimension=32))
+        reader = NumpyVectorStore(tmp_path / "ann", MockEmbedder(dimension=32))
+        writer.add("greet", "Greet someone", "def run(): ...", "hash1")
+        assert reader.get_content_hash("greet") == "hash1"
+
+        writer.add("part", "Say goodbye", "def run(): ...", "hash2")
+        writer.remove("greet")
+        writer.compact()
+
+        assert reader.count() == 1
+        assert [r.id for r in reader.search("Say goodbye", limit=5)] == ["part"]
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        store, desc, code, query = _table_store(tmp_path, 400, 1)
+        store.compact(retrain=True)
+        expected = [r.id for r in store.search("q0", limit=10)]
+
+        reopened = NumpyVectorStore(tmp_path / "ann", store._embedder)
+
+        assert reopened.count() == 400
+        assert [r.id for r in reopened.search("q0", limit=10)] == expected
+
+    @pytest.mark.parametrize("precision", ["float16", "int8"])
+    def test_quantized_probes_rescore_to_float32_results(
+        self, tmp_path: Path, precision: str
+    ) -> None:
+        """Scanning quantized codes still returns the float32 store's top 10."""
+        store, _, _, _ = _table_store(tmp_path / "exact", 2_000, 10)
+        quantized, _, _, _ = _table_store(tmp_path / "quantized", 2_000, 10, precision=precision)
+        store.compact(retrain=True)
+        quantized.compact(retrain=True)
+
+        generation = quantized._path / quantized._current["generation"]
+        assert (generation / "desc_codes.npy").exists()
+        hits = 0
+        for i in range(10):
+            expected = {r.id for r in store.search(f"q{i}", limit=10)}
+            hits += len({r.id for r in quantized.search(f"q{i}", limit=10)} & expected)
+        assert hits >= 98
+
+    def test_reopening_as_float32_drops_codes(self, tmp_path: Path) -> None:
+        store = NumpyVectorStore(tmp_path / "ann", MockEmbedder(dimension=32), precision="int8")
+        store.add("greet", "Greet someone", "def run(): ...", "hash1")
+        store.compact()
+
+        reopened = NumpyVectorStore(tmp_path / "ann", MockEmbedder(dimension=32))
+
+        generation = tmp_path / "ann" / reopened._current["generation"]
+        assert reopened._current["precision"] == "float32"
+        assert not (generation / "desc_codes.npy").exists()
+        assert reopened.get_content_hash("greet") == "hash1"
+
+    @pytest.mark.benchmark
+    def test_benchmark_recall_and_speedup_at_100k(self, tmp_path: Path) -> None:
+        """Top-10 search over 100k skills: recall vs brute force, and speedup."""
+        import time
+
+        count, queries, dimension = 100_000, 50, 384
+        store, desc, code, query = _table_store(tmp_path, count, queries, dimension)
+
+        hits = 0
+        ann_seconds = 0.0
+        for i in range(queries):
+            start = time.perf_counter()
+            results = store.search(f"q{i}", limit=10)
+            ann_seconds += time.perf_counter() - start
+            hits += len({r.id for r in results} & set(_exact_top(desc, code, query[i], 10)))
+
+        unit_desc = desc / np.linalg.norm(desc, axis=1, keepdims=True)
+        unit_code = code / np.linalg.norm(code, axis=1, keepdims=True)
+        start = time.perf_counter()
+        for i in range(queries):
+            q = query[i] / np.linalg.norm(query[i])
+            scores = 0.7 * np.clip(unit_desc @ q, 0, 1) + 0.3 * np.clip(unit_code @ q, 0, 1)
+            np.argpartition(scores, -10)[-10:]
+        brute_seconds = time.perf_counter() - start
+
+        assert hits / (queries * 10) >= 0.95
+        assert ann_seconds * 5 < brute_seconds
@@ -284,13 +284,15 @@ class TestRedisArtifactStoreDelete:
         return RedisArtifactStore(mock_redis, prefix="test")
 
     def test_delete_removes_data_and_index(self, store) -> None:
-        """delete() removes both data key and index entry."""
+        """delete() removes both data key and index entry in one script."""
         store.delete("temp.json")
 
-        # Should delete data key
-        store._redis.delete.assert_called_with("test:temp.json")
-        # Should remove from index
-        store._redis.hdel.assert_called()
+        swap = store._redis.register_script.return_value
+        swap.assert_called_once_with(
+            keys=["test:__index__", "test:temp.json", "test:__refs__"],
+            args=["temp.json", "", "test:__blob__:"],
+            client=None,
+        )
 
 
 class TestRedisArtifactStoreSubpaths:
@@ -320,6 +322,277 @@ class TestRedisArtifactStoreSubpaths:
         assert data == {"nested": True}
 
 
+class TestRedisArtifactStoreStreams:
+    """Chunked open(name, "rb"/"wb") streams."""
+
+    @pytest.fixture
+    def store(self):
+        from py_code_mode.artifacts import RedisArtifactStore
+
+        mock_redis = MagicMock()
+        return RedisArtifactStore(mock_redis, prefix="test", chunk_size=4)
+
+    def test_write_pushes_chunks_then_renames_atomically(self, store) -> None:
+        """Chunks go to an upload key; close() renames it and indexes in one MULTI."""
+        pipe = store._redis.pipeline.return_value
+
+        with store.open("blob.bin", "wb", description="Blob") as f:
+            f.write(b"0123456789")
+            assert not pipe.rename.called
+
+        pushed = [c.args for c in pipe.rpush.call_args_list]
+        upload_key = pushed[0][0]
+        assert upload_key.startswith("test:__upload__:")
+        assert pushed == [(upload_key, b"0123"), (upload_key, b"4567"), (upload_key, b"89")]
+        pipe.rename.assert_called_once_with(upload_key, "test:blob.bin")
+        store._redis.pipeline.assert_called_with(transaction=True)
+        entry = json.loads(pipe.hset.call_args.args[2])
+        assert entry["metadata"] == {"_data_type": "bytes", "_chunk_size": 4, "_size": 10}
+
+    def test_exception_discards_upload(self, store) -> None:
+        pipe = store._redis.pipeline.return_value
+
+        with pytest.raises(RuntimeError), store.open("blob.bin", "wb") as f:
+            f.write(b"0123456789")
+            raise RuntimeError("boom")
+
+        upload_key = pipe.rpush.call_args.args[0]
+        store._redis.delete.assert_called_once_with(upload_key)
+        assert not pipe.hset.called
+
+    def test_read_fetches_one_chunk_at_a_time(self, store) -> None:
+        chunks = [b"0123", b"4567", b"89"]
+        entry = {
+            "description": "",
+            "created_at": "2024-01-01T00:00:00+00:00",
+            "metadata": {"_data_type": "bytes", "_chunk_size": 4, "_size": 10},
+        }
+        store._redis.hget.return_value = json.dumps(entry)
+        store._redis.exists.return_value = 1
+        store._redis.lindex.side_effect = lambda key, index: chunks[index]
+        store._redis.lrange.return_value = chunks
+
+        with store.open("blob.bin", "rb") as f:
+            assert f.read(6) == b"012345"
+            f.seek(9)
+            assert f.read() == b"9"
+
+        assert store.load("blob.bin") == b"0123456789"
+
+    def test_read_missing_artifact_raises(self, store) -> None:
+        store._redis.hget.return_value = None
+        store._redis.pipeline.return_value.execute.return_value = [0, 0]
+
+        with pytest.raises(ArtifactNotFoundError):
+            store.open("missing.bin", "rb")
+
+    def test_rejects_unknown_mode(self, store) -> None:
+        with pytest.raises(ValueError, match="mode"):
+            store.open("blob.bin", "ab")
+
+
+class TestRedisArtifactStoreViews:
+    """view() wraps the fetched value without further copies."""
+
+    @pytest.fixture
+    def store(self):
+        from py_code_mode.artifacts import RedisArtifactStore
+
+        mock_redis = MagicMock()
+        mock_redis.hget.return_value = None
+        return RedisArtifactStore(mock_redis, prefix="test")
+
+    def test_view_returns_read_only_memoryview(self, store) -> None:
+        payload = b"raw bytes"
+        store._redis.get.return_value = payload
+
+        view = store.view("blob.bin")
+
+        assert view.obj is payload
+        assert view.readonly
+
+    def test_view_npy_shares_fetched_buffer(self, store) -> None:
+        import io
+
+        import numpy as np
+
+        stream = io.BytesIO()
+        np.save(stream, np.arange(10, dtype=np.int64))
+        store._redis.get.return_value = stream.getvalue()
+
+        viewed = store.view("inputs.npy")
+
+        np.testing.assert_array_equal(viewed, np.arange(10))
+        assert not viewed.flags.owndata
+        assert not viewed.flags.writeable
+
+    def test_view_missing_raises(self, store) -> None:
+        store._redis.get.return_value = None
+
+        with pytest.raises(ArtifactNotFoundError):
+            store.view("missing.bin")
+
+
+class TestRedisArtifactStoreCompression:
+    """compression= stores payloads compressed and records the codec."""
+
+    @pytest.fixture
+    def store(self):
+        from py_code_mode.artifacts import RedisArtifactStore
+
+        return RedisArtifactStore(MagicMock(), prefix="test", compression="gzip")
+
+    def test_save_compresses_and_records_codec(self, store) -> None:
+        import gzip
+
+        data = {"rows": [{"id": i, "status": "open"} for i in range(200)]}
+
+        store.save("rows.json", data)
+
+        stored_value = store._redis.set.call_args[0][1]
+        entry = json.loads(store._redis.hset.call_args[0][2])
+        assert json.loads(gzip.decompress(stored_value)) == data
+        assert len(stored_value) < len(json.dumps(data)) / 5
+        assert entry["metadata"] == {"_data_type": "json", "_codec": "gzip"}
+
+    def test_small_values_stay_uncompressed(self, store) -> None:
+        store.save("notes.txt", "hello world")
+
+        entry = json.loads(store._redis.hset.call_args[0][2])
+        assert store._redis.set.call_args[0][1] == "hello world"
+        assert "_codec" not in entry["metadata"]
+
+    def test_load_open_and_view_decompress(self, store) -> None:
+        import gzip
+
+        text = "line of log output\n" * 500
+        store._redis.hget.return_value = json.dumps(
+            {
+                "description": "",
+                "created_at": "2024-01-01T00:00:00+00:00",
+                "metadata": {"_data_type": "text", "_codec": "gzip"},
+            }
+        )
+        packed = gzip.compress(text.encode())
+        store._redis.get.return_value = packed
+        store._redis.pipeline.return_value.execute.return_value = [1, len(packed)]
+        store._redis.getrange.side_effect = lambda key, start, end: packed[start : end + 1]
+
+        assert store.load("log.txt") == text
+        with store.open("log.txt", "rb") as f:
+            assert f.read(100) == text.encode()[:100]
+            f.seek(5000)
+            assert f.read() == text.encode()[5000:]
+            f.seek(10)
+            assert f.read(10) == text.encode()[10:20]
+        assert store.view("log.txt").tobytes() == text.encode()
+        # Only load() and view() fetched the whole value; the stream read byte ranges
+        assert store._redis.get.call_count == 2
+        assert store._redis.getrange.called
+
+    def test_rejects_unknown_codec(self) -> None:
+        from py_code_mode.artifacts import RedisArtifactStore
+
+        with pytest.raises(ValueError, match="compression"):
+            RedisArtifactStore(MagicMock(), compression="lz4")  # type: ignore[arg-type]
+
+
+class TestRedisArtifactStoreContentAddressed:
+    """content_addressed=True stores payloads once per SHA-256 with refcounts."""
+
+    @pytest.fixture
+    def store(self):
+        from py_code_mode.artifacts import RedisArtifactStore
+
+        mock_redis = MagicMock()
+        mock_redis.hget.return_value = None
+        return RedisArtifactStore(mock_redis, prefix="test", content_addressed=True)
+
+    @staticmethod
+    def _entry(blob: str) -> str:
+        return json.dumps(
+            {
+                "description": "",
+                "created_at": "2024-01-01T00:00:00+00:00",
+                "metadata": {"_data_type": "text", "_blob": blob},
+            }
+        )
+
+    def test_new_blob_is_written_once_and_referenced(self, store) -> None:
+        import hashlib
+
+        pipe = store._redis.pipeline.return_value
+        pipe.execute.return_value = [1, 0]
+        digest = hashlib.sha256(b"hello").hexdigest()
+
+        artifact = store.save("notes.txt", "hello")
+
+        pipe.hincrby.assert_called_once_with("test:__refs__", digest, 1)
+        store._redis.set.assert_called_once_with(f"test:__blob__:{digest}", b"hello")
+        swap = store._redis.register_script.return_value
+        assert swap.call_args.kwargs["keys"] == [
+            "test:__index__",
+            "test:notes.txt",
+            "test:__refs__",
+        ]
+        name, entry_json, blob_prefix = swap.call_args.kwargs["args"]
+        assert (name, blob_prefix) == ("notes.txt", "test:__blob__:")
+        assert json.loads(entry_json)["metadata"]["_blob"] == digest
+        assert artifact.path == f"test:__blob__:{digest}"
+
+    def test_existing_blob_skips_the_write(self, store) -> None:
+        store._redis.pipeline.return_value.execute.return_value = [2, 1]
+
+        store.save("notes.txt", "hello")
+
+        store._redis.set.assert_not_called()
+
+    def test_overwrite_reads_old_blob_in_the_swap(self, store) -> None:
+        """The replaced entry is read by the script, not by a separate HGET."""
+        store._redis.pipeline.return_value.execute.return_value = [1, 0]
+        store._redis.hget.return_value = self._entry("old")
+
+        store.save("notes.txt", "new content")
+
+        store._redis.hget.assert_not_called()
+        store._redis.register_script.return_value.assert_called_once()
+
+    def test_load_reads_blob(self, store) -> None:
+        store._redis.hget.return_value = self._entry("abc")
+        store._redis.get.return_value = b"shared"
+
+        assert store.load("notes.txt") == "shared"
+        store._redis.get.assert_called_with("test:__blob__:abc")
+
+    def test_delete_releases_blob_in_the_swap(self, store) -> None:
+        store._redis.hget.return_value = self._entry("abc")
+
+        store.delete("notes.txt")
+
+        store._redis.hget.assert_not_called()
+        store._redis.hdel.assert_not_called()
+        store._redis.register_script.return_value.assert_called_once_with(
+            keys=["test:__index__", "test:notes.txt", "test:__refs__"],
+            args=["notes.txt", "", "test:__blob__:"],
+            client=None,
+        )
+
+    def test_stream_into_existing_blob_drops_upload(self, store) -> None:
+        pipe = store._redis.pipeline.return_value
+        pipe.execute.return_value = [2, 1]
+
+        with store.open("big.bin", "wb") as f:
+            f.write(b"data")
+
+        upload_key = pipe.rpush.call_args[0][0]
+        pipe.delete.assert_any_call(upload_key)
+        pipe.rename.assert_not_called()
+        swap = store._redis.register_script.return_value
+        assert swap.call_args.kwargs["client"] is pipe
+        entry = json.loads(swap.call_args.kwargs["args"][1])
+        assert entry["metadata"]["_blob"].endswith(f"-{store._chunk_size}")
+
+
 class TestRedisArtifactStoreIntegration:
     """Integration tests with real Redis using testcontainers."""
 
@@ -370,3 +643,93 @@ class TestRedisArtifactStoreIntegration:
 
         store.delete("temp.json")
         assert not store.exists("temp.json")
+
+    def test_stream_roundtrip(self, redis_client, request) -> None:
+        """Chunked writes and reads through real Redis, next to save()d artifacts."""
+        from py_code_mode.artifacts import RedisArtifactStore
+
+        test_name = request.node.name.replace("[", "_").replace("]", "_")
+        store = RedisArtifactStore(redis_client, prefix=f"test-artifacts-{test_name}")
+        payload = bytes(range(256)) * 10_000
+
+        with store.open("big.bin", "wb") as f:
+            for start in range(0, len(payload), 100_000):
+                f.write(payload[start : start + 100_000])
+        store.save("notes.txt", "plain text")
+
+        with store.open("big.bin", "rb") as r:
+            r.seek(1_500_000)
+            assert r.read(10) == payload[1_500_000:1_500_010]
+        assert store.load("big.bin") == payload
+        assert store.open("notes.txt", "rb").read() == b"plain text"
+        assert not redis_client.keys(f"{store.path}:__upload__:*")
+
+    def test_content_addressed_dedup_and_collection(self, redis_client, request) -> None:
+        """Shared blobs survive until the last referencing artifact is deleted."""
+        from py_code_mode.artifacts import RedisArtifactStore
+
+        test_name = request.node.name.replace("[", "_").replace("]", "_")
+        store = RedisArtifactStore(
+            redis_client, prefix=f"test-artifacts-{test_name}", content_addressed=True
+        )
+        data = {"status": "ok", "items": list(range(100))}
+
+        store.save("a.json", data)
+        store.save("b.json", data)
+        with store.open("c.bin", "wb") as f:
+            f.write(b"streamed")
+
+        assert len(redis_client.keys(f"{store.path}:__blob__:*")) == 2
+        assert store.load("b.json") == data
+        assert store.open("c.bin", "rb").read() == b"streamed"
+        store.delete("a.json")
+        assert store.load("b.json") == data
+        store.delete("b.json")
+        store.save("c.bin", "overwritten")
+        store.delete("c.bin")
+        assert not redis_client.keys(f"{store.path}:__blob__:*")
+        assert not redis_client.hgetall(f"{store.path}:__refs__")
+
+    def test_concurrent_overwrites_keep_refcounts_exact(self, redis_client, request) -> None:
+        """Racing saves and deletes of one name never release a reference twice."""
+        import threading
+
+        from py_code_mode.artifacts import RedisArtifactStore
+
+        test_name = request.node.name.replace("[", "_").replace("]", "_")
+        store = RedisArtifactStore(
+            redis_client, prefix=f"test-artifacts-{test_name}", content_addressed=True
+        )
+        payloads = [f"payload {i}\n" * 100 for i in range(3)]
+        # Keepers hold a reference to every payload's blob throughout
+        for i, payload in enumerate(payloads):
+            store.save(f"keeper-{i}.txt", payload)
+        barrier = threading.Barrier(8)
+        errors: list[BaseException] = []
+
+        def race(worker: int) -> None:
+            try:
+                barrier.wait()
+                for step in range(50):
+                    if (worker + step) % 4 == 0:
+                        store.delete("contested.txt")
+                    else:
+                        store.save("contested.txt", payloads[(worker + step) % 3])
+            except BaseException as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=race, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        for i, payload in enumerate(payloads):
+            assert store.load(f"keeper-{i}.txt") == payload
+        refs = redis_client.hgetall(f"{store.path}:__refs__")
+        counts = {(k.decode() if isinstance(k, bytes) else k): int(v) for k, v in refs.items()}
+        expected = {store._index_metadata(f"keeper-{i}.txt")["_blob"]: 1 for i in range(3)}
+        if store.exists("contested.txt"):
+            expected[store._index_metadata("contested.txt")["_blob"]] += 1
+        assert counts == expected
@@ -309,6 +309,62 @@ class TestRedisVectorStoreModelValidation:
         assert store2.count() == 0
 
 
+class TestRedisVectorStorePrecision:
+    """Tests for FLOAT16 vector storage."""
+
+    def test_float16_store_searches(self, redis_client: Redis) -> None:
+        """FLOAT16 vectors are stored at half size and still rank matches first."""
+        pytest.importorskip("redis")
+        from py_code_mode.skills.embeddings import MockEmbedder
+        from py_code_mode.skills.vector_stores.redis_store import RedisVectorStore
+
+        store = RedisVectorStore(
+            redis=redis_client,
+            embedder=MockEmbedder(dimension=384),
+            prefix="skills",
+            index_name="skills_idx",
+            precision="float16",
+        )
+        store.add("greet", "Greet someone", "async def run(): pass", "hash1")
+        store.add("part", "Say goodbye", "async def run(): return 1", "hash2")
+
+        stored = redis_client.hget("skills:skills_idx:greet", "desc_vector")
+        assert stored is not None
+        assert len(stored) == 384 * 2
+        assert store.search("Greet someone", limit=1)[0].id == "greet"
+
+    def test_precision_change_recreates_index(self, redis_client: Redis) -> None:
+        """Reopening with another precision clears vectors of the old type."""
+        pytest.importorskip("redis")
+        from py_code_mode.skills.embeddings import MockEmbedder
+        from py_code_mode.skills.vector_stores.redis_store import RedisVectorStore
+
+        store1 = RedisVectorStore(
+            redis=redis_client, embedder=MockEmbedder(dimension=384), prefix="skills"
+        )
+        store1.add("greet", "Greet someone", "async def run(): pass", "hash1")
+
+        store2 = RedisVectorStore(
+            redis=redis_client,
+            embedder=MockEmbedder(dimension=384),
+            prefix="skills",
+            precision="float16",
+        )
+
+        assert store2.count() == 0
+
+    def test_rejects_int8(self, redis_client: Redis) -> None:
+        """RediSearch has no int8 vector type."""
+        pytest.importorskip("redis")
+        from py_code_mode.skills.embeddings import MockEmbedder
+        from py_code_mode.skills.vector_stores.redis_store import RedisVectorStore
+
+        with pytest.raises(ValueError, match="precision"):
+            RedisVectorStore(
+                redis=redis_client, embedder=MockEmbedder(dimension=384), precision="int8"
+            )
+
+
 class TestRedisVectorStoreCRUD:
     """Tests for add, remove, get_content_hash operations."""
 
@@ -430,6 +486,46 @@ class TestRedisVectorStoreCRUD:
 
         assert store.count() == 0
 
+    def test_add_many_indexes_in_batches(self, store, mock_embedder) -> None:
+        """add_many() embeds new skills in batches and stores their hashes."""
+        from unittest.mock import patch
+
+        from py_code_mode.skills.vector_store import BatchVectorStore, VectorEntry
+
+        assert isinstance(store, BatchVectorStore)
+        entries = [VectorEntry(f"skill{i}", f"desc{i}", f"code{i}", f"hash{i}") for i in range(5)]
+
+        with patch.object(mock_embedder, "embed", wraps=mock_embedder.embed) as embed:
+            assert store.add_many(entries, batch_size=4) == 5
+
+        # 10 texts (description + code per skill) in batches of 4
+        assert [len(c.args[0]) for c in embed.call_args_list] == [4, 4, 2]
+        assert store.count() == 5
+        assert store.get_content_hash("skill3") == "hash3"
+
+    def test_add_many_skips_unchanged_skills(self, store, mock_embedder) -> None:
+        """add_many() only re-embeds skills whose content hash changed."""
+        from unittest.mock import patch
+
+        from py_code_mode.skills.vector_store import VectorEntry
+
+        store.add_many(
+            [VectorEntry(f"skill{i}", f"desc{i}", f"code{i}", f"hash{i}") for i in range(3)]
+        )
+        entries = [
+            VectorEntry("skill0", "desc0", "code0", "hash0"),
+            VectorEntry("skill1", "new desc", "code1", "hash1b"),
+            VectorEntry("skill3", "desc3", "code3", "hash3"),
+        ]
+
+        with patch.object(mock_embedder, "embed", wraps=mock_embedder.embed) as embed:
+            assert store.add_many(entries) == 2
+
+        assert embed.call_count == 1
+        assert sorted(embed.call_args.args[0]) == sorted(["new desc", "code1", "desc3", "code3"])
+        assert store.count() == 4
+        assert store.get_content_hash("skill1") == "hash1b"
+
 
 class TestRedisVectorStoreSimilaritySearch:
     """Tests for semantic similarity search."""
@@ -884,3 +980,89 @@ class TestRedisVectorStoreIndexIsolation:
         # Second index should be empty
         assert store1.count() == 1
         assert store2.count() == 0
+
+
+class TestRedisVectorStoreRoundTrips:
+    """Round-trips per operation, checked against a mocked client."""
+
+    @pytest.fixture
+    def client(self):
+        from unittest.mock import MagicMock
+
+        pytest.importorskip("redis")
+        client = MagicMock()
+        client.hgetall.return_value = {}
+        client.ft.return_value.info.return_value = {"num_docs": 2}
+        return client
+
+    @pytest.fixture
+    def store(self, client):
+        from py_code_mode.skills.embeddings import MockEmbedder
+        from py_code_mode.skills.vector_stores.redis_store import RedisVectorStore
+
+        store = RedisVectorStore(redis=client, embedder=MockEmbedder(dimension=8))
+        client.reset_mock()
+        return store
+
+    def test_search_is_one_pipelined_round_trip(self, client, store) -> None:
+        """Both KNN queries share one pipeline, and search does not run FT.INFO."""
+        pipe = client.pipeline.return_value
+        pipe.execute.return_value = [
+            [
+                2,
+                b"k:a",
+                [b"skill_id", b"a", b"desc_score", b"0.2"],
+                b"k:b",
+                [b"skill_id", b"b", b"desc_score", b"1.0"],
+            ],
+            [1, b"k:b", [b"skill_id", b"b", b"code_score", b"1.0"]],
+        ]
+
+        results = store.search("query", limit=2, desc_weight=0.7, code_weight=0.3)
+
+        assert pipe.execute.call_count == 1
+        assert [call.args[0] for call in pipe.execute_command.call_args_list] == ["FT.SEARCH"] * 2
+        client.ft.return_value.info.assert_not_called()
+        assert [r.id for r in results] == ["a", "b"]
+        assert results[0].score == pytest.approx(0.7 * 0.9)
+        assert results[1].score == pytest.approx(0.7 * 0.5 + 0.3 * 0.5)
+
+    def test_count_is_cached_until_a_write(self, client, store) -> None:
+        info = client.ft.return_value.info
+        client.hget.return_value = None
+
+        assert store.count() == 2
+        assert store.count() == 2
+        assert info.call_count == 1
+
+        store.add("skill1", "Test skill", "async def run(): pass", "hash1")
+        info.return_value = {"num_docs": 3}
+
+        assert store.count() == 3
+        assert info.call_count == 2
+
+    def test_get_content_hashes_is_one_round_trip(self, client, store) -> None:
+        pipe = client.pipeline.return_value
+        pipe.execute.return_value = [b"h1", None]
+
+        assert store.get_content_hashes(["a", "b"]) == {"a": "h1"}
+        assert pipe.execute.call_count == 1
+        client.hget.assert_not_called()
+
+    def test_remove_uses_delete_result(self, client, store) -> None:
+        client.delete.return_value = 0
+
+        assert store.remove("missing") is False
+        client.hget.assert_not_called()
+
+    def test_parses_resp3_search_replies(self) -> None:
+        from py_code_mode.skills.vector_stores.redis_store import _knn_distances
+
+        reply = {
+            b"total_results": 1,
+            b"results": [
+                {b"id": b"k:a", b"extra_attributes": {b"skill_id": b"a", b"desc_score": b"0.5"}}
+            ],
+        }
+
+        assert _knn_distances(reply, "desc_score") == {"a": 0.5}
@@ -334,6 +334,28 @@ class TestToolRegistrySemanticSearch:
         assert len(results) >= 2
         assert results[0].name == "curl"
 
+    @pytest.mark.asyncio
+    async def test_search_skips_vectors_without_tool(
+        self,
+        controllable_embedder: ControllableEmbedder,
+        web_adapter: MockAdapter,
+        json_adapter: MockAdapter,
+    ) -> None:
+        """A vector left behind for an unregistered tool is skipped, not a KeyError."""
+        controllable_embedder.set_response("curl: HTTP client", [1.0, 0.0, 0.0, 0.0])
+        controllable_embedder.set_response("ffuf: Web fuzzer", [0.8, 0.2, 0.0, 0.0])
+        controllable_embedder.set_response("jq: JSON processor", [0.0, 1.0, 0.0, 0.0])
+        controllable_embedder.set_response("HTTP requests", [0.9, 0.1, 0.0, 0.0])
+
+        registry = ToolRegistry(embedder=controllable_embedder)
+        registry.register_adapter(web_adapter)
+        registry.register_adapter(json_adapter)
+        del registry._tools["curl"]
+
+        results = registry.search("HTTP requests", limit=2)
+
+        assert [t.name for t in results] == ["ffuf", "jq"]
+
     @pytest.mark.asyncio
     async def test_fallback_to_substring_no_embedder(
         self,
@@ -363,6 +385,44 @@ class TestToolRegistrySemanticSearch:
         results = registry.search("anything")
         assert len(results) == 0
 
+    @pytest.mark.asyncio
+    async def test_exact_name_beats_semantic_ranking(
+        self,
+        controllable_embedder: ControllableEmbedder,
+        web_adapter: MockAdapter,
+        json_adapter: MockAdapter,
+    ) -> None:
+        """BM25 fusion lifts a tool named in the query above closer vectors."""
+        controllable_embedder.set_response("curl: HTTP client", [1.0, 0.0, 0.0, 0.0])
+        controllable_embedder.set_response("ffuf: Web fuzzer", [0.9, 0.1, 0.0, 0.0])
+        controllable_embedder.set_response("jq: JSON processor", [0.0, 1.0, 0.0, 0.0])
+        controllable_embedder.set_response("jq", [1.0, 0.0, 0.0, 0.0])
+
+        registry = ToolRegistry(embedder=controllable_embedder)
+        registry.register_adapter(web_adapter)
+        registry.register_adapter(json_adapter)
+
+        assert registry.search("jq")[0].name == "jq"
+
+    @pytest.mark.asyncio
+    async def test_lexical_only_while_embedder_loads(
+        self,
+        controllable_embedder: ControllableEmbedder,
+        web_adapter: MockAdapter,
+    ) -> None:
+        """Tools registered during model loading are searchable and embedded later."""
+        controllable_embedder.loading = True  # type: ignore[attr-defined]
+        registry = ToolRegistry(embedder=controllable_embedder)
+        registry.register_adapter(web_adapter)
+
+        assert len(registry._vectors) == 0
+        assert [t.name for t in registry.search("fuzzer")] == ["ffuf"]
+
+        controllable_embedder.loading = False  # type: ignore[attr-defined]
+        registry.search("fuzzer")
+
+        assert "curl" in registry._vectors
+
     # --- Low-level: Adapter lifecycle ---
 
     @pytest.mark.asyncio
@@ -1,6 +1,9 @@
 """Tests for semantic search - written first to define interface."""
 
+import threading
+from pathlib import Path
 from textwrap import dedent
+from unittest.mock import patch
 
 import pytest
 
@@ -98,6 +101,203 @@ class TestEmbedder:
         assert embedder.device in ("mps", "cuda", "cpu")
 
 
+class _FakeModel:
+    """Stand-in for SentenceTransformer that records every encode call.
+
+    With a gate, the first encode blocks until the gate is set, so tests can
+    queue calls behind a running encode.
+    """
+
+    def __init__(self, delay: float = 0.0, gate: threading.Event | None = None) -> None:
+        self.calls: list[list[str]] = []
+        self.delay = delay
+        self.gate = gate
+
+    def encode(self, texts: list[str], normalize_embeddings: bool = True):
+        import time
+
+        import numpy as np
+
+        self.calls.append(list(texts))
+        if self.gate is not None and len(self.calls) == 1:
+            self.gate.wait()
+        time.sleep(self.delay)
+        return np.array([[float(len(t)), float(sum(map(ord, t)) % 97), 1.0] for t in texts])
+
+
+def _fake_embedder(model: _FakeModel, **kwargs):
+    from py_code_mode.skills import Embedder
+
+    embedder = Embedder(**kwargs)
+    embedder._model = model
+    return embedder
+
+
+def _wait_until(condition, timeout: float = 5.0) -> None:
+    import time
+
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+class TestEmbedderQueryCache:
+    """Query LRU cache and encode micro-batching, with the model stubbed out."""
+
+    def test_repeated_query_is_served_from_cache(self) -> None:
+        """The second identical query does not reach the model."""
+        model = _FakeModel()
+        embedder = _fake_embedder(model)
+
+        first = embedder.embed_query("scan ports")
+        second = embedder.embed_query("scan ports")
+
+        assert first == second
+        assert model.calls == [[embedder.QUERY_INSTRUCTION + "scan ports"]]
+        stats = embedder.stats
+        assert (stats.query_hits, stats.query_misses) == (1, 1)
+        assert stats.hit_rate == 0.5
+
+    def test_cached_vector_cannot_be_mutated_by_caller(self) -> None:
+        """Callers get copies, so editing a result leaves the cache intact."""
+        embedder = _fake_embedder(_FakeModel())
+
+        embedder.embed_query("q").append(99.0)
+
+        assert len(embedder.embed_query("q")) == 3
+
+    def test_least_recently_used_query_is_evicted(self) -> None:
+        """Once full, the cache drops the query used longest ago."""
+        model = _FakeModel()
+        embedder = _fake_embedder(model, query_cache_size=2)
+
+        embedder.embed_query("a")
+        embedder.embed_query("b")
+        embedder.embed_query("a")  # "b" is now least recently used
+        embedder.embed_query("c")
+        model.calls.clear()
+        embedder.embed_query("a")
+        embedder.embed_query("b")
+
+        assert model.calls == [[embedder.QUERY_INSTRUCTION + "b"]]
+
+    def test_zero_cache_size_disables_cache(self) -> None:
+        """query_cache_size=0 encodes every query."""
+        model = _FakeModel()
+        embedder = _fake_embedder(model, query_cache_size=0)
+
+        embedder.embed_query("q")
+        embedder.embed_query("q")
+
+        assert len(model.calls) == 2
+        assert embedder.stats.query_hits == 0
+
+    def test_documents_are_not_cached(self) -> None:
+        """embed() always encodes and does not count toward query stats."""
+        model = _FakeModel()
+        embedder = _fake_embedder(model)
+
+        embedder.embed(["doc"])
+        embedder.embed(["doc"])
+
+        assert len(model.calls) == 2
+        assert embedder.stats.query_misses == 0
+
+    def test_lone_call_skips_batch_window(self) -> None:
+        """A call that finds the model idle encodes without waiting the window."""
+        import time
+
+        model = _FakeModel()
+        embedder = _fake_embedder(model, batch_window_ms=5000)
+
+        start = time.perf_counter()
+        embedder.embed_query("q")
+        embedder.embed(["doc"])
+
+        assert time.perf_counter() - start < 1.0
+        assert embedder.stats.batches == 2
+
+    def test_concurrent_calls_share_one_encode(self) -> None:
+        """Calls that queue behind a running encode are encoded together."""
+        model = _FakeModel(gate=threading.Event())
+        embedder = _fake_embedder(model, batch_window_ms=200)
+        results: dict[str, list[float]] = {}
+
+        def query(text: str) -> None:
+            results[text] = embedder.embed_query(text)
+
+        busy = threading.Thread(target=query, args=("busy",))
+        busy.start()
+        _wait_until(lambda: len(model.calls) == 1)
+        threads = [threading.Thread(target=query, args=(f"q{i}",)) for i in range(4)]
+        for t in threads:
+            t.start()
+        _wait_until(lambda: len(embedder._pending) == 4)
+        model.gate.set()
+        for t in [busy, *threads]:
+            t.join()
+
+        assert len(model.calls) == 2
+        assert len(model.calls[1]) == 4
+        expected = _fake_embedder(_FakeModel(), batch_window_ms=0)
+        for text, vector in results.items():
+            assert vector == expected.embed_query(text)
+        stats = embedder.stats
+        assert (stats.batches, stats.batched_requests, stats.batched_texts) == (2, 5, 5)
+        assert stats.mean_batch_size == 2.5
+
+    def test_batch_deduplicates_texts(self) -> None:
+        """The same text requested by concurrent callers is encoded once."""
+        model = _FakeModel(gate=threading.Event())
+        embedder = _fake_embedder(model, batch_window_ms=200)
+        results: list[list[list[float]]] = []
+
+        busy = threading.Thread(target=embedder.embed, args=(["busy"],))
+        busy.start()
+        _wait_until(lambda: len(model.calls) == 1)
+        threads = [
+            threading.Thread(target=lambda: results.append(embedder.embed(["same", "other"])))
+            for _ in range(3)
+        ]
+        for t in threads:
+            t.start()
+        _wait_until(lambda: len(embedder._pending) == 3)
+        model.gate.set()
+        for t in [busy, *threads]:
+            t.join()
+
+        assert model.calls == [["busy"], ["same", "other"]]
+        assert results[0] == results[1] == results[2]
+
+    def test_encode_error_reaches_every_caller(self) -> None:
+        """A failing encode raises in each caller that joined the batch."""
+
+        class _BrokenModel(_FakeModel):
+            def encode(self, texts, normalize_embeddings=True):
+                raise RuntimeError("out of memory")
+
+        embedder = _fake_embedder(_BrokenModel(), batch_window_ms=100)
+        barrier = threading.Barrier(2)
+        errors: list[BaseException] = []
+
+        def query(text: str) -> None:
+            barrier.wait()
+            try:
+                embedder.embed_query(text)
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=query, args=(t,)) for t in ("a", "b")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(errors) == 2
+        assert embedder.stats.query_hits == 0
+
+
 class TestSkillLibrary:
     """Tests for SkillLibrary semantic search with dual indexing."""
 
@@ -308,6 +508,371 @@ class TestRankingConfig:
         library.search("completely unrelated query")
 
 
+class _LoadingEmbedder:
+    """MockEmbedder stand-in whose model is still loading until told otherwise."""
+
+    def __init__(self) -> None:
+        from py_code_mode.skills import MockEmbedder
+
+        self._inner = MockEmbedder(dimension=32)
+        self.dimension = 32
+        self.loading = True
+        self.embedded: list[str] = []
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        assert not self.loading, "embed() would block while the model loads"
+        self.embedded += texts
+        return self._inner.embed(texts)
+
+    def embed_query(self, query: str) -> list[float]:
+        assert not self.loading, "embed_query() would block while the model loads"
+        return self._inner.embed_query(query)
+
+
+class TestHybridSearch:
+    """BM25 + semantic search fused by reciprocal rank."""
+
+    def test_exact_identifier_ranks_first(self) -> None:
+        """A skill named in the query wins even when embeddings are uninformative."""
+        from py_code_mode.skills import MockEmbedder, SkillLibrary
+
+        library = SkillLibrary(MockEmbedder(dimension=32))
+        for i in range(30):
+            library.add(_make_skill(f"skill_{i}", f"Does task number {i}", "pass"))
+        library.add(_make_skill("github_stars", "Count repository stargazers", "pass"))
+
+        # limit 10 fuses the top 40 of each ranking, so every skill has a
+        # semantic rank and a lexical hit cannot merely tie the best vector
+        results = library.search("github_stars", limit=10)
+
+        assert results[0].name == "github_stars"
+
+    def test_parameter_names_are_searchable(self) -> None:
+        from py_code_mode.skills import MockEmbedder, PythonSkill, RankingConfig, SkillLibrary
+
+        library = SkillLibrary(MockEmbedder(dimension=32), ranking=RankingConfig(semantic_weight=0))
+        source = '"""Scan a host."""\n\nasync def run(target_host: str) -> str:\n    return ""'
+        library.add(PythonSkill.from_source(name="scan", source=source, description="Scan a host"))
+        library.add(_make_skill("other", "Unrelated", "pass"))
+
+        assert [s.name for s in library.search("target_host")] == ["scan"]
+
+    def test_lexical_index_follows_removals_and_updates(self) -> None:
+        from py_code_mode.skills import MockEmbedder, RankingConfig, SkillLibrary
+
+        library = SkillLibrary(MockEmbedder(dimension=32), ranking=RankingConfig(semantic_weight=0))
+        library.add(_make_skill("fetch", "Download a page", "pass"))
+        library.add(_make_skill("fetch", "Upload a file", "pass"))
+
+        assert library.search("download") == []
+        assert [s.name for s in library.search("upload")] == ["fetch"]
+        library.remove("fetch")
+        assert library.search("upload") == []
+
+    def test_cold_start_answers_lexically_without_embedding(self) -> None:
+        """While the model loads, indexing and search never call the embedder."""
+        from py_code_mode.skills import MemorySkillStore, SkillLibrary
+
+        store = MemorySkillStore()
+        store.save(_make_skill("nmap_scan", "Scan ports with nmap", "pass"))
+        store.save(_make_skill("fetch", "Download a page", "pass"))
+        embedder = _LoadingEmbedder()
+
+        library = SkillLibrary(embedder, store=store)
+
+        assert [s.name for s in library.search("nmap")] == ["nmap_scan"]
+        assert embedder.embedded == []
+
+        embedder.loading = False
+        results = library.search("Download a page")
+
+        assert results[0].name == "fetch"
+        assert sorted(embedder.embedded) == sorted(
+            [s.description for s in store.list_all()] + [s.source for s in store.list_all()]
+        )
+        assert "fetch" in library._description_vectors
+
+    def test_semantic_only_when_lexical_weight_is_zero(self) -> None:
+        from py_code_mode.skills import MockEmbedder, RankingConfig, SkillLibrary
+
+        library = SkillLibrary(MockEmbedder(dimension=32), ranking=RankingConfig(lexical_weight=0))
+        library.add(_make_skill("alpha", "First", "pass"))
+        library.add(_make_skill("beta", "Second", "pass"))
+
+        with patch.object(library._lexical, "search") as lexical_search:
+            assert len(library.search("alpha")) == 2
+
+        lexical_search.assert_not_called()
+
+
+class TestEmbeddingMatrix:
+    """Tests for the normalized in-memory embedding matrix."""
+
+    def test_set_normalizes_and_indexes_rows(self) -> None:
+        """Vectors are stored unit-normalized and looked up by name."""
+        from py_code_mode.skills import EmbeddingMatrix
+
+        matrix = EmbeddingMatrix()
+        matrix.set("a", [3.0, 4.0])
+        matrix.set("b", [0.0, 2.0])
+
+        assert len(matrix) == 2
+        assert "a" in matrix
+        assert matrix.names == ["a", "b"]
+        assert matrix["a"].tolist() == pytest.approx([0.6, 0.8])
+
+    def test_set_replaces_existing_row(self) -> None:
+        """Setting an existing name overwrites its row in place."""
+        from py_code_mode.skills import EmbeddingMatrix
+
+        matrix = EmbeddingMatrix()
+        matrix.set_many(["a", "b"], [[1.0, 0.0], [0.0, 1.0]])
+        matrix.set("a", [0.0, 5.0])
+
+        assert matrix.names == ["a", "b"]
+        assert matrix["a"].tolist() == pytest.approx([0.0, 1.0])
+
+    def test_remove_moves_last_row_into_slot(self) -> None:
+        """Removing a row keeps the matrix dense and the index consistent."""
+        from py_code_mode.skills import EmbeddingMatrix
+
+        matrix = EmbeddingMatrix()
+        matrix.set_many(["a", "b", "c"], [[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+
+        assert matrix.remove("a") is True
+        assert matrix.remove("a") is False
+        assert matrix.names == ["c", "b"]
+        assert matrix.matrix.shape == (2, 2)
+        assert matrix.scores([0.0, 1.0]).tolist() == pytest.approx([2**-0.5, 1.0])
+
+    def test_zero_vectors_score_zero(self) -> None:
+        """Zero vectors behave like cosine_similarity and score 0."""
+        from py_code_mode.skills import EmbeddingMatrix
+
+        matrix = EmbeddingMatrix()
+        matrix.set("zero", [0.0, 0.0])
+
+        assert matrix.scores([1.0, 0.0]).tolist() == [0.0]
+        assert matrix.scores([0.0, 0.0]).tolist() == [0.0]
+
+    def test_dimension_mismatch_raises(self) -> None:
+        """Vectors must match the dimension of existing rows."""
+        from py_code_mode.skills import EmbeddingMatrix
+
+        matrix = EmbeddingMatrix()
+        matrix.set("a", [1.0, 0.0])
+
+        with pytest.raises(ValueError, match="dimension"):
+            matrix.set("b", [1.0, 0.0, 0.0])
+
+    def test_top_k_indices_orders_best_first(self) -> None:
+        """top_k_indices returns the k best rows, ties in row order."""
+        import numpy as np
+
+        from py_code_mode.skills.embeddings import top_k_indices
+
+        scores = np.array([0.1, 0.9, 0.5, 0.9, 0.3])
+
+        assert top_k_indices(scores, 3).tolist() == [1, 3, 2]
+        assert top_k_indices(scores, 10).tolist() == [1, 3, 2, 4, 0]
+        assert top_k_indices(scores, 0).tolist() == []
+
+
+class TestVectorizedSearch:
+    """The matrix search path ranks like the per-skill cosine loop."""
+
+    def test_matches_pure_python_ranking(self) -> None:
+        """Blended description/code scores rank skills like cosine_similarity."""
+        from py_code_mode.skills import (
+            MockEmbedder,
+            RankingConfig,
+            SkillLibrary,
+            cosine_similarity,
+        )
+
+        embedder = MockEmbedder(dimension=64)
+        ranking = RankingConfig(code_min_length=60, lexical_weight=0.0)
+        library = SkillLibrary(embedder, ranking=ranking)
+        skills = [
+            _make_skill(f"skill_{i}", f"Skill about topic {i}", "x = 1; " * (i % 4) + "pass")
+            for i in range(40)
+        ]
+        for skill in skills:
+            library.add(skill)
+        library.remove("skill_7")
+
+        query = "topic 12"
+        query_vec = embedder.embed_query(query)
+        expected = []
+        for skill in skills:
+            if skill.name == "skill_7":
+                continue
+            desc_sim = cosine_similarity(query_vec, embedder.embed([skill.description])[0])
+            score = desc_sim
+            if len(skill.source) >= ranking.code_min_length:
+                code_sim = cosine_similarity(query_vec, embedder.embed([skill.source])[0])
+                score = ranking.description_weight * desc_sim + ranking.code_weight * code_sim
+            expected.append((score, skill.name))
+        expected.sort(key=lambda x: x[0], reverse=True)
+
+        results = library.search(query, limit=10)
+
+        assert [s.name for s in results] == [name for _, name in expected[:10]]
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("count", [1_000, 10_000, 100_000])
+    def test_benchmark_search(self, count: int) -> None:
+        """Benchmark one search over 1k/10k/100k in-memory skills."""
+        import time
+
+        import numpy as np
+
+        from py_code_mode.skills import MockEmbedder, SkillLibrary, cosine_similarity
+
+        dimension = 384
+        embedder = MockEmbedder(dimension=dimension)
+        library = SkillLibrary(embedder)
+        rng = np.random.default_rng(0)
+        names = [f"skill_{i}" for i in range(count)]
+        skill = _make_skill("template", "Template skill", "pass")
+        library._skills = dict.fromkeys(names, skill)
+        library._description_vectors.set_many(names, rng.random((count, dimension)))
+        library._code_vectors.set_many(names, rng.random((count, dimension)))
+
+        library.search("warm up")
+        start = time.perf_counter()
+        results = library.search("find something", limit=10)
+        search_ms = (time.perf_counter() - start) * 1000
+        assert len(results) == 10
+
+        # Per-skill pure-Python cosine loop that search() used to run
+        query_vec = embedder.embed_query("find something")
+        sample = min(count, 1_000)
+        desc_rows = library._description_vectors.matrix[:sample].tolist()
+        code_rows = library._code_vectors.matrix[:sample].tolist()
+        start = time.perf_counter()
+        for desc_vec, code_vec in zip(desc_rows, code_rows, strict=True):
+            0.7 * cosine_similarity(query_vec, desc_vec) + 0.3 * cosine_similarity(
+                query_vec, code_vec
+            )
+        loop_ms = (time.perf_counter() - start) * 1000 * count / sample
+
+        assert search_ms * 10 < loop_ms
+
+
+def _clustered_vectors(count: int, dimension: int, seed: int = 0):
+    """Vectors scattered around shared topic centres, like real embeddings."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    centres = np.random.default_rng(1).normal(size=(max(1, count // 50), dimension))
+    noise = rng.normal(scale=0.6, size=(count, dimension))
+    return (centres[rng.integers(0, len(centres), count)] + noise).astype(np.float32)
+
+
+class TestQuantizedVectors:
+    """float16/int8 EmbeddingMatrix storage and full-precision rescoring."""
+
+    @pytest.mark.parametrize(("precision", "ratio"), [("float16", 2), ("int8", 4)])
+    def test_quantized_scores_are_close(self, precision, ratio) -> None:
+        """Quantized rows take a fraction of the memory and score almost exactly."""
+        import numpy as np
+
+        from py_code_mode.skills import EmbeddingMatrix
+
+        vectors = _clustered_vectors(500, 128)
+        names = [f"s{i}" for i in range(500)]
+        exact = EmbeddingMatrix()
+        exact.set_many(names, vectors)
+        quantized = EmbeddingMatrix(precision)
+        quantized.set_many(names, vectors)
+
+        query = vectors[0] + 0.1
+        assert quantized.precision == precision
+        assert quantized.nbytes * ratio <= exact.nbytes * 1.05
+        assert np.abs(quantized.scores(query) - exact.scores(query)).max() < 0.01
+        assert np.abs(quantized["s3"] - exact["s3"]).max() < 0.01
+
+    def test_int8_remove_keeps_scales_aligned(self) -> None:
+        """The moved last row keeps its own scale."""
+        from py_code_mode.skills import EmbeddingMatrix
+
+        matrix = EmbeddingMatrix("int8")
+        matrix.set_many(["a", "b", "c"], [[1.0, 0.0], [0.0, 1.0], [3.0, 4.0]])
+
+        matrix.remove("a")
+
+        assert matrix.names == ["c", "b"]
+        assert matrix["c"].tolist() == pytest.approx([0.6, 0.8], abs=0.01)
+        assert matrix.scores([0.0, 1.0]).tolist() == pytest.approx([0.8, 1.0], abs=0.01)
+
+    def test_rejects_unknown_precision(self) -> None:
+        from py_code_mode.skills import EmbeddingMatrix, MockEmbedder, SkillLibrary
+
+        with pytest.raises(ValueError, match="precision"):
+            EmbeddingMatrix("int4")  # type: ignore[arg-type]
+        with pytest.raises(ValueError, match="precision"):
+            SkillLibrary(MockEmbedder(), vector_precision="bf16")  # type: ignore[arg-type]
+
+    def test_int8_library_with_cache_ranks_like_float32(self, tmp_path: Path) -> None:
+        """Rescoring the int8 shortlist from the cache restores the float32 order."""
+        from py_code_mode.skills import (
+            EmbeddingCache,
+            MockEmbedder,
+            RankingConfig,
+            SkillLibrary,
+        )
+
+        embedder = MockEmbedder(dimension=64)
+        ranking = RankingConfig(lexical_weight=0.0)
+        exact = SkillLibrary(embedder, ranking=ranking)
+        quantized = SkillLibrary(
+            embedder,
+            ranking=ranking,
+            embedding_cache=EmbeddingCache(tmp_path / "cache"),
+            vector_precision="int8",
+        )
+        for i in range(300):
+            skill = _make_skill(f"skill_{i}", f"Skill about topic {i}", f"return {i}")
+            exact.add(skill)
+            quantized.add(skill)
+
+        for query in ("topic 12", "network scan", "parse json"):
+            expected = [s.name for s in exact.search(query, limit=10)]
+            assert [s.name for s in quantized.search(query, limit=10)] == expected
+
+    @pytest.mark.benchmark
+    def test_benchmark_quantized_memory_and_recall(self) -> None:
+        """Memory saved and recall@10 of float16/int8 over 100k 768-d vectors."""
+        from py_code_mode.skills import EmbeddingMatrix
+        from py_code_mode.skills.embeddings import top_k_indices
+
+        count, queries, dimension = 100_000, 50, 768
+        vectors = _clustered_vectors(count, dimension)
+        query_vectors = _clustered_vectors(queries, dimension, seed=2)
+        names = [f"s{i}" for i in range(count)]
+        exact = EmbeddingMatrix()
+        exact.set_many(names, vectors)
+        truth = [set(top_k_indices(exact.scores(q), 10).tolist()) for q in query_vectors]
+
+        for precision, ratio, min_recall in (("float16", 2, 0.99), ("int8", 4, 0.95)):
+            quantized = EmbeddingMatrix(precision)
+            quantized.set_many(names, vectors)
+            hits = rescored_hits = 0
+            for q, expected in zip(query_vectors, truth, strict=True):
+                shortlist = top_k_indices(quantized.scores(q), 40)
+                hits += len(set(shortlist[:10].tolist()) & expected)
+                # Full-precision rescoring of the shortlist, as SkillLibrary does
+                rescored = shortlist[
+                    top_k_indices(exact.matrix[shortlist] @ exact._normalize(q), 10)
+                ]
+                rescored_hits += len(set(rescored.tolist()) & expected)
+
+            assert quantized.nbytes * ratio <= exact.nbytes * 1.05, precision
+            assert hits / (queries * 10) >= min_recall, precision
+            assert rescored_hits == queries * 10, precision
+
+
 class TestSkillLibraryWithStore:
     """Tests for SkillLibrary with storage backend integration.
 
@@ -495,6 +1060,154 @@ class TestSkillLibraryWithStore:
 
         assert len(library) == 1
 
+    def test_refresh_is_noop_when_store_unchanged(self, sample_skills: list[PythonSkill]) -> None:
+        """refresh() loads nothing when the store's change token is unchanged."""
+        from unittest.mock import patch
+
+        from py_code_mode.skills import MemorySkillStore, MockEmbedder, SkillLibrary
+
+        store = MemorySkillStore()
+        for skill in sample_skills:
+            store.save(skill)
+        library = SkillLibrary(embedder=MockEmbedder(dimension=384), store=store)
+
+        with (
+            patch.object(store, "list_all", wraps=store.list_all) as list_all,
+            patch.object(store, "load", wraps=store.load) as load,
+        ):
+            library.refresh()
+
+        list_all.assert_not_called()
+        load.assert_not_called()
+        assert len(library) == 2
+
+    def test_refresh_reloads_only_changed_skills(self, tmp_path: Path) -> None:
+        """refresh() reloads and re-embeds only skills whose version changed."""
+        from unittest.mock import patch
+
+        from py_code_mode.skills import FileSkillStore, MockEmbedder, SkillLibrary
+
+        store = FileSkillStore(tmp_path)
+        for i in range(5):
+            store.save(_make_skill(f"skill_{i}", f"Skill number {i}", "pass"))
+        embedder = MockEmbedder(dimension=384)
+        library = SkillLibrary(embedder=embedder, store=store)
+
+        store.save(_make_skill("skill_2", "Rewritten skill", "return 2"))
+        store.delete("skill_4")
+        store.save(_make_skill("skill_5", "Brand new skill", "pass"))
+
+        with (
+            patch.object(store, "list_all", wraps=store.list_all) as list_all,
+            patch.object(store, "load", wraps=store.load) as load,
+            patch.object(embedder, "embed", wraps=embedder.embed) as embed,
+        ):
+            library.refresh()
+
+        list_all.assert_not_called()
+        assert sorted(c.args[0] for c in load.call_args_list) == ["skill_2", "skill_5"]
+        # Description and code embeddings for the two reloaded skills only, in one batch
+        assert embed.call_count == 1
+        assert len(embed.call_args.args[0]) == 4
+        assert sorted(s.name for s in library.list()) == [
+            "skill_0",
+            "skill_1",
+            "skill_2",
+            "skill_3",
+            "skill_5",
+        ]
+        assert library.get("skill_2").description == "Rewritten skill"
+
+
+class TestBatchedIndexing:
+    """Refresh embeds new and changed skills in batches."""
+
+    def test_cold_refresh_embeds_in_batches(self) -> None:
+        """Indexing N skills costs ceil(2N / embed_batch_size) embed calls."""
+        from unittest.mock import patch
+
+        from py_code_mode.skills import MemorySkillStore, MockEmbedder, SkillLibrary
+
+        store = MemorySkillStore()
+        for i in range(50):
+            store.save(_make_skill(f"skill_{i}", f"Skill number {i}", "pass"))
+        embedder = MockEmbedder(dimension=32)
+
+        with patch.object(embedder, "embed", wraps=embedder.embed) as embed:
+            library = SkillLibrary(embedder=embedder, store=store, embed_batch_size=40)
+
+        assert [len(c.args[0]) for c in embed.call_args_list] == [40, 40, 20]
+        assert len(library) == 50
+        # Vectors line up with their skills
+        skill = library.get("skill_17")
+        assert library._description_vectors["skill_17"].tolist() == pytest.approx(
+            embedder.embed([skill.description])[0], abs=1e-6
+        )
+        assert library._code_vectors["skill_17"].tolist() == pytest.approx(
+            embedder.embed([skill.source])[0], abs=1e-6
+        )
+
+    def test_refresh_uses_add_many_on_batch_vector_store(self) -> None:
+        """A BatchVectorStore receives all skills in one add_many() call."""
+        from py_code_mode.skills import (
+            MemorySkillStore,
+            MockEmbedder,
+            SkillLibrary,
+            VectorEntry,
+            compute_content_hash,
+        )
+
+        class RecordingVectorStore:
+            def __init__(self) -> None:
+                self.add_many_calls: list[tuple[list[VectorEntry], int]] = []
+
+            def add(self, id: str, description: str, source: str, content_hash: str) -> None:
+                raise AssertionError("add() should not be called")
+
+            def add_many(self, entries: list[VectorEntry], batch_size: int = 128) -> int:
+                self.add_many_calls.append((entries, batch_size))
+                return len(entries)
+
+            def remove(self, id: str) -> bool:
+                return False
+
+            def search(self, query, limit, desc_weight, code_weight):
+                return []
+
+            def get_content_hash(self, id: str) -> str | None:
+                return None
+
+            def get_model_info(self):
+                from py_code_mode.skills import ModelInfo
+
+                return ModelInfo("mock", 32)
+
+            def clear(self) -> None:
+                pass
+
+            def count(self) -> int:
+                return 0
+
+        store = MemorySkillStore()
+        for i in range(3):
+            store.save(_make_skill(f"skill_{i}", f"Skill number {i}", "pass"))
+        vector_store = RecordingVectorStore()
+
+        SkillLibrary(
+            embedder=MockEmbedder(dimension=32),
+            store=store,
+            vector_store=vector_store,
+            embed_batch_size=16,
+        )
+
+        assert len(vector_store.add_many_calls) == 1
+        entries, batch_size = vector_store.add_many_calls[0]
+        assert batch_size == 16
+        assert sorted(e.id for e in entries) == ["skill_0", "skill_1", "skill_2"]
+        skill = store.load("skill_1")
+        entry = next(e for e in entries if e.id == "skill_1")
+        assert entry.content_hash == compute_content_hash(skill.description, skill.source)
+
 
 class TestCreateSkillLibraryFactory:
     """Tests for the create_skill_library factory function."""
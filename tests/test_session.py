@@ -1037,3 +1037,53 @@ async def run(a: int, b: int) -> int:
             assert result.value in (True, "True"), (
                 "artifacts namespace not available - serializable access likely broken"
             )
+
+
+class TestSessionRunStream:
+    """Tests for Session.run_stream() - streaming execution events."""
+
+    @pytest.fixture
+    def storage(self, tmp_path: Path) -> FileStorage:
+        return FileStorage(tmp_path)
+
+    @pytest.mark.asyncio
+    async def test_run_stream_yields_output_then_result(self, storage: FileStorage) -> None:
+        """run_stream() yields stdout chunks, then the final result."""
+        from py_code_mode import ResultEvent, StdoutEvent
+
+        async with Session(storage=storage) as session:
+            events = [e async for e in session.run_stream("print('a')\nprint('b')\n7 * 6")]
+
+        assert [e.text for e in events if isinstance(e, StdoutEvent)] == ["a", "\n", "b", "\n"]
+        assert isinstance(events[-1], ResultEvent)
+        assert events[-1].result.value == 42
+
+    @pytest.mark.asyncio
+    async def test_run_stream_falls_back_to_run(self, storage: FileStorage) -> None:
+        """Executors without run_stream still produce a complete event stream."""
+        from py_code_mode import ResultEvent, StdoutEvent
+        from py_code_mode.execution.in_process import InProcessExecutor
+
+        class NonStreamingExecutor(InProcessExecutor):
+            run_stream = None  # type: ignore[assignment]
+
+        async with Session(storage=storage, executor=NonStreamingExecutor()) as session:
+            events = [e async for e in session.run_stream("print('hi')\n1")]
+
+        assert events == [StdoutEvent("hi\n"), ResultEvent(events[-1].result)]
+        assert events[-1].result.value == 1
+
+    @pytest.mark.asyncio
+    async def test_run_stream_on_closed_session(self, storage: FileStorage) -> None:
+        """run_stream() on a closed session yields a single ErrorEvent."""
+        from py_code_mode import ErrorEvent
+
+        session = Session(storage=storage)
+        await session.start()
+        await session.close()
+
+        events = [e async for e in session.run_stream("1")]
+
+        assert len(events) == 1
+        assert isinstance(events[0], ErrorEvent)
+        assert "closed" in events[0].error.lower()
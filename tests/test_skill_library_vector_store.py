@@ -156,12 +156,17 @@ class TestSearchDelegation:
 
         This test will FAIL because delegation logic doesn't exist yet.
         """
-        from py_code_mode.skills import MockEmbedder, SkillLibrary
+        from py_code_mode.skills import MockEmbedder, RankingConfig, SkillLibrary
 
         embedder = MockEmbedder(dimension=384)
         vector_store = MockVectorStore()
 
-        library = SkillLibrary(embedder=embedder, vector_store=vector_store)
+        # Semantic only: fused search asks the store for extra candidates
+        library = SkillLibrary(
+            embedder=embedder,
+            vector_store=vector_store,
+            ranking=RankingConfig(lexical_weight=0.0),
+        )
 
         # Add a skill (so search has something to find)
         skill = _make_skill("test", "test skill", "pass")
@@ -203,12 +208,16 @@ class TestSearchDelegation:
 
     def test_search_respects_limit_parameter(self) -> None:
         """search(limit=N) should pass limit to vector_store.search()."""
-        from py_code_mode.skills import MockEmbedder, SkillLibrary
+        from py_code_mode.skills import MockEmbedder, RankingConfig, SkillLibrary
 
         embedder = MockEmbedder(dimension=384)
         vector_store = MockVectorStore()
 
-        library = SkillLibrary(embedder=embedder, vector_store=vector_store)
+        library = SkillLibrary(
+            embedder=embedder,
+            vector_store=vector_store,
+            ranking=RankingConfig(lexical_weight=0.0),
+        )
 
         # Add multiple skills
         for i in range(5):
@@ -1,6 +1,8 @@
 """Tests for SkillStore protocol and implementations."""
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -10,6 +12,7 @@ from py_code_mode.skills import (
     PythonSkill,
     RedisSkillStore,
     SkillStore,
+    VersionedSkillStore,
 )
 
 # --- Fixtures ---
@@ -245,6 +248,8 @@ class TestRedisSkillStore:
         class MockRedis:
             def __init__(self):
                 self._data: dict[str, dict[str, str]] = {}
+                self._strings: dict[str, str] = {}
+                self.pipelines = 0
 
             def hset(self, key: str, field: str, value: str) -> int:
                 if key not in self._data:
@@ -267,6 +272,25 @@ class TestRedisSkillStore:
             def hexists(self, key: str, field: str) -> bool:
                 return field in self._data.get(key, {})
 
+            def hkeys(self, key: str) -> list[str]:
+                return list(self._data.get(key, {}))
+
+            def hlen(self, key: str) -> int:
+                return len(self._data.get(key, {}))
+
+            def get(self, key: str) -> str | None:
+                return self._strings.get(key)
+
+            def incr(self, key: str) -> int:
+                self._strings[key] = str(int(self._strings.get(key, "0")) + 1)
+                return int(self._strings[key])
+
+            def pipeline(self):
+                from tests.conftest import MockPipeline
+
+                self.pipelines += 1
+                return MockPipeline(self)
+
         return MockRedis()
 
     @pytest.fixture
@@ -339,6 +363,154 @@ class TestRedisSkillStore:
         # Check the key in mock redis
         assert "my-prefix:__skills__" in mock_redis._data
 
+    def test_change_token_and_versions_track_writes(
+        self, redis_store: RedisSkillStore, sample_python_skill: PythonSkill
+    ):
+        """Saves and deletes bump the generation and per-skill versions."""
+        assert redis_store.change_token() == "0"
+
+        redis_store.save(sample_python_skill)
+        token = redis_store.change_token()
+        version = redis_store.versions()["greet"]
+        assert token != "0"
+
+        redis_store.save(
+            PythonSkill.from_source(
+                name="greet",
+                source='async def run(name: str) -> str:\n    return f"Hi, {name}!"',
+                description="Greet someone",
+            )
+        )
+        assert redis_store.change_token() != token
+        assert redis_store.versions()["greet"] != version
+
+        token = redis_store.change_token()
+        redis_store.delete("greet")
+        assert redis_store.change_token() != token
+        assert redis_store.versions() == {}
+
+    def test_save_is_one_pipeline(
+        self, mock_redis, redis_store: RedisSkillStore, sample_python_skill: PythonSkill
+    ):
+        """Skill data, its version and the generation bump go out in one pipeline."""
+        with patch.object(mock_redis, "hset", wraps=mock_redis.hset) as hset:
+            redis_store.save(sample_python_skill)
+
+        assert mock_redis.pipelines == 1
+        assert hset.call_count == 2
+        assert redis_store.change_token() == "1"
+        assert redis_store.load("greet") is not None
+
+    def test_versions_include_untracked_skills(self, mock_redis, redis_store: RedisSkillStore):
+        """Skills written without a version entry still appear in versions()."""
+        mock_redis.hset(
+            "test-skills:__skills__",
+            "legacy",
+            '{"name": "legacy", "source": "async def run(): pass", "description": "Old"}',
+        )
+
+        assert redis_store.versions() == {"legacy": ""}
+
+
+# --- VersionedSkillStore Tests ---
+
+
+class TestVersionedSkillStore:
+    """change_token() and versions() for the memory and file stores."""
+
+    @pytest.fixture(params=["memory", "file"])
+    def store(self, request, tmp_path: Path):
+        if request.param == "memory":
+            return MemorySkillStore()
+        return FileSkillStore(tmp_path)
+
+    def test_stores_are_versioned(self, store):
+        """Built-in stores satisfy VersionedSkillStore."""
+        assert isinstance(store, VersionedSkillStore)
+
+    def test_token_stable_without_writes(self, store, sample_python_skill: PythonSkill):
+        """Reads do not change the token."""
+        store.save(sample_python_skill)
+        token = store.change_token()
+
+        store.list_all()
+        store.load("greet")
+
+        assert store.change_token() == token
+
+    def test_save_changes_only_that_skill_version(
+        self, store, sample_python_skill: PythonSkill, another_python_skill: PythonSkill
+    ):
+        """Overwriting one skill changes its version and the token, not the others."""
+        store.save(sample_python_skill)
+        store.save(another_python_skill)
+        token = store.change_token()
+        before = store.versions()
+
+        store.save(
+            PythonSkill.from_source(
+                name="greet",
+                source='async def run(name: str) -> str:\n    return f"Hello again, {name}!"',
+                description="Greet someone",
+            )
+        )
+        after = store.versions()
+
+        assert store.change_token() != token
+        assert after["greet"] != before["greet"]
+        assert after["farewell"] == before["farewell"]
+
+    def test_versions_after_token_reflect_later_writes(
+        self, store, sample_python_skill: PythonSkill
+    ):
+        """A save between change_token() and versions() is not hidden."""
+        store.change_token()
+        store.save(sample_python_skill)
+
+        assert "greet" in store.versions()
+
+    def test_delete_removes_version(self, store, sample_python_skill: PythonSkill):
+        """Deleted skills drop out of versions()."""
+        store.save(sample_python_skill)
+        token = store.change_token()
+
+        store.delete("greet")
+
+        assert store.change_token() != token
+        assert store.versions() == {}
+
+
+class TestFileSkillStoreScans:
+    """FileSkillStore scans the directory once per refresh."""
+
+    def test_versions_reuses_change_token_scan(
+        self, tmp_path: Path, sample_python_skill: PythonSkill
+    ):
+        store = FileSkillStore(tmp_path)
+        store.save(sample_python_skill)
+
+        with patch("py_code_mode.skills.store.os.scandir", wraps=os.scandir) as scandir:
+            store.change_token()
+            versions = store.versions()
+            assert scandir.call_count == 1
+
+            # The kept manifest is used once; later calls scan again
+            assert store.versions() == versions
+            assert scandir.call_count == 2
+
+    def test_changed_refresh_scans_once(self, tmp_path: Path, sample_python_skill: PythonSkill):
+        from py_code_mode.skills import MockEmbedder, SkillLibrary
+
+        store = FileSkillStore(tmp_path)
+        library = SkillLibrary(embedder=MockEmbedder(dimension=8), store=store)
+        store.save(sample_python_skill)
+
+        with patch("py_code_mode.skills.store.os.scandir", wraps=os.scandir) as scandir:
+            library.refresh()
+
+        assert scandir.call_count == 1
+        assert library.get("greet") is not None
+
 
 # --- FileSkillStore Name Validation Tests ---
 
@@ -222,3 +222,134 @@ class TestPythonSkillFromSource:
         result = await skill.invoke(x=3, y=4)
 
         assert result == 12
+
+
+class TestLazyPythonSkill:
+    """Skills are parsed at load time and only executed on first invoke."""
+
+    SIDE_EFFECT_SOURCE = dedent('''
+        """Touch a marker file when the module runs."""
+        from pathlib import Path
+
+        Path(__file__).with_suffix(".ran").touch()
+
+        async def run(n: int = 2) -> int:
+            return n * 2
+    ''').strip()
+
+    def test_from_file_does_not_execute_module(self, tmp_path: Path) -> None:
+        """Loading a skill does not run its top-level code."""
+        skill_path = tmp_path / "marker.py"
+        skill_path.write_text(self.SIDE_EFFECT_SOURCE)
+
+        skill = PythonSkill.from_file(skill_path)
+
+        assert skill.description == "Touch a marker file when the module runs."
+        assert not (tmp_path / "marker.ran").exists()
+
+    @pytest.mark.asyncio
+    async def test_first_invoke_executes_module_once(self, tmp_path: Path) -> None:
+        """The module runs on the first invoke and the function is reused after."""
+        skill_path = tmp_path / "marker.py"
+        skill_path.write_text(self.SIDE_EFFECT_SOURCE)
+        skill = PythonSkill.from_file(skill_path)
+
+        assert await skill.invoke() == 4
+        marker = tmp_path / "marker.ran"
+        assert marker.exists()
+
+        marker.unlink()
+        assert await skill.invoke(n=5) == 10
+        assert not marker.exists()
+
+    def test_parameters_from_ast(self) -> None:
+        """Types, defaults and injected params are read from the AST."""
+        source = dedent('''
+            from __future__ import annotations
+
+            LIMIT = 10
+
+            async def run(
+                tools,
+                query: str,
+                ratio: float = 0.5,
+                tags: list = [],
+                limit: int = LIMIT,
+                *,
+                verbose: bool = False,
+                opts: dict | None = None,
+            ) -> list:
+                """Search for things."""
+                return []
+        ''').strip()
+
+        skill = PythonSkill.from_source(name="find_things", source=source)
+        params = {p.name: p for p in skill.parameters}
+
+        assert skill.description == "Search for things."
+        assert list(params) == ["query", "ratio", "tags", "limit", "verbose", "opts"]
+        assert params["query"].type == "string"
+        assert params["query"].required is True
+        assert params["ratio"].type == "number"
+        assert params["ratio"].default == 0.5
+        assert params["tags"].type == "array"
+        assert params["tags"].default == []
+        # Non-literal defaults are reported as their source text
+        assert params["limit"].type == "integer"
+        assert params["limit"].default == "LIMIT"
+        assert params["verbose"].type == "boolean"
+        assert params["verbose"].required is False
+        assert params["opts"].type == "string"
+        assert params["opts"].default is None
+        assert params["opts"].required is False
+
+    @pytest.mark.asyncio
+    async def test_runtime_errors_surface_on_invoke(self) -> None:
+        """Errors in top-level code are raised by invoke, not at load time."""
+        source = dedent("""
+            import not_a_real_module_xyz
+
+            async def run() -> None:
+                pass
+        """).strip()
+
+        skill = PythonSkill.from_source(name="broken", source=source)
+
+        with pytest.raises(ModuleNotFoundError):
+            await skill.invoke()
+
+    @pytest.mark.benchmark
+    def test_benchmark_load_10k_skills(self, tmp_path: Path) -> None:
+        """Loading 10k skills costs parsing only, well below executing them."""
+        import time
+
+        from py_code_mode.skills import FileSkillStore
+
+        # Top-level work stands in for heavy imports and module side effects
+        template = dedent('''
+            """Skill number {i}."""
+            import json
+            import decimal
+
+            TABLE = [decimal.Decimal(x) / 7 for x in range(2000)]
+
+            async def run(x: int, label: str = "s{i}") -> str:
+                return json.dumps([x, label])
+        ''').strip()
+        for i in range(10_000):
+            (tmp_path / f"skill_{i}.py").write_text(template.format(i=i))
+        store = FileSkillStore(tmp_path)
+
+        start = time.perf_counter()
+        skills = store.list_all()
+        load_s = time.perf_counter() - start
+
+        assert len(skills) == 10_000
+        assert all(s._func is None for s in skills)
+
+        start = time.perf_counter()
+        for skill in skills[:1000]:
+            skill._func = skill._load_func()
+        exec_s = (time.perf_counter() - start) * 10
+
+        assert load_s < exec_s
@@ -21,6 +21,8 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import patch
 
+import pytest
+
 from py_code_mode.storage import FileStorage, RedisStorage
 
 if TYPE_CHECKING:
@@ -62,6 +64,25 @@ class TestFileStorageVectorStoreIntegration:
         assert hasattr(vector_store, "search")
         assert hasattr(vector_store, "count")
 
+    def test_get_vector_store_returns_numpy_store_when_requested(self, tmp_path: Path) -> None:
+        """vector_index="numpy" selects NumpyVectorStore under vectors/ann.
+
+        Breaks when: The option is ignored or the index lands elsewhere.
+        """
+        from py_code_mode.skills.vector_stores import NumpyVectorStore
+
+        storage = FileStorage(tmp_path, vector_index="numpy")
+
+        vector_store = storage.get_vector_store()
+
+        assert isinstance(vector_store, NumpyVectorStore)
+        assert (tmp_path / "vectors" / "ann").is_dir()
+
+    def test_rejects_unknown_vector_index(self, tmp_path: Path) -> None:
+        """An unknown vector_index fails fast."""
+        with pytest.raises(ValueError, match="vector_index"):
+            FileStorage(tmp_path, vector_index="faiss")  # type: ignore[arg-type]
+
     def test_get_vector_store_uses_correct_path(self, tmp_path: Path) -> None:
         """get_vector_store() uses {base_path}/vectors/ directory.
 
@@ -165,6 +186,42 @@ class TestFileStorageSkillLibraryVectorStoreIntegration:
         assert len(results) > 0
         assert any(r.name == "calculate_total" for r in results)
 
+    def test_skill_library_answers_lexically_while_model_loads(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The model loads in the background and search falls back to BM25 meanwhile.
+
+        Breaks when: get_skill_library() or get_vector_store() builds an Embedder
+        that only loads on first use, so the first search blocks on the model.
+        """
+        import threading
+
+        from py_code_mode.skills import Embedder, PythonSkill
+        from tests.conftest import _original_embedder_init
+
+        release = threading.Event()
+        # Bypass the shared test model so this embedder really loads in the background
+        monkeypatch.setattr(Embedder, "__init__", _original_embedder_init)
+        monkeypatch.setattr(Embedder, "_load_model", lambda self: release.wait())
+        try:
+            storage = FileStorage(tmp_path, vector_index="numpy")
+            library = storage.get_skill_library()
+
+            assert library.embedder.loading
+            assert storage.get_vector_store()._embedder is library.embedder
+            library.add(
+                PythonSkill.from_source(
+                    name="calculate_total",
+                    source="async def run(numbers): return sum(numbers)",
+                    description="Add up all numbers in a list",
+                )
+            )
+            results = library.search("calculate_total numbers")
+        finally:
+            release.set()
+
+        assert [r.name for r in results] == ["calculate_total"]
+
 
 # =============================================================================
 # Phase 4.3: RedisStorage.get_vector_store() (placeholder for Phase 6)
@@ -1,5 +1,6 @@
 """Tests for SubprocessExecutor, SubprocessConfig, and VenvManager."""
 
+import asyncio
 import shutil
 import sys
 from pathlib import Path
@@ -189,6 +190,11 @@ class TestSubprocessConfig:
         with pytest.raises(ValueError, match="default_timeout"):
             SubprocessConfig(python_version="3.12", default_timeout=0.0)
 
+    def test_zero_storage_io_workers_raises_value_error(self) -> None:
+        """storage_io_workers must allow at least one thread."""
+        with pytest.raises(ValueError, match="storage_io_workers"):
+            SubprocessConfig(python_version="3.12", storage_io_workers=0)
+
     # =========================================================================
     # Valid python_version formats (positive tests)
     # =========================================================================
@@ -1040,6 +1046,146 @@ class TestSubprocessExecutorCapabilities:
         assert Capability.FILESYSTEM_ISOLATION not in caps
 
 
+# =============================================================================
+# StorageResourceProvider Skill Tests
+# =============================================================================
+
+
+class TestStorageResourceProviderGetSkill:
+    """Tests for conditional skills.get used by the kernel's compiled skill cache."""
+
+    @pytest.fixture
+    def provider(self):
+        """Provide a StorageResourceProvider backed by a one-skill library."""
+        from unittest.mock import MagicMock
+
+        from py_code_mode.execution.subprocess.executor import StorageResourceProvider
+        from py_code_mode.skills import PythonSkill
+
+        skill = PythonSkill.from_source(
+            name="double",
+            source="async def run(n: int) -> int:\n    return n * 2\n",
+            description="x2",
+        )
+        library = MagicMock()
+        library.get.side_effect = lambda name: skill if name == "double" else None
+        storage = MagicMock()
+        storage.get_skill_library.return_value = library
+        return StorageResourceProvider(storage=storage)
+
+    @pytest.mark.asyncio
+    async def test_get_skill_includes_content_hash(self, provider) -> None:
+        """Full responses carry the hash the kernel caches against."""
+        from py_code_mode.skills import compute_content_hash
+
+        skill = await provider.get_skill("double")
+
+        assert skill["source"].startswith("async def run")
+        assert skill["content_hash"] == compute_content_hash("x2", skill["source"])
+
+    @pytest.mark.asyncio
+    async def test_matching_hash_returns_not_modified_without_source(self, provider) -> None:
+        """An up-to-date cache gets only the hash back."""
+        full = await provider.get_skill("double")
+
+        result = await provider.get_skill("double", if_none_match=full["content_hash"])
+
+        assert result == {
+            "name": "double",
+            "content_hash": full["content_hash"],
+            "not_modified": True,
+        }
+
+    @pytest.mark.asyncio
+    async def test_stale_hash_returns_full_skill(self, provider) -> None:
+        """A stale cache gets the current source."""
+        result = await provider.get_skill("double", if_none_match="stale")
+
+        assert "source" in result
+        assert "not_modified" not in result
+
+    @pytest.mark.asyncio
+    async def test_missing_skill_returns_none(self, provider) -> None:
+        """A deleted skill is reported as missing even with a cached hash."""
+        assert await provider.get_skill("missing", if_none_match="abc") is None
+
+
+class TestStorageResourceProviderNonBlocking:
+    """Blocking storage calls must not stall the host event loop."""
+
+    @pytest.mark.asyncio
+    async def test_slow_storage_call_does_not_block_event_loop(self) -> None:
+        """Other coroutines keep running while a slow artifact load is in flight."""
+        import time
+        from unittest.mock import MagicMock
+
+        from py_code_mode.execution.subprocess.executor import StorageResourceProvider
+
+        def slow_load(name: str) -> str:
+            time.sleep(0.5)
+            return f"data:{name}"
+
+        store = MagicMock()
+        store.load.side_effect = slow_load
+        storage = MagicMock()
+        storage.get_artifact_store.return_value = store
+        provider = StorageResourceProvider(storage=storage)
+
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        try:
+            assert await provider.load_artifact("report") == "data:report"
+        finally:
+            ticking.cancel()
+            provider.close()
+
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_concurrent_skill_calls_are_serialized(self) -> None:
+        """The skill library is never entered by two threads at once."""
+        import threading
+        import time
+        from unittest.mock import MagicMock
+
+        from py_code_mode.execution.subprocess.executor import StorageResourceProvider
+
+        active = 0
+        peak = 0
+        guard = threading.Lock()
+
+        def refresh() -> None:
+            nonlocal active, peak
+            with guard:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with guard:
+                active -= 1
+
+        library = MagicMock()
+        library.refresh.side_effect = refresh
+        library.list.return_value = []
+        storage = MagicMock()
+        storage.get_skill_library.return_value = library
+        provider = StorageResourceProvider(storage=storage, io_workers=4)
+
+        try:
+            await asyncio.gather(*(provider.list_skills() for _ in range(4)))
+        finally:
+            provider.close()
+
+        assert library.refresh.call_count == 4
+        assert peak == 1
+
+
 # =============================================================================
 # SubprocessExecutor Lifecycle Tests
 # =============================================================================
@@ -1521,6 +1667,211 @@ time.sleep(10)  # Sleep longer than timeout
         assert "timeout" in result.error.lower() or "timed out" in result.error.lower()
 
 
+# =============================================================================
+# SubprocessExecutor Latency Tests
+# =============================================================================
+
+
+@pytest.mark.slow
+@pytest.mark.xdist_group("subprocess")
+class TestSubprocessExecutorLatency:
+    """Round-trip latency benchmarks for trivial cells.
+
+    execute() must return as soon as the kernel reports completion, with no
+    fixed polling or drain delay on top of the kernel's own latency.
+    """
+
+    @pytest.fixture
+    async def executor(self, tmp_path: Path):
+        """Provide a started SubprocessExecutor for tests."""
+        from py_code_mode.execution.subprocess import SubprocessExecutor
+
+        config = SubprocessConfig(
+            python_version="3.12",
+            venv_path=tmp_path / "venv",
+            base_deps=("ipykernel",),
+        )
+        exec = SubprocessExecutor(config=config)
+        await exec.start()
+        yield exec
+        await exec.close()
+
+    @pytest.mark.benchmark
+    @pytest.mark.asyncio
+    async def test_trivial_cell_round_trip(self, executor) -> None:
+        """Trivial cells complete without a fixed latency floor."""
+        import statistics
+        import time
+
+        # Warm up the kernel
+        await executor.run("1 + 1")
+
+        timings = []
+        for _ in range(50):
+            start = time.perf_counter()
+            result = await executor.run("1 + 1")
+            timings.append(time.perf_counter() - start)
+            assert result.value == 2
+
+        # The previous implementation always waited >= 100ms draining iopub
+        assert statistics.median(timings) * 1000 < 10
+
+    @pytest.mark.asyncio
+    async def test_output_is_complete_on_return(self, executor) -> None:
+        """All output for a cell has been collected when run() returns."""
+        result = await executor.run("for i in range(200): print(i)")
+
+        assert result.error is None
+        assert result.stdout.splitlines() == [str(i) for i in range(200)]
+
+
+@pytest.mark.slow
+@pytest.mark.xdist_group("subprocess")
+class TestSubprocessExecutorStreaming:
+    """Tests for run_stream() - kernel output forwarded as it arrives."""
+
+    @pytest.fixture
+    async def executor(self, tmp_path: Path):
+        """Provide a started SubprocessExecutor for tests."""
+        from py_code_mode.execution.subprocess import SubprocessExecutor
+
+        config = SubprocessConfig(
+            python_version="3.12",
+            venv_path=tmp_path / "venv",
+            base_deps=("ipykernel",),
+        )
+        exec = SubprocessExecutor(config=config)
+        await exec.start()
+        yield exec
+        await exec.close()
+
+    @pytest.mark.asyncio
+    async def test_output_streams_before_cell_finishes(self, executor) -> None:
+        """stdout/stderr events arrive while the cell is still running."""
+        import time
+
+        from py_code_mode import ResultEvent, StderrEvent, StdoutEvent
+
+        code = (
+            "import sys, time\n"
+            "print('first', flush=True)\n"
+            "print('oops', file=sys.stderr, flush=True)\n"
+            "time.sleep(1.0)\n"
+            "print('second')\n"
+            "40 + 2"
+        )
+        start = time.perf_counter()
+        first_output_at = None
+        events = []
+        async for event in executor.run_stream(code):
+            if isinstance(event, StdoutEvent) and first_output_at is None:
+                first_output_at = time.perf_counter() - start
+            events.append(event)
+        total = time.perf_counter() - start
+
+        assert first_output_at is not None
+        assert first_output_at < total - 0.5
+        assert "".join(e.text for e in events if isinstance(e, StdoutEvent)) == "first\nsecond\n"
+        assert "".join(e.text for e in events if isinstance(e, StderrEvent)) == "oops\n"
+        assert isinstance(events[-1], ResultEvent)
+        assert events[-1].result.value == 42
+        assert events[-1].result == await executor.run(code)
+
+    @pytest.mark.asyncio
+    async def test_display_data_is_streamed(self, executor) -> None:
+        """IPython display() output is delivered as a DisplayEvent."""
+        from py_code_mode import DisplayEvent
+
+        events = [
+            e
+            async for e in executor.run_stream(
+                "from IPython.display import display, HTML\ndisplay(HTML('<b>hi</b>'))"
+            )
+        ]
+
+        displays = [e for e in events if isinstance(e, DisplayEvent)]
+        assert len(displays) == 1
+        assert displays[0].data["text/html"] == "<b>hi</b>"
+
+    @pytest.mark.asyncio
+    async def test_error_ends_with_error_event(self, executor) -> None:
+        """A failing cell ends with an ErrorEvent carrying the traceback."""
+        from py_code_mode import ErrorEvent
+
+        events = [e async for e in executor.run_stream("1 / 0")]
+
+        assert isinstance(events[-1], ErrorEvent)
+        assert "ZeroDivisionError" in events[-1].error
+
+
+# =============================================================================
+# SubprocessExecutor Result Transport Tests
+# =============================================================================
+
+
+@pytest.mark.slow
+@pytest.mark.xdist_group("subprocess")
+class TestSubprocessExecutorResultTransport:
+    """Tests for structured result values sent alongside text/plain."""
+
+    @pytest.fixture
+    async def executor(self, tmp_path: Path):
+        """Provide a started SubprocessExecutor with msgpack in the kernel venv."""
+        pytest.importorskip("msgpack")
+        from py_code_mode.execution.subprocess import SubprocessExecutor
+
+        config = SubprocessConfig(
+            python_version="3.12",
+            venv_path=tmp_path / "venv",
+            base_deps=("ipykernel", "msgpack"),
+        )
+        exec = SubprocessExecutor(config=config)
+        await exec.start()
+        yield exec
+        await exec.close()
+
+    @pytest.mark.asyncio
+    async def test_large_containers_are_not_truncated(self, executor) -> None:
+        """Results past IPython's 1000-item repr limit come back whole."""
+        result = await executor.run("list(range(5000))")
+
+        assert result.error is None
+        assert result.value == list(range(5000))
+
+    @pytest.mark.asyncio
+    async def test_container_types_are_preserved(self, executor) -> None:
+        """Tuples, sets and big ints keep their exact types."""
+        result = await executor.run("{'t': (1, 2), 's': {3}, 'big': 2**80, (1, 2): 1j}")
+
+        assert result.value == {"t": (1, 2), "s": {3}, "big": 2**80, (1, 2): 1j}
+        assert type(result.value["t"]) is tuple
+
+    @pytest.mark.asyncio
+    async def test_unencodable_values_fall_back_to_repr(self, executor) -> None:
+        """Custom objects still come back as their text representation."""
+        result = await executor.run(
+            "class Point:\n    def __repr__(self): return 'Point()'\nPoint()"
+        )
+
+        assert result.value == "Point()"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("shape", ["list", "dict"])
+    async def test_10mb_result(self, executor, shape: str) -> None:
+        """A ~10MB result crosses the kernel boundary intact."""
+        if shape == "list":
+            code = "list(range(1_200_000))"
+            expected: object = list(range(1_200_000))
+        else:
+            code = "{f'key-{i}': {'id': i, 'score': i * 0.5} for i in range(200_000)}"
+            expected = {f"key-{i}": {"id": i, "score": i * 0.5} for i in range(200_000)}
+
+        result = await executor.run(code)
+
+        assert result.error is None
+        assert result.value == expected
+
+
 # =============================================================================
 # SubprocessExecutor Reset Tests
 # =============================================================================
@@ -1581,6 +1932,123 @@ class TestSubprocessExecutorReset:
         assert result.value in (True, "True")
 
 
+@pytest.mark.slow
+@pytest.mark.xdist_group("subprocess")
+class TestSubprocessExecutorStandbyReset:
+    """Tests for reset() swapping to a standby kernel (standby_kernel=True)."""
+
+    @pytest.fixture
+    async def executor(self, tmp_path: Path):
+        """Provide a started SubprocessExecutor with a standby kernel."""
+        from py_code_mode.execution.subprocess import SubprocessExecutor
+        from py_code_mode.storage.backends import FileStorage
+
+        storage = FileStorage(tmp_path)
+
+        config = SubprocessConfig(
+            python_version="3.12",
+            venv_path=tmp_path / "venv",
+            base_deps=("ipykernel",),
+            preload_modules=("decimal", "not_a_real_module_xyz"),
+            standby_kernel=True,
+        )
+        exec = SubprocessExecutor(config=config)
+        await exec.start(storage=storage)
+        yield exec
+        await exec.close()
+
+    @pytest.mark.asyncio
+    async def test_reset_gives_fresh_process(self, executor) -> None:
+        """reset() clears variables by moving to a different kernel process."""
+        await executor.run("my_data = [1, 2, 3]")
+        pid_before = (await executor.run("import os; os.getpid()")).value
+
+        await executor.reset()
+
+        assert (await executor.run("'my_data' in dir()")).value is False
+        assert (await executor.run("import os; os.getpid()")).value != pid_before
+
+    @pytest.mark.asyncio
+    async def test_reset_kernel_is_bound_to_storage(self, executor) -> None:
+        """The swapped-in kernel serves RPC from the executor's storage."""
+        await executor.run("artifacts.save('before', 'kept')")
+
+        await executor.reset()
+
+        result = await executor.run("artifacts.load('before')")
+        assert result.error is None
+        assert result.value == "kept"
+
+    @pytest.mark.asyncio
+    async def test_preload_modules_imported(self, executor) -> None:
+        """Configured modules are imported at init; missing ones are skipped."""
+        await executor.reset()
+
+        result = await executor.run("import sys; 'decimal' in sys.modules")
+        assert result.value is True
+
+    @pytest.mark.asyncio
+    async def test_repeated_resets_use_replenished_standby(self, executor) -> None:
+        """Back-to-back resets each swap in a fresh standby the pool refilled."""
+        import time
+
+        pids = {(await executor.run("import os; os.getpid()")).value}
+
+        for i in range(3):
+            # Let the pool replace the standby kernel, as between real tasks
+            deadline = time.monotonic() + 60
+            while executor._kernel_pool.ready_count < 1:
+                assert time.monotonic() < deadline, "standby kernel was not replaced"
+                await asyncio.sleep(0.05)
+            await executor.run(f"leftover_{i} = {i}")
+            await executor.reset()
+
+            assert (await executor.run(f"'leftover_{i}' in dir()")).value is False
+            pids.add((await executor.run("import os; os.getpid()")).value)
+
+        assert len(pids) == 4
+
+    @pytest.mark.benchmark
+    @pytest.mark.asyncio
+    async def test_reset_latency_vs_restart(self, executor, tmp_path: Path) -> None:
+        """Swapping in the standby is much faster than restarting the kernel."""
+        import statistics
+        import time
+
+        from py_code_mode.execution.subprocess import SubprocessExecutor
+
+        restart_executor = SubprocessExecutor(
+            config=SubprocessConfig(
+                python_version="3.12",
+                venv_path=tmp_path / "venv",
+                base_deps=("ipykernel",),
+            )
+        )
+        await restart_executor.start()
+        try:
+            restart_timings = []
+            for _ in range(3):
+                start = time.perf_counter()
+                await restart_executor.reset()
+                restart_timings.append(time.perf_counter() - start)
+        finally:
+            await restart_executor.close()
+
+        standby_timings = []
+        for _ in range(3):
+            # Let the pool replace the standby kernel, as between real tasks
+            deadline = time.monotonic() + 60
+            while executor._kernel_pool.ready_count < 1:
+                assert time.monotonic() < deadline, "standby kernel was not replaced"
+                await asyncio.sleep(0.05)
+            start = time.perf_counter()
+            await executor.reset()
+            standby_timings.append(time.perf_counter() - start)
+            assert (await executor.run("1 + 1")).value == 2
+
+        assert statistics.median(standby_timings) < statistics.median(restart_timings) / 10
+
+
 # =============================================================================
 # SubprocessExecutor Error Condition Tests
 # =============================================================================
@@ -11,6 +11,7 @@ Tests are designed to FAIL with the current stub implementation, then pass once
 the builder implements proper namespace injection via py-code-mode installation.
 """
 
+import asyncio
 from pathlib import Path
 
 import pytest
@@ -241,6 +242,27 @@ class TestToolsNamespaceContract:
         assert result.error is None, f"Escape hatch failed: {result.error}"
         assert "direct" in str(result.value) or "direct" in result.stdout
 
+    @pytest.mark.asyncio
+    async def test_tools_map_batches_calls(self, executor_with_storage) -> None:
+        """tools.map() runs many calls in one RPC and returns results in order.
+
+        Breaks when: batch RPC missing, results reordered, or errors lost.
+        """
+        result = await executor_with_storage.run(
+            "[r.strip() for r in tools.map(tools.echo.run, "
+            "[{'text': f'item-{i}'} for i in range(50)], concurrency=8)]"
+        )
+        assert result.error is None, result.error
+        assert result.value == [f"item-{i}" for i in range(50)]
+
+        result = await executor_with_storage.run(
+            "results = tools.gather((tools.echo, {'text': 'ok'}), "
+            "(tools.echo.missing_recipe, {}), return_exceptions=True)\n"
+            "[type(r).__name__ for r in results]"
+        )
+        assert result.error is None, result.error
+        assert result.value == ["str", "ToolError"]
+
 
 # =============================================================================
 # Contract Tests - Skills Namespace
@@ -343,6 +365,49 @@ skills.create(
         assert result.error is None, f"Skill invocation failed: {result.error}"
         assert result.value in (25, "25"), f"Wrong result: {result.value}"
 
+    @pytest.mark.asyncio
+    async def test_skills_invoke_reuses_compiled_skill(self, executor_empty_storage) -> None:
+        """Repeated invokes reuse the compiled skill until it changes.
+
+        Breaks when: the kernel re-executes skill source on every invoke, or
+        serves a stale skill after skills.create()/skills.delete().
+        """
+        create_code = """
+skills.create(
+    name="counted",
+    source='''
+import builtins
+builtins._counted_loads = getattr(builtins, "_counted_loads", 0) + 1
+
+async def run(n: int) -> int:
+    return n + 1
+''',
+    description="Counts its own loads"
+)
+"""
+        result = await executor_empty_storage.run(create_code)
+        assert result.error is None, result.error
+
+        result = await executor_empty_storage.run(
+            "[skills.invoke('counted', n=i) for i in range(3)], _counted_loads"
+        )
+        assert result.error is None, result.error
+        assert result.value == ([1, 2, 3], 1)
+
+        # Replacing the skill invalidates the cached module
+        result = await executor_empty_storage.run(
+            create_code.replace("return n + 1", "return n + 100")
+        )
+        assert result.error is None, result.error
+        result = await executor_empty_storage.run("skills.invoke('counted', n=1), _counted_loads")
+        assert result.value == (101, 2)
+
+        result = await executor_empty_storage.run("skills.delete('counted')")
+        assert result.error is None
+        result = await executor_empty_storage.run("skills.invoke('counted', n=1)")
+        assert result.error is not None
+        assert "not found" in result.error.lower()
+
     @pytest.mark.asyncio
     async def test_skills_attribute_access_invocation(self, executor_empty_storage) -> None:
         """skills.<name>(**kwargs) provides attribute-based invocation.
@@ -725,6 +790,94 @@ class TestNamespaceErrors:
         assert "Syntax" in result.error or "syntax" in result.error.lower()
 
 
+# =============================================================================
+# Concurrent RPC Tests
+# =============================================================================
+
+
+@pytest.fixture
+async def executor_with_slow_provider(tmp_path: Path):
+    """Provide a started SubprocessExecutor whose tool calls take 0.5s on the host."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    async def slow_call_tool(name: str, args: dict) -> dict:
+        await asyncio.sleep(0.5)
+        return args
+
+    provider = MagicMock()
+    provider.call_tool = slow_call_tool
+    provider.list_tools = AsyncMock(return_value=[{"name": "slow"}])
+
+    config = SubprocessConfig(venv_path=tmp_path / "venv", base_deps=("ipykernel",))
+    executor = SubprocessExecutor(config=config)
+    await executor.start()
+    executor._host._provider = provider
+    yield executor
+    await executor.close()
+
+
+@pytest.mark.slow
+@pytest.mark.xdist_group("subprocess")
+class TestConcurrentRPC:
+    """RPC calls from multiple kernel threads are in flight at the same time."""
+
+    @pytest.mark.asyncio
+    async def test_threaded_tool_calls_run_concurrently(self, executor_with_slow_provider) -> None:
+        """Eight 0.5s tool calls from a thread pool finish in well under 4s.
+
+        Breaks when: RPC calls are serialized (global lock, single channel).
+        """
+        code = """
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+_start = time.monotonic()
+with ThreadPoolExecutor(max_workers=8) as pool:
+    results = list(pool.map(lambda i: tools.slow(index=i), range(8)))
+(results, time.monotonic() - _start)
+"""
+        result = await executor_with_slow_provider.run(code)
+
+        assert result.error is None, result.error
+        results, elapsed = result.value
+        assert results == [{"index": i} for i in range(8)]
+        assert elapsed < 2.0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_get_their_own_results(self, executor_empty_storage) -> None:
+        """Responses are routed back to the thread that made each request.
+
+        Breaks when: Responses are matched to the wrong caller.
+        """
+        code = """
+from concurrent.futures import ThreadPoolExecutor
+
+for i in range(8):
+    artifacts.save(f"item_{i}", {"index": i})
+
+with ThreadPoolExecutor(max_workers=8) as pool:
+    loaded = list(pool.map(lambda i: artifacts.load(f"item_{i}"), range(8)))
+[item["index"] for item in loaded]
+"""
+        result = await executor_empty_storage.run(code)
+
+        assert result.error is None, result.error
+        assert result.value == list(range(8))
+
+    @pytest.mark.asyncio
+    async def test_rpc_works_after_reset(self, executor_empty_storage) -> None:
+        """The RPC socket survives a kernel restart.
+
+        Breaks when: The restarted kernel cannot reach the host.
+        """
+        await executor_empty_storage.reset()
+
+        result = await executor_empty_storage.run('artifacts.exists("missing")')
+
+        assert result.error is None, result.error
+        assert result.value is False
+
+
 # =============================================================================
 # Unit Tests - Redis Storage Code Generation
 # =============================================================================
@@ -1138,3 +1291,51 @@ class TestRedisStorageIntegration:
 # Import for type hints
 if False:  # TYPE_CHECKING equivalent that doesn't require import at runtime
     from py_code_mode.storage import RedisStorage
+
+
+# =============================================================================
+# Binary Artifact Transfer Benchmarks
+# =============================================================================
+
+
+@pytest.fixture
+async def executor_with_msgpack(tmp_path: Path, empty_storage: FileStorage):
+    """Provide a started SubprocessExecutor with msgpack in the kernel venv."""
+    config = SubprocessConfig(
+        venv_path=tmp_path / "venv",
+        base_deps=("ipykernel", "msgpack"),
+    )
+    executor = SubprocessExecutor(config=config)
+    await executor.start(storage=empty_storage)
+    yield executor
+    await executor.close()
+
+
+@pytest.mark.xdist_group("subprocess")
+class TestBinaryArtifactTransfer:
+    """Bytes artifacts round-tripped through ArtifactsProxy.
+
+    Framing throughput against base64-in-JSON is benchmarked in
+    test_subprocess_rpc.py without needing a kernel.
+    """
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("size", [1024, 1024 * 1024])
+    async def test_bytes_artifact_round_trip(self, executor_with_msgpack, size: int) -> None:
+        """Bytes artifacts survive save + load unchanged.
+
+        Breaks when: bytes can't cross the RPC channel or come back as str.
+        """
+        code = f"""
+_payload = bytes(range(256)) * ({size} // 256)
+artifacts.save("blob", _payload)
+_loaded = artifacts.load("blob")
+(_RPC_CODEC, type(_loaded).__name__, _loaded == _payload)
+"""
+        result = await executor_with_msgpack.run(code)
+
+        assert result.error is None, result.error
+        codec, loaded_type, matches = result.value
+        assert codec == "msgpack"
+        assert loaded_type == "bytes"
+        assert matches